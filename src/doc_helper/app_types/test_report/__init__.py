@@ -81,13 +81,14 @@ class TestReportAppType(IAppType):
         """Get schema repository for this AppType.
 
         Returns:
-            SqliteSchemaRepository pointing to config.db
+            Read-only SqliteSchemaRepository over an in-memory copy of
+            config.db (runtime never writes the schema)
 
         Note:
             The config.db contains minimal schema for testing.
         """
         config_db_path = self._package_dir / "config.db"
-        return SqliteSchemaRepository(db_path=config_db_path)
+        return SqliteSchemaRepository(db_path=config_db_path, read_only=True)
 
     def register_transformers(self, registry: "TransformerRegistry") -> None:
         """Register custom transformers for this AppType.
@@ -16,6 +16,7 @@ from doc_helper.application.commands.open_project_command import OpenProjectComm
 from doc_helper.application.commands.save_project_command import SaveProjectCommand
 from doc_helper.application.commands.close_project_command import CloseProjectCommand
 from doc_helper.application.commands.update_field_command import UpdateFieldCommand
+from doc_helper.application.commands.update_table_row_command import UpdateTableRowCommand
 from doc_helper.application.commands.delete_project_command import DeleteProjectCommand
 from doc_helper.application.commands.generate_document_command import GenerateDocumentCommand
 from doc_helper.application.commands.export_project_command import ExportProjectCommand
@@ -27,6 +28,7 @@ __all__ = [
     "SaveProjectCommand",
     "CloseProjectCommand",
     "UpdateFieldCommand",
+    "UpdateTableRowCommand",
     "DeleteProjectCommand",
     "GenerateDocumentCommand",
     "ExportProjectCommand",
@@ -9,13 +9,19 @@ ADR-025 ENHANCEMENTS:
 - Validation with severity levels before generation
 - Block generation if ERROR-level validation failures exist
 - Allow generation with WARNING/INFO-level failures
+
+Phase R-7:
+- Control rules, validation and output mappings come from one project-level
+  runtime evaluation (EvaluateProjectRuntimeUseCase), the same result the
+  pre-generation checklist shows
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from doc_helper.application.commands.save_project_command import SaveProjectCommand
+from doc_helper.application.dto.runtime_dto import ProjectRuntimeEvaluationResultDTO
 from doc_helper.application.services.override_service import OverrideService
-from doc_helper.application.services.validation_service import ValidationService
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.document.document_format import DocumentFormat
 from doc_helper.domain.project.project_ids import ProjectId
@@ -24,6 +30,12 @@ from doc_helper.application.document.document_generation_service import (
     DocumentGenerationService,
 )
 
+if TYPE_CHECKING:
+    # The use-case package imports this command (DocumentUseCases)
+    from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+        EvaluateProjectRuntimeUseCase,
+    )
+
 
 class GenerateDocumentCommand:
     """Command to generate a document from a project.
@@ -39,8 +51,9 @@ class GenerateDocumentCommand:
     - SYNCED_FORMULA overrides preserved
 
     ADR-025 BEHAVIOR:
-    - Validates project before generation
+    - Evaluates the project runtime (R-7) before generation
     - Blocks generation if ERROR-level validation failures exist
+      (or an output mapping fails)
     - Allows generation with WARNING/INFO-level failures only
 
     Example:
@@ -49,7 +62,7 @@ class GenerateDocumentCommand:
             save_command=save_cmd,
             document_service=doc_service,
             override_service=override_svc,
-            validation_service=validation_svc
+            project_runtime_use_case=project_runtime
         )
         result = command.execute(
             project_id=project_id,
@@ -67,7 +80,7 @@ class GenerateDocumentCommand:
         save_command: SaveProjectCommand,
         document_service: DocumentGenerationService,
         override_service: OverrideService,
-        validation_service: ValidationService,
+        project_runtime_use_case: "EvaluateProjectRuntimeUseCase",
     ) -> None:
         """Initialize command.
 
@@ -76,8 +89,13 @@ class GenerateDocumentCommand:
             save_command: Command for auto-saving project (U8)
             document_service: Service for generating documents
             override_service: Service for managing overrides (U8)
-            validation_service: Service for validating projects (ADR-025)
+            project_runtime_use_case: Project-level runtime evaluation
+                (ADR-025, Phase R-7)
         """
+        from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+            EvaluateProjectRuntimeUseCase,
+        )
+
         if not isinstance(project_repository, IProjectRepository):
             raise TypeError("project_repository must implement IProjectRepository")
         if not isinstance(save_command, SaveProjectCommand):
@@ -88,14 +106,43 @@ class GenerateDocumentCommand:
             )
         if not isinstance(override_service, OverrideService):
             raise TypeError("override_service must be an OverrideService instance")
-        if not isinstance(validation_service, ValidationService):
-            raise TypeError("validation_service must be a ValidationService instance")
+        if not isinstance(project_runtime_use_case, EvaluateProjectRuntimeUseCase):
+            raise TypeError(
+                "project_runtime_use_case must be an EvaluateProjectRuntimeUseCase instance"
+            )
 
         self._project_repository = project_repository
         self._save_command = save_command
         self._document_service = document_service
         self._override_service = override_service
-        self._validation_service = validation_service
+        self._project_runtime_use_case = project_runtime_use_case
+
+    def evaluate_runtime(
+        self, project_id: ProjectId
+    ) -> Result[ProjectRuntimeEvaluationResultDTO, str]:
+        """Evaluate the project runtime that generation will check.
+
+        The pre-generation checklist shows this result, so it lists exactly
+        the issues that execute() blocks on.
+
+        Args:
+            project_id: Project to evaluate
+
+        Returns:
+            Success(ProjectRuntimeEvaluationResultDTO) or Failure(error)
+        """
+        if not isinstance(project_id, ProjectId):
+            return Failure("project_id must be a ProjectId")
+
+        load_result = self._project_repository.get_by_id(project_id)
+        if isinstance(load_result, Failure):
+            return Failure(f"Failed to load project: {load_result.error}")
+
+        project = load_result.value
+        if project is None:
+            return Failure(f"Project not found: {project_id.value}")
+
+        return Success(self._project_runtime_use_case.execute_for_project(project))
 
     def execute(
         self,
@@ -109,7 +156,7 @@ class GenerateDocumentCommand:
         U8 WORKFLOW:
         1. Auto-save project before generation
         2. Load project from repository
-        3. ADR-025: Validate project and block if ERROR-level failures
+        3. ADR-025: Evaluate project runtime and block if ERROR-level failures
         4. Generate document via service
         5. Cleanup SYNCED overrides after successful generation
 
@@ -132,26 +179,6 @@ class GenerateDocumentCommand:
         if isinstance(save_result, Failure):
             return Failure(f"Auto-save before generation failed: {save_result.error}")
 
-        # ADR-025: Validate project before generation
-        validation_result = self._validation_service.validate_by_project_id(project_id)
-        if isinstance(validation_result, Failure):
-            return Failure(f"Validation failed: {validation_result.error}")
-
-        validation = validation_result.value
-
-        # ADR-025: Block generation if ERROR-level validation failures exist
-        if validation.has_blocking_errors():
-            error_count = len(validation.get_errors_by_severity(
-                __import__('doc_helper.domain.validation.severity', fromlist=['Severity']).Severity.ERROR
-            ))
-            return Failure(
-                f"Cannot generate document: {error_count} ERROR-level validation "
-                f"failure(s) must be resolved before generation"
-            )
-
-        # WARNING and INFO level failures do not block generation
-        # (User confirmation for warnings is handled in presentation layer)
-
         # Load project
         load_result = self._project_repository.get_by_id(project_id)
         if isinstance(load_result, Failure):
@@ -161,6 +188,21 @@ class GenerateDocumentCommand:
         if project is None:
             return Failure(f"Project not found: {project_id.value}")
 
+        # ADR-025: Block generation if ERROR-level validation failures exist
+        runtime_result = self._project_runtime_use_case.execute_for_project(project)
+        if runtime_result.is_blocked:
+            reasons = "; ".join(
+                result.blocking_reason
+                for result in runtime_result.entity_results
+                if result.is_blocked and result.blocking_reason
+            )
+            return Failure(
+                f"Cannot generate document: {reasons or 'runtime evaluation blocked'}"
+            )
+
+        # WARNING and INFO level failures do not block generation
+        # (User confirmation for warnings is handled in presentation layer)
+
         # Generate document
         generation_result = self._document_service.generate(
             project=project,
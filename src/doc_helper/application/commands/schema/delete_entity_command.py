@@ -14,13 +14,14 @@ class DeleteEntityCommand:
 
     Phase 2 Step 3 Scope (Decision 4):
     - Delete entity only if no dependencies exist
-    - Check TABLE fields, LOOKUP fields, child entities
+    - Check TABLE fields, LOOKUP fields, child entities, relationships
     - Return detailed error if dependencies found
 
     Dependencies checked:
     - referenced_by_table_fields: Other entities have TABLE fields pointing to this entity
     - referenced_by_lookup_fields: Other entities have LOOKUP fields pointing to this entity
     - child_entities: This entity has child entities (parent_entity_id relationship)
+    - referenced_by_relationships: Relationships from or to this entity (if reported)
 
     Examples:
         >>> command = DeleteEntityCommand(schema_repository)
@@ -86,6 +87,7 @@ class DeleteEntityCommand:
             deps["referenced_by_table_fields"]
             or deps["referenced_by_lookup_fields"]
             or deps["child_entities"]
+            or deps.get("referenced_by_relationships")
         )
 
         if has_dependencies:
@@ -130,6 +132,17 @@ class DeleteEntityCommand:
                     remaining = len(deps["child_entities"]) - 5
                     error_lines.append(f"      ... and {remaining} more")
 
+            # List relationship dependencies
+            relationships = deps.get("referenced_by_relationships", [])
+            if relationships:
+                error_lines.append(f"  - {len(relationships)} relationship(s):")
+                # Show up to 5 examples
+                for relationship_id, other_entity_id in relationships[:5]:
+                    error_lines.append(f"      {relationship_id} (with {other_entity_id})")
+                if len(relationships) > 5:
+                    remaining = len(relationships) - 5
+                    error_lines.append(f"      ... and {remaining} more")
+
             error_lines.append("")
             error_lines.append("Remove these references before deleting this entity.")
 
@@ -96,6 +96,7 @@ class DeleteFieldCommand:
             or deps["referenced_by_controls_source"]
             or deps["referenced_by_controls_target"]
             or deps["referenced_by_lookup_display"]
+            or deps.get("referenced_by_control_rules")
         )
 
         if has_dependencies:
@@ -132,6 +133,14 @@ class DeleteFieldCommand:
                 if len(deps["referenced_by_lookup_display"]) > 5:
                     error_lines.append(f"      ... and {len(deps['referenced_by_lookup_display']) - 5} more")
 
+            control_rules = deps.get("referenced_by_control_rules", [])
+            if control_rules:
+                error_lines.append(f"  - {len(control_rules)} control rule formula(s):")
+                for ent_id, fld_id in control_rules[:5]:
+                    error_lines.append(f"      {ent_id}.{fld_id}")
+                if len(control_rules) > 5:
+                    error_lines.append(f"      ... and {len(control_rules) - 5} more")
+
             error_lines.append("Remove these references before deleting this field.")
 
             return Failure("\n".join(error_lines))
@@ -32,7 +32,7 @@ from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.relationship_definition import RelationshipDefinition
 from doc_helper.domain.schema.relationship_repository import IRelationshipRepository
 from doc_helper.domain.schema.schema_compatibility import CompatibilityLevel, CompatibilityResult
-from doc_helper.domain.schema.schema_repository import ISchemaRepository
+from doc_helper.domain.schema.schema_repository import ISchemaBulkWriter, ISchemaRepository
 from doc_helper.domain.schema.schema_version import SchemaVersion
 
 
@@ -265,10 +265,14 @@ class ImportSchemaCommand:
     ) -> Result[None, str]:
         """Perform atomic import: delete existing, save new.
 
-        IMPORTANT: This is all-or-nothing. If any operation fails,
+        When the schema repository implements ISchemaBulkWriter, the whole
+        replacement runs as one bulk write that rolls back completely on
+        failure. Otherwise falls back to per-entity calls.
+
+        IMPORTANT: In the per-entity fallback, if any operation fails,
         the schema may be in an inconsistent state.
 
-        Order of operations:
+        Order of operations (fallback):
         1. Delete existing entities (cascades to relationships via FK)
         2. Save new entities
         3. Save new relationships (requires entities to exist)
@@ -281,6 +285,10 @@ class ImportSchemaCommand:
         Returns:
             Result with None on success or error message
         """
+        if isinstance(self._schema_repository, ISchemaBulkWriter):
+            relationships = import_relationships if self._relationship_repository else ()
+            return self._schema_repository.replace_all(import_entities, relationships)
+
         # Delete existing entities (relationships deleted via FK cascade or manually)
         for entity in existing_entities:
             delete_result = self._schema_repository.delete(entity.id)
@@ -0,0 +1,84 @@
+"""Command for editing one child record of a TABLE field."""
+
+from typing import Any, Optional
+
+from doc_helper.domain.common.result import Failure, Result
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.project.project_repository import ITableRowRepository
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
+
+
+class UpdateTableRowCommand:
+    """Command to insert, update, delete or move one TABLE field record.
+
+    Unlike UpdateFieldCommand, which saves the whole project, only the
+    edited record is written.
+
+    RULES (IMPLEMENTATION_RULES.md Section 5):
+    - Command handlers are stateless (dependencies injected)
+    - Commands modify state and return Result[None, str]
+
+    Example:
+        command = UpdateTableRowCommand(table_row_repository=repo)
+        result = command.execute(
+            project_id=project_id,
+            field_id=FieldDefinitionId("samples"),
+            kind="update",
+            index=2,
+            record={"depth": 4.5},
+        )
+    """
+
+    KINDS = ("insert", "update", "delete", "move")
+
+    def __init__(self, table_row_repository: ITableRowRepository) -> None:
+        """Initialize command.
+
+        Args:
+            table_row_repository: Repository for row-level TABLE edits
+        """
+        if not isinstance(table_row_repository, ITableRowRepository):
+            raise TypeError("table_row_repository must implement ITableRowRepository")
+        self._table_row_repository = table_row_repository
+
+    def execute(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        kind: str,
+        index: int,
+        record: Optional[dict[str, Any]] = None,
+        to_index: Optional[int] = None,
+    ) -> Result[None, str]:
+        """Execute update table row command.
+
+        Args:
+            project_id: Project to update
+            field_id: TABLE field to update
+            kind: "insert", "update", "delete" or "move"
+            index: Record position (the source position for "move")
+            record: New record for "insert" and "update"
+            to_index: Destination position for "move"
+
+        Returns:
+            Success(None) if the record was written, Failure(error) otherwise
+        """
+        if not isinstance(project_id, ProjectId):
+            return Failure("project_id must be a ProjectId")
+        if not isinstance(field_id, FieldDefinitionId):
+            return Failure("field_id must be a FieldDefinitionId")
+        if kind not in self.KINDS:
+            return Failure(f"Unknown row change: {kind}")
+
+        repository = self._table_row_repository
+        if kind in ("insert", "update"):
+            if record is None:
+                return Failure(f"A record is required to {kind} a row")
+            if kind == "insert":
+                return repository.insert_table_row(project_id, field_id, index, record)
+            return repository.update_table_row(project_id, field_id, index, record)
+        if kind == "delete":
+            return repository.delete_table_row(project_id, field_id, index)
+        if to_index is None:
+            return Failure("to_index is required to move a row")
+        return repository.move_table_row(project_id, field_id, index, to_index)
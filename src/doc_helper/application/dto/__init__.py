@@ -17,6 +17,7 @@ from doc_helper.application.dto.project_dto import (
     ProjectSummaryDTO,
 )
 from doc_helper.application.dto.schema_dto import (
+    EntityChangeResult,
     EntityDefinitionDTO,
     FieldDefinitionDTO,
     FieldOptionDTO,
@@ -54,6 +55,10 @@ from doc_helper.application.dto.field_history_dto import (
 from doc_helper.application.dto.search_result_dto import (
     SearchResultDTO,
 )
+from doc_helper.application.dto.lookup_dto import (
+    LookupOptionDTO,
+    LookupPageDTO,
+)
 from doc_helper.application.dto.import_export_dto import (
     ImportValidationErrorDTO,
     ImportResultDTO,
@@ -72,6 +77,7 @@ from doc_helper.application.dto.formula_dto import (
     FormulaCycleAnalysisResultDTO,
     FormulaGovernanceStatus,
     FormulaGovernanceResultDTO,
+    FormulaDiagnosticsDTO,
     SchemaFieldInfoDTO,
     FormulaResultType,
     # Phase F-7: Formula Binding
@@ -103,6 +109,7 @@ __all__ = [
     "ProjectSummaryDTO",
     # Schema DTOs
     "EntityDefinitionDTO",
+    "EntityChangeResult",
     "FieldDefinitionDTO",
     "FieldOptionDTO",
     # Field DTOs
@@ -130,6 +137,9 @@ __all__ = [
     "FieldHistoryResultDTO",
     # Search DTOs
     "SearchResultDTO",
+    # Lookup DTOs
+    "LookupOptionDTO",
+    "LookupPageDTO",
     # Import/Export DTOs
     "ImportValidationErrorDTO",
     "ImportResultDTO",
@@ -149,6 +159,7 @@ __all__ = [
     # Formula Governance DTOs (Phase F-6)
     "FormulaGovernanceStatus",
     "FormulaGovernanceResultDTO",
+    "FormulaDiagnosticsDTO",
     # Formula Binding DTOs (Phase F-7)
     "FormulaBindingTarget",
     "FormulaBindingStatus",
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldValueDTO:
     """UI-facing field value data for display.
 
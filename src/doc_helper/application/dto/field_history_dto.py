@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldHistoryEntryDTO:
     """UI-facing field history entry for display.
 
@@ -451,6 +451,24 @@ class FormulaGovernanceResultDTO:
             return "Formula is valid"
 
 
+@dataclass(frozen=True)
+class FormulaDiagnosticsDTO:
+    """Consolidated editor diagnostics for one formula text.
+
+    Bundles the F-1, F-3, F-4 and F-6 results produced by a single
+    diagnostics pass so the editor can publish them as one update.
+
+    cycle_analysis_result is None when no entity dependency graph has
+    been loaded for the diagnostics session.
+    """
+
+    formula_text: str
+    validation_result: FormulaValidationResultDTO
+    dependency_analysis_result: FormulaDependencyAnalysisResultDTO
+    cycle_analysis_result: FormulaCycleAnalysisResultDTO | None
+    governance_result: FormulaGovernanceResultDTO
+
+
 # =============================================================================
 # PHASE F-7: Formula Binding & Persistence Rules (Policy Only)
 # =============================================================================
@@ -0,0 +1,45 @@
+"""Data Transfer Objects for LOOKUP field options.
+
+- Read-only query results (CQRS)
+- Immutable DTOs for presentation layer
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class LookupOptionDTO:
+    """One selectable option of a LOOKUP field.
+
+    Attributes:
+        value: Stored value (e.g., record key)
+        display_text: Text shown to the user
+    """
+
+    value: Any
+    display_text: str
+
+
+@dataclass(frozen=True)
+class LookupPageDTO:
+    """One page of LOOKUP options matching a query.
+
+    Attributes:
+        query: Query text the page was fetched for
+        match_mode: "prefix" or "substring"
+        page_index: Zero-based page number
+        options: Options in display order
+        has_more: True if further pages exist
+    """
+
+    query: str
+    match_mode: str
+    page_index: int
+    options: tuple[LookupOptionDTO, ...]
+    has_more: bool
+
+    @property
+    def is_complete(self) -> bool:
+        """Check if this first page holds every matching option."""
+        return self.page_index == 0 and not self.has_more
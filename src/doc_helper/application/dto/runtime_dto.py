@@ -1,4 +1,4 @@
-"""Runtime Evaluation DTOs (Phase R-1, R-2, R-3, R-4, R-4.5, R-5, R-6).
+"""Runtime Evaluation DTOs (Phase R-1, R-2, R-3, R-4, R-4.5, R-5, R-6, R-7).
 
 Data Transfer Objects for runtime evaluation:
 - Control rule evaluation (Phase R-1)
@@ -9,6 +9,7 @@ Data Transfer Objects for runtime evaluation:
 - Form runtime state adapter (Phase R-4.5)
 - Entity-level output mappings aggregation (Phase R-5)
 - Document runtime context builder (Phase R-6)
+- Project-level runtime evaluation (Phase R-7)
 
 ADR-050 Compliance:
 - Pull-based evaluation (caller provides all inputs)
@@ -20,6 +21,8 @@ ADR-050 Compliance:
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from doc_helper.application.dto.validation_dto import ValidationErrorDTO
+
 
 # ============================================================================
 # Control Rule Evaluation DTOs
@@ -980,3 +983,170 @@ class DocumentRuntimeContextDTO:
             output_values={},
             has_blocking_errors=False,
         )
+
+
+# ============================================================================
+# Project-Level Runtime Evaluation DTOs (Phase R-7)
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ProjectRuntimeEvaluationRequestDTO:
+    """Request DTO for evaluating every entity of a project at once (Phase R-7).
+
+    ADR-050 Compliance:
+        - Pull-based: Caller provides one snapshot of the whole project
+        - Each entity is still evaluated in its own scope (no cross-entity rules)
+        - Field values passed as snapshot (read-only)
+    """
+
+    entity_values: dict[str, dict[str, Any]]
+    """Project snapshot: entity ID -> field values of that entity.
+    Entities are evaluated (and reported) in this order."""
+
+
+@dataclass(frozen=True)
+class ProjectEntityRuntimeResultDTO:
+    """Runtime evaluation result of one entity of a project (Phase R-7)."""
+
+    entity_id: str
+    """Entity that was evaluated."""
+
+    runtime_result: RuntimeEvaluationResultDTO
+    """Control rules and validation result (R-3)."""
+
+    output_mappings: Optional[EntityOutputMappingsEvaluationDTO]
+    """Output mappings result (R-5).
+    None if not evaluated (validation blocked)."""
+
+    is_blocked: bool
+    """Whether validation blocked or an output mapping failed."""
+
+    blocking_reason: Optional[str]
+    """Human-readable reason for blocking (None if not blocked)."""
+
+    @staticmethod
+    def from_results(
+        entity_id: str,
+        runtime_result: RuntimeEvaluationResultDTO,
+        output_mappings: Optional[EntityOutputMappingsEvaluationDTO],
+    ) -> "ProjectEntityRuntimeResultDTO":
+        """Combine the R-3 and R-5 results of an entity.
+
+        Args:
+            entity_id: Entity identifier
+            runtime_result: Runtime evaluation result (R-3)
+            output_mappings: Output mappings result (R-5), None if not evaluated
+
+        Returns:
+            ProjectEntityRuntimeResultDTO with blocking determined
+        """
+        if runtime_result.is_blocked:
+            is_blocked = True
+            blocking_reason = runtime_result.blocking_reason
+        elif output_mappings is not None and not output_mappings.result.success:
+            is_blocked = True
+            blocking_reason = f"Output mapping failed: {output_mappings.result.error}"
+        else:
+            is_blocked = False
+            blocking_reason = None
+
+        return ProjectEntityRuntimeResultDTO(
+            entity_id=entity_id,
+            runtime_result=runtime_result,
+            output_mappings=output_mappings,
+            is_blocked=is_blocked,
+            blocking_reason=blocking_reason,
+        )
+
+
+@dataclass(frozen=True)
+class ProjectRuntimeEvaluationResultDTO:
+    """Aggregated runtime evaluation result of a whole project (Phase R-7).
+
+    One result serves both consumers of project-wide evaluation:
+        - Pre-generation checklist: to_validation_error_dtos()
+        - Document generation: is_blocked and output_values()
+
+    ADR-050 Compliance:
+        - Immutable aggregation of per-entity results
+        - Blocking if ANY entity blocks
+        - No persistence side effects
+    """
+
+    entity_results: tuple[ProjectEntityRuntimeResultDTO, ...]
+    """Per-entity results, in snapshot order."""
+
+    is_blocked: bool
+    """Whether any entity is blocked."""
+
+    blocked_entity_ids: tuple[str, ...]
+    """Entities that are blocked, in snapshot order."""
+
+    @staticmethod
+    def from_entity_results(
+        entity_results: tuple[ProjectEntityRuntimeResultDTO, ...],
+    ) -> "ProjectRuntimeEvaluationResultDTO":
+        """Aggregate per-entity results.
+
+        Args:
+            entity_results: Per-entity results, in snapshot order
+
+        Returns:
+            ProjectRuntimeEvaluationResultDTO with blocking aggregated
+        """
+        blocked_entity_ids = tuple(
+            result.entity_id for result in entity_results if result.is_blocked
+        )
+        return ProjectRuntimeEvaluationResultDTO(
+            entity_results=entity_results,
+            is_blocked=len(blocked_entity_ids) > 0,
+            blocked_entity_ids=blocked_entity_ids,
+        )
+
+    def get_entity_result(
+        self, entity_id: str
+    ) -> Optional[ProjectEntityRuntimeResultDTO]:
+        """Get the result of one entity (None if not in the snapshot)."""
+        for result in self.entity_results:
+            if result.entity_id == entity_id:
+                return result
+        return None
+
+    def output_values(self, entity_id: str) -> dict[str, Any]:
+        """Get the output values of one entity for document generation.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            Output values {target -> value}; empty if the entity is not in
+            the snapshot, is blocked, or has no output mappings
+        """
+        result = self.get_entity_result(entity_id)
+        if result is None or result.is_blocked or result.output_mappings is None:
+            return {}
+        return result.output_mappings.result.values
+
+    def to_validation_error_dtos(self) -> tuple[ValidationErrorDTO, ...]:
+        """Convert all validation issues into UI-facing ValidationErrorDTOs.
+
+        Issues are ordered by entity (snapshot order), then by severity
+        (ERROR, WARNING, INFO), as the pre-generation checklist expects.
+
+        Returns:
+            Tuple of ValidationErrorDTO for every entity's issues
+        """
+        errors: list[ValidationErrorDTO] = []
+        for result in self.entity_results:
+            validation = result.runtime_result.validation_result
+            for issue in (*validation.errors, *validation.warnings, *validation.info):
+                errors.append(
+                    ValidationErrorDTO(
+                        field_id=issue.field_id,
+                        message=issue.message,
+                        constraint_type=issue.constraint_type,
+                        severity=issue.severity,
+                    )
+                )
+        return tuple(errors)
@@ -11,6 +11,8 @@ RULES (AGENT_RULES.md Section 3-4, unified_upgrade_plan.md H2):
 from dataclasses import dataclass
 from typing import Optional
 
+from doc_helper.application.dto.operation_result import OperationResult
+
 
 @dataclass(frozen=True)
 class FieldOptionDTO:
@@ -75,3 +77,20 @@ class EntityDefinitionDTO:
     is_root_entity: bool  # Whether this is a top-level entity
     parent_entity_id: Optional[str]  # Parent entity ID (or None)
     fields: tuple[FieldDefinitionDTO, ...]  # Field definitions for this entity
+
+
+@dataclass(frozen=True)
+class EntityChangeResult(OperationResult):
+    """OperationResult of a schema mutation that carries the changed entity.
+
+    Lets the Presentation layer patch its in-memory schema state instead
+    of re-querying the whole schema after every edit.
+
+    Exactly one of entity / removed_entity_id is set on success. If both
+    are None the change could not be described (e.g. the entity could not
+    be re-read) and the caller should fall back to a full reload.
+    """
+
+    entity: Optional[EntityDefinitionDTO] = None  # Entity state after the change
+    removed_entity_id: Optional[str] = None  # ID of a deleted entity
+
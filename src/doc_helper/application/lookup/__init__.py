@@ -0,0 +1,19 @@
+"""Lookup module for LOOKUP field option sources.
+
+- Read-only query operations (CQRS query side)
+- Options are paged from the source, never materialized up front
+"""
+
+from doc_helper.application.lookup.lookup_source import (
+    ILookupSource,
+    ILookupSourceFactory,
+    LookupMatchMode,
+    fold_lookup_text,
+)
+
+__all__ = [
+    "ILookupSource",
+    "ILookupSourceFactory",
+    "LookupMatchMode",
+    "fold_lookup_text",
+]
@@ -0,0 +1,127 @@
+"""Source interface for LOOKUP field options.
+
+- Interface defined in Application layer (option paging is a UI concern)
+- Implementation in Infrastructure layer
+- Read-only operations (no mutations, no side effects)
+"""
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Iterable, Optional
+
+from doc_helper.domain.common.result import Result
+
+_ASCII_LOWER = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+)
+
+
+def fold_lookup_text(text: str) -> str:
+    """Case-fold text for lookup matching.
+
+    Only ASCII letters are folded, matching SQLite's lower(), so in-memory
+    filtering agrees with what a source returns.
+
+    Args:
+        text: Display text or query
+
+    Returns:
+        Folded text
+    """
+    return text.translate(_ASCII_LOWER)
+
+
+class LookupMatchMode(str, Enum):
+    """How a query matches option display texts (case-insensitive)."""
+
+    PREFIX = "prefix"
+    SUBSTRING = "substring"
+
+    def matches(self, folded_display_text: str, folded_query: str) -> bool:
+        """Check if a folded display text matches a folded query."""
+        if self is LookupMatchMode.PREFIX:
+            return folded_display_text.startswith(folded_query)
+        return folded_query in folded_display_text
+
+
+class ILookupSource(ABC):
+    """Pages (value, display_text) options of one LOOKUP field.
+
+    Options are ordered by folded display text (see fold_lookup_text);
+    the order must be stable so pages do not overlap.
+
+    Example:
+        source = SqliteLookupSource(db_path, project_id, "boreholes", "name")
+        result = source.search("bh-1", LookupMatchMode.PREFIX, offset=0, limit=50)
+        if result.is_success():
+            for value, display_text in result.value:
+                print(value, display_text)
+    """
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        match_mode: LookupMatchMode,
+        offset: int,
+        limit: int,
+    ) -> Result[list[tuple[Any, str]], str]:
+        """Get options whose display text matches query.
+
+        Args:
+            query: Text to match (empty matches every option)
+            match_mode: Prefix or substring matching
+            offset: Number of matching options to skip
+            limit: Maximum number of options to return
+
+        Returns:
+            Success(list of (value, display_text)) in display order,
+            Failure(error) if the source cannot be read
+        """
+        pass
+
+    @abstractmethod
+    def resolve(self, values: Iterable[Any]) -> Result[dict[Any, str], str]:
+        """Get the display texts of values.
+
+        Args:
+            values: Option values (e.g., stored LOOKUP field values)
+
+        Returns:
+            Success(dict value -> display_text) - unknown values are absent,
+            Failure(error) if the source cannot be read
+        """
+        pass
+
+
+class ILookupSourceFactory(ABC):
+    """Creates the option source of a LOOKUP field of a project.
+
+    The factory decides where the records of the referenced entity live;
+    callers only know the project and the LOOKUP field's target.
+
+    Example:
+        source = factory.create_source("proj-123", "borehole", "name")
+        if source is not None:
+            service = LookupSourceService(source)
+    """
+
+    @abstractmethod
+    def create_source(
+        self,
+        project_id: str,
+        lookup_entity_id: str,
+        display_field: str,
+    ) -> Optional[ILookupSource]:
+        """Create the source of a LOOKUP field's options.
+
+        Args:
+            project_id: Project whose records are looked up
+            lookup_entity_id: Entity the LOOKUP field references
+            display_field: Field of that entity shown as option text
+
+        Returns:
+            Option source, or None if the project holds no records of
+            lookup_entity_id
+        """
+        pass
@@ -44,6 +44,14 @@ class GetSchemaEntitiesQuery:
     - Formats validation constraints as human-readable strings
 
     All domain types stay within this query - only DTOs are returned.
+
+    Translated field DTOs are memoized per language and entity, keyed by the
+    (immutable, hashable) FieldDefinition value object. Repeated
+    get_all_entities() calls reuse the memo, and a language switch
+    translates each field only once. Every full pass replaces the memo and
+    every single-entity read replaces that entity's entries, so the memo
+    never holds more than one schema's worth of DTOs per language. Call
+    invalidate() when an entity is deleted.
     """
 
     def __init__(
@@ -59,6 +67,8 @@ class GetSchemaEntitiesQuery:
         """
         self._schema_repository = schema_repository
         self._translation_service = translation_service
+        # language -> entity ID -> {FieldDefinition: FieldDefinitionDTO}
+        self._field_dto_memo: dict = {}
 
     def execute(self) -> Result[tuple[EntityDefinitionDTO, ...], str]:
         """Execute query to load all entities.
@@ -71,10 +81,55 @@ class GetSchemaEntitiesQuery:
             return Failure(result.error)
 
         entity_definitions = result.value
-        dtos = tuple(
-            self._entity_to_dto(entity) for entity in entity_definitions
-        )
-        return Success(dtos)
+        current_lang = self._translation_service.get_current_language()
+        previous_memo = self._field_dto_memo.get(current_lang, {})
+        memo: dict = {}
+        dtos = []
+        for entity in entity_definitions:
+            entity_id = str(entity.id.value)
+            memo[entity_id] = {}
+            dtos.append(
+                self._entity_to_dto(entity, previous_memo.get(entity_id), memo[entity_id])
+            )
+        self._field_dto_memo[current_lang] = memo
+        return Success(tuple(dtos))
+
+    def execute_for_entity(self, entity_id: str) -> Result[EntityDefinitionDTO, str]:
+        """Execute query for a single entity (after a targeted mutation).
+
+        Reads only that entity and reuses the current language's memo, so
+        unchanged fields are not re-translated.
+
+        Args:
+            entity_id: Entity ID (string)
+
+        Returns:
+            Result containing the EntityDefinitionDTO or error message
+        """
+        result = self._schema_repository.get_by_id(EntityDefinitionId(entity_id))
+        if result.is_failure():
+            return Failure(result.error)
+
+        current_lang = self._translation_service.get_current_language()
+        previous_memo = self._field_dto_memo.get(current_lang, {}).get(entity_id)
+        # Other languages hold the entity's previous fields; drop them
+        self.invalidate(entity_id)
+        memo: dict = {}
+        dto = self._entity_to_dto(result.value, previous_memo, memo)
+        self._field_dto_memo.setdefault(current_lang, {})[entity_id] = memo
+        return Success(dto)
+
+    def invalidate(self, entity_id: Optional[str] = None) -> None:
+        """Drop memoized field DTOs (after a schema change).
+
+        Args:
+            entity_id: Entity whose DTOs are dropped (None: all entities)
+        """
+        if entity_id is None:
+            self._field_dto_memo.clear()
+            return
+        for language_memo in self._field_dto_memo.values():
+            language_memo.pop(entity_id, None)
 
     def get_field_validation_rules(
         self,
@@ -107,11 +162,18 @@ class GetSchemaEntitiesQuery:
             self._format_constraint(c) for c in field_def.constraints
         )
 
-    def _entity_to_dto(self, entity_definition) -> EntityDefinitionDTO:
+    def _entity_to_dto(
+        self,
+        entity_definition,
+        previous_memo: Optional[dict] = None,
+        memo: Optional[dict] = None,
+    ) -> EntityDefinitionDTO:
         """Convert EntityDefinition to DTO.
 
         Args:
             entity_definition: Domain entity definition
+            previous_memo: Field DTOs translated on the previous pass
+            memo: Field DTOs collected on the current pass
 
         Returns:
             EntityDefinitionDTO for UI consumption
@@ -128,7 +190,8 @@ class GetSchemaEntitiesQuery:
             )
 
         field_dtos = tuple(
-            self._field_to_dto(field) for field in entity_definition.get_all_fields()
+            self._memoized_field_to_dto(field, previous_memo, memo)
+            for field in entity_definition.get_all_fields()
         )
 
         return EntityDefinitionDTO(
@@ -151,6 +214,38 @@ class GetSchemaEntitiesQuery:
             fields=field_dtos,
         )
 
+    def _memoized_field_to_dto(
+        self,
+        field_definition,
+        previous_memo: Optional[dict],
+        memo: Optional[dict],
+    ) -> FieldDefinitionDTO:
+        """Convert FieldDefinition to DTO, reusing a memoized translation.
+
+        Args:
+            field_definition: Domain field definition
+            previous_memo: Field DTOs translated on the previous pass
+            memo: Field DTOs collected on the current pass
+
+        Returns:
+            FieldDefinitionDTO for UI consumption
+        """
+        if memo is None:
+            return self._field_to_dto(field_definition)
+
+        try:
+            dto = memo.get(field_definition)
+            if dto is None and previous_memo:
+                dto = previous_memo.get(field_definition)
+        except TypeError:
+            # Unhashable default_value or similar - translate directly
+            return self._field_to_dto(field_definition)
+
+        if dto is None:
+            dto = self._field_to_dto(field_definition)
+        memo[field_definition] = dto
+        return dto
+
     def _field_to_dto(self, field_definition) -> FieldDefinitionDTO:
         """Convert FieldDefinition to DTO.
 
@@ -30,7 +30,7 @@ class ControlService:
     determining which fields should be visible, enabled, or have their values set.
 
     RULES (IMPLEMENTATION_RULES.md Section 5):
-    - Service is stateless (no instance state beyond evaluator)
+    - Service is stateless (no instance state beyond evaluator and its compiled rule plans)
     - Service coordinates domain logic, doesn't contain it
     - Returns Result monad for error handling
 
@@ -6,6 +6,7 @@ from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.formula.dependency_tracker import DependencyTracker
 from doc_helper.domain.formula.evaluator import EvaluationContext, FormulaEvaluator
 from doc_helper.domain.formula.parser import FormulaParser
+from doc_helper.domain.formula.table_columns import TABLE_AGGREGATE_FUNCTIONS
 from doc_helper.domain.project.project import Project
 from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.field_definition import FieldDefinition
@@ -38,13 +39,17 @@ class FormulaService:
         formula: str,
         field_values: dict[str, Any],
         functions: dict[str, Any] | None = None,
+        table_columns: dict | None = None,
     ) -> Result[Any, str]:
         """Evaluate a formula expression.
 
         Args:
             formula: Formula expression to evaluate
             field_values: Field values to use in evaluation
-            functions: Optional functions to use in evaluation
+            functions: Optional functions to use in evaluation, in addition
+                to the TABLE aggregates (sum_of, avg_of, ...)
+            table_columns: Optional cache of TABLE column views; pass the
+                same dict to several calls so each table is read once
 
         Returns:
             Success(value) if evaluation succeeded, Failure(error) otherwise
@@ -62,7 +67,8 @@ class FormulaService:
             # Evaluate formula
             context = EvaluationContext(
                 field_values=field_values,
-                functions=functions or {},
+                functions={**TABLE_AGGREGATE_FUNCTIONS, **(functions or {})},
+                table_columns=table_columns if table_columns is not None else {},
             )
             evaluator = FormulaEvaluator(context)
             return evaluator.evaluate(ast)
@@ -110,6 +116,8 @@ class FormulaService:
         # Evaluate formulas in dependency order
         evaluation_order = dep_result.value
         computed_values = {}
+        # TABLE column views, shared by every formula of this pass
+        table_columns: dict = {}
 
         for field_id in evaluation_order:
             field_def = calculated_fields[field_id]
@@ -120,6 +128,7 @@ class FormulaService:
             result = self.evaluate_formula(
                 formula=field_def.formula,
                 field_values=field_values,
+                table_columns=table_columns,
             )
 
             if isinstance(result, Failure):
@@ -232,6 +241,7 @@ class FormulaService:
         """
         from doc_helper.domain.formula.ast_nodes import (
             BinaryOp,
+            ColumnReference,
             FieldReference,
             FunctionCall,
             Literal,
@@ -241,6 +251,9 @@ class FormulaService:
         if isinstance(ast_node, FieldReference):
             return {ast_node.field_name}
 
+        if isinstance(ast_node, ColumnReference):
+            return {ast_node.table_name}
+
         if isinstance(ast_node, BinaryOp):
             left_refs = self._extract_field_references(ast_node.left)
             right_refs = self._extract_field_references(ast_node.right)
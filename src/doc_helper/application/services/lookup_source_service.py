@@ -0,0 +1,290 @@
+"""Lookup source service for LOOKUP field options.
+
+Serves LOOKUP options page by page from an ILookupSource instead of
+handing every option of the referenced entity to the widget:
+- Recently used pages are kept in an LRU cache
+- Display texts are resolved through a value -> display_text hash index,
+  filled by every fetched page and by batched source lookups; the index
+  and the set of values known to be missing are LRU-bounded as well
+- TypeAheadCompleter narrows complete result sets in memory while the
+  user keeps typing, and only queries the source when it must
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from doc_helper.application.dto.lookup_dto import LookupOptionDTO, LookupPageDTO
+from doc_helper.application.lookup import ILookupSource, LookupMatchMode, fold_lookup_text
+from doc_helper.domain.common.result import Failure, Result, Success
+
+
+class LookupSourceService:
+    """Paged, cached access to the options of one LOOKUP field.
+
+    The service owns one source; create one per LOOKUP field. Call
+    invalidate() after the referenced records change.
+
+    Example:
+        service = LookupSourceService(SqliteLookupSource(...), page_size=50)
+        page = service.get_page("bh", LookupMatchMode.PREFIX).value
+        for option in page.options:
+            print(option.value, option.display_text)
+        service.get_display_text("bh-001")
+    """
+
+    def __init__(
+        self,
+        source: ILookupSource,
+        page_size: int = 50,
+        max_cached_pages: int = 32,
+        max_cached_values: int = 4096,
+    ) -> None:
+        """Initialize LookupSourceService.
+
+        Args:
+            source: Source of the field's options
+            page_size: Options per page
+            max_cached_pages: Pages kept in the LRU cache
+            max_cached_values: Display texts (and, separately, unknown
+                values) kept in their LRU caches
+
+        Raises:
+            TypeError: If source doesn't implement ILookupSource
+            ValueError: If page_size, max_cached_pages or max_cached_values
+                is not positive
+        """
+        if not isinstance(source, ILookupSource):
+            raise TypeError("source must implement ILookupSource")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        if max_cached_pages <= 0:
+            raise ValueError("max_cached_pages must be positive")
+        if max_cached_values <= 0:
+            raise ValueError("max_cached_values must be positive")
+        self._source = source
+        self._page_size = page_size
+        self._max_cached_pages = max_cached_pages
+        self._max_cached_values = max_cached_values
+        self._pages: OrderedDict[tuple, LookupPageDTO] = OrderedDict()
+        self._display_by_value: OrderedDict[Any, str] = OrderedDict()
+        self._unknown_values: OrderedDict[Any, None] = OrderedDict()
+
+    @property
+    def page_size(self) -> int:
+        """Options per page."""
+        return self._page_size
+
+    def get_page(
+        self,
+        query: str = "",
+        match_mode: LookupMatchMode = LookupMatchMode.PREFIX,
+        page_index: int = 0,
+    ) -> Result[LookupPageDTO, str]:
+        """Get one page of options matching query.
+
+        Args:
+            query: Text to match (empty matches every option)
+            match_mode: Prefix or substring matching
+            page_index: Zero-based page number
+
+        Returns:
+            Success(LookupPageDTO) or Failure(error) from the source
+        """
+        if page_index < 0:
+            return Failure("page_index must not be negative")
+        key = (match_mode, query, page_index)
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+            return Success(page)
+
+        # One extra row tells whether another page follows
+        result = self._source.search(
+            query, match_mode, page_index * self._page_size, self._page_size + 1
+        )
+        if result.is_failure():
+            return Failure(result.error)
+        rows = result.value
+        options = tuple(
+            LookupOptionDTO(value=value, display_text=display_text)
+            for value, display_text in rows[: self._page_size]
+        )
+        page = LookupPageDTO(
+            query=query,
+            match_mode=match_mode.value,
+            page_index=page_index,
+            options=options,
+            has_more=len(rows) > self._page_size,
+        )
+        for option in options:
+            self._remember(option.value, option.display_text)
+
+        self._pages[key] = page
+        if len(self._pages) > self._max_cached_pages:
+            self._pages.popitem(last=False)
+        return Success(page)
+
+    def resolve_display_texts(self, values: Iterable[Any]) -> Result[dict[Any, str], str]:
+        """Get the display texts of values.
+
+        Values already seen are answered from the hash index; the rest are
+        fetched from the source in one batch.
+
+        Args:
+            values: Option values
+
+        Returns:
+            Success(dict value -> display_text, unknown values absent)
+            or Failure(error) from the source
+        """
+        values = [value for value in values if value is not None]
+        found: dict[Any, str] = {}
+        missing = []
+        for value in dict.fromkeys(values):
+            if value in self._display_by_value:
+                self._display_by_value.move_to_end(value)
+                found[value] = self._display_by_value[value]
+            elif value in self._unknown_values:
+                self._unknown_values.move_to_end(value)
+            else:
+                missing.append(value)
+        if missing:
+            result = self._source.resolve(missing)
+            if result.is_failure():
+                return Failure(result.error)
+            for value in missing:
+                if value in result.value:
+                    found[value] = result.value[value]
+                    self._remember(value, result.value[value])
+                else:
+                    self._remember_unknown(value)
+        return Success({value: found[value] for value in values if value in found})
+
+    def get_display_text(self, value: Any) -> Optional[str]:
+        """Get the display text of one value.
+
+        Args:
+            value: Option value
+
+        Returns:
+            Display text, or None if the value is unknown or the source failed
+        """
+        result = self.resolve_display_texts((value,))
+        if result.is_failure():
+            return None
+        return result.value.get(value)
+
+    def contains(self, value: Any) -> bool:
+        """Check if value is one of the field's options."""
+        return self.get_display_text(value) is not None
+
+    def create_completer(
+        self, match_mode: LookupMatchMode = LookupMatchMode.SUBSTRING
+    ) -> "TypeAheadCompleter":
+        """Create a type-ahead completer backed by this service."""
+        return TypeAheadCompleter(self, match_mode)
+
+    def invalidate(self) -> None:
+        """Drop cached pages and display texts (after the records changed)."""
+        self._pages.clear()
+        self._display_by_value.clear()
+        self._unknown_values.clear()
+
+    def _remember(self, value: Any, display_text: str) -> None:
+        self._display_by_value[value] = display_text
+        self._display_by_value.move_to_end(value)
+        self._unknown_values.pop(value, None)
+        if len(self._display_by_value) > self._max_cached_values:
+            self._display_by_value.popitem(last=False)
+
+    def _remember_unknown(self, value: Any) -> None:
+        self._unknown_values[value] = None
+        self._unknown_values.move_to_end(value)
+        if len(self._unknown_values) > self._max_cached_values:
+            self._unknown_values.popitem(last=False)
+
+
+class TypeAheadCompleter:
+    """Incremental completion for one LOOKUP input.
+
+    When the new text extends the previous one and the previous result was
+    complete (a single page), every match of the new text is already in
+    that result: it is filtered in memory without querying the source.
+
+    Example:
+        completer = service.create_completer()
+        completer.update("b").value      # source query
+        completer.update("bh").value     # filtered in memory if "b" fit one page
+        completer.next_page()            # further matches of "bh"
+    """
+
+    def __init__(
+        self,
+        service: LookupSourceService,
+        match_mode: LookupMatchMode = LookupMatchMode.SUBSTRING,
+    ) -> None:
+        """Initialize TypeAheadCompleter.
+
+        Args:
+            service: Lookup source service of the field
+            match_mode: Prefix or substring matching
+        """
+        self._service = service
+        self._match_mode = match_mode
+        self._page: Optional[LookupPageDTO] = None
+
+    @property
+    def current_page(self) -> Optional[LookupPageDTO]:
+        """Last page returned (None before the first update)."""
+        return self._page
+
+    def update(self, text: str) -> Result[LookupPageDTO, str]:
+        """Get the first page of completions for the current input text.
+
+        Args:
+            text: Current input text
+
+        Returns:
+            Success(LookupPageDTO) or Failure(error) from the source
+        """
+        previous = self._page
+        if (
+            previous is not None
+            and previous.is_complete
+            and fold_lookup_text(text).startswith(fold_lookup_text(previous.query))
+        ):
+            folded = fold_lookup_text(text)
+            self._page = LookupPageDTO(
+                query=text,
+                match_mode=self._match_mode.value,
+                page_index=0,
+                options=tuple(
+                    option
+                    for option in previous.options
+                    if self._match_mode.matches(fold_lookup_text(option.display_text), folded)
+                ),
+                has_more=False,
+            )
+            return Success(self._page)
+
+        result = self._service.get_page(text, self._match_mode, 0)
+        if result.is_success():
+            self._page = result.value
+        return result
+
+    def next_page(self) -> Result[Optional[LookupPageDTO], str]:
+        """Get the next page of completions for the current text.
+
+        Returns:
+            Success(LookupPageDTO), Success(None) if there are no more
+            pages, or Failure(error) from the source
+        """
+        if self._page is None or not self._page.has_more:
+            return Success(None)
+        result = self._service.get_page(
+            self._page.query, self._match_mode, self._page.page_index + 1
+        )
+        if result.is_failure():
+            return Failure(result.error)
+        self._page = result.value
+        return Success(self._page)
@@ -0,0 +1,491 @@
+"""Indexed schema diff engine (Phase 3).
+
+Diffs two schema states by comparing a canonical form of every field: the
+structural attributes compared under Decision 7 (type, required flag,
+constraints, choice option values). Entities are indexed by their field
+forms, so identical entities and fields are skipped with a single
+C-level equality check instead of attribute-by-attribute comparison.
+Stable fingerprints (SHA-256 of the canonical form) are derived from the
+same forms on demand, for callers that need persistent keys.
+
+The result is a change tree (schema -> entity -> field -> changes) whose
+lower levels are only built when expanded: an import preview that only
+needs the changed entity list never compares a single field.
+
+APPROVED DECISIONS:
+- Decision 2: No rename detection (rename = delete + add)
+- Decision 7: Structural comparison only
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, Optional
+
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.schema_change import ChangeType, SchemaChange
+
+
+class DiffStatus(str, Enum):
+    """How a node of the change tree differs from the source schema."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    MODIFIED = "modified"
+
+
+def field_canonical_form(field_def: FieldDefinition) -> tuple:
+    """Canonical form of the structural attributes of a field (Decision 7).
+
+    Translation keys, help text and default values are excluded. Fields
+    with equal forms produce no SchemaChange; the converse does not quite
+    hold (e.g. reordered constraints), so differing fields are still
+    confirmed by a detailed comparison.
+
+    Args:
+        field_def: Field definition
+
+    Returns:
+        Tuple of (field type, required, constraints, option values)
+    """
+    options: frozenset = frozenset()
+    if field_def.options and field_def.is_choice_field:
+        options = frozenset(opt[0] for opt in field_def.options)
+    return (field_def.field_type, field_def.required, field_def.constraints, options)
+
+
+def fingerprint(form: tuple) -> str:
+    """Stable hash of a field canonical form (independent of hash randomization).
+
+    Args:
+        form: Result of field_canonical_form
+
+    Returns:
+        SHA-256 hex digest
+    """
+    field_type, required, constraints, options = form
+    canonical = (
+        field_type.value,
+        required,
+        tuple(sorted((type(c).__name__, repr(c)) for c in constraints)),
+        tuple(sorted(repr(value) for value in options)),
+    )
+    return hashlib.sha256(repr(canonical).encode("utf-8")).hexdigest()
+
+
+class SchemaIndex:
+    """Canonical-form index of one schema state.
+
+    Built once per schema state (O(fields)) and reusable across diffs,
+    e.g. as the common base of a three-way diff.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[EntityDefinition],
+        relationships: Iterable = (),
+    ) -> None:
+        """Index entities and relationships.
+
+        Args:
+            entities: EntityDefinition instances of the schema
+            relationships: RelationshipDefinition instances of the schema
+        """
+        self.fields: dict[str, dict[str, FieldDefinition]] = {}
+        self.forms: dict[str, dict[str, tuple]] = {}
+        for entity in entities:
+            fields = {f.id.value: f for f in entity.get_all_fields()}
+            self.fields[entity.id.value] = fields
+            self.forms[entity.id.value] = {
+                field_id: field_canonical_form(f) for field_id, f in fields.items()
+            }
+
+        self.relationship_ids: frozenset[str] = frozenset(
+            r.id.value for r in relationships
+        )
+        self._entity_fingerprints: dict[str, str] = {}
+
+    def field_fingerprint(self, entity_id: str, field_id: str) -> str:
+        """Stable fingerprint of one field."""
+        return fingerprint(self.forms[entity_id][field_id])
+
+    def entity_fingerprint(self, entity_id: str) -> str:
+        """Stable fingerprint of one entity (its sorted field fingerprints)."""
+        if entity_id not in self._entity_fingerprints:
+            field_prints = tuple(
+                (field_id, fingerprint(form))
+                for field_id, form in sorted(self.forms[entity_id].items())
+            )
+            self._entity_fingerprints[entity_id] = hashlib.sha256(
+                repr(field_prints).encode("utf-8")
+            ).hexdigest()
+        return self._entity_fingerprints[entity_id]
+
+
+class FieldDiffNode:
+    """Leaf of the change tree: one added, removed or modified field."""
+
+    def __init__(
+        self,
+        entity_id: str,
+        field_id: str,
+        status: DiffStatus,
+        source_field: Optional[FieldDefinition],
+        target_field: Optional[FieldDefinition],
+    ) -> None:
+        self.entity_id = entity_id
+        self.field_id = field_id
+        self.status = status
+        self.source_field = source_field
+        self.target_field = target_field
+        self._changes: Optional[tuple[SchemaChange, ...]] = None
+
+    @property
+    def changes(self) -> tuple[SchemaChange, ...]:
+        """Changes of this field (computed on first access)."""
+        if self._changes is None:
+            if self.status == DiffStatus.ADDED:
+                self._changes = (SchemaChange(
+                    change_type=ChangeType.FIELD_ADDED,
+                    entity_id=self.entity_id,
+                    field_id=self.field_id,
+                ),)
+            elif self.status == DiffStatus.REMOVED:
+                self._changes = (SchemaChange(
+                    change_type=ChangeType.FIELD_REMOVED,
+                    entity_id=self.entity_id,
+                    field_id=self.field_id,
+                ),)
+            else:
+                self._changes = _field_detail_changes(
+                    self.entity_id, self.field_id, self.source_field, self.target_field
+                )
+        return self._changes
+
+
+class EntityDiffNode:
+    """Entity node of the change tree.
+
+    Added and removed entities carry a single entity-level change. For a
+    modified entity only fields whose canonical forms differ are expanded.
+    """
+
+    def __init__(
+        self,
+        entity_id: str,
+        status: DiffStatus,
+        source: SchemaIndex,
+        target: SchemaIndex,
+    ) -> None:
+        self.entity_id = entity_id
+        self.status = status
+        self._source = source
+        self._target = target
+        self._fields: Optional[tuple[FieldDiffNode, ...]] = None
+        self._changes: Optional[tuple[SchemaChange, ...]] = None
+
+    @property
+    def fields(self) -> tuple[FieldDiffNode, ...]:
+        """Changed fields, sorted by ID (expanded on first access)."""
+        if self._fields is None:
+            self._fields = self._expand_fields() if self.status == DiffStatus.MODIFIED else ()
+        return self._fields
+
+    @property
+    def changes(self) -> tuple[SchemaChange, ...]:
+        """All changes in this entity's subtree."""
+        if self._changes is None:
+            if self.status == DiffStatus.ADDED:
+                self._changes = (SchemaChange(
+                    change_type=ChangeType.ENTITY_ADDED, entity_id=self.entity_id
+                ),)
+            elif self.status == DiffStatus.REMOVED:
+                self._changes = (SchemaChange(
+                    change_type=ChangeType.ENTITY_REMOVED, entity_id=self.entity_id
+                ),)
+            else:
+                self._changes = tuple(
+                    change for node in self.fields for change in node.changes
+                )
+        return self._changes
+
+    def _expand_fields(self) -> tuple[FieldDiffNode, ...]:
+        """Build nodes for fields whose canonical forms differ."""
+        source_forms = self._source.forms[self.entity_id]
+        target_forms = self._target.forms[self.entity_id]
+        source_fields = self._source.fields[self.entity_id]
+        target_fields = self._target.fields[self.entity_id]
+
+        nodes: list[FieldDiffNode] = []
+        for field_id in sorted(source_forms.keys() | target_forms.keys()):
+            source_form = source_forms.get(field_id)
+            target_form = target_forms.get(field_id)
+            if source_form == target_form:
+                continue
+            if source_form is None:
+                status = DiffStatus.ADDED
+            elif target_form is None:
+                status = DiffStatus.REMOVED
+            else:
+                status = DiffStatus.MODIFIED
+            node = FieldDiffNode(
+                self.entity_id,
+                field_id,
+                status,
+                source_fields.get(field_id),
+                target_fields.get(field_id),
+            )
+            # Forms can differ without a structural change (e.g. the same
+            # constraints in another order); such fields are dropped
+            if node.changes:
+                nodes.append(node)
+        return tuple(nodes)
+
+
+class SchemaDiff:
+    """Change tree between a source and a target schema state.
+
+    Usage:
+        diff = SchemaDiff(SchemaIndex(source_entities), SchemaIndex(target_entities))
+        for entity_node in diff.entities:       # cheap: form equality only
+            ...
+        entity_node.fields                      # expands one entity
+        diff.changes                            # expands everything
+    """
+
+    def __init__(self, source: SchemaIndex, target: SchemaIndex) -> None:
+        self.source = source
+        self.target = target
+        self._entities: Optional[tuple[EntityDiffNode, ...]] = None
+        self._changes: Optional[tuple[SchemaChange, ...]] = None
+
+    @property
+    def entities(self) -> tuple[EntityDiffNode, ...]:
+        """Entities whose field forms differ, sorted by ID."""
+        if self._entities is None:
+            source_forms = self.source.forms
+            target_forms = self.target.forms
+            nodes: list[EntityDiffNode] = []
+            for entity_id in sorted(source_forms.keys() | target_forms.keys()):
+                source_form = source_forms.get(entity_id)
+                target_form = target_forms.get(entity_id)
+                if source_form == target_form:
+                    continue
+                if source_form is None:
+                    status = DiffStatus.ADDED
+                elif target_form is None:
+                    status = DiffStatus.REMOVED
+                else:
+                    status = DiffStatus.MODIFIED
+                nodes.append(EntityDiffNode(entity_id, status, self.source, self.target))
+            self._entities = tuple(nodes)
+        return self._entities
+
+    def entity(self, entity_id: str) -> Optional[EntityDiffNode]:
+        """Get the node of one entity, or None if it is unchanged."""
+        for node in self.entities:
+            if node.entity_id == entity_id:
+                return node
+        return None
+
+    @property
+    def relationship_changes(self) -> tuple[SchemaChange, ...]:
+        """Relationships added or removed (ADD-ONLY per ADR-022, so by ID)."""
+        source_ids = self.source.relationship_ids
+        target_ids = self.target.relationship_ids
+        added = tuple(
+            SchemaChange(change_type=ChangeType.RELATIONSHIP_ADDED, relationship_id=rel_id)
+            for rel_id in sorted(target_ids - source_ids)
+        )
+        removed = tuple(
+            SchemaChange(change_type=ChangeType.RELATIONSHIP_REMOVED, relationship_id=rel_id)
+            for rel_id in sorted(source_ids - target_ids)
+        )
+        return added + removed
+
+    @property
+    def changes(self) -> tuple[SchemaChange, ...]:
+        """Flat list of all changes: entities, then fields, then relationships."""
+        if self._changes is None:
+            entity_level = [
+                node.changes[0] for node in self.entities if node.status != DiffStatus.MODIFIED
+            ]
+            field_level = [
+                change
+                for node in self.entities
+                if node.status == DiffStatus.MODIFIED
+                for change in node.changes
+            ]
+            self._changes = tuple(entity_level + field_level) + self.relationship_changes
+        return self._changes
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if the schemas differ structurally."""
+        return len(self.changes) > 0
+
+
+@dataclass(frozen=True)
+class SchemaConflict:
+    """An entity or field changed differently on both sides of a three-way diff.
+
+    Attributes:
+        entity_id: Conflicting entity
+        field_id: Conflicting field (None for an entity-level conflict)
+        ours: How our side changed it relative to the base
+        theirs: How their side changed it relative to the base
+    """
+
+    entity_id: str
+    field_id: Optional[str]
+    ours: DiffStatus
+    theirs: DiffStatus
+
+
+class ThreeWaySchemaDiff:
+    """Diffs of two schema states against their common base.
+
+    Changes made on only one side, or identically on both, never conflict.
+    An entity or field changed on both sides to different results does.
+    """
+
+    def __init__(self, base: SchemaIndex, ours: SchemaIndex, theirs: SchemaIndex) -> None:
+        self.base = base
+        self.ours = SchemaDiff(base, ours)
+        self.theirs = SchemaDiff(base, theirs)
+        self._conflicts: Optional[tuple[SchemaConflict, ...]] = None
+
+    @property
+    def conflicts(self) -> tuple[SchemaConflict, ...]:
+        """Conflicting entities and fields, sorted by location."""
+        if self._conflicts is None:
+            ours_nodes = {node.entity_id: node for node in self.ours.entities}
+            theirs_nodes = {node.entity_id: node for node in self.theirs.entities}
+            ours_forms = self.ours.target.forms
+            theirs_forms = self.theirs.target.forms
+
+            conflicts: list[SchemaConflict] = []
+            for entity_id in sorted(ours_nodes.keys() & theirs_nodes.keys()):
+                if ours_forms.get(entity_id) == theirs_forms.get(entity_id):
+                    continue  # Same change on both sides
+                ours_node = ours_nodes[entity_id]
+                theirs_node = theirs_nodes[entity_id]
+                if ours_node.status == theirs_node.status == DiffStatus.MODIFIED:
+                    conflicts.extend(self._field_conflicts(entity_id))
+                else:
+                    conflicts.append(SchemaConflict(
+                        entity_id, None, ours_node.status, theirs_node.status
+                    ))
+            self._conflicts = tuple(conflicts)
+        return self._conflicts
+
+    @property
+    def has_conflicts(self) -> bool:
+        """Check if any entity or field conflicts."""
+        return len(self.conflicts) > 0
+
+    def _field_conflicts(self, entity_id: str) -> list[SchemaConflict]:
+        """Fields of an entity modified on both sides to different results."""
+        base_forms = self.base.forms[entity_id]
+        ours_forms = self.ours.target.forms[entity_id]
+        theirs_forms = self.theirs.target.forms[entity_id]
+
+        conflicts: list[SchemaConflict] = []
+        for field_id in sorted(ours_forms.keys() | theirs_forms.keys()):
+            base_form = base_forms.get(field_id)
+            ours_form = ours_forms.get(field_id)
+            theirs_form = theirs_forms.get(field_id)
+            if ours_form == theirs_form or base_form in (ours_form, theirs_form):
+                continue
+            conflicts.append(SchemaConflict(
+                entity_id,
+                field_id,
+                _status_of(base_form, ours_form),
+                _status_of(base_form, theirs_form),
+            ))
+        return conflicts
+
+
+def _status_of(base_form: Optional[tuple], side_form: Optional[tuple]) -> DiffStatus:
+    """Classify a changed field relative to the base."""
+    if base_form is None:
+        return DiffStatus.ADDED
+    if side_form is None:
+        return DiffStatus.REMOVED
+    return DiffStatus.MODIFIED
+
+
+def _field_detail_changes(
+    entity_id: str,
+    field_id: str,
+    source_field: FieldDefinition,
+    target_field: FieldDefinition,
+) -> tuple[SchemaChange, ...]:
+    """Compare the structural details of a field present in both schemas.
+
+    Structural comparison only (Decision 7): field type, required flag,
+    constraints and choice options. Translation keys, help text keys and
+    default values are excluded.
+    """
+    changes: list[SchemaChange] = []
+
+    # Field type changed (BREAKING)
+    if source_field.field_type != target_field.field_type:
+        changes.append(SchemaChange(
+            change_type=ChangeType.FIELD_TYPE_CHANGED,
+            entity_id=entity_id,
+            field_id=field_id,
+            old_value=source_field.field_type.value,
+            new_value=target_field.field_type.value,
+        ))
+
+    # Required changed (non-breaking)
+    if source_field.required != target_field.required:
+        changes.append(SchemaChange(
+            change_type=ChangeType.FIELD_REQUIRED_CHANGED,
+            entity_id=entity_id,
+            field_id=field_id,
+            old_value=str(source_field.required),
+            new_value=str(target_field.required),
+        ))
+
+    # Constraints, keyed by constraint type
+    source_constraints = {type(c).__name__: c for c in source_field.constraints}
+    target_constraints = {type(c).__name__: c for c in target_field.constraints}
+    for constraint_type in sorted(source_constraints.keys() | target_constraints.keys()):
+        if constraint_type not in source_constraints:
+            change_type = ChangeType.CONSTRAINT_ADDED
+        elif constraint_type not in target_constraints:
+            change_type = ChangeType.CONSTRAINT_REMOVED
+        elif source_constraints[constraint_type] != target_constraints[constraint_type]:
+            change_type = ChangeType.CONSTRAINT_MODIFIED
+        else:
+            continue
+        changes.append(SchemaChange(
+            change_type=change_type,
+            entity_id=entity_id,
+            field_id=field_id,
+            constraint_type=constraint_type,
+        ))
+
+    # Options for choice fields (values only, label keys ignored)
+    if source_field.is_choice_field or target_field.is_choice_field:
+        source_options = {opt[0] for opt in source_field.options}
+        target_options = {opt[0] for opt in target_field.options}
+        for option_value in sorted(target_options - source_options, key=str):
+            changes.append(SchemaChange(
+                change_type=ChangeType.OPTION_ADDED,
+                entity_id=entity_id,
+                field_id=field_id,
+                option_value=str(option_value),
+            ))
+        for option_value in sorted(source_options - target_options, key=str):
+            changes.append(SchemaChange(
+                change_type=ChangeType.OPTION_REMOVED,
+                entity_id=entity_id,
+                field_id=field_id,
+                option_value=str(option_value),
+            ))
+
+    return tuple(changes)
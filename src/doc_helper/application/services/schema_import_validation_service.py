@@ -23,11 +23,16 @@ VALIDATION LAYERS:
 1. JSON Structure Validation
 2. Schema Content Validation
 3. Domain Object Conversion
+
+Layers 2 and 3 run one entity at a time, in entity order. In fail-fast
+mode (max_errors) validation stops as soon as that many errors are known.
+All control rule checks share one formula parse cache.
 """
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from doc_helper.application.dto.control_rule_dto import ControlRuleType
 from doc_helper.application.dto.export_dto import (
@@ -47,6 +52,7 @@ from doc_helper.application.dto.import_dto import (
 )
 from doc_helper.domain.common.i18n import TranslationKey
 from doc_helper.domain.common.result import Failure, Result, Success
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
 from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.field_definition import FieldDefinition
 from doc_helper.domain.schema.field_type import FieldType
@@ -94,6 +100,30 @@ KNOWN_CONTROL_RULE_TYPES = {"VISIBILITY", "ENABLED", "REQUIRED"}
 KNOWN_OUTPUT_MAPPING_TARGETS = {"TEXT", "NUMBER", "BOOLEAN"}
 
 
+@dataclass(frozen=True)
+class _EntityOutcome:
+    """Result of checking one import entity (layers 2 and 3).
+
+    Attributes:
+        structure_errors: Entity or field structure errors (layer 2)
+        entity_id: Entity ID if the entity-level structure is valid
+        entity: Converted entity if conversion succeeded
+        conversion_errors: Conversion/formula errors (layer 3)
+        warnings: Non-blocking warnings raised during conversion
+    """
+
+    structure_errors: tuple[ImportValidationError, ...]
+    entity_id: Optional[str] = None
+    entity: Optional[EntityDefinition] = None
+    conversion_errors: tuple[ImportValidationError, ...] = ()
+    warnings: tuple[ImportWarning, ...] = ()
+
+    @property
+    def errors(self) -> tuple[ImportValidationError, ...]:
+        """Errors this entity contributes (structure errors take precedence)."""
+        return self.structure_errors or self.conversion_errors
+
+
 class SchemaImportValidationService:
     """Service for validating and parsing schema import files.
 
@@ -111,8 +141,38 @@ class SchemaImportValidationService:
             parsed = result.value
             entities = parsed["entities"]
             warnings = parsed["warnings"]
+
+    Fail-fast usage (first 50 errors, as soon as they are found):
+        service = SchemaImportValidationService(max_errors=50)
     """
 
+    # Error limit used by the Schema Designer import (fail-fast mode)
+    FAIL_FAST_ERROR_LIMIT = 50
+
+    def __init__(
+        self,
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """Initialize service.
+
+        Args:
+            max_errors: Stop validating once this many errors are found
+                (None = report every error, the default)
+        """
+        # Import locally to avoid circular import
+        from doc_helper.application.usecases.control_rule_usecases import ControlRuleUseCases
+        from doc_helper.application.usecases.formula_usecases import FormulaUseCases
+
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be positive")
+        self._max_errors = max_errors
+
+        # One parse per distinct formula text across the whole import
+        self._parse_cache = FormulaParseCache()
+        self._control_rule_usecases = ControlRuleUseCases(
+            formula_usecases=FormulaUseCases(parse_cache=self._parse_cache),
+        )
+
     def validate_and_parse(
         self,
         file_path: Path,
@@ -153,22 +213,7 @@ class SchemaImportValidationService:
                 message=f"Failed to read file: {e}",
             ),))
 
-        # Layer 2: Structure validation
-        structure_result = self._validate_structure(data)
-        if structure_result.is_failure():
-            return structure_result
-
-        # Layer 2: Content validation
-        content_result = self._validate_content(data)
-        if content_result.is_failure():
-            return content_result
-
-        # Layer 3: Convert to domain objects
-        conversion_result = self._convert_to_domain_objects(data)
-        if conversion_result.is_failure():
-            return conversion_result
-
-        return conversion_result
+        return self.validate_json_data(data)
 
     def validate_json_data(
         self,
@@ -187,13 +232,71 @@ class SchemaImportValidationService:
         if structure_result.is_failure():
             return structure_result
 
+        # Layers 2-3 per entity, consumed in entity order
+        outcomes: list[_EntityOutcome] = []
+        reported: list[ImportValidationError] = []
+        entity_outcomes = self._entity_outcomes(data["entities"])
+        try:
+            for outcome in entity_outcomes:
+                outcomes.append(outcome)
+                if self._max_errors is not None and outcome.errors:
+                    reported.extend(outcome.errors)
+                    if len(reported) >= self._max_errors:
+                        # Fail fast: pending entity checks are cancelled
+                        return Failure(tuple(reported[:self._max_errors]))
+        finally:
+            entity_outcomes.close()
+
         # Layer 2: Content validation
-        content_result = self._validate_content(data)
+        content_result = self._validate_content(data, outcomes)
         if content_result.is_failure():
             return content_result
 
         # Layer 3: Convert to domain objects
-        return self._convert_to_domain_objects(data)
+        return self._convert_to_domain_objects(data, outcomes)
+
+    def _entity_outcomes(self, entities: list) -> Iterator[_EntityOutcome]:
+        """Check entities one by one, yielding each outcome in entity order.
+
+        The checks are pure Python, so worker threads would only contend
+        for the GIL; closing the generator skips the remaining entities.
+        """
+        for i, entity_data in enumerate(entities):
+            yield self._check_entity(entity_data, i)
+
+    def _check_entity(self, entity_data: dict, index: int) -> _EntityOutcome:
+        """Validate one entity's structure and, if valid, convert it."""
+        entity_location = f"entities[{index}]"
+
+        # Validate entity structure
+        entity_errors = self._validate_entity_structure(entity_data, entity_location)
+        if entity_errors:
+            return _EntityOutcome(structure_errors=tuple(entity_errors))
+
+        # Only validate fields if entity is valid
+        entity_id = entity_data.get("id", "")
+        field_errors: list[ImportValidationError] = []
+        for j, field in enumerate(entity_data.get("fields", [])):
+            field_location = f"{entity_location}.fields[{j}]"
+            field_errors.extend(self._validate_field_structure(field, field_location))
+        if field_errors:
+            return _EntityOutcome(structure_errors=tuple(field_errors), entity_id=entity_id)
+
+        warnings: list[ImportWarning] = []
+        entity_result = self._convert_entity(entity_data, index, warnings)
+        if entity_result.is_failure():
+            return _EntityOutcome(
+                structure_errors=(),
+                entity_id=entity_id,
+                conversion_errors=tuple(entity_result.error),
+                warnings=tuple(warnings),
+            )
+        return _EntityOutcome(
+            structure_errors=(),
+            entity_id=entity_id,
+            entity=entity_result.value,
+            warnings=tuple(warnings),
+        )
 
     def _validate_structure(self, data: dict) -> Result[None, tuple]:
         """Layer 2: Validate JSON structure.
@@ -268,7 +371,11 @@ class SchemaImportValidationService:
 
         return Success(None)
 
-    def _validate_content(self, data: dict) -> Result[None, tuple]:
+    def _validate_content(
+        self,
+        data: dict,
+        outcomes: list[_EntityOutcome],
+    ) -> Result[None, tuple]:
         """Layer 2: Validate schema content.
 
         Checks:
@@ -277,25 +384,14 @@ class SchemaImportValidationService:
         - All constraint types are known
         - All relationship structures are valid (Phase 6A)
         """
-        errors: list[ImportValidationError] = []
-
-        entities = data.get("entities", [])
-        entity_ids = set()  # Collect entity IDs for relationship validation
-
-        for i, entity in enumerate(entities):
-            entity_location = f"entities[{i}]"
-
-            # Validate entity structure
-            entity_errors = self._validate_entity_structure(entity, entity_location)
-            errors.extend(entity_errors)
+        errors: list[ImportValidationError] = [
+            error for outcome in outcomes for error in outcome.structure_errors
+        ]
 
-            if not entity_errors:  # Only validate fields if entity is valid
-                entity_ids.add(entity.get("id", ""))
-                fields = entity.get("fields", [])
-                for j, field in enumerate(fields):
-                    field_location = f"{entity_location}.fields[{j}]"
-                    field_errors = self._validate_field_structure(field, field_location)
-                    errors.extend(field_errors)
+        # Collect entity IDs for relationship validation
+        entity_ids = {
+            outcome.entity_id for outcome in outcomes if outcome.entity_id is not None
+        }
 
         # Validate relationships (Phase 6A - ADR-022)
         relationships = data.get("relationships", [])
@@ -307,6 +403,8 @@ class SchemaImportValidationService:
             errors.extend(rel_errors)
 
         if errors:
+            if self._max_errors is not None:
+                errors = errors[:self._max_errors]
             return Failure(tuple(errors))
 
         return Success(None)
@@ -935,8 +1033,12 @@ class SchemaImportValidationService:
 
         return errors
 
-    def _convert_to_domain_objects(self, data: dict) -> Result[dict, tuple]:
-        """Layer 3: Convert validated JSON to domain objects."""
+    def _convert_to_domain_objects(
+        self,
+        data: dict,
+        outcomes: list[_EntityOutcome],
+    ) -> Result[dict, tuple]:
+        """Layer 3: Collect converted entities and convert relationships."""
         warnings: list[ImportWarning] = []
         entities: list[EntityDefinition] = []
         relationships: list[RelationshipDefinition] = []
@@ -944,11 +1046,11 @@ class SchemaImportValidationService:
         schema_id = data["schema_id"]
         version = data.get("version")
 
-        for i, entity_data in enumerate(data["entities"]):
-            entity_result = self._convert_entity(entity_data, i, warnings)
-            if entity_result.is_failure():
-                return entity_result
-            entities.append(entity_result.value)
+        for outcome in outcomes:
+            warnings.extend(outcome.warnings)
+            if outcome.conversion_errors:
+                return Failure(outcome.conversion_errors)
+            entities.append(outcome.entity)
 
         # Convert relationships (Phase 6A - ADR-022)
         for i, rel_data in enumerate(data.get("relationships", [])):
@@ -1055,16 +1157,13 @@ class SchemaImportValidationService:
 
         Per Phase F-10 spec: Reject on invalid rule (no silent dropping).
         """
-        # Import locally to avoid circular import
-        from doc_helper.application.usecases.control_rule_usecases import ControlRuleUseCases
-
         errors: list[ImportValidationError] = []
 
         # Build schema_fields from converted fields
         schema_fields = self._build_schema_fields(fields)
 
-        # Create ControlRuleUseCases for validation
-        control_rule_usecases = ControlRuleUseCases()
+        # Shared ControlRuleUseCases (one formula parse cache per import)
+        control_rule_usecases = self._control_rule_usecases
 
         # Validate control rules for each field
         for field_idx, field_def in enumerate(fields.values()):
@@ -16,8 +16,9 @@ from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.field_definition import FieldDefinition
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
 from doc_helper.domain.schema.schema_repository import ISchemaRepository
+from doc_helper.domain.validation.validation_plan import ValidationPlan
 from doc_helper.domain.validation.validation_result import ValidationResult
-from doc_helper.domain.validation.validators import get_validator_for_field_type
+from doc_helper.domain.validation.validators import IValidator, get_validator_for_field_type
 
 
 class ValidationService:
@@ -27,10 +28,14 @@ class ValidationService:
     applying constraints from field definitions.
 
     RULES (IMPLEMENTATION_RULES.md Section 5):
-    - Service is stateless (no instance state)
+    - Service is stateless (no instance state beyond compiled-validator caches)
     - Service coordinates domain logic, doesn't contain it
     - Returns ValidationResult (immutable value object)
 
+    Validators are compiled once per schema version: a ValidationPlan per
+    entity definition (recompiled when its fields or constraints change)
+    and one validator per (field type, constraints) for validate_field().
+
     Example:
         service = ValidationService(project_repo, schema_repo)
         result = service.validate_by_project_id(project_id)
@@ -52,6 +57,26 @@ class ValidationService:
         """
         self._project_repository = project_repository
         self._schema_repository = schema_repository
+        self._plans: dict[EntityDefinitionId, ValidationPlan] = {}
+        self._validators: dict[tuple, IValidator] = {}
+
+    def get_plan(self, entity_definition: EntityDefinition) -> ValidationPlan:
+        """Get the compiled validation plan for an entity definition.
+
+        The cached plan is reused while the definition's fields and
+        constraints are unchanged and recompiled otherwise.
+
+        Args:
+            entity_definition: Entity definition with field constraints
+
+        Returns:
+            ValidationPlan for the entity definition
+        """
+        plan = self._plans.get(entity_definition.id)
+        if plan is None or plan.signature != ValidationPlan.signature_of(entity_definition):
+            plan = ValidationPlan(entity_definition)
+            self._plans[entity_definition.id] = plan
+        return plan
 
     def validate_by_project_id(
         self,
@@ -143,30 +168,10 @@ class ValidationService:
         if not isinstance(entity_definition, EntityDefinition):
             raise TypeError("entity_definition must be an EntityDefinition")
 
-        all_errors = []
-
-        # Validate each field value
-        for field_id, field_value in project.field_values.items():
-            # Get field definition
-            field_def = entity_definition.fields.get(field_id)
-            if field_def is None:
-                # Skip fields not in definition (orphaned fields)
-                continue
-
-            # Validate field
-            result = self.validate_field(
-                field_path=field_id.value,
-                value=field_value.value,
-                field_definition=field_def,
-            )
-
-            # Collect errors
-            if result.is_invalid():
-                all_errors.extend(result.errors)
-
-        if all_errors:
-            return ValidationResult.failure(tuple(all_errors))
-        return ValidationResult.success()
+        # Validate each field value (orphaned fields are skipped by the plan)
+        return self.get_plan(entity_definition).validate(
+            {field_id: field_value.value for field_id, field_value in project.field_values.items()}
+        )
 
     def validate_field(
         self,
@@ -189,11 +194,20 @@ class ValidationService:
         if not isinstance(field_definition, FieldDefinition):
             raise TypeError("field_definition must be a FieldDefinition")
 
-        # Get validator for field type
-        validator = get_validator_for_field_type(
-            field_type=field_definition.field_type,
-            constraints=field_definition.constraints,
-        )
+        # Get validator for field type (built once per type and constraints)
+        key = (field_definition.field_type, field_definition.constraints)
+        try:
+            validator = self._validators.get(key)
+        except TypeError:
+            # Unhashable constraint parameters: build an uncached validator
+            key, validator = None, None
+        if validator is None:
+            validator = get_validator_for_field_type(
+                field_type=field_definition.field_type,
+                constraints=field_definition.constraints,
+            )
+            if key is not None:
+                self._validators[key] = validator
 
         # Validate field
         return validator.validate(field_path=field_path, value=value)
@@ -217,25 +231,4 @@ class ValidationService:
         if not isinstance(entity_definition, EntityDefinition):
             raise TypeError("entity_definition must be an EntityDefinition")
 
-        all_errors = []
-
-        for field_id, value in field_values.items():
-            # Get field definition
-            field_def = entity_definition.fields.get(field_id)
-            if field_def is None:
-                continue
-
-            # Validate field
-            result = self.validate_field(
-                field_path=field_id.value,
-                value=value,
-                field_definition=field_def,
-            )
-
-            # Collect errors
-            if result.is_invalid():
-                all_errors.extend(result.errors)
-
-        if all_errors:
-            return ValidationResult.failure(tuple(all_errors))
-        return ValidationResult.success()
+        return self.get_plan(entity_definition).validate(field_values)
@@ -9,16 +9,18 @@ RULE 0 ENFORCEMENT:
 - Returns primitives/DTOs to Presentation (no domain types)
 
 This class wraps:
-- GenerateDocumentCommand (generate document)
+- GenerateDocumentCommand (pre-generation runtime evaluation, generate document)
 """
 
 from pathlib import Path
 from typing import Union
+from uuid import UUID
 
 from doc_helper.application.commands.generate_document_command import (
     GenerateDocumentCommand,
 )
 from doc_helper.application.dto import DocumentFormatDTO
+from doc_helper.application.dto.runtime_dto import ProjectRuntimeEvaluationResultDTO
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.document.document_format import DocumentFormat
 from doc_helper.domain.project.project_ids import ProjectId
@@ -55,6 +57,27 @@ class DocumentUseCases:
         """
         self._generate_document_command = generate_document_command
 
+    def evaluate_pre_generation(
+        self, project_id: str
+    ) -> Result[ProjectRuntimeEvaluationResultDTO, str]:
+        """Evaluate a project for the pre-generation checklist.
+
+        Returns the same runtime result that generate_document() blocks on.
+
+        Args:
+            project_id: Project ID as string
+
+        Returns:
+            Success(ProjectRuntimeEvaluationResultDTO) or Failure(error)
+        """
+        domain_project_id_result = self._convert_project_id(project_id)
+        if domain_project_id_result.is_failure():
+            return Failure(domain_project_id_result.error)
+
+        return self._generate_document_command.evaluate_runtime(
+            domain_project_id_result.value
+        )
+
     def generate_document(
         self,
         project_id: str,
@@ -73,12 +96,12 @@ class DocumentUseCases:
         Returns:
             Success(output_path) if generated, Failure(error) otherwise
         """
-        # Validate inputs
-        if not project_id:
-            return Failure("project_id cannot be empty")
-
         # Convert string to domain ID (Application layer responsibility)
-        domain_project_id = ProjectId(project_id)
+        domain_project_id_result = self._convert_project_id(project_id)
+        if domain_project_id_result.is_failure():
+            return Failure(domain_project_id_result.error)
+
+        domain_project_id = domain_project_id_result.value
 
         # Convert DTO to domain enum (Application layer responsibility)
         domain_format_result = self._convert_format_dto_to_domain(format_dto)
@@ -95,6 +118,24 @@ class DocumentUseCases:
             format=domain_format,
         )
 
+    @staticmethod
+    def _convert_project_id(project_id: str) -> Result[ProjectId, str]:
+        """Convert string to ProjectId.
+
+        Args:
+            project_id: Project ID as string (UUID format)
+
+        Returns:
+            Success(ProjectId) or Failure(error)
+        """
+        if not project_id:
+            return Failure("project_id cannot be empty")
+
+        try:
+            return Success(ProjectId(UUID(project_id)))
+        except (ValueError, AttributeError) as e:
+            return Failure(f"Invalid project ID format: {str(e)}")
+
     @staticmethod
     def _convert_format_dto_to_domain(dto: DocumentFormatDTO) -> Result[DocumentFormat, str]:
         """Convert DocumentFormatDTO to domain DocumentFormat.
@@ -62,7 +62,8 @@ ARCHITECTURE COMPLIANCE:
 - Returns DTOs to Presentation
 """
 
-from typing import Any, Callable
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
 
 from doc_helper.application.dto.formula_dto import (
     # Phase F-4
@@ -71,6 +72,7 @@ from doc_helper.application.dto.formula_dto import (
     # Phase F-3
     FormulaDependencyAnalysisResultDTO,
     FormulaDependencyDTO,
+    FormulaDiagnosticsDTO,
     # Phase F-2
     FormulaExecutionResultDTO,
     # Phase F-6
@@ -90,13 +92,21 @@ from doc_helper.domain.common.result import Failure, Success
 from doc_helper.domain.formula.ast_nodes import (
     ASTNode,
     BinaryOp,
+    ColumnReference,
     FieldReference,
     FunctionCall,
     Literal,
     UnaryOp,
 )
+from doc_helper.domain.formula.dependency_analysis import (
+    DependencyAnalyzer,
+    IncrementalCycleDetector,
+)
 from doc_helper.domain.formula.evaluator import EvaluationContext, FormulaEvaluator
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
 from doc_helper.domain.formula.parser import FormulaParser
+from doc_helper.domain.formula.table_columns import TABLE_AGGREGATE_FUNCTIONS
+from doc_helper.domain.formula.tokenizer import IncrementalFormulaTokenizer
 
 
 # Allowed functions in formulas (from plan.md)
@@ -114,6 +124,12 @@ ALLOWED_FUNCTIONS = frozenset({
     "if_else",
     "is_empty",
     "coalesce",
+    # TABLE aggregates (argument is a table.column expression)
+    "sum_of",
+    "avg_of",
+    "min_of",
+    "max_of",
+    "count_where",
 })
 
 # Function return types (for type inference)
@@ -131,6 +147,11 @@ FUNCTION_RETURN_TYPES: dict[str, FormulaResultType] = {
     "if_else": FormulaResultType.UNKNOWN,  # Depends on arguments
     "is_empty": FormulaResultType.BOOLEAN,
     "coalesce": FormulaResultType.UNKNOWN,  # Depends on arguments
+    "sum_of": FormulaResultType.NUMBER,
+    "avg_of": FormulaResultType.NUMBER,
+    "min_of": FormulaResultType.UNKNOWN,  # Depends on column type
+    "max_of": FormulaResultType.UNKNOWN,  # Depends on column type
+    "count_where": FormulaResultType.NUMBER,
 }
 
 # Field type to result type mapping
@@ -263,9 +284,29 @@ BUILTIN_FUNCTIONS: dict[str, Callable[..., Any]] = {
     "if_else": _builtin_if_else,
     "is_empty": _builtin_is_empty,
     "coalesce": _builtin_coalesce,
+    **TABLE_AGGREGATE_FUNCTIONS,
 }
 
 
+@dataclass(frozen=True)
+class CompiledFormula:
+    """Formula parsed once for repeated execution (Phase F-2).
+
+    Returned by FormulaUseCases.compile_formula() and run with
+    FormulaUseCases.execute_compiled(). Holds either the parsed AST or the
+    error execute_formula() would report for the text.
+    """
+
+    formula_text: str
+    ast: Optional[ASTNode]
+    error: Optional[str]
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the formula parsed."""
+        return self.ast is not None
+
+
 class FormulaUseCases:
     """Use-case class for formula validation, execution, dependency discovery, cycle detection, governance, and binding.
 
@@ -281,6 +322,8 @@ class FormulaUseCases:
 
     PHASE F-2 SCOPE (Runtime Execution - ADR-040):
     - execute_formula(): Execute formula with runtime field values
+    - compile_formula() / execute_compiled(): Same, parsing once for
+      formulas that are executed repeatedly
 
     PHASE F-3 SCOPE (Dependency Discovery - ADR-040):
     - analyze_dependencies(): Discover field dependencies (analysis only)
@@ -340,6 +383,16 @@ class FormulaUseCases:
         # result.has_cycles == False
     """
 
+    def __init__(self, parse_cache: Optional[FormulaParseCache] = None) -> None:
+        """Initialize FormulaUseCases.
+
+        Args:
+            parse_cache: Optional parse cache shared with other use-case
+                instances, so each distinct formula text is parsed once
+                (e.g. across all control rules of a schema import)
+        """
+        self._parse_cache = parse_cache
+
     def validate_formula(
         self,
         formula_text: str,
@@ -366,10 +419,6 @@ class FormulaUseCases:
         - No formula execution
         - Returns DTO only
         """
-        errors: list[str] = []
-        warnings: list[str] = []
-        field_references: set[str] = set()
-
         # Handle empty formula
         if not formula_text or not formula_text.strip():
             return FormulaValidationResultDTO(
@@ -382,8 +431,7 @@ class FormulaUseCases:
 
         # Step 1: Parse formula (syntax validation)
         try:
-            parser = FormulaParser(formula_text)
-            ast = parser.parse()
+            ast = self._parse(formula_text)
         except ValueError as e:
             return FormulaValidationResultDTO(
                 is_valid=False,
@@ -401,33 +449,8 @@ class FormulaUseCases:
                 field_references=(),
             )
 
-        # Build field lookup dictionary
         field_lookup = {f.field_id: f for f in schema_fields}
-
-        # Step 2: Extract and validate field references
-        field_references = self._extract_field_references(ast)
-        for field_ref in field_references:
-            if field_ref not in field_lookup:
-                errors.append(f"Unknown field: '{field_ref}'")
-
-        # Step 3: Validate function calls
-        function_errors = self._validate_functions(ast)
-        errors.extend(function_errors)
-
-        # Step 4: Infer result type
-        inferred_type = self._infer_type(ast, field_lookup)
-
-        # Step 5: Add warnings for potential issues
-        type_warnings = self._check_type_compatibility(ast, field_lookup)
-        warnings.extend(type_warnings)
-
-        return FormulaValidationResultDTO(
-            is_valid=len(errors) == 0,
-            errors=tuple(errors),
-            warnings=tuple(warnings),
-            inferred_type=inferred_type.value,
-            field_references=tuple(sorted(field_references)),
-        )
+        return self._validation_from_ast(ast, field_lookup)
 
     def parse_formula(
         self,
@@ -449,8 +472,7 @@ class FormulaUseCases:
             return (False, "Formula cannot be empty", ())
 
         try:
-            parser = FormulaParser(formula_text)
-            ast = parser.parse()
+            ast = self._parse(formula_text)
             field_refs = self._extract_field_references(ast)
             return (True, None, tuple(sorted(field_refs)))
         except ValueError as e:
@@ -476,8 +498,7 @@ class FormulaUseCases:
             return FormulaResultType.UNKNOWN
 
         try:
-            parser = FormulaParser(formula_text)
-            ast = parser.parse()
+            ast = self._parse(formula_text)
             field_lookup = {f.field_id: f for f in schema_fields}
             return self._infer_type(ast, field_lookup)
         except Exception:
@@ -511,7 +532,8 @@ class FormulaUseCases:
 
         Args:
             formula_text: Formula expression to execute
-            field_values: Runtime field values as primitives (field_id -> value)
+            field_values: Runtime field values as primitives (field_id -> value);
+                TABLE fields as lists of child record dicts
 
         Returns:
             FormulaExecutionResultDTO with:
@@ -531,6 +553,11 @@ class FormulaUseCases:
             - Arithmetic with null → null
             - is_empty(null) → True
             - coalesce(null, x) → x
+            - TABLE aggregates skip null cells
+
+        TABLE aggregates:
+            sum_of(layers.thickness), avg_of(layers.spt_n),
+            min_of(...), max_of(...), count_where(layers.spt_n > 50)
         """
         # Validate inputs
         if not isinstance(formula_text, str):
@@ -540,49 +567,71 @@ class FormulaUseCases:
                 error="formula_text must be a string",
             )
 
-        if not isinstance(field_values, dict):
-            return FormulaExecutionResultDTO(
-                success=False,
-                value=None,
-                error="field_values must be a dictionary",
-            )
+        return self.execute_compiled(self.compile_formula(formula_text), field_values)
+
+    def compile_formula(self, formula_text: str) -> CompiledFormula:
+        """Parse a formula once for repeated execution.
+
+        Args:
+            formula_text: Formula expression
 
+        Returns:
+            CompiledFormula with the AST, or with the error message
+            execute_formula() reports for this text
+        """
         # Handle empty formula
         if not formula_text or not formula_text.strip():
-            return FormulaExecutionResultDTO(
-                success=False,
-                value=None,
-                error="Formula cannot be empty",
-            )
+            return CompiledFormula(formula_text, None, "Formula cannot be empty")
 
-        # Step 1: Parse formula
+        # Parse formula
         try:
-            parser = FormulaParser(formula_text)
-            ast = parser.parse()
+            return CompiledFormula(formula_text, self._parse(formula_text), None)
         except ValueError as e:
+            return CompiledFormula(formula_text, None, f"Syntax error: {str(e)}")
+        except Exception as e:
+            return CompiledFormula(formula_text, None, f"Parse error: {str(e)}")
+
+    def execute_compiled(
+        self,
+        compiled: CompiledFormula,
+        field_values: dict[str, Any],
+    ) -> FormulaExecutionResultDTO:
+        """Execute a compiled formula with runtime field values.
+
+        Same semantics and result as execute_formula() for the compiled text.
+
+        Args:
+            compiled: Formula from compile_formula()
+            field_values: Runtime field values as primitives (field_id -> value)
+
+        Returns:
+            FormulaExecutionResultDTO (see execute_formula())
+        """
+        if not isinstance(field_values, dict):
             return FormulaExecutionResultDTO(
                 success=False,
                 value=None,
-                error=f"Syntax error: {str(e)}",
+                error="field_values must be a dictionary",
             )
-        except Exception as e:
+
+        if compiled.ast is None:
             return FormulaExecutionResultDTO(
                 success=False,
                 value=None,
-                error=f"Parse error: {str(e)}",
+                error=compiled.error,
             )
 
-        # Step 2: Create evaluation context with field values and built-in functions
+        # Create evaluation context with field values and built-in functions
         context = EvaluationContext(
             field_values=field_values,
             functions=BUILTIN_FUNCTIONS,
         )
 
-        # Step 3: Evaluate formula
+        # Evaluate formula
         evaluator = FormulaEvaluator(context)
-        result = evaluator.evaluate(ast)
+        result = evaluator.evaluate(compiled.ast)
 
-        # Step 4: Convert Result to DTO
+        # Convert Result to DTO
         if isinstance(result, Success):
             return FormulaExecutionResultDTO(
                 success=True,
@@ -597,6 +646,20 @@ class FormulaUseCases:
                 error=str(result.error),
             )
 
+    def referenced_fields(self, compiled: CompiledFormula) -> frozenset[str]:
+        """Get the fields a compiled formula reads.
+
+        Args:
+            compiled: Formula from compile_formula()
+
+        Returns:
+            Referenced field names (a table.column reference counts as the
+            TABLE field); empty if the formula did not parse
+        """
+        if compiled.ast is None:
+            return frozenset()
+        return frozenset(self._extract_field_references(compiled.ast))
+
     # =========================================================================
     # PHASE F-3: Dependency Discovery (Analysis-Only)
     # =========================================================================
@@ -657,8 +720,7 @@ class FormulaUseCases:
 
         # Step 1: Parse formula (syntax validation)
         try:
-            parser = FormulaParser(formula_text)
-            ast = parser.parse()
+            ast = self._parse(formula_text)
         except ValueError as e:
             return FormulaDependencyAnalysisResultDTO(
                 dependencies=(),
@@ -674,42 +736,8 @@ class FormulaUseCases:
                 parse_error=f"Parse error: {str(e)}",
             )
 
-        # Step 2: Build field lookup dictionary
         field_lookup = {f.field_id: f for f in schema_fields}
-
-        # Step 3: Extract field references from AST
-        field_refs = self._extract_field_references(ast)
-
-        # Step 4: Build dependency DTOs and track unknown fields
-        dependencies: list[FormulaDependencyDTO] = []
-        unknown_fields: list[str] = []
-
-        for field_id in sorted(field_refs):  # Sort for deterministic order
-            if field_id in field_lookup:
-                field_info = field_lookup[field_id]
-                dependencies.append(
-                    FormulaDependencyDTO(
-                        field_id=field_id,
-                        is_known=True,
-                        field_type=field_info.field_type,
-                    )
-                )
-            else:
-                dependencies.append(
-                    FormulaDependencyDTO(
-                        field_id=field_id,
-                        is_known=False,
-                        field_type=None,
-                    )
-                )
-                unknown_fields.append(field_id)
-
-        return FormulaDependencyAnalysisResultDTO(
-            dependencies=tuple(dependencies),
-            unknown_fields=tuple(unknown_fields),
-            has_parse_error=False,
-            parse_error=None,
-        )
+        return self._dependencies_from_ast(ast, field_lookup)
 
     # =========================================================================
     # PHASE F-4: Cycle Detection (Design-Time Analysis)
@@ -776,96 +804,25 @@ class FormulaUseCases:
                 _cycle_errors=(),
             )
 
-        # Detect all cycles using DFS
+        # Detect all cycles (strongly connected components)
         detected_cycles = self._find_all_cycles(formula_dependencies)
-
-        # Build cycle DTOs
-        cycle_dtos: list[FormulaCycleDTO] = []
-        for cycle_fields in detected_cycles:
-            # Build human-readable path (A → B → C → A)
-            cycle_path = " → ".join(cycle_fields) + " → " + cycle_fields[0]
-            cycle_dtos.append(
-                FormulaCycleDTO(
-                    field_ids=tuple(cycle_fields),
-                    cycle_path=cycle_path,
-                    severity="ERROR",
-                )
-            )
-
-        # Sort cycles for deterministic output
-        cycle_dtos.sort(key=lambda c: c.cycle_path)
-
-        # Phase H-3: Compute all required fields upfront
-        cycles_tuple = tuple(cycle_dtos)
-        all_ids: set[str] = set()
-        for cycle in cycles_tuple:
-            all_ids.update(cycle.field_ids)
-
-        return FormulaCycleAnalysisResultDTO(
-            has_cycles=len(cycles_tuple) > 0,
-            cycles=cycles_tuple,
-            analyzed_field_count=len(formula_dependencies),
-            _cycle_count=len(cycles_tuple),
-            _all_cycle_field_ids=tuple(sorted(all_ids)),
-            _cycle_errors=tuple(f"Circular dependency: {c.cycle_path}" for c in cycles_tuple),
-        )
+        return self._cycle_result_from(detected_cycles, len(formula_dependencies))
 
     def _find_all_cycles(
         self,
         dependencies: dict[str, tuple[str, ...]],
     ) -> list[list[str]]:
-        """Find all cycles in the dependency graph using DFS.
+        """Find cycles covering every circular field (iterative SCC analysis).
 
         Args:
             dependencies: Mapping from field to its dependencies
 
         Returns:
             List of cycles, where each cycle is a list of field IDs in order
+            starting with its smallest field ID
         """
-        cycles: list[list[str]] = []
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-        path: list[str] = []
-
-        def dfs(node: str) -> None:
-            """DFS to find cycles."""
-            if node in rec_stack:
-                # Found a cycle - extract the cycle from path
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:]
-                # Normalize cycle to start with smallest field_id for determinism
-                if cycle:
-                    min_idx = cycle.index(min(cycle))
-                    normalized = cycle[min_idx:] + cycle[:min_idx]
-                    # Avoid duplicates (same cycle found from different starting points)
-                    if normalized not in cycles:
-                        cycles.append(normalized)
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            # Get dependencies, filtering to only formula fields in our graph
-            node_deps = dependencies.get(node, ())
-            for dep in node_deps:
-                # Only traverse to nodes that are formula fields (in our dependency map)
-                # or to nodes that would create a back-edge to our current path
-                if dep in dependencies or dep in rec_stack:
-                    dfs(dep)
-
-            path.pop()
-            rec_stack.remove(node)
-
-        # Start DFS from each formula field
-        for field_id in sorted(dependencies.keys()):  # Sort for determinism
-            if field_id not in visited:
-                dfs(field_id)
-
-        return cycles
+        analysis = DependencyAnalyzer().analyze(dependencies)
+        return [list(cycle) for cycle in analysis.cycles]
 
     # =========================================================================
     # PHASE F-6: Governance & Enforcement (Policy Decisions)
@@ -1227,10 +1184,146 @@ class FormulaUseCases:
             block_reason=None,
         )
 
+    # =========================================================================
+    # Editor Diagnostics (Incremental, Design-Time)
+    # =========================================================================
+
+    def create_diagnostics_session(self) -> "FormulaDiagnosticsSession":
+        """Create a stateful diagnostics session for one formula editor.
+
+        The session produces the same DTOs as validate_formula(),
+        analyze_dependencies(), detect_cycles() and evaluate_governance(),
+        but in one pass per edit and reusing work between edits.
+
+        Returns:
+            New FormulaDiagnosticsSession bound to this use-case class
+        """
+        return FormulaDiagnosticsSession(self)
+
     # =========================================================================
     # Internal Methods (Domain Logic Coordination)
     # =========================================================================
 
+    def _parse(self, formula_text: str) -> ASTNode:
+        """Parse formula text, through the shared parse cache if one is set."""
+        if self._parse_cache is not None:
+            return self._parse_cache.parse(formula_text)
+        return FormulaParser(formula_text).parse()
+
+    def _validation_from_ast(
+        self,
+        ast: ASTNode,
+        field_lookup: dict[str, SchemaFieldInfoDTO],
+    ) -> FormulaValidationResultDTO:
+        """Build validation result for a parsed formula (steps 2-5 of validate_formula)."""
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        # Step 2: Extract and validate field references
+        field_references = self._extract_field_references(ast)
+        for field_ref in field_references:
+            if field_ref not in field_lookup:
+                errors.append(f"Unknown field: '{field_ref}'")
+        for table_name in sorted(self._extract_column_tables(ast)):
+            field_info = field_lookup.get(table_name)
+            if field_info is not None and field_info.field_type != "TABLE":
+                errors.append(f"Field '{table_name}' is not a TABLE field")
+
+        # Step 3: Validate function calls
+        function_errors = self._validate_functions(ast)
+        errors.extend(function_errors)
+
+        # Step 4: Infer result type
+        inferred_type = self._infer_type(ast, field_lookup)
+
+        # Step 5: Add warnings for potential issues
+        type_warnings = self._check_type_compatibility(ast, field_lookup)
+        warnings.extend(type_warnings)
+
+        return FormulaValidationResultDTO(
+            is_valid=len(errors) == 0,
+            errors=tuple(errors),
+            warnings=tuple(warnings),
+            inferred_type=inferred_type.value,
+            field_references=tuple(sorted(field_references)),
+        )
+
+    def _dependencies_from_ast(
+        self,
+        ast: ASTNode,
+        field_lookup: dict[str, SchemaFieldInfoDTO],
+    ) -> FormulaDependencyAnalysisResultDTO:
+        """Build dependency analysis for a parsed formula."""
+        field_refs = self._extract_field_references(ast)
+
+        # Build dependency DTOs and track unknown fields
+        dependencies: list[FormulaDependencyDTO] = []
+        unknown_fields: list[str] = []
+
+        for field_id in sorted(field_refs):  # Sort for deterministic order
+            if field_id in field_lookup:
+                field_info = field_lookup[field_id]
+                dependencies.append(
+                    FormulaDependencyDTO(
+                        field_id=field_id,
+                        is_known=True,
+                        field_type=field_info.field_type,
+                    )
+                )
+            else:
+                dependencies.append(
+                    FormulaDependencyDTO(
+                        field_id=field_id,
+                        is_known=False,
+                        field_type=None,
+                    )
+                )
+                unknown_fields.append(field_id)
+
+        return FormulaDependencyAnalysisResultDTO(
+            dependencies=tuple(dependencies),
+            unknown_fields=tuple(unknown_fields),
+            has_parse_error=False,
+            parse_error=None,
+        )
+
+    @staticmethod
+    def _cycle_result_from(
+        detected_cycles: Sequence[Sequence[str]],
+        analyzed_field_count: int,
+    ) -> FormulaCycleAnalysisResultDTO:
+        """Build cycle analysis DTO from detected cycles."""
+        # Build cycle DTOs
+        cycle_dtos: list[FormulaCycleDTO] = []
+        for cycle_fields in detected_cycles:
+            # Build human-readable path (A → B → C → A)
+            cycle_path = " → ".join(cycle_fields) + " → " + cycle_fields[0]
+            cycle_dtos.append(
+                FormulaCycleDTO(
+                    field_ids=tuple(cycle_fields),
+                    cycle_path=cycle_path,
+                    severity="ERROR",
+                )
+            )
+
+        # Sort cycles for deterministic output
+        cycle_dtos.sort(key=lambda c: c.cycle_path)
+
+        # Phase H-3: Compute all required fields upfront
+        cycles_tuple = tuple(cycle_dtos)
+        all_ids: set[str] = set()
+        for cycle in cycles_tuple:
+            all_ids.update(cycle.field_ids)
+
+        return FormulaCycleAnalysisResultDTO(
+            has_cycles=len(cycles_tuple) > 0,
+            cycles=cycles_tuple,
+            analyzed_field_count=analyzed_field_count,
+            _cycle_count=len(cycles_tuple),
+            _all_cycle_field_ids=tuple(sorted(all_ids)),
+            _cycle_errors=tuple(f"Circular dependency: {c.cycle_path}" for c in cycles_tuple),
+        )
+
     def _extract_field_references(self, node: ASTNode) -> set[str]:
         """Extract all field references from AST.
 
@@ -1238,11 +1331,15 @@ class FormulaUseCases:
             node: AST root node
 
         Returns:
-            Set of field names referenced in formula
+            Set of field names referenced in formula (a table.column
+            reference counts as a reference to the TABLE field)
         """
         if isinstance(node, FieldReference):
             return {node.field_name}
 
+        if isinstance(node, ColumnReference):
+            return {node.table_name}
+
         if isinstance(node, BinaryOp):
             left = self._extract_field_references(node.left)
             right = self._extract_field_references(node.right)
@@ -1262,6 +1359,32 @@ class FormulaUseCases:
 
         return set()
 
+    def _extract_column_tables(self, node: ASTNode) -> set[str]:
+        """Extract the TABLE fields read through table.column references.
+
+        Args:
+            node: AST root node
+
+        Returns:
+            Set of table field names
+        """
+        if isinstance(node, ColumnReference):
+            return {node.table_name}
+
+        if isinstance(node, BinaryOp):
+            return self._extract_column_tables(node.left) | self._extract_column_tables(node.right)
+
+        if isinstance(node, UnaryOp):
+            return self._extract_column_tables(node.operand)
+
+        if isinstance(node, FunctionCall):
+            tables: set[str] = set()
+            for arg in node.arguments:
+                tables |= self._extract_column_tables(arg)
+            return tables
+
+        return set()
+
     def _validate_functions(self, node: ASTNode) -> list[str]:
         """Validate function calls in AST.
 
@@ -1457,3 +1580,167 @@ class FormulaUseCases:
                 warnings.extend(self._check_type_compatibility(arg, field_lookup))
 
         return warnings
+
+
+class FormulaDiagnosticsSession:
+    """Incremental diagnostics pipeline for a formula editor.
+
+    Runs validation (F-1), dependency analysis (F-3), cycle analysis (F-4)
+    and governance (F-6) for an edited formula in a single pass:
+    - The formula is tokenized and parsed once per pass, and tokens of the
+      unchanged prefix are reused from the previous pass
+    - The entity's formula dependency graph is loaded once; each pass only
+      replaces the edited field's dependencies and re-checks the cycles
+      that edit can affect
+    - The schema field lookup is rebuilt only when the schema snapshot changes
+
+    Results are the same DTOs the stateless FormulaUseCases methods return.
+
+    Usage:
+        session = usecases.create_diagnostics_session()
+        session.load_entity_dependencies({"total": ("subtotal",), ...})
+        diagnostics = session.diagnose("subtotal * 2", schema_fields, "total")
+        diagnostics.cycle_analysis_result.has_cycles
+    """
+
+    def __init__(self, usecases: FormulaUseCases) -> None:
+        """Initialize session.
+
+        Args:
+            usecases: Use-case class that owns the DTO construction rules
+        """
+        self._usecases = usecases
+        self._tokenizer = IncrementalFormulaTokenizer()
+        self._cycle_detector: Optional[IncrementalCycleDetector] = None
+        self._cycle_result: Optional[FormulaCycleAnalysisResultDTO] = None
+        self._schema_fields: Optional[tuple[SchemaFieldInfoDTO, ...]] = None
+        self._field_lookup: dict[str, SchemaFieldInfoDTO] = {}
+
+    @property
+    def cycle_analysis_result(self) -> Optional[FormulaCycleAnalysisResultDTO]:
+        """Latest cycle analysis, or None if no dependency graph is loaded."""
+        return self._cycle_result
+
+    def load_entity_dependencies(
+        self,
+        formula_dependencies: dict[str, tuple[str, ...]],
+    ) -> FormulaCycleAnalysisResultDTO:
+        """Load the entity-wide formula dependency graph (full analysis).
+
+        Args:
+            formula_dependencies: Mapping from formula field ID to its
+                dependency field IDs (same shape as detect_cycles())
+
+        Returns:
+            FormulaCycleAnalysisResultDTO for the whole graph
+        """
+        self._cycle_detector = IncrementalCycleDetector(formula_dependencies)
+        self._cycle_result = self._current_cycle_result()
+        return self._cycle_result
+
+    def clear_entity_dependencies(self) -> None:
+        """Drop the cached dependency graph and cycle result."""
+        self._cycle_detector = None
+        self._cycle_result = None
+
+    def diagnose(
+        self,
+        formula_text: str,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+        field_id: str = "",
+    ) -> FormulaDiagnosticsDTO:
+        """Run all editor diagnostics for the current formula text.
+
+        Args:
+            formula_text: Formula expression being edited
+            schema_fields: Read-only schema field snapshot (DTOs)
+            field_id: Field the formula belongs to. When given and a
+                dependency graph is loaded, that field's dependencies are
+                replaced by the formula's references before cycle analysis.
+
+        Returns:
+            FormulaDiagnosticsDTO with all results of this pass
+        """
+        if schema_fields is not self._schema_fields:
+            self._schema_fields = schema_fields
+            self._field_lookup = {f.field_id: f for f in schema_fields}
+
+        validation_result, dependency_result = self._analyze_text(formula_text)
+
+        # A formula that does not parse keeps its previous graph entry, so
+        # cycle diagnostics do not flicker while the user is mid-edit.
+        if (
+            self._cycle_detector is not None
+            and field_id
+            and not dependency_result.has_parse_error
+        ):
+            self._cycle_detector.set_dependencies(
+                field_id, validation_result.field_references
+            )
+            self._cycle_result = self._current_cycle_result()
+
+        governance_result = self._usecases.evaluate_governance(
+            formula_text=formula_text,
+            validation_result=validation_result,
+            cycle_result=self._cycle_result,
+        )
+
+        return FormulaDiagnosticsDTO(
+            formula_text=formula_text,
+            validation_result=validation_result,
+            dependency_analysis_result=dependency_result,
+            cycle_analysis_result=self._cycle_result,
+            governance_result=governance_result,
+        )
+
+    def _analyze_text(
+        self,
+        formula_text: str,
+    ) -> tuple[FormulaValidationResultDTO, FormulaDependencyAnalysisResultDTO]:
+        """Parse once and build validation and dependency results."""
+        if not formula_text or not formula_text.strip():
+            self._tokenizer.reset()
+            return (
+                self._usecases.validate_formula(formula_text, self._schema_fields or ()),
+                self._usecases.analyze_dependencies(formula_text, self._schema_fields or ()),
+            )
+
+        try:
+            tokens = self._tokenizer.tokenize(formula_text)
+            ast = FormulaParser(formula_text, tokens=tokens).parse()
+        except ValueError as e:
+            return self._parse_failure(f"Syntax error: {str(e)}")
+        except RecursionError as e:
+            # Recursive-descent parser on a deeply nested formula
+            return self._parse_failure(f"Parse error: {str(e)}")
+
+        return (
+            self._usecases._validation_from_ast(ast, self._field_lookup),
+            self._usecases._dependencies_from_ast(ast, self._field_lookup),
+        )
+
+    @staticmethod
+    def _parse_failure(
+        message: str,
+    ) -> tuple[FormulaValidationResultDTO, FormulaDependencyAnalysisResultDTO]:
+        """Build validation and dependency results for an unparseable formula."""
+        return (
+            FormulaValidationResultDTO(
+                is_valid=False,
+                errors=(message,),
+                warnings=(),
+                inferred_type=FormulaResultType.UNKNOWN.value,
+                field_references=(),
+            ),
+            FormulaDependencyAnalysisResultDTO(
+                dependencies=(),
+                unknown_fields=(),
+                has_parse_error=True,
+                parse_error=message,
+            ),
+        )
+
+    def _current_cycle_result(self) -> FormulaCycleAnalysisResultDTO:
+        """Build cycle DTO from the detector's current state."""
+        detector = self._cycle_detector
+        return self._usecases._cycle_result_from(detector.cycles, detector.node_count)
@@ -11,6 +11,7 @@ RULE 0 ENFORCEMENT:
 This class wraps:
 - GetProjectQuery (load project)
 - SaveProjectCommand (save project)
+- UpdateTableRowCommand (edit one TABLE field record)
 - ExportProjectCommand (export project)
 - ImportProjectCommand (import project from file)
 - SearchFieldsQuery (search fields in project)
@@ -18,12 +19,13 @@ This class wraps:
 """
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from uuid import UUID
 
 from doc_helper.application.commands.export_project_command import ExportProjectCommand
 from doc_helper.application.commands.import_project_command import ImportProjectCommand
 from doc_helper.application.commands.save_project_command import SaveProjectCommand
+from doc_helper.application.commands.update_table_row_command import UpdateTableRowCommand
 from doc_helper.application.dto import (
     ExportResultDTO,
     FieldHistoryResultDTO,
@@ -38,6 +40,7 @@ from doc_helper.application.queries.get_project_query import GetProjectQuery
 from doc_helper.application.queries.search_fields_query import SearchFieldsQuery
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
 
 
 class ProjectUseCases:
@@ -68,6 +71,7 @@ class ProjectUseCases:
         import_project_command: Optional[ImportProjectCommand] = None,
         search_fields_query: Optional[SearchFieldsQuery] = None,
         get_field_history_query: Optional[GetFieldHistoryQuery] = None,
+        update_table_row_command: Optional[UpdateTableRowCommand] = None,
     ) -> None:
         """Initialize ProjectUseCases.
 
@@ -78,6 +82,7 @@ class ProjectUseCases:
             import_project_command: Command for importing projects (optional)
             search_fields_query: Query for searching fields (optional)
             get_field_history_query: Query for field history (optional)
+            update_table_row_command: Command for TABLE record edits (optional)
 
         Note:
             All dependencies are optional to support feature flags.
@@ -88,6 +93,7 @@ class ProjectUseCases:
         self._import_project_command = import_project_command
         self._search_fields_query = search_fields_query
         self._get_field_history_query = get_field_history_query
+        self._update_table_row_command = update_table_row_command
 
     # =========================================================================
     # Core Project Operations (formerly in ProjectOperationsFacade)
@@ -138,6 +144,49 @@ class ProjectUseCases:
         # Delegate to underlying command
         return self._save_project_command.execute(domain_project_id)
 
+    def update_table_row(
+        self,
+        project_id: str,
+        field_id: str,
+        kind: str,
+        index: int,
+        record: Optional[dict[str, Any]] = None,
+        to_index: Optional[int] = None,
+    ) -> Result[None, str]:
+        """Insert, update, delete or move one record of a TABLE field.
+
+        Args:
+            project_id: Project ID as string (UUID format)
+            field_id: TABLE field ID as string
+            kind: "insert", "update", "delete" or "move"
+            index: Record position (the source position for "move")
+            record: New record for "insert" and "update"
+            to_index: Destination position for "move"
+
+        Returns:
+            Success(None) if the record was written, Failure(error) otherwise
+        """
+        if not self._update_table_row_command:
+            return Failure("Table row editing feature not available")
+
+        id_result = self._convert_string_to_project_id(project_id)
+        if id_result.is_failure():
+            return Failure(id_result.error)
+
+        try:
+            domain_field_id = FieldDefinitionId(field_id)
+        except (ValueError, TypeError) as e:
+            return Failure(f"Invalid field ID: {str(e)}")
+
+        return self._update_table_row_command.execute(
+            project_id=id_result.value,
+            field_id=domain_field_id,
+            kind=kind,
+            index=index,
+            record=record,
+            to_index=to_index,
+        )
+
     def export_project(
         self,
         project_id: str,
@@ -1,4 +1,4 @@
-"""Runtime use cases package (Phase R-1, Phase R-2, Phase R-3, Phase R-4, Phase R-4.5, Phase R-5, Phase R-6).
+"""Runtime use cases package (Phase R-1, Phase R-2, Phase R-3, Phase R-4, Phase R-4.5, Phase R-5, Phase R-6, Phase R-7).
 
 Contains use cases for runtime evaluation:
 - Control rules (Phase R-1)
@@ -9,12 +9,14 @@ Contains use cases for runtime evaluation:
 - Form runtime state adapter (Phase R-4.5)
 - Entity-level output mappings aggregation (Phase R-5)
 - Document runtime context builder (Phase R-6)
+- Project-level runtime evaluation (Phase R-7)
 
 Phase R-3: Use EvaluateRuntimeRulesUseCase as the single runtime entry point.
 Phase R-4: Entity-level control rule aggregation used by R-3.
 Phase R-4.5: Form runtime state adapter for UI consumption.
 Phase R-5: Entity-level output mappings aggregation for document generation.
 Phase R-6: Document runtime context builder for final document-ready payload.
+Phase R-7: Project-level evaluation of all entities for checklist and generation.
 """
 
 from doc_helper.application.usecases.runtime.build_document_runtime_context import (
@@ -35,6 +37,9 @@ from doc_helper.application.usecases.runtime.evaluate_entity_output_mappings imp
 from doc_helper.application.usecases.runtime.evaluate_output_mappings import (
     EvaluateOutputMappingsUseCase,
 )
+from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+    EvaluateProjectRuntimeUseCase,
+)
 from doc_helper.application.usecases.runtime.evaluate_runtime_rules import (
     EvaluateRuntimeRulesUseCase,
 )
@@ -49,6 +54,7 @@ __all__ = [
     "EvaluateEntityControlRulesUseCase",  # Phase R-4: Entity-level aggregation
     "EvaluateEntityOutputMappingsUseCase",  # Phase R-5: Output mappings aggregation
     "EvaluateOutputMappingsUseCase",
+    "EvaluateProjectRuntimeUseCase",  # Phase R-7: Project-level evaluation
     "EvaluateValidationRulesUseCase",
     "EvaluateRuntimeRulesUseCase",  # Phase R-3: Authoritative entry point
 ]
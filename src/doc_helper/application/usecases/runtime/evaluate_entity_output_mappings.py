@@ -11,18 +11,24 @@ ADR-050 Compliance:
 - Reuses Phase R-1 output mapping evaluation
 
 Phase R-5: Aggregates field-level output mappings into document-ready output map.
+
+The entity's mappings are compiled once per schema version into an
+OutputMappingProgram; each execution loads the entity once and runs the
+program in a single pass over the field values.
 """
 
+from collections import OrderedDict
 from typing import Any
 
-from doc_helper.application.dto.runtime_dto import (
-    EntityOutputMappingsEvaluationDTO,
-    OutputMappingEvaluationRequestDTO,
-)
+from doc_helper.application.dto.runtime_dto import EntityOutputMappingsEvaluationDTO
 from doc_helper.application.usecases.formula_usecases import FormulaUseCases
 from doc_helper.application.usecases.runtime.evaluate_output_mappings import (
     EvaluateOutputMappingsUseCase,
 )
+from doc_helper.application.usecases.runtime.output_mapping_program import (
+    CompiledFieldMappings,
+    OutputMappingProgram,
+)
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId
 
@@ -38,7 +44,16 @@ class EvaluateEntityOutputMappingsUseCase:
         - Read-only: No persistence of results
         - Blocking: ANY failure BLOCKS document generation
         - Single-entity scope: All fields within same entity
-        - Reuses R-1: Delegates to EvaluateOutputMappingsUseCase
+        - Reuses R-1: Same first-success rule and type coercion as
+          EvaluateOutputMappingsUseCase
+
+    Compiled Programs:
+        The output mappings of an entity are compiled (formulas parsed)
+        once and cached per entity. The cache entry is reused while the
+        entity's mappings are unchanged and recompiled when they change,
+        so the schema repository is consulted a fixed number of times per
+        execution regardless of the entity's field count. At most
+        max_programs entities are cached (least recently used dropped).
 
     Blocking Rules:
         - Output mapping failure → BLOCK
@@ -59,25 +74,37 @@ class EvaluateEntityOutputMappingsUseCase:
                 print(f"{target} = {value}")
     """
 
+    DEFAULT_MAX_PROGRAMS = 64
+
     def __init__(
         self,
         schema_usecases: SchemaUseCases,
         formula_usecases: FormulaUseCases | None = None,
+        max_programs: int = DEFAULT_MAX_PROGRAMS,
     ) -> None:
         """Initialize EvaluateEntityOutputMappingsUseCase.
 
         Args:
             schema_usecases: SchemaUseCases instance for fetching entities/fields/mappings
             formula_usecases: FormulaUseCases instance for formula evaluation
-                If None, passed to R-1 use case (which creates a new instance).
+                If None, a new instance is created (shared with the R-1 use case).
+            max_programs: Maximum number of entities with a cached program
+
+        Raises:
+            ValueError: If max_programs is not positive
         """
+        if max_programs < 1:
+            raise ValueError("max_programs must be positive")
         self._schema_usecases = schema_usecases
-        self._formula_usecases = formula_usecases
-        # Create R-1 use case instance for output mapping evaluation
+        self._formula_usecases = formula_usecases or FormulaUseCases()
+        # R-1 use case: same formula evaluation, supplies the type coercion
         self._evaluate_output_mappings = EvaluateOutputMappingsUseCase(
             schema_usecases=schema_usecases,
-            formula_usecases=formula_usecases,
+            formula_usecases=self._formula_usecases,
         )
+        # Compiled programs by entity ID (recompiled when mappings change)
+        self._max_programs = max_programs
+        self._programs: OrderedDict[str, OutputMappingProgram] = OrderedDict()
 
     def execute(
         self,
@@ -94,12 +121,11 @@ class EvaluateEntityOutputMappingsUseCase:
             - Single-entity scope only
 
         Execution Steps:
-            1. Get entity from schema repository
-            2. Iterate all fields in entity
-            3. For each field, get output mappings
-            4. For each mapping, call EvaluateOutputMappingsUseCase (R-1)
-            5. If ANY evaluation fails: STOP, return blocked result
-            6. Otherwise: Aggregate {target → value}, return success
+            1. Get entity from schema repository (once)
+            2. Get the compiled program for the entity's mappings
+            3. Run the program over field_values in one pass
+            4. If ANY field fails: STOP, return blocked result
+            5. Otherwise: Aggregate {target → value}, return success
 
         Args:
             entity_id: Entity whose output mappings should be evaluated
@@ -148,50 +174,85 @@ class EvaluateEntityOutputMappingsUseCase:
 
         entity = load_result.value
 
-        # Step 2: Initialize output values accumulator
-        output_values: dict[str, Any] = {}
-
-        # Step 3: Iterate all fields in entity
-        for field_id_obj, field in entity.fields.items():
-            field_id = field_id_obj.value
+        # Step 2: Get compiled program (compiled once per schema version)
+        program = self._get_program(entity)
 
-            # Step 4: Get output mappings for this field
-            output_mappings = self._schema_usecases.list_output_mappings_for_field(
-                entity_id=entity_id,
-                field_id=field_id,
-            )
-
-            # Skip field if no output mappings
-            if not output_mappings:
-                continue
+        # Step 3: Run program over field values
+        output_values: dict[str, Any] = {}
+        for field_mappings in program.fields:
+            target, value, error = self._evaluate_field(field_mappings, field_values)
 
-            # Step 5: Evaluate each output mapping
-            for mapping in output_mappings:
-                # Create request DTO for R-1 use case
-                request = OutputMappingEvaluationRequestDTO(
+            # Step 4: Check for failure (blocking semantics)
+            if error is not None:
+                # ANY failure blocks entire entity evaluation
+                return EntityOutputMappingsEvaluationDTO.failure(
                     entity_id=entity_id,
-                    field_id=field_id,
-                    field_values=field_values,
+                    error=f"Output mapping evaluation failed for field '{field_mappings.field_id}': {error}",
                 )
 
-                # Call R-1 use case
-                mapping_result = self._evaluate_output_mappings.execute(request)
+            # Store target → value mapping
+            output_values[target] = value
 
-                # Step 6: Check for failure (blocking semantics)
-                if not mapping_result.success:
-                    # ANY failure blocks entire entity evaluation
-                    return EntityOutputMappingsEvaluationDTO.failure(
-                        entity_id=entity_id,
-                        error=f"Output mapping evaluation failed for field '{field_id}': {mapping_result.error_message}",
-                    )
-
-                # Step 7: Accumulate successful result
-                # Store target → value mapping
-                output_values[mapping_result.target] = mapping_result.value
-
-        # Step 8: Return aggregated success result
+        # Step 5: Return aggregated success result
         # Even if no output mappings found, return success (empty result)
         return EntityOutputMappingsEvaluationDTO.success_result(
             entity_id=entity_id,
             values=output_values,
         )
+
+    def _get_program(self, entity) -> OutputMappingProgram:
+        """Get the compiled program for an entity, compiling it if stale.
+
+        Args:
+            entity: Loaded EntityDefinition
+
+        Returns:
+            OutputMappingProgram matching the entity's current mappings
+        """
+        entity_id = entity.id.value
+        program = self._programs.get(entity_id)
+        if program is None or program.signature != OutputMappingProgram.signature_of(entity):
+            program = OutputMappingProgram.compile(entity, self._formula_usecases)
+            self._programs[entity_id] = program
+        self._programs.move_to_end(entity_id)
+        if len(self._programs) > self._max_programs:
+            self._programs.popitem(last=False)
+        return program
+
+    def _evaluate_field(
+        self,
+        field_mappings: CompiledFieldMappings,
+        field_values: dict[str, Any],
+    ) -> tuple[str, Any, str | None]:
+        """Evaluate one field's compiled mappings (first success wins, as in R-1).
+
+        Args:
+            field_mappings: Compiled mappings of the field
+            field_values: Current field values (snapshot)
+
+        Returns:
+            (target, value, None) on success, or (target, None, error)
+            when every mapping failed
+        """
+        errors: list[str] = []
+        for mapping in field_mappings.mappings:
+            execution_result = self._formula_usecases.execute_compiled(
+                mapping.formula, field_values
+            )
+            if not execution_result.success:
+                errors.append(f"Target '{mapping.target}': {execution_result.error}")
+                continue
+
+            coercion_result = self._evaluate_output_mappings.coerce_to_target_type(
+                value=execution_result.value,
+                target=mapping.target,
+            )
+            if coercion_result["success"]:
+                return mapping.target, coercion_result["value"], None
+            errors.append(f"Target '{mapping.target}': {coercion_result['error']}")
+
+        return (
+            field_mappings.mappings[0].target,
+            None,
+            f"All output mappings failed: {'; '.join(errors)}",
+        )
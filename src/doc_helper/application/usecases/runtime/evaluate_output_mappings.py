@@ -151,7 +151,7 @@ class EvaluateOutputMappingsUseCase:
                 continue
 
             # Apply type coercion based on target type
-            coercion_result = self._coerce_to_target_type(
+            coercion_result = self.coerce_to_target_type(
                 value=execution_result.value,
                 target=mapping.target,
             )
@@ -189,7 +189,7 @@ class EvaluateOutputMappingsUseCase:
             error_message=f"All output mappings failed: {'; '.join(errors)}",
         )
 
-    def _coerce_to_target_type(
+    def coerce_to_target_type(
         self, value: Any, target: str
     ) -> dict[str, Any]:
         """Coerce formula result to target type.
@@ -0,0 +1,175 @@
+"""Evaluate Project Runtime Use Case (Phase R-7).
+
+Evaluates control rules, validation and output mappings for every entity
+of a project snapshot in one call, and returns one aggregated result that
+both the pre-generation checklist and document generation consume.
+
+ADR-050 Compliance:
+- Pull-based evaluation (caller provides the whole project snapshot)
+- Deterministic (same inputs → same outputs, results in snapshot order)
+- Read-only (no side effects, no persistence)
+- Each entity is evaluated in its own scope (no cross-entity rules)
+- Orchestration only (reuses R-3 and R-5 use cases)
+
+All entities share one R-3 and one R-5 use case, so compiled validation
+checks, output mapping programs and memoized results are built once per
+schema version and reused across entities and calls.
+"""
+
+from concurrent.futures import Executor
+from typing import Any, Optional
+
+from doc_helper.application.dto.runtime_dto import (
+    ProjectEntityRuntimeResultDTO,
+    ProjectRuntimeEvaluationRequestDTO,
+    ProjectRuntimeEvaluationResultDTO,
+    RuntimeEvaluationRequestDTO,
+)
+from doc_helper.application.usecases.formula_usecases import FormulaUseCases
+from doc_helper.application.usecases.runtime.evaluate_entity_output_mappings import (
+    EvaluateEntityOutputMappingsUseCase,
+)
+from doc_helper.application.usecases.runtime.evaluate_runtime_rules import (
+    EvaluateRuntimeRulesUseCase,
+)
+from doc_helper.application.usecases.schema_usecases import SchemaUseCases
+from doc_helper.domain.project.project import Project
+
+
+class EvaluateProjectRuntimeUseCase:
+    """Use case for project-level runtime evaluation (Phase R-7).
+
+    Per entity, in snapshot order:
+        1. Runtime rules (R-3): control rules, then validation
+        2. Output mappings (R-5) - only if validation doesn't block
+
+    Blocking Rules:
+        - An entity blocks if validation blocks or an output mapping fails
+        - The project blocks if ANY entity blocks
+
+    Parallel Evaluation:
+        Entities are independent, so they can be evaluated on an executor
+        (e.g. a ThreadPoolExecutor owned by the caller). Evaluation units
+        share the in-process compiled plans and memo, so executors that
+        pickle work to other processes are not supported.
+
+    Usage:
+        use_case = EvaluateProjectRuntimeUseCase(schema_usecases=schema_usecases)
+        result = use_case.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={
+                    "project": {"name": "Site A"},
+                    "borehole": {"depth": 12.5},
+                }
+            )
+        )
+        checklist_errors = result.to_validation_error_dtos()
+        if not result.is_blocked:
+            values = result.output_values("project")
+    """
+
+    def __init__(
+        self,
+        schema_usecases: SchemaUseCases,
+        formula_usecases: Optional[FormulaUseCases] = None,
+        runtime_rules_use_case: Optional[EvaluateRuntimeRulesUseCase] = None,
+        output_mappings_use_case: Optional[EvaluateEntityOutputMappingsUseCase] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Initialize EvaluateProjectRuntimeUseCase.
+
+        Args:
+            schema_usecases: SchemaUseCases instance for fetching rules/constraints
+            formula_usecases: FormulaUseCases instance for formula evaluation
+                If None, created internally by sub-use-cases.
+            runtime_rules_use_case: Shared R-3 use case (e.g. the one the form
+                uses, to share its memo). If None, created internally.
+            output_mappings_use_case: Shared R-5 use case. If None, created
+                internally.
+            executor: Executor for evaluating entities concurrently
+                (None = evaluate on the calling thread)
+        """
+        self._runtime_rules_use_case = runtime_rules_use_case or EvaluateRuntimeRulesUseCase(
+            schema_usecases=schema_usecases,
+            formula_usecases=formula_usecases,
+        )
+        self._output_mappings_use_case = (
+            output_mappings_use_case
+            or EvaluateEntityOutputMappingsUseCase(
+                schema_usecases=schema_usecases,
+                formula_usecases=formula_usecases,
+            )
+        )
+        self._executor = executor
+
+    def execute(
+        self,
+        request: ProjectRuntimeEvaluationRequestDTO,
+    ) -> ProjectRuntimeEvaluationResultDTO:
+        """Evaluate every entity of a project snapshot.
+
+        Args:
+            request: ProjectRuntimeEvaluationRequestDTO with the field values
+                of every entity
+
+        Returns:
+            ProjectRuntimeEvaluationResultDTO with per-entity results in
+            snapshot order and aggregated blocking
+        """
+        entities = list(request.entity_values.items())
+        if self._executor is None or len(entities) < 2:
+            entity_results = tuple(
+                self._evaluate_entity(entity_id, field_values)
+                for entity_id, field_values in entities
+            )
+        else:
+            futures = [
+                self._executor.submit(self._evaluate_entity, entity_id, field_values)
+                for entity_id, field_values in entities
+            ]
+            entity_results = tuple(future.result() for future in futures)
+
+        return ProjectRuntimeEvaluationResultDTO.from_entity_results(entity_results)
+
+    def execute_for_project(self, project: Project) -> ProjectRuntimeEvaluationResultDTO:
+        """Evaluate the current field values of a project.
+
+        This is the single evaluation behind both the pre-generation
+        checklist and document generation.
+
+        Args:
+            project: Project whose field values form the snapshot
+
+        Returns:
+            ProjectRuntimeEvaluationResultDTO for the project's entity
+        """
+        field_values = {
+            field_id.value: field_value.value
+            for field_id, field_value in project.field_values.items()
+        }
+        return self.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={project.entity_definition_id.value: field_values}
+            )
+        )
+
+    def _evaluate_entity(
+        self,
+        entity_id: str,
+        field_values: dict[str, Any],
+    ) -> ProjectEntityRuntimeResultDTO:
+        """Evaluate one entity (see execute())."""
+        runtime_result = self._runtime_rules_use_case.execute(
+            RuntimeEvaluationRequestDTO(entity_id=entity_id, field_values=field_values)
+        )
+        output_mappings = None
+        if not runtime_result.is_blocked:
+            output_mappings = self._output_mappings_use_case.execute(
+                entity_id=entity_id,
+                field_values=field_values,
+            )
+        return ProjectEntityRuntimeResultDTO.from_results(
+            entity_id=entity_id,
+            runtime_result=runtime_result,
+            output_mappings=output_mappings,
+        )
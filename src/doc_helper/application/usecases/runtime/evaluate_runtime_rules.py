@@ -11,8 +11,15 @@ ADR-050 Compliance:
 
 Phase R-3: Authoritative runtime entry point.
 Phase R-4 Update: Now uses entity-level control rules aggregation.
+
+Results are memoized (see runtime_memo): re-evaluating a state whose
+schema revision, label language and read field values were already seen
+is a memo hit.
 """
 
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
 from doc_helper.application.dto.runtime_dto import (
     OutputMappingEvaluationRequestDTO,
     RuntimeEvaluationRequestDTO,
@@ -28,9 +35,21 @@ from doc_helper.application.usecases.runtime.evaluate_output_mappings import (
 from doc_helper.application.usecases.runtime.evaluate_validation_rules import (
     EvaluateValidationRulesUseCase,
 )
+from doc_helper.application.usecases.runtime.runtime_memo import (
+    RuntimeEvaluationMemo,
+    value_fingerprint,
+)
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 
 
+@dataclass(frozen=True)
+class _RuntimeDependencies:
+    """Fields the runtime rules of one entity read, for one schema revision."""
+
+    schema_revision: int
+    read_fields: tuple[str, ...]
+
+
 class EvaluateRuntimeRulesUseCase:
     """Use case for orchestrated runtime rule evaluation (Phase R-3, updated in R-4).
 
@@ -55,6 +74,15 @@ class EvaluateRuntimeRulesUseCase:
         - Orchestration only: Reuses existing use cases
         - Single-entity scope: All fields within same entity
 
+    Memoization:
+        Results are cached in a bounded memo keyed by entity, schema revision,
+        label language and a fingerprint of the field values in the rules'
+        dependency set (fields read by control rule formulas and fields with
+        constraints). The schema revision (SchemaUseCases.schema_revision)
+        changes with every schema mutation; the dependency set is only
+        re-read then. Translated labels are part of cached results, so
+        switching the UI language (SchemaUseCases.label_language) misses.
+
     Usage:
         use_case = EvaluateRuntimeRulesUseCase(
             schema_usecases=schema_usecases,
@@ -74,6 +102,7 @@ class EvaluateRuntimeRulesUseCase:
         self,
         schema_usecases: SchemaUseCases,
         formula_usecases=None,  # Optional, created if None
+        memo_size: int = RuntimeEvaluationMemo.DEFAULT_MAX_ENTRIES,
     ) -> None:
         """Initialize EvaluateRuntimeRulesUseCase.
 
@@ -81,6 +110,7 @@ class EvaluateRuntimeRulesUseCase:
             schema_usecases: SchemaUseCases instance for fetching rules/constraints
             formula_usecases: FormulaUseCases instance for formula evaluation
                 If None, created internally by sub-use-cases.
+            memo_size: Maximum number of memoized results
         """
         self._schema_usecases = schema_usecases
         self._formula_usecases = formula_usecases
@@ -99,6 +129,20 @@ class EvaluateRuntimeRulesUseCase:
             formula_usecases=formula_usecases,
         )
 
+        # Memoized results and per-entity dependency sets
+        self._memo = RuntimeEvaluationMemo(max_entries=memo_size)
+        self._dependencies: dict[str, _RuntimeDependencies] = {}
+
+    @property
+    def memo(self) -> RuntimeEvaluationMemo:
+        """Result memo (hits, misses and hit_rate for diagnostics)."""
+        return self._memo
+
+    def clear_memo(self) -> None:
+        """Drop memoized results and dependency sets."""
+        self._memo.clear()
+        self._dependencies.clear()
+
     def execute(
         self,
         request: RuntimeEvaluationRequestDTO,
@@ -147,6 +191,22 @@ class EvaluateRuntimeRulesUseCase:
                 for error in result.validation_result.errors:
                     print(error.message)
         """
+        key = self._memo_key(request)
+        if key is not None:
+            cached = self._memo.get(key)
+            if cached is not None:
+                return cached
+
+        result = self._evaluate(request)
+        if key is not None:
+            self._memo.put(key, result)
+        return result
+
+    def _evaluate(
+        self,
+        request: RuntimeEvaluationRequestDTO,
+    ) -> RuntimeEvaluationResultDTO:
+        """Evaluate all runtime rules (see execute())."""
         # STEP 1: Evaluate Control Rules (R-4 Entity-Level Aggregation) - Never blocking
         # Phase R-4: Use entity-level control rules aggregation
         # Aggregates control rule evaluation across all fields in the entity
@@ -194,3 +254,58 @@ class EvaluateRuntimeRulesUseCase:
             is_blocked=is_blocked,
             blocking_reason=blocking_reason,
         )
+
+    # =========================================================================
+    # Memoization
+    # =========================================================================
+
+    def _memo_key(self, request: RuntimeEvaluationRequestDTO) -> Optional[Hashable]:
+        """Build the memo key for a request.
+
+        Args:
+            request: Runtime evaluation request
+
+        Returns:
+            (entity_id, schema_revision, label_language, fingerprint), or
+            None if the request cannot be memoized (entity not found,
+            unhashable values)
+        """
+        dependencies = self._get_dependencies(request.entity_id)
+        if dependencies is None:
+            return None
+        fingerprint = value_fingerprint(request.field_values, dependencies.read_fields)
+        if fingerprint is None:
+            return None
+        return (
+            request.entity_id,
+            dependencies.schema_revision,
+            self._schema_usecases.label_language,
+            fingerprint,
+        )
+
+    def _get_dependencies(self, entity_id: str) -> Optional[_RuntimeDependencies]:
+        """Get the dependency set of an entity's runtime rules.
+
+        The set is reused while the schema revision is unchanged, without
+        loading the entity; it is re-read after any schema mutation.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            _RuntimeDependencies, or None if the entity does not exist
+        """
+        revision = self._schema_usecases.schema_revision
+        dependencies = self._dependencies.get(entity_id)
+        if dependencies is not None and dependencies.schema_revision == revision:
+            return dependencies
+
+        read_fields = self._schema_usecases.get_rule_dependencies(entity_id)
+        if read_fields is None:
+            return None
+        dependencies = _RuntimeDependencies(
+            schema_revision=revision,
+            read_fields=tuple(sorted(read_fields)),
+        )
+        self._dependencies[entity_id] = dependencies
+        return dependencies
@@ -9,10 +9,14 @@ ADR-050 Compliance:
 - Blocking determination based on severity
 - Single-entity scope only
 - Strict type enforcement (no coercion)
+
+Each field's constraint set is compiled once into bound checkers (regexes
+compiled, limits bound, allowed values hashed, constraint type resolved)
+and reused until the field's constraints change.
 """
 
 import re
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from doc_helper.application.dto.export_dto import ConstraintExportDTO
 from doc_helper.application.dto.runtime_dto import (
@@ -22,6 +26,9 @@ from doc_helper.application.dto.runtime_dto import (
 )
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 
+# Bound check for one constraint: (field_id, field_label, field_value) -> issue or None
+ConstraintCheck = Callable[[str, str, Any], Optional[ValidationIssueDTO]]
+
 
 class EvaluateValidationRulesUseCase:
     """Use case for evaluating validation constraints at runtime (Phase R-2).
@@ -55,6 +62,11 @@ class EvaluateValidationRulesUseCase:
             schema_usecases: SchemaUseCases instance for fetching constraints and fields
         """
         self._schema_usecases = schema_usecases
+        # (entity_id, field_id) -> (constraints, compiled checks)
+        self._compiled: dict[
+            tuple[str, str],
+            tuple[tuple[ConstraintExportDTO, ...], tuple[tuple[str, bool, ConstraintCheck], ...]],
+        ] = {}
 
     def execute(
         self,
@@ -153,23 +165,18 @@ class EvaluateValidationRulesUseCase:
             # Get field label (use field_id if not found)
             field_label = field_labels.get(field_id, field_id)
 
-            # Evaluate each constraint for this field
-            for constraint_dto in constraints:
-                constraint_type = constraint_dto.constraint_type
-                parameters = constraint_dto.parameters
-
-                # Extract severity (default to ERROR if missing)
-                severity = parameters.get("severity", "ERROR")
+            # Non-REQUIRED constraints skip None or empty string values
+            is_empty = field_value is None or (
+                isinstance(field_value, str) and field_value == ""
+            )
 
-                # Evaluate constraint based on type
-                issue = self._evaluate_constraint(
-                    field_id=field_id,
-                    field_label=field_label,
-                    field_value=field_value,
-                    constraint_type=constraint_type,
-                    parameters=parameters,
-                    severity=severity,
-                )
+            # Evaluate each compiled constraint for this field
+            for severity, is_required, check in self._compiled_checks(
+                request.entity_id, field_id, constraints
+            ):
+                if is_empty and not is_required:
+                    continue
+                issue = check(field_id, field_label, field_value)
 
                 # Categorize issue by severity
                 if issue:
@@ -190,183 +197,294 @@ class EvaluateValidationRulesUseCase:
             failed_fields=tuple(failed_fields),
         )
 
-    def _evaluate_constraint(
+    def _compiled_checks(
         self,
+        entity_id: str,
         field_id: str,
-        field_label: str,
-        field_value: Any,
-        constraint_type: str,
-        parameters: dict,
-        severity: str,
-    ) -> Optional[ValidationIssueDTO]:
-        """Evaluate a single constraint for a field value.
+        constraints: tuple[ConstraintExportDTO, ...],
+    ) -> tuple[tuple[str, bool, ConstraintCheck], ...]:
+        """Get compiled checks for a field, compiling if its constraints changed.
 
         Args:
+            entity_id: Entity containing the field
             field_id: Field identifier
-            field_label: Translated field label
-            field_value: Current field value
-            constraint_type: Type of constraint (e.g., "RequiredConstraint")
-            parameters: Constraint-specific parameters
-            severity: Severity level (ERROR/WARNING/INFO)
+            constraints: Field's current constraints
 
         Returns:
-            ValidationIssueDTO if constraint violated, None if valid
+            Tuple of (severity, is_required, check) in constraint order
         """
-        # RequiredConstraint: None, "", whitespace → violation
-        if constraint_type == "RequiredConstraint":
-            if field_value is None or (
-                isinstance(field_value, str) and not field_value.strip()
-            ):
-                return ValidationIssueDTO(
-                    field_id=field_id,
-                    field_label=field_label,
-                    constraint_type=constraint_type,
-                    severity=severity,
-                    message=f"{field_label} is required",
-                    code="REQUIRED_FIELD_EMPTY",
-                    details=None,
-                )
+        key = (entity_id, field_id)
+        cached = self._compiled.get(key)
+        if cached is not None and cached[0] == constraints:
+            return cached[1]
+        checks = tuple(
+            (
+                dto.parameters.get("severity", "ERROR"),
+                dto.constraint_type == "RequiredConstraint",
+                _compile_constraint(dto),
+            )
+            for dto in constraints
+        )
+        self._compiled[key] = (constraints, checks)
+        return checks
 
-        # Skip other constraints if value is None or empty string
-        if field_value is None or (isinstance(field_value, str) and field_value == ""):
-            return None
 
-        # MinLengthConstraint: string length >= min_length
-        if constraint_type == "MinLengthConstraint":
-            min_length = parameters.get("min_length")
-            if isinstance(field_value, str) and len(field_value) < min_length:
-                return ValidationIssueDTO(
-                    field_id=field_id,
-                    field_label=field_label,
-                    constraint_type=constraint_type,
-                    severity=severity,
-                    message=f"{field_label} must be at least {min_length} characters",
-                    code="VALUE_TOO_SHORT",
-                    details={"min_length": min_length, "actual_length": len(field_value)},
-                )
+# ============================================================================
+# Constraint compilation
+# ============================================================================
 
-        # MaxLengthConstraint: string length <= max_length
-        if constraint_type == "MaxLengthConstraint":
-            max_length = parameters.get("max_length")
-            if isinstance(field_value, str) and len(field_value) > max_length:
-                return ValidationIssueDTO(
-                    field_id=field_id,
-                    field_label=field_label,
-                    constraint_type=constraint_type,
-                    severity=severity,
-                    message=f"{field_label} must be at most {max_length} characters",
-                    code="VALUE_TOO_LONG",
-                    details={"max_length": max_length, "actual_length": len(field_value)},
-                )
 
-        # MinValueConstraint: numeric value >= min_value
-        if constraint_type == "MinValueConstraint":
-            min_value = parameters.get("min_value")
-            if isinstance(field_value, (int, float)) and field_value < min_value:
-                return ValidationIssueDTO(
-                    field_id=field_id,
-                    field_label=field_label,
-                    constraint_type=constraint_type,
-                    severity=severity,
-                    message=f"{field_label} must be at least {min_value}",
-                    code="VALUE_TOO_SMALL",
-                    details={"min_value": min_value, "actual_value": field_value},
-                )
+def _no_issue(field_id: str, field_label: str, field_value: Any) -> None:
+    """Check for constraint types without runtime semantics."""
+    return None
+
+
+def _compile_constraint(constraint_dto: ConstraintExportDTO) -> ConstraintCheck:
+    """Compile one constraint into a bound check.
+
+    The check assumes non-REQUIRED constraints are only run for non-empty
+    values (see execute()).
+
+    Args:
+        constraint_dto: Constraint type and parameters
+
+    Returns:
+        Check returning a ValidationIssueDTO if the constraint is violated
+    """
+    builder = _CHECK_BUILDERS.get(constraint_dto.constraint_type)
+    if builder is None:
+        return _no_issue
+    parameters = constraint_dto.parameters
+    return builder(
+        constraint_dto.constraint_type,
+        parameters,
+        parameters.get("severity", "ERROR"),
+    )
+
+
+def _required_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """RequiredConstraint: None, "", whitespace → violation."""
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if field_value is None or (isinstance(field_value, str) and not field_value.strip()):
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} is required",
+                code="REQUIRED_FIELD_EMPTY",
+                details=None,
+            )
+        return None
+
+    return check
+
 
-        # MaxValueConstraint: numeric value <= max_value
-        if constraint_type == "MaxValueConstraint":
-            max_value = parameters.get("max_value")
-            if isinstance(field_value, (int, float)) and field_value > max_value:
+def _min_length_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """MinLengthConstraint: string length >= min_length."""
+    min_length = parameters.get("min_length")
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if isinstance(field_value, str) and len(field_value) < min_length:
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must be at least {min_length} characters",
+                code="VALUE_TOO_SHORT",
+                details={"min_length": min_length, "actual_length": len(field_value)},
+            )
+        return None
+
+    return check
+
+
+def _max_length_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """MaxLengthConstraint: string length <= max_length."""
+    max_length = parameters.get("max_length")
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if isinstance(field_value, str) and len(field_value) > max_length:
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must be at most {max_length} characters",
+                code="VALUE_TOO_LONG",
+                details={"max_length": max_length, "actual_length": len(field_value)},
+            )
+        return None
+
+    return check
+
+
+def _min_value_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """MinValueConstraint: numeric value >= min_value."""
+    min_value = parameters.get("min_value")
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if isinstance(field_value, (int, float)) and field_value < min_value:
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must be at least {min_value}",
+                code="VALUE_TOO_SMALL",
+                details={"min_value": min_value, "actual_value": field_value},
+            )
+        return None
+
+    return check
+
+
+def _max_value_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """MaxValueConstraint: numeric value <= max_value."""
+    max_value = parameters.get("max_value")
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if isinstance(field_value, (int, float)) and field_value > max_value:
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must be at most {max_value}",
+                code="VALUE_TOO_LARGE",
+                details={"max_value": max_value, "actual_value": field_value},
+            )
+        return None
+
+    return check
+
+
+def _pattern_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """PatternConstraint: string matches regex pattern."""
+    pattern = parameters.get("pattern")
+    description = parameters.get("description", "valid format")
+    try:
+        regex = re.compile(pattern)
+    except (re.error, TypeError):
+        # Invalid regex pattern - skip constraint
+        return _no_issue
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        if isinstance(field_value, str) and not regex.match(field_value):
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must match {description}",
+                code="PATTERN_MISMATCH",
+                details={"pattern": pattern, "value": field_value},
+            )
+        return None
+
+    return check
+
+
+def _allowed_values_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """AllowedValuesConstraint: value in allowed_values list."""
+    allowed_values = parameters.get("allowed_values", [])
+    try:
+        allowed: Any = frozenset(allowed_values)
+    except TypeError:
+        allowed = allowed_values
+    message_values = ", ".join(str(v) for v in allowed_values)
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        try:
+            is_allowed = field_value in allowed
+        except TypeError:
+            is_allowed = field_value in allowed_values
+        if not is_allowed:
+            return ValidationIssueDTO(
+                field_id=field_id,
+                field_label=field_label,
+                constraint_type=constraint_type,
+                severity=severity,
+                message=f"{field_label} must be one of: {message_values}",
+                code="VALUE_NOT_ALLOWED",
+                details={"allowed_values": allowed_values, "actual_value": field_value},
+            )
+        return None
+
+    return check
+
+
+def _file_extension_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """FileExtensionConstraint: file extension in allowed_extensions."""
+    allowed_extensions = parameters.get("allowed_extensions", [])
+    lowered = frozenset(ext.lower() for ext in allowed_extensions)
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        # Expect file metadata dict with "name" key
+        if isinstance(field_value, dict) and "name" in field_value:
+            file_name = field_value["name"]
+            file_ext = file_name.split(".")[-1].lower() if "." in file_name else ""
+            if file_ext not in lowered:
                 return ValidationIssueDTO(
                     field_id=field_id,
                     field_label=field_label,
                     constraint_type=constraint_type,
                     severity=severity,
-                    message=f"{field_label} must be at most {max_value}",
-                    code="VALUE_TOO_LARGE",
-                    details={"max_value": max_value, "actual_value": field_value},
+                    message=f"{field_label} must be one of: {', '.join(allowed_extensions)}",
+                    code="FILE_EXTENSION_NOT_ALLOWED",
+                    details={
+                        "allowed_extensions": allowed_extensions,
+                        "file_name": file_name,
+                        "file_extension": file_ext,
+                    },
                 )
+        return None
 
-        # PatternConstraint: string matches regex pattern
-        if constraint_type == "PatternConstraint":
-            pattern = parameters.get("pattern")
-            description = parameters.get("description", "valid format")
-            if isinstance(field_value, str):
-                try:
-                    if not re.match(pattern, field_value):
-                        return ValidationIssueDTO(
-                            field_id=field_id,
-                            field_label=field_label,
-                            constraint_type=constraint_type,
-                            severity=severity,
-                            message=f"{field_label} must match {description}",
-                            code="PATTERN_MISMATCH",
-                            details={"pattern": pattern, "value": field_value},
-                        )
-                except re.error:
-                    # Invalid regex pattern - skip constraint
-                    pass
-
-        # AllowedValuesConstraint: value in allowed_values list
-        if constraint_type == "AllowedValuesConstraint":
-            allowed_values = parameters.get("allowed_values", [])
-            if field_value not in allowed_values:
+    return check
+
+
+def _max_file_size_check(constraint_type: str, parameters: dict, severity: str) -> ConstraintCheck:
+    """MaxFileSizeConstraint: file size <= max_size_bytes."""
+    max_size_bytes = parameters.get("max_size_bytes")
+
+    def check(field_id: str, field_label: str, field_value: Any) -> Optional[ValidationIssueDTO]:
+        # Expect file metadata dict with "size_bytes" key
+        if isinstance(field_value, dict) and "size_bytes" in field_value:
+            file_size = field_value["size_bytes"]
+            if file_size > max_size_bytes:
+                # Convert bytes to human-readable format
+                max_size_mb = max_size_bytes / (1024 * 1024)
+                actual_size_mb = file_size / (1024 * 1024)
                 return ValidationIssueDTO(
                     field_id=field_id,
                     field_label=field_label,
                     constraint_type=constraint_type,
                     severity=severity,
-                    message=f"{field_label} must be one of: {', '.join(str(v) for v in allowed_values)}",
-                    code="VALUE_NOT_ALLOWED",
-                    details={"allowed_values": allowed_values, "actual_value": field_value},
+                    message=f"{field_label} must be smaller than {max_size_mb:.2f} MB",
+                    code="FILE_TOO_LARGE",
+                    details={
+                        "max_size_bytes": max_size_bytes,
+                        "actual_size_bytes": file_size,
+                        "max_size_mb": max_size_mb,
+                        "actual_size_mb": actual_size_mb,
+                    },
                 )
-
-        # FileExtensionConstraint: file extension in allowed_extensions
-        if constraint_type == "FileExtensionConstraint":
-            allowed_extensions = parameters.get("allowed_extensions", [])
-            # Expect file metadata dict with "name" key
-            if isinstance(field_value, dict) and "name" in field_value:
-                file_name = field_value["name"]
-                file_ext = file_name.split(".")[-1].lower() if "." in file_name else ""
-                if file_ext not in [ext.lower() for ext in allowed_extensions]:
-                    return ValidationIssueDTO(
-                        field_id=field_id,
-                        field_label=field_label,
-                        constraint_type=constraint_type,
-                        severity=severity,
-                        message=f"{field_label} must be one of: {', '.join(allowed_extensions)}",
-                        code="FILE_EXTENSION_NOT_ALLOWED",
-                        details={
-                            "allowed_extensions": allowed_extensions,
-                            "file_name": file_name,
-                            "file_extension": file_ext,
-                        },
-                    )
-
-        # MaxFileSizeConstraint: file size <= max_size_bytes
-        if constraint_type == "MaxFileSizeConstraint":
-            max_size_bytes = parameters.get("max_size_bytes")
-            # Expect file metadata dict with "size_bytes" key
-            if isinstance(field_value, dict) and "size_bytes" in field_value:
-                file_size = field_value["size_bytes"]
-                if file_size > max_size_bytes:
-                    # Convert bytes to human-readable format
-                    max_size_mb = max_size_bytes / (1024 * 1024)
-                    actual_size_mb = file_size / (1024 * 1024)
-                    return ValidationIssueDTO(
-                        field_id=field_id,
-                        field_label=field_label,
-                        constraint_type=constraint_type,
-                        severity=severity,
-                        message=f"{field_label} must be smaller than {max_size_mb:.2f} MB",
-                        code="FILE_TOO_LARGE",
-                        details={
-                            "max_size_bytes": max_size_bytes,
-                            "actual_size_bytes": file_size,
-                            "max_size_mb": max_size_mb,
-                            "actual_size_mb": actual_size_mb,
-                        },
-                    )
-
-        # No violation found
         return None
+
+    return check
+
+
+# Constraint type -> check builder (resolved once per compiled constraint)
+_CHECK_BUILDERS: dict[str, Callable[[str, dict, str], ConstraintCheck]] = {
+    "RequiredConstraint": _required_check,
+    "MinLengthConstraint": _min_length_check,
+    "MaxLengthConstraint": _max_length_check,
+    "MinValueConstraint": _min_value_check,
+    "MaxValueConstraint": _max_value_check,
+    "PatternConstraint": _pattern_check,
+    "AllowedValuesConstraint": _allowed_values_check,
+    "FileExtensionConstraint": _file_extension_check,
+    "MaxFileSizeConstraint": _max_file_size_check,
+}
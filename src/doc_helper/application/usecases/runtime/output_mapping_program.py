@@ -0,0 +1,119 @@
+"""Compiled entity-level output mapping program (Phase R-5).
+
+An OutputMappingProgram holds every output mapping of one entity with its
+formula already parsed, in field order. It is compiled once per schema
+version of the entity and then run against any number of field value
+snapshots, so document generation does not re-fetch mappings or re-parse
+formulas per field.
+
+The schema version is the program signature: the (field_id, target,
+formula_text) triples of the entity's mappings. A program whose signature
+no longer matches the loaded entity is stale and must be recompiled.
+"""
+
+from dataclasses import dataclass
+
+from doc_helper.application.dto.export_dto import OutputMappingExportDTO
+from doc_helper.application.usecases.formula_usecases import (
+    CompiledFormula,
+    FormulaUseCases,
+)
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+
+ProgramSignature = tuple[tuple[str, str, str], ...]
+
+
+@dataclass(frozen=True)
+class CompiledOutputMapping:
+    """One output mapping with its parsed formula."""
+
+    target: str
+    formula: CompiledFormula
+
+
+@dataclass(frozen=True)
+class CompiledFieldMappings:
+    """Output mappings of one field, in declaration order.
+
+    The first mapping that evaluates and coerces successfully wins
+    (same rule as EvaluateOutputMappingsUseCase).
+    """
+
+    field_id: str
+    mappings: tuple[CompiledOutputMapping, ...]
+
+
+@dataclass(frozen=True)
+class OutputMappingProgram:
+    """All output mappings of an entity, compiled for repeated evaluation.
+
+    Fields without output mappings are not part of the program.
+
+    Usage:
+        program = OutputMappingProgram.compile(entity, formula_usecases)
+        if program.signature != OutputMappingProgram.signature_of(entity):
+            program = OutputMappingProgram.compile(entity, formula_usecases)
+    """
+
+    entity_id: str
+    signature: ProgramSignature
+    fields: tuple[CompiledFieldMappings, ...]
+
+    @staticmethod
+    def signature_of(entity: EntityDefinition) -> ProgramSignature:
+        """Schema version of an entity's output mappings.
+
+        Args:
+            entity: Entity definition
+
+        Returns:
+            (field_id, target, formula_text) for every output mapping,
+            in field and declaration order
+        """
+        return tuple(
+            (field_id.value, mapping.target, mapping.formula_text)
+            for field_id, field in entity.fields.items()
+            for mapping in field.output_mappings
+            if isinstance(mapping, OutputMappingExportDTO)
+        )
+
+    @classmethod
+    def compile(
+        cls,
+        entity: EntityDefinition,
+        formula_usecases: FormulaUseCases,
+    ) -> "OutputMappingProgram":
+        """Compile the output mappings of an entity.
+
+        Formulas that do not parse are kept with their error, so the
+        program reports them at evaluation time like execute_formula().
+
+        Args:
+            entity: Entity definition
+            formula_usecases: FormulaUseCases used to parse formulas
+
+        Returns:
+            OutputMappingProgram for the entity's current mappings
+        """
+        signature = cls.signature_of(entity)
+        grouped: dict[str, list[CompiledOutputMapping]] = {}
+        for field_id, target, formula_text in signature:
+            grouped.setdefault(field_id, []).append(
+                CompiledOutputMapping(
+                    target=target,
+                    formula=formula_usecases.compile_formula(formula_text),
+                )
+            )
+        return cls(
+            entity_id=entity.id.value,
+            signature=signature,
+            fields=tuple(
+                CompiledFieldMappings(field_id=field_id, mappings=tuple(mappings))
+                for field_id, mappings in grouped.items()
+            ),
+        )
+
+    @property
+    def mapping_count(self) -> int:
+        """Number of compiled output mappings."""
+        return len(self.signature)
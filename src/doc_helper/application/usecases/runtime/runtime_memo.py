@@ -0,0 +1,141 @@
+"""Memo of runtime evaluation results (Phase R-3).
+
+Runtime evaluation is deterministic (ADR-050: same inputs → same outputs),
+so a result can be reused whenever the schema and the field values the
+rules read are unchanged. Undo/redo and toggling a value back return to
+states that were already evaluated; those become memo hits.
+
+Memo keys are built from:
+- the entity ID,
+- a schema version (bumped whenever the entity's runtime rules change),
+- a fingerprint of the field values in the rules' dependency set only
+  (plus the set of field IDs supplied, which R-2 reports as evaluated).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+from doc_helper.application.dto.runtime_dto import RuntimeEvaluationResultDTO
+from doc_helper.domain.common.value_object import freeze
+
+# Fingerprint placeholder for a dependency missing from field_values
+# (distinct from a field present with value None)
+_MISSING = object()
+
+
+def value_fingerprint(
+    field_values: Mapping[str, Any],
+    read_fields: Iterable[str],
+) -> Optional[tuple]:
+    """Fingerprint the field values a set of rules reads.
+
+    Args:
+        field_values: Current field values (snapshot)
+        read_fields: Fields the rules read, in a stable order
+
+    Returns:
+        Hashable fingerprint, or None if a value cannot be fingerprinted
+        (the caller then evaluates without the memo)
+    """
+    try:
+        return (
+            frozenset(field_values),
+            tuple(freeze(field_values.get(field_id, _MISSING)) for field_id in read_fields),
+        )
+    except TypeError:
+        return None
+
+
+class RuntimeEvaluationMemo:
+    """Bounded least-recently-used memo of RuntimeEvaluationResultDTOs.
+
+    Results are frozen DTOs, so a cached result is returned as is.
+    Lookups and updates are locked, so one memo can serve evaluations
+    running on several threads.
+
+    Usage:
+        memo = RuntimeEvaluationMemo(max_entries=128)
+        result = memo.get(key)
+        if result is None:
+            result = evaluate()
+            memo.put(key, result)
+        print(f"hit rate: {memo.hit_rate:.0%}")
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize memo.
+
+        Args:
+            max_entries: Maximum number of cached results
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, RuntimeEvaluationResultDTO] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the memo."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that required an evaluation."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the memo (0.0 before any lookup)."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Optional[RuntimeEvaluationResultDTO]:
+        """Look up a cached result (counts a hit or miss).
+
+        Args:
+            key: Memo key
+
+        Returns:
+            Cached result, or None
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: Hashable, result: RuntimeEvaluationResultDTO) -> None:
+        """Cache a result, evicting the least recently used one when full.
+
+        Args:
+            key: Memo key
+            result: Evaluation result for the key
+        """
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset hit/miss counts."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -115,8 +115,12 @@ from doc_helper.application.dto.import_dto import (
 )
 from doc_helper.application.dto.operation_result import OperationResult
 from doc_helper.application.dto.relationship_dto import RelationshipDTO
-from doc_helper.application.dto.schema_dto import EntityDefinitionDTO
+from doc_helper.application.dto.schema_dto import EntityChangeResult, EntityDefinitionDTO
+from doc_helper.application.services.schema_import_validation_service import (
+    SchemaImportValidationService,
+)
 from doc_helper.application.usecases.control_rule_usecases import ControlRuleUseCases
+from doc_helper.application.usecases.formula_usecases import FormulaUseCases
 from doc_helper.application.queries.schema.get_relationships_query import (
     GetRelationshipsQuery,
 )
@@ -214,9 +218,13 @@ class SchemaUseCases:
         self._export_command = ExportSchemaCommand(
             schema_repository, relationship_repository
         )
+        # Import reports the first errors as soon as they are found
         self._import_command = ImportSchemaCommand(
             schema_repository=schema_repository,
             relationship_repository=relationship_repository,
+            validation_service=SchemaImportValidationService(
+                max_errors=SchemaImportValidationService.FAIL_FAST_ERROR_LIMIT,
+            ),
         )
         self._add_constraint_command = AddFieldConstraintCommand(schema_repository)
         self._update_entity_command = UpdateEntityCommand(schema_repository)
@@ -231,7 +239,13 @@ class SchemaUseCases:
         self._reorder_field_options_command = ReorderFieldOptionsCommand(schema_repository)
 
         # Phase F-10: Control Rule UseCases for validation
-        self._control_rule_usecases = ControlRuleUseCases()
+        self._formula_usecases = FormulaUseCases()
+        self._control_rule_usecases = ControlRuleUseCases(
+            formula_usecases=self._formula_usecases
+        )
+
+        # Bumped by every successful schema mutation (see schema_revision)
+        self._schema_revision = 0
 
     # =========================================================================
     # Private Validation Helpers
@@ -286,6 +300,27 @@ class SchemaUseCases:
 
         return OperationResult.ok(None)
 
+    def _entity_changed(self, value: Optional[str], entity_id: str) -> EntityChangeResult:
+        """Build success result carrying the re-read state of one entity.
+
+        Args:
+            value: Success value (typically the changed ID)
+            entity_id: Entity affected by the mutation
+
+        Returns:
+            EntityChangeResult; entity is None if the entity cannot be read
+        """
+        self._schema_revision += 1
+        # The mutation already succeeded - failing to describe it must not
+        # turn it into an error; callers then fall back to a full reload
+        try:
+            result = self._schema_query.execute_for_entity(entity_id.strip())
+            entity = result.value if result.is_success() else None
+        except ValueError:
+            # Not a valid entity ID (the repository reports other failures)
+            entity = None
+        return EntityChangeResult(success=True, value=value, entity=entity)
+
     # =========================================================================
     # Query Operations (READ)
     # =========================================================================
@@ -301,6 +336,73 @@ class SchemaUseCases:
             return result.value
         return ()
 
+    def get_entity(self, entity_id: str) -> Optional[EntityDefinitionDTO]:
+        """Get a single entity definition.
+
+        Args:
+            entity_id: Entity ID (string)
+
+        Returns:
+            EntityDefinitionDTO, or None if not found or on error
+        """
+        result = self._schema_query.execute_for_entity(entity_id)
+        if result.is_success():
+            return result.value
+        return None
+
+    @property
+    def schema_revision(self) -> int:
+        """Counter that changes whenever a schema mutation succeeds.
+
+        Callers caching data derived from the schema (e.g. runtime rule
+        dependencies) can reuse it while the revision is unchanged.
+        """
+        return self._schema_revision
+
+    @property
+    def label_language(self) -> Optional[str]:
+        """Code of the language labels are currently translated into.
+
+        Callers caching results that contain translated labels should
+        cache them per language. None without a translation service.
+        """
+        if self._translation_service is None:
+            return None
+        return self._translation_service.get_current_language().code
+
+    def get_rule_dependencies(self, entity_id: str) -> Optional[frozenset[str]]:
+        """Get the fields an entity's runtime rules read.
+
+        These are the fields with constraints (validation reads their
+        values) and the fields referenced by control rule formulas.
+
+        Args:
+            entity_id: Entity ID (string)
+
+        Returns:
+            Field IDs, or None if the entity does not exist
+        """
+        from doc_helper.domain.schema.schema_ids import EntityDefinitionId
+
+        try:
+            entity_id_obj = EntityDefinitionId(entity_id.strip())
+        except ValueError:
+            return None
+        load_result = self._schema_repository.get_by_id(entity_id_obj)
+        if load_result.is_failure():
+            return None
+
+        read_fields: set[str] = set()
+        for field_id, field in load_result.value.fields.items():
+            if field.constraints:
+                read_fields.add(field_id.value)
+            for rule in field.control_rules:
+                if isinstance(rule, ControlRuleExportDTO):
+                    read_fields |= self._formula_usecases.referenced_fields(
+                        self._formula_usecases.compile_formula(rule.formula_text)
+                    )
+        return frozenset(read_fields)
+
     def get_all_relationships(self) -> tuple[RelationshipDTO, ...]:
         """Get all relationship definitions.
 
@@ -407,7 +509,7 @@ class SchemaUseCases:
 
         if result.is_success():
             # Unwrap domain ID to string HERE (not in Presentation)
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -441,7 +543,7 @@ class SchemaUseCases:
 
         if result.is_success():
             # Unwrap domain ID to string HERE (not in Presentation)
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -461,7 +563,9 @@ class SchemaUseCases:
         result = self._delete_entity_command.execute(entity_id=entity_id)
 
         if result.is_success():
-            return OperationResult.ok(None)
+            self._schema_revision += 1
+            self._schema_query.invalidate(entity_id)
+            return EntityChangeResult(success=True, removed_entity_id=entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -532,7 +636,7 @@ class SchemaUseCases:
 
         if result.is_success():
             # Unwrap domain ID to string HERE (not in Presentation)
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -650,7 +754,7 @@ class SchemaUseCases:
 
         if result.is_success():
             # Unwrap domain ID to string HERE (not in Presentation)
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -674,7 +778,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(None)
+            return self._entity_changed(None, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -861,12 +965,16 @@ class SchemaUseCases:
             - was_skipped: True if import was skipped
             - error: Error message (on failure)
         """
-        return self._import_command.execute(
+        result = self._import_command.execute(
             file_path=file_path,
             enforcement_policy=enforcement_policy,
             identical_action=identical_action,
             force=force,
         )
+        if result.success and not result.was_skipped:
+            self._schema_revision += 1
+            self._schema_query.invalidate()
+        return result
 
     def add_constraint(
         self,
@@ -1115,7 +1223,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -1333,7 +1441,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to add control rule: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def update_control_rule(
         self,
@@ -1459,7 +1567,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to update control rule: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def delete_control_rule(
         self,
@@ -1544,7 +1652,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to delete control rule: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def list_control_rules_for_field(
         self,
@@ -1685,7 +1793,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to add output mapping: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def update_output_mapping(
         self,
@@ -1788,7 +1896,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to update output mapping: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def delete_output_mapping(
         self,
@@ -1869,7 +1977,7 @@ class SchemaUseCases:
         if save_result.is_failure():
             return OperationResult.fail(f"Failed to delete output mapping: {save_result.error}")
 
-        return OperationResult.ok(field_id)
+        return self._entity_changed(field_id, entity_id)
 
     def list_output_mappings_for_field(
         self,
@@ -1983,7 +2091,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -2023,7 +2131,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -2059,7 +2167,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -2100,7 +2208,7 @@ class SchemaUseCases:
         )
 
         if result.is_success():
-            return OperationResult.ok(result.value.value)
+            return self._entity_changed(result.value.value, entity_id)
         else:
             return OperationResult.fail(result.error)
 
@@ -4,8 +4,8 @@ Value objects are immutable objects defined by their attributes (ADR-010).
 """
 
 from abc import ABC
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, fields
+from typing import Any, Hashable
 
 
 @dataclass(frozen=True)
@@ -26,6 +26,10 @@ class ValueObject(ABC):
     - NO mutable attributes (lists, dicts, sets)
     - Use tuples instead of lists for collections
 
+    ValueObject declares no instance storage (empty __slots__), so
+    subclasses declared with slots=True carry no per-instance __dict__.
+    Value objects created in bulk (IDs, field values) should use it.
+
     Example:
         @dataclass(frozen=True)
         class FieldId(ValueObject):
@@ -44,14 +48,70 @@ class ValueObject(ABC):
         obj.value = "new"  # ❌ Would violate immutability
     """
 
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
-        """Value objects are equal if all attributes are equal."""
+        """Value objects are equal if all compared fields are equal."""
         if not isinstance(other, self.__class__):
             return False
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(self)
+            if f.compare
+        )
 
     def __hash__(self) -> int:
         """Hash based on all attributes for use in sets/dicts."""
         # Dataclass with frozen=True automatically implements __hash__
         # This is here for documentation
         return super().__hash__()
+
+
+
+@dataclass(frozen=True, eq=False)
+class ValueId(ValueObject):
+    """Base class for strongly-typed IDs wrapping a single value.
+
+    IDs are compared and hashed through their value alone, which is
+    cheaper than the field-by-field ValueObject comparison; IDs are
+    dictionary keys throughout the domain.
+
+    Subclasses declare a "value" field and must pass eq=False to
+    @dataclass, otherwise the generated __eq__/__hash__ replace these.
+
+    Example:
+        @dataclass(frozen=True, slots=True, eq=False)
+        class FieldId(ValueId):
+            value: str
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        """IDs are equal if they are the same type with the same value."""
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        """Hash of the value (str caches its own hash)."""
+        return hash(self.value)
+
+def freeze(value: Any) -> Hashable:
+    """Convert a value into a hashable form (for cache keys).
+
+    Lists, tuples and dicts are converted recursively. The value's type is
+    kept so values that compare equal across types (1, 1.0 and True) do
+    not share a key.
+
+    Raises:
+        TypeError: If the value (or a nested value) is not hashable
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((key, freeze(item)) for key, item in value.items()))
+    hash(value)
+    return (type(value), value)
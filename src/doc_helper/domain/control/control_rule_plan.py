@@ -0,0 +1,138 @@
+"""Compiled control rule plan.
+
+A ControlRulePlan prepares a set of control rules for repeated evaluation:
+enabled rules are sorted by priority once, conditions are parsed once, and
+every rule is indexed by the fields its condition reads. VALUE_SET rules
+are also indexed by their target field, so the evaluator can re-evaluate
+only the rules whose inputs changed (see ControlEffectEvaluator).
+
+The plan is tied to the schema version it was compiled from: its signature
+is the (rule_id, condition, effect, enabled, priority) of every rule, with
+effect values in hashable form. Callers that cache plans recompile when the
+signature of the current rules differs.
+"""
+
+from typing import Optional, Sequence, Union
+
+from doc_helper.domain.common.value_object import freeze
+from doc_helper.domain.control.control_rule import ControlRule
+from doc_helper.domain.formula.ast_nodes import ASTNode
+from doc_helper.domain.formula.dependency_tracker import DependencyTracker
+from doc_helper.domain.formula.parser import FormulaParser
+
+
+class ControlRulePlan:
+    """Priority-sorted, parsed and indexed control rules, built once.
+
+    Rules are addressed by their position in priority order (higher
+    priority first; equal priorities keep their input order).
+
+    Example:
+        plan = ControlRulePlan(rules)
+        for index in plan.readers_of("field1"):
+            print(plan.rules[index].id.value)
+        if plan.signature != ControlRulePlan.signature_of(rules):
+            plan = ControlRulePlan(rules)  # rules changed
+    """
+
+    __slots__ = ("_signature", "_rules", "_conditions", "_readers", "_setters")
+
+    def __init__(self, rules: Sequence[ControlRule]) -> None:
+        """Compile plan.
+
+        Conditions that fail to parse are kept as errors and reported each
+        time the rule is evaluated.
+
+        Args:
+            rules: Control rules (disabled rules are left out)
+        """
+        try:
+            self._signature: Optional[tuple] = self.signature_of(rules)
+        except TypeError:
+            self._signature = None
+        self._rules: tuple[ControlRule, ...] = tuple(
+            sorted(
+                (rule for rule in rules if rule.is_enabled),
+                key=lambda rule: rule.priority,
+                reverse=True,
+            )
+        )
+
+        tracker = DependencyTracker()
+        conditions: list[Union[ASTNode, Exception]] = []
+        readers: dict[str, list[int]] = {}
+        setters: dict[str, list[int]] = {}
+        for index, rule in enumerate(self._rules):
+            try:
+                condition = FormulaParser(rule.condition).parse()
+            except Exception as e:
+                conditions.append(e)
+            else:
+                conditions.append(condition)
+                for field_name in tracker.extract_dependencies(condition):
+                    readers.setdefault(field_name, []).append(index)
+            if rule.control_type.is_value_setter:
+                setters.setdefault(rule.target_field_id.value, []).append(index)
+
+        self._conditions = tuple(conditions)
+        self._readers = {name: tuple(indexes) for name, indexes in readers.items()}
+        self._setters = {name: tuple(indexes) for name, indexes in setters.items()}
+
+    @staticmethod
+    def signature_of(rules: Sequence[ControlRule]) -> tuple:
+        """Schema version of a set of control rules.
+
+        Args:
+            rules: Control rules
+
+        Returns:
+            (rule_id, condition, effect, enabled, priority) for every rule;
+            effects as (control_type, target_field_id, frozen value), so
+            list and dict VALUE_SET values are hashable
+
+        Raises:
+            TypeError: If an effect value cannot be made hashable
+        """
+        return tuple(
+            (
+                rule.id.value,
+                rule.condition,
+                (
+                    rule.effect.control_type,
+                    rule.effect.target_field_id,
+                    freeze(rule.effect.value),
+                ),
+                rule.enabled,
+                rule.priority,
+            )
+            for rule in rules
+        )
+
+    @property
+    def signature(self) -> Optional[tuple]:
+        """Signature of the rules this plan was compiled from (None if unhashable)."""
+        return self._signature
+
+    @property
+    def rules(self) -> tuple[ControlRule, ...]:
+        """Enabled rules in priority order."""
+        return self._rules
+
+    def condition(self, index: int) -> Union[ASTNode, Exception]:
+        """Parsed condition of a rule, or the error that parsing raised."""
+        return self._conditions[index]
+
+    def readers_of(self, field_name: str) -> tuple[int, ...]:
+        """Rules whose conditions read a field, in priority order."""
+        return self._readers.get(field_name, ())
+
+    def setters_of(self, field_name: str) -> tuple[int, ...]:
+        """VALUE_SET rules targeting a field, in priority order."""
+        return self._setters.get(field_name, ())
+
+    def target_of_setter(self, index: int) -> Optional[str]:
+        """Field a rule sets, or None if it is not a VALUE_SET rule."""
+        rule = self._rules[index]
+        if not rule.control_type.is_value_setter:
+            return None
+        return rule.target_field_id.value
@@ -3,16 +3,22 @@
 Evaluates control rules to determine which effects should be applied.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Union
 
 from doc_helper.domain.common.result import Result, Success, Failure
 from doc_helper.domain.control.control_effect import ControlEffect
 from doc_helper.domain.control.control_rule import ControlRule
+from doc_helper.domain.control.control_rule_plan import ControlRulePlan
+from doc_helper.domain.formula.ast_nodes import ASTNode
 from doc_helper.domain.formula.evaluator import FormulaEvaluator, EvaluationContext
 from doc_helper.domain.formula.parser import FormulaParser
 from doc_helper.domain.schema.schema_ids import FieldDefinitionId
 
+# Marks a field absent from the field values
+_MISSING = object()
+
 
 @dataclass(frozen=True)
 class EvaluationResult:
@@ -77,6 +83,25 @@ class ControlEffectEvaluator:
     - Returns effects for rules where conditions are true
     - Handles enabled/disabled rules
     - Supports priority-based conflict resolution
+    - Applies VALUE_SET effects until the rules reach a fixed point
+
+    VALUE_SET effects change field values that other rule conditions may
+    read. evaluate_rules() works from a worklist: after each round only
+    the rules reading a field whose value changed are evaluated again.
+    Among the true VALUE_SET rules targeting a field the highest priority
+    one sets its value; when none is true the field keeps its input value.
+    A VALUE_SET rule whose condition reads its own target field sees that
+    field's input value, as in a single pass: setting the field does not
+    switch the rule off again.
+    Evaluation stops after max_iterations rounds, or as soon as a round
+    repeats an earlier state (rules that keep switching each other on and
+    off); both are reported as errors and the effects of the last round
+    are returned.
+
+    Rules are compiled into a ControlRulePlan (priority-sorted, parsed,
+    indexed by the fields they read) once per schema version. Plans are
+    cached by rule signature; the least recently used plans are evicted
+    beyond max_plans.
 
     Example:
         # Evaluate rules
@@ -92,13 +117,65 @@ class ControlEffectEvaluator:
             apply_effect(effect)
     """
 
+    DEFAULT_MAX_ITERATIONS = 50
+    DEFAULT_MAX_PLANS = 32
+
+    def __init__(
+        self,
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        max_plans: int = DEFAULT_MAX_PLANS,
+    ) -> None:
+        """Initialize evaluator.
+
+        Args:
+            max_iterations: Maximum evaluation rounds before giving up
+            max_plans: Maximum number of compiled plans kept
+
+        Raises:
+            ValueError: If max_iterations or max_plans is not positive
+        """
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be positive")
+        if max_plans < 1:
+            raise ValueError("max_plans must be positive")
+        self._max_iterations = max_iterations
+        # Compiled plans by rule signature (schema version), least recently used first
+        self._max_plans = max_plans
+        self._plans: OrderedDict[tuple, ControlRulePlan] = OrderedDict()
+
+    def get_plan(self, rules: list) -> ControlRulePlan:  # List[ControlRule]
+        """Get the compiled plan for a set of control rules.
+
+        The cached plan is reused while the rules are unchanged; changed
+        rules have another signature and are compiled into a new plan.
+        Rules whose effect values cannot be hashed are compiled uncached.
+
+        Args:
+            rules: Control rules
+
+        Returns:
+            ControlRulePlan for the rules
+        """
+        try:
+            signature = ControlRulePlan.signature_of(rules)
+        except TypeError:
+            return ControlRulePlan(rules)
+        plan = self._plans.get(signature)
+        if plan is None:
+            plan = ControlRulePlan(rules)
+            self._plans[signature] = plan
+        self._plans.move_to_end(signature)
+        if len(self._plans) > self._max_plans:
+            self._plans.popitem(last=False)
+        return plan
+
     def evaluate_rules(
         self,
         rules: list,  # List[ControlRule]
         field_values: dict,  # Dict[str, Any]
         functions: dict = None,  # Dict[str, Callable]
     ) -> EvaluationResult:
-        """Evaluate a list of control rules.
+        """Evaluate a list of control rules to a fixed point.
 
         Args:
             rules: List of control rules to evaluate
@@ -106,7 +183,8 @@ class ControlEffectEvaluator:
             functions: Optional functions available for formula evaluation
 
         Returns:
-            EvaluationResult with effects to apply and any errors
+            EvaluationResult with effects to apply (highest priority first)
+            and any errors
         """
         if not isinstance(rules, list):
             raise TypeError("rules must be a list")
@@ -120,31 +198,133 @@ class ControlEffectEvaluator:
         if functions is None:
             functions = {}
 
-        effects = []
-        errors = []
+        plan = self.get_plan(rules)
+        values = dict(field_values)
+        active = [False] * len(plan.rules)
+        failures: dict[int, str] = {}
+        settle_error = None
+
+        worklist = frozenset(range(len(plan.rules)))
+        seen_states = set()
+        iterations = 0
+        while worklist:
+            state = (tuple(active), worklist)
+            if state in seen_states:
+                rule_ids = ", ".join(plan.rules[index].id.value for index in sorted(worklist))
+                settle_error = f"Control rules did not settle, oscillating rules: {rule_ids}"
+                break
+            if iterations == self._max_iterations:
+                settle_error = (
+                    f"Control rules did not settle within {self._max_iterations} iterations"
+                )
+                break
+            seen_states.add(state)
+            iterations += 1
+
+            # Every rule of a round sees the values from the start of the round
+            context = EvaluationContext(field_values=values, functions=functions)
+            changed_targets = set()
+            for index in sorted(worklist):
+                result = self._evaluate_ast(
+                    plan.condition(index),
+                    self._rule_context(plan, index, context, field_values),
+                )
+                if isinstance(result, Failure):
+                    failures[index] = result.error
+                else:
+                    failures.pop(index, None)
+                is_true = isinstance(result, Success) and result.value is True
+                if is_true != active[index]:
+                    active[index] = is_true
+                    target = plan.target_of_setter(index)
+                    if target is not None:
+                        changed_targets.add(target)
+
+            next_worklist = set()
+            for target in changed_targets:
+                if self._apply_value_set(plan, target, active, values, field_values):
+                    next_worklist.update(plan.readers_of(target))
+            worklist = frozenset(next_worklist)
+
+        errors = [
+            f"Rule '{plan.rules[index].id.value}' condition evaluation failed: {failures[index]}"
+            for index in sorted(failures)
+        ]
+        if settle_error is not None:
+            errors.append(settle_error)
+
+        effects = tuple(
+            rule.effect for rule, is_active in zip(plan.rules, active) if is_active
+        )
+        return EvaluationResult(effects=effects, errors=tuple(errors))
 
-        # Sort rules by priority (higher priority first)
-        sorted_rules = sorted(rules, key=lambda r: r.priority, reverse=True)
+    @staticmethod
+    def _rule_context(
+        plan: ControlRulePlan,
+        index: int,
+        context: EvaluationContext,
+        input_values: dict,  # Dict[str, Any]
+    ) -> EvaluationContext:
+        """Context a rule's condition is evaluated in.
 
-        for rule in sorted_rules:
-            # Skip disabled rules
-            if not rule.is_enabled:
-                continue
+        A VALUE_SET rule reading its own target sees the target's input value.
 
-            # Evaluate rule condition
-            result = self._evaluate_condition(rule.condition, field_values, functions)
+        Args:
+            plan: Compiled rules
+            index: Rule (by plan index)
+            context: Context of the round
+            input_values: Field values evaluation started from
 
-            if isinstance(result, Failure):
-                errors.append(
-                    f"Rule '{rule.id.value}' condition evaluation failed: {result.error}"
-                )
-                continue
+        Returns:
+            context, or a copy with the rule's target reset to its input value
+        """
+        target = plan.target_of_setter(index)
+        if target is None or index not in plan.readers_of(target):
+            return context
+        values = dict(context.field_values)
+        if target in input_values:
+            values[target] = input_values[target]
+        else:
+            values.pop(target, None)
+        return EvaluationContext(field_values=values, functions=context.functions)
+
+    @staticmethod
+    def _apply_value_set(
+        plan: ControlRulePlan,
+        target: str,
+        active: list,  # List[bool]
+        values: dict,  # Dict[str, Any]
+        input_values: dict,  # Dict[str, Any]
+    ) -> bool:
+        """Set a field to the value of its highest priority true VALUE_SET rule.
 
-            # If condition is true, add effect
-            if result.value is True:
-                effects.append(rule.effect)
+        Args:
+            plan: Compiled rules
+            target: Field name
+            active: Rule states (by plan index)
+            values: Working field values (updated)
+            input_values: Field values evaluation started from
 
-        return EvaluationResult(effects=tuple(effects), errors=tuple(errors))
+        Returns:
+            True if the field's value changed
+        """
+        for index in plan.setters_of(target):
+            if active[index]:
+                new_value = plan.rules[index].effect.value
+                break
+        else:
+            new_value = input_values.get(target, _MISSING)
+
+        old_value = values.get(target, _MISSING)
+        if old_value is new_value or (
+            old_value is not _MISSING and new_value is not _MISSING and old_value == new_value
+        ):
+            return False
+        if new_value is _MISSING:
+            del values[target]
+        else:
+            values[target] = new_value
+        return True
 
     def evaluate_rule(
         self,
@@ -193,14 +373,30 @@ class ControlEffectEvaluator:
             Success(True/False) if evaluation succeeds, Failure if error
         """
         try:
-            # Parse condition
-            parser = FormulaParser(condition)
-            ast = parser.parse()
-
-            # Evaluate condition
-            context = EvaluationContext(field_values=field_values, functions=functions)
-            evaluator = FormulaEvaluator(context)
-            result = evaluator.evaluate(ast)
+            ast = FormulaParser(condition).parse()
+        except Exception as e:
+            return Failure(f"Error evaluating condition: {str(e)}")
+
+        context = EvaluationContext(field_values=field_values, functions=functions)
+        return self._evaluate_ast(ast, context)
+
+    @staticmethod
+    def _evaluate_ast(
+        condition: Union[ASTNode, Exception], context: EvaluationContext
+    ) -> Result[bool, str]:
+        """Evaluate a parsed condition.
+
+        Args:
+            condition: Parsed condition, or the error parsing raised
+            context: Field values and functions
+
+        Returns:
+            Success(True/False) if evaluation succeeds, Failure if error
+        """
+        if isinstance(condition, Exception):
+            return Failure(f"Error evaluating condition: {str(condition)}")
+        try:
+            result = FormulaEvaluator(context).evaluate(condition)
 
             if isinstance(result, Failure):
                 return Failure(f"Condition evaluation failed: {result.error}")
@@ -10,6 +10,9 @@ This context handles:
 Domain entities:
 - Attachment: File reference aggregate
 
+Storage:
+- IAttachmentBlobStore: Content-addressed, deduplicated file storage
+
 Value objects:
 - FigureNumber: Auto-assigned sequential number
 - NumberingFormat: Style + prefix + suffix
@@ -23,16 +26,21 @@ Services:
 
 from doc_helper.domain.file.entities.attachment import Attachment
 from doc_helper.domain.file.file_ids import AttachmentId
-from doc_helper.domain.file.repositories import IAttachmentRepository
+from doc_helper.domain.file.repositories import IAttachmentBlobStore, IAttachmentRepository
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
 from doc_helper.domain.file.value_objects.figure_number import FigureNumber
 from doc_helper.domain.file.value_objects.index_type import IndexType
 from doc_helper.domain.file.value_objects.numbering_format import NumberingFormat
 from doc_helper.domain.file.value_objects.numbering_style import NumberingStyle
+from doc_helper.domain.file.value_objects.storage_report import AttachmentStorageReport
 
 __all__ = [
     "Attachment",
     "AttachmentId",
     "IAttachmentRepository",
+    "IAttachmentBlobStore",
+    "AttachmentStorageReport",
+    "ContentHash",
     "FigureNumber",
     "IndexType",
     "NumberingFormat",
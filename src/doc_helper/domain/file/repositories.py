@@ -6,11 +6,14 @@ persistence concerns.
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import List
 
 from doc_helper.domain.common.result import Result
 from doc_helper.domain.file.entities.attachment import Attachment
 from doc_helper.domain.file.file_ids import AttachmentId
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
+from doc_helper.domain.file.value_objects.storage_report import AttachmentStorageReport
 from doc_helper.domain.project.project_ids import ProjectId
 from doc_helper.domain.schema.schema_ids import FieldDefinitionId
 
@@ -187,3 +190,83 @@ class IAttachmentRepository(ABC):
             - All attachments must exist in repository
         """
         pass
+
+
+class IAttachmentBlobStore(ABC):
+    """Content-addressed storage for attachment files.
+
+    RULES:
+    - Files are keyed by ContentHash; identical content is stored once
+    - Each attachment holds one reference to its blob
+    - A blob is removed when its last reference is released
+    """
+
+    @abstractmethod
+    def store(
+        self,
+        source_path: Path,
+        attachment_id: AttachmentId,
+        project_id: ProjectId,
+    ) -> Result[ContentHash, str]:
+        """Store a file for an attachment.
+
+        Args:
+            source_path: File to store
+            attachment_id: Attachment that references the content
+            project_id: Project the attachment belongs to
+
+        Returns:
+            Result containing:
+            - Success: ContentHash of the stored content
+            - Failure: Error message if hashing or storing fails
+
+        Notes:
+            - Content already in the store is not copied again
+            - Storing again for the same attachment replaces its reference
+        """
+        pass
+
+    @abstractmethod
+    def release(self, attachment_id: AttachmentId) -> Result[None, str]:
+        """Drop an attachment's reference to its blob.
+
+        Args:
+            attachment_id: Attachment whose reference is released
+
+        Returns:
+            Result containing:
+            - Success: None (also when the attachment had no reference)
+            - Failure: Error message if release fails
+
+        Notes:
+            - The blob file is deleted when no references remain
+        """
+        pass
+
+    @abstractmethod
+    def get_blob_path(self, content_hash: ContentHash) -> Result[Path, str]:
+        """Get the stored file for a content hash.
+
+        Args:
+            content_hash: Content to locate
+
+        Returns:
+            Result containing:
+            - Success: Absolute path to the blob file
+            - Failure: Error message if the content is not stored
+        """
+        pass
+
+    @abstractmethod
+    def get_storage_report(self, project_id: ProjectId) -> Result[AttachmentStorageReport, str]:
+        """Report how much storage deduplication saves for a project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Result containing:
+            - Success: AttachmentStorageReport for the project
+            - Failure: Error message if query fails
+        """
+        pass
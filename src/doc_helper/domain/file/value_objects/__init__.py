@@ -4,10 +4,14 @@ from doc_helper.domain.file.value_objects.index_type import IndexType
 from doc_helper.domain.file.value_objects.numbering_style import NumberingStyle
 from doc_helper.domain.file.value_objects.figure_number import FigureNumber
 from doc_helper.domain.file.value_objects.numbering_format import NumberingFormat
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
+from doc_helper.domain.file.value_objects.storage_report import AttachmentStorageReport
 
 __all__ = [
     "IndexType",
     "NumberingStyle",
     "FigureNumber",
     "NumberingFormat",
+    "ContentHash",
+    "AttachmentStorageReport",
 ]
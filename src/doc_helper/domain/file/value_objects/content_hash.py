@@ -0,0 +1,42 @@
+"""Content hash value object."""
+
+from dataclasses import dataclass
+
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+@dataclass(frozen=True)
+class ContentHash:
+    """SHA-256 digest identifying attachment file content.
+
+    Identical files have the same ContentHash, so the blob store keeps
+    only one copy of each regardless of how many attachments use it.
+
+    Example:
+        content_hash = ContentHash("9f86d081884c7d65...")  # 64 hex chars
+        assert content_hash.shard == ("9f", "86")
+    """
+
+    value: str  # Lowercase hex SHA-256 digest
+
+    def __post_init__(self) -> None:
+        """Validate content hash.
+
+        Raises:
+            TypeError: If value is not a string
+            ValueError: If value is not a 64-character lowercase hex digest
+        """
+        if not isinstance(self.value, str):
+            raise TypeError(f"value must be str, got {type(self.value)}")
+        if len(self.value) != 64 or not _HEX_DIGITS.issuperset(self.value):
+            raise ValueError(f"value must be a lowercase SHA-256 hex digest, got {self.value!r}")
+
+    @property
+    def shard(self) -> tuple[str, str]:
+        """Two-level directory shard (first and second byte of the digest)."""
+        return self.value[:2], self.value[2:4]
+
+    def __str__(self) -> str:
+        """String representation (hex digest)."""
+        return self.value
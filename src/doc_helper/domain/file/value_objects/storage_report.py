@@ -0,0 +1,57 @@
+"""Attachment storage report value object."""
+
+from dataclasses import dataclass
+
+from doc_helper.domain.project.project_ids import ProjectId
+
+
+@dataclass(frozen=True)
+class AttachmentStorageReport:
+    """Disk usage of a project's attachments in the content-addressed store.
+
+    logical_bytes is what the attachments would occupy if every one were
+    stored as its own file; stored_bytes counts each distinct content once.
+
+    Example:
+        report = AttachmentStorageReport(
+            project_id=project_id,
+            attachment_count=3,
+            unique_blob_count=1,
+            logical_bytes=3000,
+            stored_bytes=1000,
+        )
+        assert report.saved_bytes == 2000
+    """
+
+    project_id: ProjectId
+    attachment_count: int
+    unique_blob_count: int
+    logical_bytes: int
+    stored_bytes: int
+
+    def __post_init__(self) -> None:
+        """Validate report.
+
+        Raises:
+            TypeError: If project_id is not ProjectId
+            ValueError: If counts are negative or inconsistent
+        """
+        if not isinstance(self.project_id, ProjectId):
+            raise TypeError(f"project_id must be ProjectId, got {type(self.project_id)}")
+        for name in ("attachment_count", "unique_blob_count", "logical_bytes", "stored_bytes"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
+        if self.stored_bytes > self.logical_bytes:
+            raise ValueError("stored_bytes cannot exceed logical_bytes")
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by deduplication."""
+        return self.logical_bytes - self.stored_bytes
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of logical size saved (0.0 when there is nothing stored)."""
+        if self.logical_bytes == 0:
+            return 0.0
+        return self.saved_bytes / self.logical_bytes
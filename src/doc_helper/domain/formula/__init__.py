@@ -9,13 +9,30 @@ from doc_helper.domain.formula.ast_nodes import (
     BinaryOp,
     UnaryOp,
     Literal,
+    ColumnReference,
     FieldReference,
     FunctionCall,
 )
 from doc_helper.domain.formula.evaluator import FormulaEvaluator, EvaluationContext
 from doc_helper.domain.formula.parser import FormulaParser
-from doc_helper.domain.formula.tokenizer import FormulaTokenizer, Token, TokenType
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
+from doc_helper.domain.formula.table_columns import (
+    TABLE_AGGREGATE_FUNCTIONS,
+    ColumnVector,
+    TableColumns,
+)
+from doc_helper.domain.formula.tokenizer import (
+    FormulaTokenizer,
+    IncrementalFormulaTokenizer,
+    Token,
+    TokenType,
+)
 from doc_helper.domain.formula.dependency_tracker import DependencyTracker
+from doc_helper.domain.formula.dependency_analysis import (
+    DependencyAnalysis,
+    DependencyAnalyzer,
+    IncrementalCycleDetector,
+)
 
 __all__ = [
     # AST
@@ -23,17 +40,26 @@ __all__ = [
     "BinaryOp",
     "UnaryOp",
     "Literal",
+    "ColumnReference",
     "FieldReference",
     "FunctionCall",
     # Tokenizer
     "FormulaTokenizer",
+    "IncrementalFormulaTokenizer",
     "Token",
     "TokenType",
     # Parser
     "FormulaParser",
+    "FormulaParseCache",
     # Evaluator
     "FormulaEvaluator",
     "EvaluationContext",
+    "ColumnVector",
+    "TableColumns",
+    "TABLE_AGGREGATE_FUNCTIONS",
     # Dependency tracking
     "DependencyTracker",
+    "DependencyAnalysis",
+    "DependencyAnalyzer",
+    "IncrementalCycleDetector",
 ]
@@ -59,6 +59,36 @@ class FieldReference(ASTNode):
         return f"FieldReference({self.field_name!r})"
 
 
+@dataclass(frozen=True)
+class ColumnReference(ASTNode):
+    """Reference to one column of a TABLE field (table.column).
+
+    Evaluates to every row's value of that column at once, so it is only
+    meaningful inside table aggregates such as sum_of().
+
+    Example:
+        ColumnReference("layers", "thickness")  # layers.thickness
+    """
+
+    table_name: str
+    column_name: str
+
+    def __post_init__(self) -> None:
+        """Validate column reference."""
+        if not isinstance(self.table_name, str):
+            raise TypeError("table_name must be a string")
+        if not isinstance(self.column_name, str):
+            raise TypeError("column_name must be a string")
+        if not self.table_name:
+            raise ValueError("table_name cannot be empty")
+        if not self.column_name:
+            raise ValueError("column_name cannot be empty")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"ColumnReference({self.table_name!r}, {self.column_name!r})"
+
+
 @dataclass(frozen=True)
 class BinaryOp(ASTNode):
     """Binary operation (left operator right).
@@ -0,0 +1,355 @@
+"""Strongly-connected-component analysis for dependency graphs.
+
+Shared cycle detection and evaluation ordering for formulas, control
+rules and output mappings. Iterative (no recursion), so long formula
+chains cannot hit Python's recursion limit.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+
+@dataclass(frozen=True)
+class DependencyAnalysis:
+    """Result of analyzing a dependency graph.
+
+    Attributes:
+        cycle_clusters: Strongly connected components that contain a cycle
+            (two or more nodes, or one node depending on itself). Members
+            are sorted; clusters are sorted by their first member.
+        cycles: Elementary cycles (real dependency paths) that together
+            cover every node of every cluster. Each cycle starts at its
+            smallest node and does not repeat it at the end (("a", "b")
+            means a -> b -> a).
+        evaluation_order: Nodes outside any cycle cluster, dependencies
+            before dependents.
+    """
+
+    cycle_clusters: tuple[tuple[str, ...], ...]
+    cycles: tuple[tuple[str, ...], ...]
+    evaluation_order: tuple[str, ...]
+
+    @property
+    def has_cycles(self) -> bool:
+        """Check if the graph contains any cycle."""
+        return len(self.cycle_clusters) > 0
+
+    @property
+    def cyclic_nodes(self) -> frozenset[str]:
+        """All nodes that belong to a cycle cluster."""
+        return frozenset(node for cluster in self.cycle_clusters for node in cluster)
+
+
+class DependencyAnalyzer:
+    """Finds cycle clusters and evaluation order in O(V + E).
+
+    The graph maps each node to the nodes it depends on. Only keys are
+    nodes; dependencies that are not keys are external inputs (e.g. plain
+    data fields) and are ignored, since they cannot take part in a cycle.
+
+    Uses iterative Tarjan's algorithm. Tarjan emits components with every
+    dependency before its dependents, which is directly the evaluation
+    order. Nodes and edges are visited in sorted order, so the result is
+    deterministic regardless of dict/set ordering.
+
+    Example:
+        analysis = DependencyAnalyzer().analyze({
+            "total": {"subtotal", "tax"},
+            "tax": {"subtotal"},
+            "subtotal": set(),
+        })
+        analysis.evaluation_order  # ("subtotal", "tax", "total")
+    """
+
+    def analyze(self, graph: Mapping[str, Iterable[str]]) -> DependencyAnalysis:
+        """Analyze a dependency graph.
+
+        Args:
+            graph: Mapping from node to the nodes it depends on
+
+        Returns:
+            DependencyAnalysis with cycle clusters, cycles and evaluation order
+        """
+        adjacency = {
+            node: sorted({dep for dep in deps if dep in graph})
+            for node, deps in graph.items()
+        }
+
+        clusters: list[tuple[str, ...]] = []
+        order: list[str] = []
+        for component in self._strongly_connected_components(adjacency):
+            if len(component) > 1 or component[0] in adjacency[component[0]]:
+                clusters.append(tuple(sorted(component)))
+            else:
+                order.append(component[0])
+
+        clusters.sort()
+        cycles: list[tuple[str, ...]] = []
+        for cluster in clusters:
+            cycles.extend(self._covering_cycles(cluster, adjacency))
+
+        return DependencyAnalysis(
+            cycle_clusters=tuple(clusters),
+            cycles=tuple(cycles),
+            evaluation_order=tuple(order),
+        )
+
+    @staticmethod
+    def _strongly_connected_components(
+        adjacency: dict[str, list[str]],
+    ) -> list[list[str]]:
+        """Iterative Tarjan's algorithm.
+
+        Args:
+            adjacency: Node -> sorted dependencies (all dependencies are nodes)
+
+        Returns:
+            Components in reverse topological order of the condensation
+            (dependencies first)
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in sorted(adjacency):
+            if root in index:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adjacency[root]))]
+
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        index[dep] = low[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(adjacency[dep])))
+                        break
+                    if dep in on_stack and index[dep] < low[node]:
+                        low[node] = index[dep]
+                else:
+                    # All dependencies of node explored
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        return components
+
+    @staticmethod
+    def _covering_cycles(
+        cluster: tuple[str, ...],
+        adjacency: dict[str, list[str]],
+    ) -> list[tuple[str, ...]]:
+        """Pick elementary cycles until every cluster member is on one.
+
+        Two breadth-first searches from the smallest member r (forward along
+        dependencies and backward against them) give, for any member v, a
+        path r -> v and a path v -> r. Joining them at the first node they
+        share yields an elementary cycle through v in O(path length).
+
+        Args:
+            cluster: Sorted members of a strongly connected component
+            adjacency: Node -> sorted dependencies
+
+        Returns:
+            Cycles, each rotated to start at its smallest node
+        """
+        root = cluster[0]
+        if len(cluster) == 1:
+            return [(root,)]
+
+        members = set(cluster)
+        reverse: dict[str, list[str]] = {node: [] for node in cluster}
+        for node in cluster:
+            for dep in adjacency[node]:
+                if dep in members:
+                    reverse[dep].append(node)
+
+        forward_parent = DependencyAnalyzer._bfs_tree(root, adjacency, members)
+        backward_next = DependencyAnalyzer._bfs_tree(root, reverse, members)
+
+        def path_to_root(node: str) -> list[str]:
+            path = [node]
+            while node != root:
+                node = backward_next[node]
+                path.append(node)
+            return path
+
+        cycles: list[tuple[str, ...]] = []
+        covered: set[str] = set()
+        for node in cluster:
+            if node in covered:
+                continue
+
+            if node == root:
+                if root in adjacency[root]:
+                    cycle = [root]
+                else:
+                    first = next(dep for dep in adjacency[root] if dep in members)
+                    cycle = [root] + path_to_root(first)[:-1]
+            else:
+                forward = [node]
+                while forward[-1] != root:
+                    forward.append(forward_parent[forward[-1]])
+                forward.reverse()  # root ... node
+                position = {member: i for i, member in enumerate(forward)}
+                backward = path_to_root(node)  # node ... root
+                for i in range(1, len(backward)):
+                    if backward[i] in position:
+                        cycle = forward[position[backward[i]]:] + backward[1:i]
+                        break
+
+            smallest = cycle.index(min(cycle))
+            rotated = tuple(cycle[smallest:] + cycle[:smallest])
+            cycles.append(rotated)
+            covered.update(rotated)
+
+        return cycles
+
+    @staticmethod
+    def _bfs_tree(
+        root: str,
+        adjacency: dict[str, list[str]],
+        members: set[str],
+    ) -> dict[str, str]:
+        """Breadth-first search tree within a cluster.
+
+        Returns:
+            Node -> the node it was reached from (root maps to itself)
+        """
+        parent = {root: root}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for dep in adjacency[node]:
+                if dep in members and dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        return parent
+
+
+class IncrementalCycleDetector:
+    """Keeps the cycle clusters of a dependency graph current under edits.
+
+    The full graph is analyzed once. When a single node's dependencies
+    change, only the region that can be affected is re-analyzed: the
+    node's previous cluster plus the nodes that are now both reachable
+    from it and able to reach it. Every other cluster is untouched by
+    the edit, so its cycles are kept as they are.
+
+    Same node semantics as DependencyAnalyzer: only keys are nodes.
+
+    Example:
+        detector = IncrementalCycleDetector({"a": {"b"}, "b": set()})
+        detector.set_dependencies("b", {"a"})
+        detector.cycles  # (("a", "b"),)
+    """
+
+    def __init__(self, graph: Mapping[str, Iterable[str]]) -> None:
+        """Analyze the initial graph.
+
+        Args:
+            graph: Mapping from node to the nodes it depends on
+        """
+        self._graph: dict[str, frozenset[str]] = {
+            node: frozenset(deps) for node, deps in graph.items()
+        }
+        self._dependents: dict[str, set[str]] = {}
+        for node, deps in self._graph.items():
+            for dep in deps:
+                self._dependents.setdefault(dep, set()).add(node)
+
+        self._cluster_of: dict[str, tuple[str, ...]] = {}
+        self._cycles_of: dict[tuple[str, ...], tuple[tuple[str, ...], ...]] = {}
+        self._add_clusters(DependencyAnalyzer().analyze(self._graph))
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self._graph)
+
+    @property
+    def cycle_clusters(self) -> tuple[tuple[str, ...], ...]:
+        """Current cycle clusters, sorted."""
+        return tuple(sorted(self._cycles_of))
+
+    @property
+    def cycles(self) -> tuple[tuple[str, ...], ...]:
+        """Current covering cycles, grouped by sorted cluster."""
+        return tuple(
+            cycle for cluster in self.cycle_clusters for cycle in self._cycles_of[cluster]
+        )
+
+    def set_dependencies(self, node: str, dependencies: Iterable[str]) -> None:
+        """Replace one node's dependencies (adding the node if new).
+
+        Args:
+            node: Node whose dependencies changed
+            dependencies: Its new dependencies
+        """
+        new_deps = frozenset(dependencies)
+        for dep in self._graph.get(node, frozenset()) - new_deps:
+            self._dependents[dep].discard(node)
+        for dep in new_deps - self._graph.get(node, frozenset()):
+            self._dependents.setdefault(dep, set()).add(node)
+        self._graph[node] = new_deps
+
+        region = set(self._cluster_of.get(node, (node,)))
+        region.update(self._reachable(node, self._graph) & self._reachable(node, self._dependents))
+
+        for member in region:
+            cluster = self._cluster_of.pop(member, None)
+            if cluster is not None:
+                self._cycles_of.pop(cluster, None)
+
+        subgraph = {member: self._graph[member] & region for member in region}
+        self._add_clusters(DependencyAnalyzer().analyze(subgraph))
+
+    def _add_clusters(self, analysis: DependencyAnalysis) -> None:
+        """Record clusters and their cycles from an analysis."""
+        grouped: dict[tuple[str, ...], list[tuple[str, ...]]] = {}
+        for cluster in analysis.cycle_clusters:
+            grouped[cluster] = []
+            for member in cluster:
+                self._cluster_of[member] = cluster
+        for cycle in analysis.cycles:
+            grouped[self._cluster_of[cycle[0]]].append(cycle)
+        for cluster, cycles in grouped.items():
+            self._cycles_of[cluster] = tuple(cycles)
+
+    def _reachable(
+        self,
+        start: str,
+        adjacency: Mapping[str, Iterable[str]],
+    ) -> set[str]:
+        """Graph nodes reachable from start (start included)."""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for nxt in adjacency.get(current, ()):
+                if nxt not in seen and nxt in self._graph:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return seen
@@ -12,9 +12,11 @@ from doc_helper.domain.formula.ast_nodes import (
     BinaryOp,
     UnaryOp,
     Literal,
+    ColumnReference,
     FieldReference,
     FunctionCall,
 )
+from doc_helper.domain.formula.dependency_analysis import DependencyAnalyzer
 
 
 @dataclass(frozen=True)
@@ -72,6 +74,7 @@ class DependencyTracker:
 
     Can:
     - Extract field references from AST
+    - Extract TABLE column references (table.column) from AST
     - Build dependency graph
     - Detect circular dependencies
     - Compute evaluation order (topological sort)
@@ -93,7 +96,8 @@ class DependencyTracker:
             node: AST node to analyze
 
         Returns:
-            Set of field names referenced in the AST
+            Set of field names referenced in the AST (a table.column
+            reference counts as a reference to the TABLE field)
         """
         dependencies = set()
         self._collect_field_references(node, dependencies)
@@ -109,6 +113,9 @@ class DependencyTracker:
         if isinstance(node, FieldReference):
             dependencies.add(node.field_name)
 
+        elif isinstance(node, ColumnReference):
+            dependencies.add(node.table_name)
+
         elif isinstance(node, BinaryOp):
             self._collect_field_references(node.left, dependencies)
             self._collect_field_references(node.right, dependencies)
@@ -160,47 +167,11 @@ class DependencyTracker:
         Returns:
             Success(None) if no cycles found, Failure(list of cycles) if cycles exist
         """
-        cycles = []
-
-        # Track visited nodes during DFS
-        visited = set()
-        rec_stack = set()  # Recursion stack for cycle detection
-        path = []  # Current path for cycle reporting
-
-        def dfs(field_name: str) -> bool:
-            """DFS to detect cycles.
-
-            Returns:
-                True if cycle detected
-            """
-            visited.add(field_name)
-            rec_stack.add(field_name)
-            path.append(field_name)
-
-            # Check all dependencies
-            for dep in graph.get_dependencies(field_name):
-                if dep not in visited:
-                    if dfs(dep):
-                        return True
-                elif dep in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(dep)
-                    cycle = path[cycle_start:] + [dep]
-                    cycle_str = " -> ".join(cycle)
-                    cycles.append(cycle_str)
-                    return True
-
-            path.pop()
-            rec_stack.remove(field_name)
-            return False
-
-        # Check each field
-        for field_name in graph.dependencies:
-            if field_name not in visited:
-                dfs(field_name)
-
-        if cycles:
-            return Failure(cycles)
+        analysis = DependencyAnalyzer().analyze(graph.dependencies)
+        if analysis.has_cycles:
+            return Failure([
+                " -> ".join(cycle + (cycle[0],)) for cycle in analysis.cycles
+            ])
         return Success(None)
 
     def topological_sort(self, graph: DependencyGraph) -> Result[list, str]:
@@ -215,32 +186,9 @@ class DependencyTracker:
         Returns:
             Success(list of field names in evaluation order) or Failure(error)
         """
-        # Check for cycles first
-        cycle_result = self.find_circular_dependencies(graph)
-        if isinstance(cycle_result, Failure):
-            return Failure(f"Circular dependencies detected: {cycle_result.error}")
-
-        # Kahn's algorithm for topological sort
-        # Calculate in-degrees (number of fields this field depends on)
-        in_degree = {}
-        for field in graph.dependencies:
-            # In-degree is the number of dependencies this field has
-            in_degree[field] = len(graph.get_dependencies(field))
-
-        # Queue of fields with no dependencies (in-degree 0)
-        queue = [field for field, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            # Process field with no remaining dependencies
-            field = queue.pop(0)
-            result.append(field)
-
-            # Find fields that depend on this field and reduce their in-degree
-            for other_field in graph.dependencies:
-                if field in graph.get_dependencies(other_field):
-                    in_degree[other_field] -= 1
-                    if in_degree[other_field] == 0:
-                        queue.append(other_field)
-
-        return Success(result)
+        analysis = DependencyAnalyzer().analyze(graph.dependencies)
+        if analysis.has_cycles:
+            cycles = [" -> ".join(cycle + (cycle[0],)) for cycle in analysis.cycles]
+            return Failure(f"Circular dependencies detected: {cycles}")
+
+        return Success(list(analysis.evaluation_order))
@@ -3,7 +3,8 @@
 Evaluates AST nodes to compute formula results.
 """
 
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from doc_helper.domain.common.result import Result, Success, Failure
@@ -12,9 +13,33 @@ from doc_helper.domain.formula.ast_nodes import (
     BinaryOp,
     UnaryOp,
     Literal,
+    ColumnReference,
     FieldReference,
     FunctionCall,
 )
+from doc_helper.domain.formula.table_columns import ColumnVector, TableColumns
+
+# Element-wise operators applied when an operand is a TABLE column
+_COLUMN_BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_COLUMN_UNARY_OPERATORS: dict[str, Callable[[Any], Any]] = {
+    "-": operator.neg,
+    "+": operator.pos,
+    "not": operator.not_,
+}
 
 
 @dataclass
@@ -22,10 +47,15 @@ class EvaluationContext:
     """Context for formula evaluation.
 
     Provides field values and functions for evaluation.
+
+    TABLE field values (lists of child records) are read column-wise
+    through TableColumns views, cached in table_columns. Pass the same
+    dict to several contexts to share the views between evaluations.
     """
 
     field_values: dict  # Dict[str, Any] - field name -> value
     functions: dict  # Dict[str, Callable] - function name -> callable
+    table_columns: dict = field(default_factory=dict)  # Dict[str, TableColumns]
 
     def __post_init__(self) -> None:
         """Validate evaluation context."""
@@ -33,6 +63,8 @@ class EvaluationContext:
             raise TypeError("field_values must be a dict")
         if not isinstance(self.functions, dict):
             raise TypeError("functions must be a dict")
+        if not isinstance(self.table_columns, dict):
+            raise TypeError("table_columns must be a dict")
 
     def get_field_value(self, field_name: str) -> Any:
         """Get field value by name.
@@ -50,6 +82,34 @@ class EvaluationContext:
             raise KeyError(f"Field '{field_name}' not found in context")
         return self.field_values[field_name]
 
+    def get_column(self, table_name: str, column_name: str) -> ColumnVector:
+        """Get one column of a TABLE field.
+
+        Args:
+            table_name: TABLE field name
+            column_name: Child field name
+
+        Returns:
+            ColumnVector with one entry per record (None value = no records)
+
+        Raises:
+            KeyError: If field not found
+            TypeError: If the field value is not a list of records
+        """
+        value = self.get_field_value(table_name)
+        if isinstance(value, TableColumns):
+            return value.column(column_name)
+
+        view = self.table_columns.get(table_name)
+        if view is None or view.records is not value:
+            if value is None:
+                value = ()
+            if not isinstance(value, (list, tuple)):
+                raise TypeError(f"Field '{table_name}' is not a TABLE field")
+            view = TableColumns(value)
+            self.table_columns[table_name] = view
+        return view.column(column_name)
+
     def has_field(self, field_name: str) -> bool:
         """Check if field exists in context.
 
@@ -98,6 +158,8 @@ class FormulaEvaluator:
     - Logical: and, or, not
     - Function calls (user-provided functions)
     - Field references
+    - TABLE column references (table.column), evaluated to a ColumnVector;
+      operators on columns apply row by row
 
     Example:
         context = EvaluationContext(
@@ -130,9 +192,13 @@ class FormulaEvaluator:
         """
         try:
             value = self._evaluate_node(node)
-            return Success(value)
         except Exception as e:
             return Failure(str(e))
+        if isinstance(value, ColumnVector):
+            return Failure(
+                "A table column is not a value; aggregate it (e.g. sum_of(table.column))"
+            )
+        return Success(value)
 
     def _evaluate_node(self, node: ASTNode) -> Any:
         """Evaluate a node (internal).
@@ -152,6 +218,9 @@ class FormulaEvaluator:
         if isinstance(node, FieldReference):
             return self.context.get_field_value(node.field_name)
 
+        if isinstance(node, ColumnReference):
+            return self.context.get_column(node.table_name, node.column_name)
+
         if isinstance(node, BinaryOp):
             return self._evaluate_binary_op(node)
 
@@ -175,6 +244,9 @@ class FormulaEvaluator:
         left = self._evaluate_node(node.left)
         right = self._evaluate_node(node.right)
 
+        if isinstance(left, ColumnVector) or isinstance(right, ColumnVector):
+            return self._evaluate_column_binary_op(node.operator, left, right)
+
         # Arithmetic operators
         if node.operator == "+":
             return left + right
@@ -226,6 +298,11 @@ class FormulaEvaluator:
         """
         operand = self._evaluate_node(node.operand)
 
+        if isinstance(operand, ColumnVector):
+            if node.operator not in _COLUMN_UNARY_OPERATORS:
+                raise ValueError(f"Unknown unary operator: {node.operator}")
+            return operand.apply(_COLUMN_UNARY_OPERATORS[node.operator])
+
         if node.operator == "-":
             return -operand
         if node.operator == "+":
@@ -235,6 +312,27 @@ class FormulaEvaluator:
 
         raise ValueError(f"Unknown unary operator: {node.operator}")
 
+    def _evaluate_column_binary_op(self, operator_name: str, left: Any, right: Any) -> ColumnVector:
+        """Evaluate a binary operation with a column operand, row by row.
+
+        Args:
+            operator_name: Binary operator
+            left: Left operand (ColumnVector or scalar)
+            right: Right operand (ColumnVector or scalar)
+
+        Returns:
+            ColumnVector of results
+        """
+        if operator_name in ("and", "or"):
+            left = left.truth() if isinstance(left, ColumnVector) else bool(left)
+            right = right.truth() if isinstance(right, ColumnVector) else bool(right)
+            op = operator.and_ if operator_name == "and" else operator.or_
+            return ColumnVector.combine(op, left, right)
+
+        if operator_name not in _COLUMN_BINARY_OPERATORS:
+            raise ValueError(f"Unknown binary operator: {operator_name}")
+        return ColumnVector.combine(_COLUMN_BINARY_OPERATORS[operator_name], left, right)
+
     def _evaluate_function_call(self, node: FunctionCall) -> Any:
         """Evaluate function call.
 
@@ -0,0 +1,97 @@
+"""Shared cache of parsed formulas.
+
+Parsing is a pure function of the formula text and ASTs are immutable,
+so one parse can be shared by every check that needs the same formula
+(validation, dependency analysis, type inference), across threads.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Union
+
+from doc_helper.domain.formula.ast_nodes import ASTNode
+from doc_helper.domain.formula.parser import FormulaParser
+
+
+class FormulaParseCache:
+    """Thread-safe, bounded LRU cache of formula text -> AST.
+
+    Syntax errors are cached too: a formula that failed to parse raises
+    the same exception on every lookup without re-parsing.
+
+    Example:
+        cache = FormulaParseCache()
+        ast = cache.parse("price * quantity")
+        ast is cache.parse("price * quantity")  # True
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of distinct formula texts kept
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Union[ASTNode, ValueError]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that had to parse."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Number of cached formulas."""
+        return len(self._entries)
+
+    def parse(self, formula_text: str) -> ASTNode:
+        """Parse a formula, reusing a previous parse of the same text.
+
+        Args:
+            formula_text: Formula expression
+
+        Returns:
+            Root AST node
+
+        Raises:
+            ValueError: If the formula has a syntax error
+        """
+        with self._lock:
+            entry = self._entries.get(formula_text)
+            if entry is not None:
+                self._entries.move_to_end(formula_text)
+                self._hits += 1
+        if entry is None:
+            # Parse outside the lock; a concurrent duplicate parse is harmless
+            try:
+                entry = FormulaParser(formula_text).parse()
+            except ValueError as e:
+                entry = e
+            with self._lock:
+                self._misses += 1
+                self._entries[formula_text] = entry
+                if len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+        if isinstance(entry, ValueError):
+            # Re-raise the original (subclass and all) with a fresh traceback
+            raise entry.with_traceback(None)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached formulas and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -9,6 +9,7 @@ from doc_helper.domain.formula.ast_nodes import (
     BinaryOp,
     UnaryOp,
     Literal,
+    ColumnReference,
     FieldReference,
     FunctionCall,
 )
@@ -27,7 +28,7 @@ class FormulaParser:
     6. *, /, %
     7. **
     8. unary -, +
-    9. function calls, field references, literals, parentheses
+    9. function calls, field and column references, literals, parentheses
 
     Example:
         parser = FormulaParser("field1 + field2 * 2")
@@ -36,14 +37,16 @@ class FormulaParser:
         #                        BinaryOp('*', FieldReference('field2'), Literal(2)))
     """
 
-    def __init__(self, formula: str):
+    def __init__(self, formula: str, tokens: list[Token] | None = None):
         """Initialize parser.
 
         Args:
             formula: Formula string to parse
+            tokens: Pre-computed tokens for formula (skips tokenizing)
         """
-        tokenizer = FormulaTokenizer(formula)
-        self.tokens = tokenizer.tokenize()
+        if tokens is None:
+            tokens = FormulaTokenizer(formula).tokenize()
+        self.tokens = tokens
         self.position = 0
         self.current_token = self.tokens[0] if self.tokens else None
 
@@ -212,7 +215,7 @@ class FormulaParser:
         return self.parse_primary()
 
     def parse_primary(self) -> ASTNode:
-        """Parse primary expression (literals, identifiers, function calls, parentheses)."""
+        """Parse primary expression (literals, references, function calls, parentheses)."""
         # Numbers
         if self.current_token.type == TokenType.NUMBER:
             value = self.current_token.value
@@ -248,6 +251,12 @@ class FormulaParser:
             if self.current_token and self.current_token.type == TokenType.LPAREN:
                 return self.parse_function_call(name)
 
+            # Table column reference (table.column)
+            if self.current_token and self.current_token.type == TokenType.DOT:
+                self.advance()
+                column = self.expect(TokenType.IDENTIFIER)
+                return ColumnReference(name, column.value)
+
             # Field reference
             return FieldReference(name)
 
@@ -0,0 +1,340 @@
+"""Column-oriented views of TABLE field values.
+
+A TABLE field value is a list of child records (dicts). Formulas read it
+one column at a time (``layers.thickness``), so each column is extracted
+once into an array and aggregates and element-wise operators then run
+over those arrays with C-level builtins (sum, min, max, map,
+itertools.compress) instead of a Python loop over the record dicts.
+
+TABLE_AGGREGATE_FUNCTIONS holds the formula functions that reduce a
+column (sum_of, avg_of, min_of, max_of, count_where); every formula
+evaluation path registers them from here.
+"""
+
+import operator
+from array import array
+from itertools import compress, repeat
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Union
+
+# Largest magnitude up to which every int converts to a float exactly
+_MAX_EXACT_FLOAT_INT = 2**53
+
+
+class ColumnVector:
+    """Values of one TABLE column, one entry per row.
+
+    Numeric columns are packed into an ``array`` ("q" for 64-bit integers,
+    "d" for floats, or floats mixed with ints a float holds exactly); other
+    columns, including booleans and wider integers, are kept as a tuple so
+    every value keeps its type. Missing cells (None or absent keys) are
+    tracked in a presence mask and skipped by aggregates.
+
+    Example:
+        column = ColumnVector.from_values([1.5, None, 2.5])
+        column.sum()    # 4.0
+        column.count()  # 2
+    """
+
+    __slots__ = ("_values", "_mask")
+
+    def __init__(
+        self,
+        values: Union[array, tuple],
+        mask: Optional[bytes] = None,
+    ) -> None:
+        """Initialize column.
+
+        Args:
+            values: Packed row values (entries of missing rows are ignored)
+            mask: One byte per row, 1 where the row has a value; None when
+                every row has one
+        """
+        if mask is not None and len(mask) != len(values):
+            raise ValueError("mask must have one entry per row")
+        self._values = values
+        self._mask = mask
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "ColumnVector":
+        """Build a column from raw row values (None marks a missing cell).
+
+        Args:
+            values: Row values in row order
+
+        Returns:
+            ColumnVector over the values
+        """
+        raw = values if isinstance(values, (list, tuple)) else list(values)
+        mask: Optional[bytes] = bytes(map(operator.is_not, raw, repeat(None)))
+        if mask.count(0) == 0:
+            mask = None
+        return cls(cls._pack(raw, mask), mask)
+
+    @staticmethod
+    def _pack(raw: Sequence[Any], mask: Optional[bytes]) -> Union[array, tuple]:
+        """Pack values into an array when the array keeps them exactly."""
+        present = raw if mask is None else list(compress(raw, mask))
+        # Exact types: bool is an int subclass but must stay a bool
+        types = set(map(type, present))
+        if not types <= {int, float}:
+            return tuple(raw)
+        if mask is not None:
+            # Missing cells need a placeholder the array can hold
+            raw = [0 if not is_present else value for value, is_present in zip(raw, mask)]
+        if float not in types:
+            try:
+                return array("q", raw)
+            except OverflowError:
+                return tuple(raw)
+        if int in types and not all(
+            -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT
+            for value in present
+            if type(value) is int
+        ):
+            return tuple(raw)
+        return array("d", raw)
+
+    def __len__(self) -> int:
+        """Number of rows (including rows with a missing value)."""
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"ColumnVector({self.to_list()!r})"
+
+    @property
+    def is_numeric(self) -> bool:
+        """True if the column is packed into a numeric array."""
+        return isinstance(self._values, array)
+
+    def to_list(self) -> list:
+        """Row values as a list, with None for missing cells."""
+        if self._mask is None:
+            return list(self._values)
+        return [value if present else None for value, present in zip(self._values, self._mask)]
+
+    # -------------------------------------------------------------------------
+    # Aggregates
+    # -------------------------------------------------------------------------
+
+    def count(self) -> int:
+        """Number of rows that have a value."""
+        if self._mask is None:
+            return len(self._values)
+        return len(self._mask) - self._mask.count(0)
+
+    def sum(self) -> Any:
+        """Sum of present values (0 for an empty column)."""
+        return sum(self._present())
+
+    def mean(self) -> Any:
+        """Average of present values (None for an empty column)."""
+        count = self.count()
+        if count == 0:
+            return None
+        return self.sum() / count
+
+    def min(self) -> Any:
+        """Smallest present value (None for an empty column)."""
+        return min(self._present(), default=None)
+
+    def max(self) -> Any:
+        """Largest present value (None for an empty column)."""
+        return max(self._present(), default=None)
+
+    def count_true(self) -> int:
+        """Number of rows whose value is present and truthy."""
+        return sum(map(bool, self._present()))
+
+    def _present(self) -> Iterable[Any]:
+        """Values of rows that have one."""
+        if self._mask is None:
+            return self._values
+        return compress(self._values, self._mask)
+
+    # -------------------------------------------------------------------------
+    # Element-wise operations
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def combine(
+        cls,
+        op: Callable[[Any, Any], Any],
+        left: Any,
+        right: Any,
+    ) -> "ColumnVector":
+        """Apply a binary operator row by row.
+
+        Either operand may be a scalar, which is broadcast to every row.
+        A row of the result is missing if it is missing in either operand
+        (a None scalar makes every row missing).
+
+        Args:
+            op: Binary operator (e.g. operator.add)
+            left: ColumnVector or scalar
+            right: ColumnVector or scalar
+
+        Returns:
+            ColumnVector of results
+
+        Raises:
+            ValueError: If both operands are columns of different lengths
+        """
+        left_column = isinstance(left, ColumnVector)
+        right_column = isinstance(right, ColumnVector)
+        row_count = len(left) if left_column else len(right)
+        if left_column and right_column and len(left) != len(right):
+            raise ValueError(
+                f"Columns have different lengths ({len(left)} and {len(right)})"
+            )
+        if (not left_column and left is None) or (not right_column and right is None):
+            return cls(tuple(repeat(None, row_count)), bytes(row_count))
+
+        mask = cls._combine_masks(
+            left._mask if left_column else None,
+            right._mask if right_column else None,
+        )
+        left_values = left._values if left_column else repeat(left, row_count)
+        right_values = right._values if right_column else repeat(right, row_count)
+        if mask is None:
+            return cls(cls._pack(list(map(op, left_values, right_values)), None), None)
+        # Only present rows are evaluated (a missing cell must not raise,
+        # e.g. as a zero divisor)
+        results = map(op, compress(left_values, mask), compress(right_values, mask))
+        return cls(cls._pack(cls._scatter(results, mask), mask), mask)
+
+    def apply(self, op: Callable[[Any], Any]) -> "ColumnVector":
+        """Apply a unary operator row by row.
+
+        Args:
+            op: Unary operator (e.g. operator.neg)
+
+        Returns:
+            ColumnVector of results (missing rows stay missing)
+        """
+        if self._mask is None:
+            return ColumnVector(self._pack(list(map(op, self._values)), None), None)
+        results = map(op, compress(self._values, self._mask))
+        return ColumnVector(self._pack(self._scatter(results, self._mask), self._mask), self._mask)
+
+    def truth(self) -> "ColumnVector":
+        """Column of row truth values (for logical operators)."""
+        return self.apply(bool)
+
+    @staticmethod
+    def _scatter(present_results: Iterable[Any], mask: bytes) -> list:
+        """Spread results of the present rows back over all rows."""
+        results = iter(present_results)
+        return [next(results) if is_present else None for is_present in mask]
+
+    @staticmethod
+    def _combine_masks(left: Optional[bytes], right: Optional[bytes]) -> Optional[bytes]:
+        """Presence mask of rows present in both operands."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return bytes(map(operator.and_, left, right))
+
+
+class TableColumns:
+    """Column-oriented view of one TABLE field value.
+
+    Columns are extracted from the records on first access and reused by
+    every later access, so formulas that read the same column repeatedly
+    (or several formulas sharing one view) pay for the extraction once.
+
+    Example:
+        table = TableColumns([{"thickness": 1.5}, {"thickness": 2.0}])
+        table.column("thickness").sum()  # 3.5
+    """
+
+    __slots__ = ("_records", "_columns")
+
+    def __init__(self, records: Sequence[Mapping[str, Any]]) -> None:
+        """Initialize view.
+
+        Args:
+            records: Child records of the TABLE field, in row order
+        """
+        if not isinstance(records, (list, tuple)):
+            raise TypeError("records must be a list or tuple of dicts")
+        self._records = records
+        self._columns: dict[str, ColumnVector] = {}
+
+    @property
+    def records(self) -> Sequence[Mapping[str, Any]]:
+        """Records this view was built from."""
+        return self._records
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows."""
+        return len(self._records)
+
+    def column(self, column_name: str) -> ColumnVector:
+        """Get one column (missing keys read as missing cells).
+
+        Args:
+            column_name: Child field name
+
+        Returns:
+            ColumnVector with one entry per row
+        """
+        column = self._columns.get(column_name)
+        if column is None:
+            column = ColumnVector.from_values(
+                list(map(operator.methodcaller("get", column_name), self._records))
+            )
+            self._columns[column_name] = column
+        return column
+
+
+# -----------------------------------------------------------------------------
+# TABLE aggregate formula functions
+# -----------------------------------------------------------------------------
+
+
+def _column_argument(function_name: str, column: Any) -> ColumnVector:
+    """Check that a TABLE aggregate received a column expression."""
+    if not isinstance(column, ColumnVector):
+        raise TypeError(
+            f"{function_name}() expects a table column (table.column), "
+            f"got {type(column).__name__}"
+        )
+    return column
+
+
+def _sum_of(column: Any) -> Any:
+    """Sum of a table column (null cells skipped)."""
+    return _column_argument("sum_of", column).sum()
+
+
+def _avg_of(column: Any) -> Any:
+    """Average of a table column (null cells skipped; null if no values)."""
+    return _column_argument("avg_of", column).mean()
+
+
+def _min_of(column: Any) -> Any:
+    """Minimum of a table column (null cells skipped; null if no values)."""
+    return _column_argument("min_of", column).min()
+
+
+def _max_of(column: Any) -> Any:
+    """Maximum of a table column (null cells skipped; null if no values)."""
+    return _column_argument("max_of", column).max()
+
+
+def _count_where(condition: Any) -> int:
+    """Number of table rows for which a column condition is true."""
+    return _column_argument("count_where", condition).count_true()
+
+
+# Formula functions that aggregate a table.column expression
+TABLE_AGGREGATE_FUNCTIONS: Mapping[str, Callable[..., Any]] = {
+    "sum_of": _sum_of,
+    "avg_of": _avg_of,
+    "min_of": _min_of,
+    "max_of": _max_of,
+    "count_where": _count_where,
+}
@@ -47,6 +47,7 @@ class TokenType(str, Enum):
     LPAREN = "LPAREN"  # (
     RPAREN = "RPAREN"  # )
     COMMA = "COMMA"  # ,
+    DOT = "DOT"  # . (table.column)
 
     # Special
     EOF = "EOF"
@@ -71,7 +72,7 @@ class FormulaTokenizer:
     Supports:
     - Numbers (int and float)
     - Strings (single and double quoted)
-    - Identifiers (field names)
+    - Identifiers (field names, table.column references)
     - Operators (+, -, *, /, %, **)
     - Comparison (==, !=, <, <=, >, >=)
     - Logical (and, or, not)
@@ -115,20 +116,23 @@ class FormulaTokenizer:
         "(": TokenType.LPAREN,
         ")": TokenType.RPAREN,
         ",": TokenType.COMMA,
+        ".": TokenType.DOT,
     }
 
-    def __init__(self, formula: str):
+    def __init__(self, formula: str, start: int = 0):
         """Initialize tokenizer.
 
         Args:
             formula: Formula string to tokenize
+            start: Position to start tokenizing from (token positions stay
+                absolute within the formula)
         """
         if not isinstance(formula, str):
             raise TypeError("formula must be a string")
 
         self.formula = formula
-        self.position = 0
-        self.current_char = self.formula[0] if formula else None
+        self.position = start
+        self.current_char = self.formula[start] if start < len(formula) else None
 
     def advance(self) -> None:
         """Move to next character."""
@@ -281,3 +285,87 @@ class FormulaTokenizer:
         # Add EOF token
         tokens.append(Token(TokenType.EOF, None, self.position))
         return tokens
+
+
+class IncrementalFormulaTokenizer:
+    """Tokenizer that reuses the previous result when only the tail changed.
+
+    Editing usually happens at the end of a formula, so consecutive texts
+    share a long prefix. A previous token is reused when it and the first
+    two characters of the token after it lie inside the unchanged prefix
+    (lexing looks at most one character past the start of the next token,
+    e.g. "1" before "." is only an integer if no digit follows the dot);
+    tokenizing resumes at the first token that is not reused.
+
+    Only successful tokenizations are remembered; after an error the next
+    call tokenizes from scratch.
+
+    Example:
+        tokenizer = IncrementalFormulaTokenizer()
+        tokenizer.tokenize("price * quantity")
+        tokenizer.tokenize("price * quantity + tax")  # re-lexes from "quantity"
+    """
+
+    def __init__(self) -> None:
+        """Initialize with an empty cache."""
+        self._formula: str | None = None
+        self._tokens: list[Token] = []
+        self._reused_count = 0
+
+    @property
+    def reused_count(self) -> int:
+        """Number of tokens reused by the last tokenize() call."""
+        return self._reused_count
+
+    def tokenize(self, formula: str) -> list[Token]:
+        """Tokenize formula, reusing tokens from the previous call.
+
+        Args:
+            formula: Formula string to tokenize
+
+        Returns:
+            List of tokens (same result as FormulaTokenizer(formula).tokenize())
+
+        Raises:
+            ValueError: If formula contains invalid syntax
+        """
+        keep = 0
+        if self._formula is not None:
+            prefix = self._common_prefix_length(self._formula, formula)
+            # The EOF token sits at len(previous formula) >= prefix, so it
+            # is never reused.
+            while (
+                keep + 1 < len(self._tokens)
+                and self._tokens[keep + 1].position + 1 < prefix
+            ):
+                keep += 1
+
+        start = self._tokens[keep].position if keep else 0
+        try:
+            tail = FormulaTokenizer(formula, start=start).tokenize()
+        except ValueError:
+            self._formula = None
+            self._tokens = []
+            self._reused_count = 0
+            raise
+
+        tokens = self._tokens[:keep] + tail
+        self._formula = formula
+        self._tokens = tokens
+        self._reused_count = keep
+        return list(tokens)
+
+    def reset(self) -> None:
+        """Forget the cached tokenization."""
+        self._formula = None
+        self._tokens = []
+        self._reused_count = 0
+
+    @staticmethod
+    def _common_prefix_length(a: str, b: str) -> int:
+        """Length of the longest common prefix of two strings."""
+        limit = min(len(a), len(b))
+        i = 0
+        while i < limit and a[i] == b[i]:
+            i += 1
+        return i
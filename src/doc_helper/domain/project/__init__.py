@@ -11,11 +11,15 @@ Key components:
 from doc_helper.domain.project.field_value import FieldValue
 from doc_helper.domain.project.project import Project
 from doc_helper.domain.project.project_ids import ProjectId
-from doc_helper.domain.project.project_repository import IProjectRepository
+from doc_helper.domain.project.project_repository import (
+    IProjectRepository,
+    ITableRowRepository,
+)
 
 __all__ = [
     "FieldValue",
     "Project",
     "ProjectId",
     "IProjectRepository",
+    "ITableRowRepository",
 ]
@@ -29,7 +29,7 @@ class ChangeSource(Enum):
     REDO_OPERATION = "REDO_OPERATION"  # Redo command executed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldHistoryEntry(ValueObject):
     """Immutable record of a single field value change.
 
@@ -7,7 +7,7 @@ from doc_helper.domain.common.value_object import ValueObject
 from doc_helper.domain.schema.schema_ids import FieldDefinitionId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldValue(ValueObject):
     """Value object representing a field's value in a project.
 
@@ -44,6 +44,12 @@ class FieldValue(ValueObject):
             is_override=True,
             original_computed_value=15800.00
         )
+
+        # Repository load of a value that was validated when saved
+        value4 = FieldValue.restore(
+            field_id=FieldDefinitionId.interned("site_location"),
+            value="123 Main Street",
+        )
     """
 
     field_id: FieldDefinitionId
@@ -75,6 +81,42 @@ class FieldValue(ValueObject):
                     "original_computed_value must be set when is_override is True"
                 )
 
+    @classmethod
+    def restore(
+        cls,
+        field_id: FieldDefinitionId,
+        value: Any,
+        is_computed: bool = False,
+        computed_from: Optional[str] = None,
+        is_override: bool = False,
+        original_computed_value: Any = None,
+    ) -> "FieldValue":
+        """Rebuild a stored field value without re-validating it.
+
+        Trusted path for repositories: the value was validated when it
+        was saved, so the checks in __post_init__ are skipped.
+
+        Args:
+            field_id: Field definition ID
+            value: Stored value
+            is_computed: True if value came from formula evaluation
+            computed_from: Formula that computed this value
+            is_override: True if user overrode a computed value
+            original_computed_value: Original computed value before override
+
+        Returns:
+            FieldValue with the given state
+        """
+        instance = object.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(instance, "field_id", field_id)
+        set_attr(instance, "value", value)
+        set_attr(instance, "is_computed", is_computed)
+        set_attr(instance, "computed_from", computed_from)
+        set_attr(instance, "is_override", is_override)
+        set_attr(instance, "original_computed_value", original_computed_value)
+        return instance
+
     @property
     def is_user_provided(self) -> bool:
         """Check if value was provided by user (not computed).
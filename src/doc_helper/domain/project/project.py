@@ -1,6 +1,7 @@
 """Project aggregate root."""
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 
 from doc_helper.domain.common.entity import AggregateRoot
@@ -105,6 +106,55 @@ class Project(AggregateRoot[ProjectId]):
         if self.file_path is not None and not isinstance(self.file_path, str):
             raise TypeError("file_path must be a string or None")
 
+    @classmethod
+    def restore(
+        cls,
+        *,
+        id: ProjectId,
+        name: str,
+        app_type_id: str,
+        entity_definition_id: EntityDefinitionId,
+        field_values: dict,
+        description: Optional[str] = None,
+        file_path: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        modified_at: Optional[datetime] = None,
+    ) -> "Project":
+        """Rebuild a stored project without re-checking every field value.
+
+        Trusted path for repositories: project metadata is validated as
+        usual, but field_values is taken as-is (one entry per field, keyed
+        by its FieldDefinitionId), as it was when the project was saved.
+
+        Args:
+            id: Project ID
+            name: Project name
+            app_type_id: AppType identifier
+            entity_definition_id: Schema definition for this project
+            field_values: Dict[FieldDefinitionId, FieldValue]
+            description: Optional project description
+            file_path: File path where project is saved (if any)
+            created_at: Stored creation timestamp (default: now)
+            modified_at: Stored modification timestamp (default: now)
+
+        Returns:
+            Project with the given state
+        """
+        project = cls(
+            id=id,
+            name=name,
+            app_type_id=app_type_id,
+            entity_definition_id=entity_definition_id,
+            description=description,
+            file_path=file_path,
+        )
+        project.field_values = field_values
+        if created_at is not None:
+            project.created_at = created_at
+        if modified_at is not None:
+            project.modified_at = modified_at
+        return project
+
     def get_field_value(self, field_id: FieldDefinitionId) -> Optional[FieldValue]:
         """Get field value by ID.
 
@@ -1,11 +1,12 @@
 """Project repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 from doc_helper.domain.common.result import Result
 from doc_helper.domain.project.project import Project
 from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
 
 
 class IProjectRepository(ABC):
@@ -105,3 +106,99 @@ class IProjectRepository(ABC):
             Success(list of Projects) if successful, Failure(error) otherwise
         """
         pass
+
+
+class ITableRowRepository(ABC):
+    """Repository interface for row-level edits of TABLE field values.
+
+    A TABLE field holds a list of child records. Editing one record
+    through this interface writes only that record instead of saving
+    the whole project.
+
+    Example:
+        result = repository.update_table_row(project_id, field_id, 2, {"depth": 4.5})
+        if isinstance(result, Success):
+            print("Row saved")
+    """
+
+    @abstractmethod
+    def insert_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+        record: dict[str, Any],
+    ) -> Result[None, str]:
+        """Insert one child record; later records move down by one.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Position of the new record (0..record count)
+            record: Child record
+
+        Returns:
+            Success(None) if inserted, Failure(error) otherwise
+        """
+        pass
+
+    @abstractmethod
+    def update_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+        record: dict[str, Any],
+    ) -> Result[None, str]:
+        """Replace one child record.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Record position
+            record: Updated child record
+
+        Returns:
+            Success(None) if updated, Failure(error) otherwise
+        """
+        pass
+
+    @abstractmethod
+    def delete_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+    ) -> Result[None, str]:
+        """Delete one child record; later records move up by one.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Record position
+
+        Returns:
+            Success(None) if deleted, Failure(error) otherwise
+        """
+        pass
+
+    @abstractmethod
+    def move_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        from_position: int,
+        to_position: int,
+    ) -> Result[None, str]:
+        """Move one child record, keeping the others in order.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            from_position: Current record position
+            to_position: New record position
+
+        Returns:
+            Success(None) if moved, Failure(error) otherwise
+        """
+        pass
@@ -4,12 +4,13 @@ Following ADR-009: Strongly Typed IDs pattern.
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
-from doc_helper.domain.common.value_object import ValueObject
+from doc_helper.domain.common.value_object import ValueId
 
 
-@dataclass(frozen=True)
-class FieldDefinitionId(ValueObject):
+@dataclass(frozen=True, slots=True, eq=False)
+class FieldDefinitionId(ValueId):
     """Strongly-typed ID for FieldDefinition.
 
     Field IDs are unique within an EntityDefinition.
@@ -20,13 +21,43 @@ class FieldDefinitionId(ValueObject):
     - IDs are immutable value objects
     - IDs enforce validation rules
 
+    Field IDs repeat across every project and history entry, so loaders
+    should use FieldDefinitionId.interned() to share one instance per ID.
+
     Example:
         field_id = FieldDefinitionId("site_location")
         field_id2 = FieldDefinitionId("soil_type")
+        FieldDefinitionId.interned("soil_type") is FieldDefinitionId.interned("soil_type")  # True
     """
 
     value: str
 
+    # Schemas define far fewer field IDs; past this (e.g. IDs read from
+    # hand-edited files) the table starts over instead of growing
+    _MAX_INTERNED: ClassVar[int] = 100_000
+    _interned: ClassVar[dict[str, "FieldDefinitionId"]] = {}
+
+    @classmethod
+    def interned(cls, value: str) -> "FieldDefinitionId":
+        """Get the shared instance for an ID, validating it on first use.
+
+        Args:
+            value: Field ID string
+
+        Returns:
+            FieldDefinitionId shared by all callers with the same value
+
+        Raises:
+            ValueError: If the ID is invalid
+        """
+        instance = cls._interned.get(value)
+        if instance is None:
+            instance = cls(value)
+            if len(cls._interned) >= cls._MAX_INTERNED:
+                cls._interned.clear()
+            instance = cls._interned.setdefault(value, instance)
+        return instance
+
     def __post_init__(self) -> None:
         """Validate field ID."""
         if not self.value:
@@ -46,8 +77,8 @@ class FieldDefinitionId(ValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
-class EntityDefinitionId(ValueObject):
+@dataclass(frozen=True, slots=True, eq=False)
+class EntityDefinitionId(ValueId):
     """Strongly-typed ID for EntityDefinition.
 
     Entity IDs are unique within an application schema.
@@ -84,8 +115,8 @@ class EntityDefinitionId(ValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
-class RelationshipDefinitionId(ValueObject):
+@dataclass(frozen=True, slots=True, eq=False)
+class RelationshipDefinitionId(ValueId):
     """Strongly-typed ID for RelationshipDefinition (Phase 6A - ADR-022).
 
     Relationship IDs are unique within an application schema.
@@ -198,7 +198,8 @@ class ISchemaRepository(ABC):
                 "referenced_by_lookup_fields": [(entity_id, field_id), ...],
                 "child_entities": [entity_id, ...],  # Entities with parent_entity_id = this entity
             }
-            or error message
+            or error message. Implementations may add
+            "referenced_by_relationships": [(relationship_id, other_entity_id), ...]
 
         Example:
             result = repo.get_entity_dependencies(EntityDefinitionId("borehole"))
@@ -232,7 +233,9 @@ class ISchemaRepository(ABC):
                 "referenced_by_controls_target": [(entity_id, field_id), ...],
                 "referenced_by_lookup_display": [(entity_id, field_id), ...],
             }
-            or error message
+            or error message. Implementations may add
+            "referenced_by_control_rules": [(entity_id, field_id), ...] and
+            "referenced_by_output_mappings": [(output_type, target_tag), ...]
 
         Example:
             result = repo.get_field_dependencies(
@@ -278,3 +281,38 @@ class ISchemaRepository(ABC):
                     # Entity deleted successfully
         """
         pass
+
+
+class ISchemaBulkWriter(ABC):
+    """Optional capability: replace the whole schema in one operation.
+
+    Repositories that can write many entities efficiently (e.g. a single
+    database transaction) implement this alongside ISchemaRepository.
+    Callers check for it with isinstance() and fall back to per-entity
+    delete()/save() calls when it is not available.
+
+    Usage:
+        if isinstance(schema_repo, ISchemaBulkWriter):
+            result = schema_repo.replace_all(entities, relationships)
+    """
+
+    @abstractmethod
+    def replace_all(
+        self,
+        entities: tuple[EntityDefinition, ...],
+        relationships: tuple = (),
+    ) -> Result[None, str]:
+        """Replace all stored schema definitions with the given ones.
+
+        All-or-nothing: on failure the previously stored schema is left
+        untouched.
+
+        Args:
+            entities: Entity definitions (with fields, constraints, options
+                and control rules) that make up the new schema
+            relationships: RelationshipDefinition objects between the entities
+
+        Returns:
+            Result with None on success or error message
+        """
+        pass
@@ -0,0 +1,105 @@
+"""Compiled validation plan for an entity.
+
+A ValidationPlan builds one validator per field of an entity definition
+(regexes compiled, min/max bound, allowed values hashed) and then validates
+any number of field value snapshots by dispatching each value to its
+field's prebuilt validator.
+
+The plan is tied to the schema version it was compiled from: its signature
+is the (field_id, field_type, constraints) of every field. Callers that
+cache plans recompile when the signature of the current entity differs.
+"""
+
+from typing import Any, Mapping, Optional
+
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
+from doc_helper.domain.validation.validation_result import ValidationResult
+from doc_helper.domain.validation.validators import (
+    IValidator,
+    get_validator_for_field_type,
+)
+
+
+class ValidationPlan:
+    """Per-field validators of one entity definition, built once.
+
+    Example:
+        plan = ValidationPlan(entity_definition)
+        result = plan.validate({FieldDefinitionId("name"): "Site A"})
+        if plan.signature != ValidationPlan.signature_of(entity_definition):
+            plan = ValidationPlan(entity_definition)  # schema changed
+    """
+
+    __slots__ = ("_signature", "_validators")
+
+    def __init__(self, entity_definition: EntityDefinition) -> None:
+        """Compile plan.
+
+        Args:
+            entity_definition: Entity definition with field constraints
+
+        Raises:
+            ValueError: If a field has an unknown field type
+        """
+        self._signature = self.signature_of(entity_definition)
+        self._validators: dict[FieldDefinitionId, tuple[str, IValidator]] = {
+            field_id: (
+                field_id.value,
+                get_validator_for_field_type(
+                    field_type=field_def.field_type,
+                    constraints=field_def.constraints,
+                ),
+            )
+            for field_id, field_def in entity_definition.fields.items()
+        }
+
+    @staticmethod
+    def signature_of(entity_definition: EntityDefinition) -> tuple:
+        """Schema version of an entity definition's validation rules.
+
+        Args:
+            entity_definition: Entity definition
+
+        Returns:
+            (field_id, field_type, constraints) for every field
+        """
+        return tuple(
+            (field_id, field_def.field_type, field_def.constraints)
+            for field_id, field_def in entity_definition.fields.items()
+        )
+
+    @property
+    def signature(self) -> tuple:
+        """Signature of the entity definition the plan was compiled from."""
+        return self._signature
+
+    def validator_for(self, field_id: FieldDefinitionId) -> Optional[IValidator]:
+        """Get the prebuilt validator of a field (None if not in the entity)."""
+        entry = self._validators.get(field_id)
+        return entry[1] if entry is not None else None
+
+    def validate(self, field_values: Mapping[FieldDefinitionId, Any]) -> ValidationResult:
+        """Validate field values (fields not in the entity are skipped).
+
+        Args:
+            field_values: Field ID -> raw value
+
+        Returns:
+            ValidationResult with the errors of all fields, in field_values order
+        """
+        validators = self._validators
+        all_errors = []
+        for field_id, value in field_values.items():
+            entry = validators.get(field_id)
+            if entry is None:
+                # Skip fields not in definition (orphaned fields)
+                continue
+            field_path, validator = entry
+            result = validator.validate(field_path=field_path, value=value)
+            if result.is_invalid():
+                all_errors.extend(result.errors)
+
+        if all_errors:
+            return ValidationResult.failure(tuple(all_errors))
+        return ValidationResult.success()
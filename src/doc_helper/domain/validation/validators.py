@@ -1,6 +1,11 @@
 """Field validators for different field types.
 
 Validators apply constraints to field values and produce ValidationResults.
+
+A validator binds its constraints when it is created (constraints grouped by
+type, regex patterns compiled, allowed values hashed), so a validator built
+once per field definition can validate any number of values without
+re-scanning or re-compiling its constraints.
 """
 
 from abc import ABC, abstractmethod
@@ -56,6 +61,20 @@ class IValidator(ABC):
         if not isinstance(constraints, tuple):
             raise ValueError("constraints must be a tuple (immutable)")
         self.constraints = constraints
+        self._required: Optional[RequiredConstraint] = next(
+            iter(self._constraints_of_type(RequiredConstraint)), None
+        )
+
+    def _constraints_of_type(self, constraint_type: type) -> tuple:
+        """Get constraints of one type, in declaration order.
+
+        Args:
+            constraint_type: FieldConstraint subclass
+
+        Returns:
+            Tuple of matching constraints
+        """
+        return tuple(c for c in self.constraints if isinstance(c, constraint_type))
 
     @abstractmethod
     def validate(self, field_path: str, value: Any) -> ValidationResult:
@@ -80,16 +99,15 @@ class IValidator(ABC):
         Returns:
             ValidationError if required and empty, None otherwise
         """
-        for constraint in self.constraints:
-            if isinstance(constraint, RequiredConstraint):
-                if value is None or value == "" or value == []:
-                    return ValidationError(
-                        field_path=field_path,
-                        message_key=TranslationKey("validation.required"),
-                        constraint_type="RequiredConstraint",
-                        current_value=value,
-                        severity=constraint.severity,
-                    )
+        constraint = self._required
+        if constraint is not None and (value is None or value == "" or value == []):
+            return ValidationError(
+                field_path=field_path,
+                message_key=TranslationKey("validation.required"),
+                constraint_type="RequiredConstraint",
+                current_value=value,
+                severity=constraint.severity,
+            )
         return None
 
 
@@ -107,6 +125,19 @@ class TextValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator, compiling pattern constraints.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._min_lengths = self._constraints_of_type(MinLengthConstraint)
+        self._max_lengths = self._constraints_of_type(MaxLengthConstraint)
+        self._patterns = tuple(
+            (re.compile(c.pattern), c) for c in self._constraints_of_type(PatternConstraint)
+        )
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate text value.
 
@@ -143,48 +174,45 @@ class TextValidator(IValidator):
             return ValidationResult.failure(tuple(errors))
 
         # Check MinLength
-        for constraint in self.constraints:
-            if isinstance(constraint, MinLengthConstraint):
-                if len(value) < constraint.min_length:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.min_length"),
-                            constraint_type="MinLengthConstraint",
-                            current_value=value,
-                            constraint_params={"min": constraint.min_length},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._min_lengths:
+            if len(value) < constraint.min_length:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.min_length"),
+                        constraint_type="MinLengthConstraint",
+                        current_value=value,
+                        constraint_params={"min": constraint.min_length},
+                        severity=constraint.severity,
                     )
+                )
 
         # Check MaxLength
-        for constraint in self.constraints:
-            if isinstance(constraint, MaxLengthConstraint):
-                if len(value) > constraint.max_length:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.max_length"),
-                            constraint_type="MaxLengthConstraint",
-                            current_value=value,
-                            constraint_params={"max": constraint.max_length},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._max_lengths:
+            if len(value) > constraint.max_length:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.max_length"),
+                        constraint_type="MaxLengthConstraint",
+                        current_value=value,
+                        constraint_params={"max": constraint.max_length},
+                        severity=constraint.severity,
                     )
+                )
 
         # Check Pattern
-        for constraint in self.constraints:
-            if isinstance(constraint, PatternConstraint):
-                if not re.match(constraint.pattern, value):
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.pattern"),
-                            constraint_type="PatternConstraint",
-                            current_value=value,
-                            severity=constraint.severity,
-                        )
+        for regex, constraint in self._patterns:
+            if not regex.match(value):
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.pattern"),
+                        constraint_type="PatternConstraint",
+                        current_value=value,
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -204,6 +232,16 @@ class NumberValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator, binding min/max constraints.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._min_values = self._constraints_of_type(MinValueConstraint)
+        self._max_values = self._constraints_of_type(MaxValueConstraint)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate number value.
 
@@ -240,34 +278,32 @@ class NumberValidator(IValidator):
             return ValidationResult.failure(tuple(errors))
 
         # Check MinValue
-        for constraint in self.constraints:
-            if isinstance(constraint, MinValueConstraint):
-                if value < constraint.min_value:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.min_value"),
-                            constraint_type="MinValueConstraint",
-                            current_value=value,
-                            constraint_params={"min": constraint.min_value},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._min_values:
+            if value < constraint.min_value:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.min_value"),
+                        constraint_type="MinValueConstraint",
+                        current_value=value,
+                        constraint_params={"min": constraint.min_value},
+                        severity=constraint.severity,
                     )
+                )
 
         # Check MaxValue
-        for constraint in self.constraints:
-            if isinstance(constraint, MaxValueConstraint):
-                if value > constraint.max_value:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.max_value"),
-                            constraint_type="MaxValueConstraint",
-                            current_value=value,
-                            constraint_params={"max": constraint.max_value},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._max_values:
+            if value > constraint.max_value:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.max_value"),
+                        constraint_type="MaxValueConstraint",
+                        current_value=value,
+                        constraint_params={"max": constraint.max_value},
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -287,6 +323,16 @@ class DateValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator, binding min/max constraints.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._min_values = self._constraints_of_type(MinValueConstraint)
+        self._max_values = self._constraints_of_type(MaxValueConstraint)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate date value.
 
@@ -327,34 +373,32 @@ class DateValidator(IValidator):
         ordinal_value = date_value.toordinal()
 
         # Check MinValue
-        for constraint in self.constraints:
-            if isinstance(constraint, MinValueConstraint):
-                if ordinal_value < constraint.min_value:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.min_value"),
-                            constraint_type="MinValueConstraint",
-                            current_value=value,
-                            constraint_params={"min": date.fromordinal(int(constraint.min_value)).isoformat()},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._min_values:
+            if ordinal_value < constraint.min_value:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.min_value"),
+                        constraint_type="MinValueConstraint",
+                        current_value=value,
+                        constraint_params={"min": date.fromordinal(int(constraint.min_value)).isoformat()},
+                        severity=constraint.severity,
                     )
+                )
 
         # Check MaxValue
-        for constraint in self.constraints:
-            if isinstance(constraint, MaxValueConstraint):
-                if ordinal_value > constraint.max_value:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.max_value"),
-                            constraint_type="MaxValueConstraint",
-                            current_value=value,
-                            constraint_params={"max": date.fromordinal(int(constraint.max_value)).isoformat()},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._max_values:
+            if ordinal_value > constraint.max_value:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.max_value"),
+                        constraint_type="MaxValueConstraint",
+                        current_value=value,
+                        constraint_params={"max": date.fromordinal(int(constraint.max_value)).isoformat()},
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -373,6 +417,18 @@ class DropdownValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator, hashing allowed values.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._allowed_values = tuple(
+            (_membership_set(c.allowed_values), c)
+            for c in self._constraints_of_type(AllowedValuesConstraint)
+        )
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate dropdown value.
 
@@ -396,18 +452,17 @@ class DropdownValidator(IValidator):
             return ValidationResult.success()
 
         # Check AllowedValues
-        for constraint in self.constraints:
-            if isinstance(constraint, AllowedValuesConstraint):
-                if value not in constraint.allowed_values:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.invalid_option"),
-                            constraint_type="AllowedValuesConstraint",
-                            current_value=value,
-                            severity=constraint.severity,
-                        )
+        for allowed, constraint in self._allowed_values:
+            if not _is_member(value, allowed, constraint.allowed_values):
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.invalid_option"),
+                        constraint_type="AllowedValuesConstraint",
+                        current_value=value,
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -425,6 +480,15 @@ class CheckboxValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._required_constraints = self._constraints_of_type(RequiredConstraint)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate checkbox value.
 
@@ -451,18 +515,17 @@ class CheckboxValidator(IValidator):
             return ValidationResult.failure(tuple(errors))
 
         # Check required (must be True if required)
-        for constraint in self.constraints:
-            if isinstance(constraint, RequiredConstraint):
-                if not value:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.required"),
-                            constraint_type="RequiredConstraint",
-                            current_value=value,
-                            severity=constraint.severity,
-                        )
+        for constraint in self._required_constraints:
+            if not value:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.required"),
+                        constraint_type="RequiredConstraint",
+                        current_value=value,
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -481,6 +544,15 @@ class RadioValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._delegate = DropdownValidator(constraints)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate radio button value.
 
@@ -492,7 +564,7 @@ class RadioValidator(IValidator):
             ValidationResult with any errors
         """
         # Radio validation is identical to Dropdown
-        return DropdownValidator(self.constraints).validate(field_path, value)
+        return self._delegate.validate(field_path, value)
 
 
 class CalculatedValidator(IValidator):
@@ -565,6 +637,19 @@ class FileValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator, binding file constraints.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._file_extensions = tuple(
+            (tuple(c.allowed_extensions), c)
+            for c in self._constraints_of_type(FileExtensionConstraint)
+        )
+        self._max_file_sizes = self._constraints_of_type(MaxFileSizeConstraint)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate file reference.
 
@@ -592,33 +677,31 @@ class FileValidator(IValidator):
         file_size = value.get("size", 0) if isinstance(value, dict) else None
 
         # Check FileExtension
-        for constraint in self.constraints:
-            if isinstance(constraint, FileExtensionConstraint):
-                if not any(filename.lower().endswith(ext) for ext in constraint.allowed_extensions):
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.invalid_file_extension"),
-                            constraint_type="FileExtensionConstraint",
-                            current_value=value,
-                            severity=constraint.severity,
-                        )
+        for extensions, constraint in self._file_extensions:
+            if not filename.lower().endswith(extensions):
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.invalid_file_extension"),
+                        constraint_type="FileExtensionConstraint",
+                        current_value=value,
+                        severity=constraint.severity,
                     )
+                )
 
         # Check MaxFileSize
-        for constraint in self.constraints:
-            if isinstance(constraint, MaxFileSizeConstraint):
-                if file_size and file_size > constraint.max_size_bytes:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.file_too_large"),
-                            constraint_type="MaxFileSizeConstraint",
-                            current_value=value,
-                            constraint_params={"max": constraint.max_size_bytes},
-                            severity=constraint.severity,
-                        )
+        for constraint in self._max_file_sizes:
+            if file_size and file_size > constraint.max_size_bytes:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.file_too_large"),
+                        constraint_type="MaxFileSizeConstraint",
+                        current_value=value,
+                        constraint_params={"max": constraint.max_size_bytes},
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -638,6 +721,15 @@ class ImageValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._delegate = FileValidator(constraints)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate image file reference.
 
@@ -649,7 +741,7 @@ class ImageValidator(IValidator):
             ValidationResult with any errors
         """
         # Image validation is identical to File validation
-        return FileValidator(self.constraints).validate(field_path, value)
+        return self._delegate.validate(field_path, value)
 
 
 class TableValidator(IValidator):
@@ -664,6 +756,15 @@ class TableValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._required_constraints = self._constraints_of_type(RequiredConstraint)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate table value (list of records).
 
@@ -690,18 +791,17 @@ class TableValidator(IValidator):
             return ValidationResult.failure(tuple(errors))
 
         # Check required (must have at least one row)
-        for constraint in self.constraints:
-            if isinstance(constraint, RequiredConstraint):
-                if not value or len(value) == 0:
-                    errors.append(
-                        ValidationError(
-                            field_path=field_path,
-                            message_key=TranslationKey("validation.required"),
-                            constraint_type="RequiredConstraint",
-                            current_value=value,
-                            severity=constraint.severity,
-                        )
+        for constraint in self._required_constraints:
+            if not value or len(value) == 0:
+                errors.append(
+                    ValidationError(
+                        field_path=field_path,
+                        message_key=TranslationKey("validation.required"),
+                        constraint_type="RequiredConstraint",
+                        current_value=value,
+                        severity=constraint.severity,
                     )
+                )
 
         if errors:
             return ValidationResult.failure(tuple(errors))
@@ -721,6 +821,15 @@ class TextAreaValidator(IValidator):
         ))
     """
 
+    def __init__(self, constraints: tuple = ()):
+        """Initialize validator.
+
+        Args:
+            constraints: Tuple of FieldConstraint objects
+        """
+        super().__init__(constraints)
+        self._delegate = TextValidator(constraints)
+
     def validate(self, field_path: str, value: Any) -> ValidationResult:
         """Validate textarea value.
 
@@ -732,7 +841,26 @@ class TextAreaValidator(IValidator):
             ValidationResult with any errors
         """
         # TextArea validation is identical to Text validation
-        return TextValidator(self.constraints).validate(field_path, value)
+        return self._delegate.validate(field_path, value)
+
+
+def _membership_set(allowed_values: tuple) -> Any:
+    """Hash allowed values for O(1) membership (tuple if any is unhashable)."""
+    try:
+        return frozenset(allowed_values)
+    except TypeError:
+        return allowed_values
+
+
+def _is_member(value: Any, allowed: Any, allowed_values: tuple) -> bool:
+    """Check membership, falling back to the tuple for unhashable values."""
+    try:
+        return value in allowed
+    except TypeError:
+        return value in allowed_values
+
+
+_VALIDATOR_CLASSES: dict = {}
 
 
 def get_validator_for_field_type(
@@ -751,25 +879,26 @@ def get_validator_for_field_type(
     Raises:
         ValueError: If field type is unknown
     """
-    from doc_helper.domain.schema.field_type import FieldType
-
-    # Map field types to validator classes
-    validator_map = {
-        FieldType.TEXT: TextValidator,
-        FieldType.TEXTAREA: TextAreaValidator,
-        FieldType.NUMBER: NumberValidator,
-        FieldType.DATE: DateValidator,
-        FieldType.DROPDOWN: DropdownValidator,
-        FieldType.CHECKBOX: CheckboxValidator,
-        FieldType.RADIO: RadioValidator,
-        FieldType.CALCULATED: CalculatedValidator,
-        FieldType.LOOKUP: LookupValidator,
-        FieldType.FILE: FileValidator,
-        FieldType.IMAGE: ImageValidator,
-        FieldType.TABLE: TableValidator,
-    }
-
-    validator_class = validator_map.get(field_type)
+    if not _VALIDATOR_CLASSES:
+        from doc_helper.domain.schema.field_type import FieldType
+
+        # Map field types to validator classes (built once)
+        _VALIDATOR_CLASSES.update({
+            FieldType.TEXT: TextValidator,
+            FieldType.TEXTAREA: TextAreaValidator,
+            FieldType.NUMBER: NumberValidator,
+            FieldType.DATE: DateValidator,
+            FieldType.DROPDOWN: DropdownValidator,
+            FieldType.CHECKBOX: CheckboxValidator,
+            FieldType.RADIO: RadioValidator,
+            FieldType.CALCULATED: CalculatedValidator,
+            FieldType.LOOKUP: LookupValidator,
+            FieldType.FILE: FileValidator,
+            FieldType.IMAGE: ImageValidator,
+            FieldType.TABLE: TableValidator,
+        })
+
+    validator_class = _VALIDATOR_CLASSES.get(field_type)
     if validator_class is None:
         raise ValueError(f"Unknown field type: {field_type}")
 
@@ -13,6 +13,12 @@ LIFETIMES:
 - Singleton: Created once, shared across application lifetime
 - Scoped: Created once per project session
 - Transient: Created on every resolution (rarely used)
+
+LAZY REGISTRATION:
+- Services can be registered by dotted import path instead of by type
+- Neither the service module nor the instance is loaded until first resolve
+- Keeps heavy dependencies (python-docx, openpyxl, PyMuPDF) off the
+  startup path
 """
 
 from pathlib import Path
@@ -29,6 +35,8 @@ class Container:
     - Singleton, Scoped, and Transient lifetimes
     - Factory functions for complex construction
     - Manual registration of pre-built instances
+    - Lazy registration by dotted import path (module not imported until
+      the service is first resolved)
 
     Example:
         container = Container()
@@ -49,6 +57,9 @@ class Container:
         self._scoped: dict[type, Any] = {}
         self._factories: dict[type, Callable[[], Any]] = {}
         self._lifetimes: dict[type, str] = {}  # "singleton", "scoped", "transient"
+        # Dotted path -> (lifetime, factory); promoted to a typed registration
+        # the first time the matching type is resolved
+        self._lazy: dict[str, tuple[str, Callable[[], Any]]] = {}
 
     def register_singleton(
         self,
@@ -138,6 +149,90 @@ class Container:
         self._singletons[interface] = instance
         self._lifetimes[interface] = "singleton"
 
+    def register_lazy(
+        self,
+        interface_path: str,
+        factory: Callable[[], Any],
+        lifetime: str = "singleton",
+    ) -> None:
+        """Register service by dotted import path without importing it.
+
+        The factory should import the implementation itself, so neither the
+        module nor the instance is loaded until the service is first resolved.
+        Callers resolve with the real type as usual; the type is matched by
+        its fully qualified name.
+
+        Args:
+            interface_path: Fully qualified type name
+                (e.g. "doc_helper.infrastructure.document.word_document_adapter.WordDocumentAdapter")
+            factory: Factory function to create service (imports lazily)
+            lifetime: "singleton", "scoped", or "transient"
+
+        Example:
+            def _word_adapter():
+                from doc_helper.infrastructure.document.word_document_adapter import (
+                    WordDocumentAdapter,
+                )
+                return WordDocumentAdapter()
+
+            container.register_lazy(
+                "doc_helper.infrastructure.document.word_document_adapter.WordDocumentAdapter",
+                _word_adapter,
+            )
+        """
+        if not callable(factory):
+            raise TypeError("factory must be callable")
+        if lifetime not in ("singleton", "scoped", "transient"):
+            raise ValueError(f"Unknown lifetime: {lifetime}")
+
+        self._lazy[interface_path] = (lifetime, factory)
+
+    @staticmethod
+    def _qualified_name(interface: type) -> str:
+        """Get the dotted path used to match lazy registrations."""
+        return f"{interface.__module__}.{interface.__qualname__}"
+
+    def _promote_lazy(self, interface: type) -> bool:
+        """Move a matching lazy registration to the typed registrations.
+
+        Args:
+            interface: Service interface type being resolved
+
+        Returns:
+            True if a lazy registration was promoted
+        """
+        if not self._lazy:
+            return False
+        entry = self._lazy.pop(self._qualified_name(interface), None)
+        if entry is None:
+            return False
+
+        lifetime, factory = entry
+        self._factories[interface] = factory
+        self._lifetimes[interface] = lifetime
+        return True
+
+    def warm_up(self) -> None:
+        """Import and construct every lazy singleton now.
+
+        Used for eager startup (e.g. diagnostics or tests that want the whole
+        graph built up front). Scoped and transient lazy services are only
+        imported, not constructed.
+        """
+        from importlib import import_module
+
+        for interface_path in list(self._lazy):
+            entry = self._lazy.get(interface_path)
+            if entry is None:
+                # Already promoted while resolving an earlier service
+                continue
+            module_name, _, type_name = interface_path.rpartition(".")
+            interface = getattr(import_module(module_name), type_name)
+            if entry[0] == "singleton":
+                self.resolve(interface)
+            else:
+                self._promote_lazy(interface)
+
     def resolve(self, interface: type[T]) -> T:
         """Resolve service instance.
 
@@ -154,7 +249,7 @@ class Container:
         Example:
             repo = container.resolve(ISchemaRepository)
         """
-        if interface not in self._lifetimes:
+        if interface not in self._lifetimes and not self._promote_lazy(interface):
             raise KeyError(f"Service {interface.__name__} not registered")
 
         lifetime = self._lifetimes[interface]
@@ -212,7 +307,10 @@ class Container:
         Returns:
             True if registered, False otherwise
         """
-        return interface in self._lifetimes
+        return (
+            interface in self._lifetimes
+            or self._qualified_name(interface) in self._lazy
+        )
 
     def clear(self) -> None:
         """Clear all registrations.
@@ -223,6 +321,7 @@ class Container:
         self._scoped.clear()
         self._factories.clear()
         self._lifetimes.clear()
+        self._lazy.clear()
 
 
 def register_undo_services(
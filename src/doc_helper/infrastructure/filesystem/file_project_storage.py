@@ -160,7 +160,7 @@ class FileProjectStorage:
             for field_id_str, field_data in project_data.get(
                 "field_values", {}
             ).items():
-                field_id = FieldDefinitionId(field_id_str)
+                field_id = FieldDefinitionId.interned(field_id_str)
                 field_value = FieldValue(
                     field_id=field_id,
                     value=field_data["value"],
@@ -8,14 +8,80 @@ RULES (AGENT_RULES.md Section 2):
 """
 
 import json
+import string
 import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 from doc_helper.domain.common.i18n import Language, TranslationKey
 from doc_helper.domain.common.translation import ITranslationService
 
 
+_FORMATTER = string.Formatter()
+
+
+class _Template:
+    """Pre-parsed translation string.
+
+    Parses {placeholder} fields once so rendering can skip str.format for
+    static strings and detect missing parameters without raising.
+
+    Rendering keeps the original interpolation semantics:
+    - No params: the raw text is returned unchanged
+    - Missing named param: the raw text is returned (graceful degradation)
+    - Otherwise: text.format(**params)
+    """
+
+    __slots__ = ("text", "_static", "_names")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._static: Optional[str] = None
+        self._names: Optional[FrozenSet[str]] = None
+        try:
+            parsed = list(_FORMATTER.parse(text))
+        except ValueError:
+            # Malformed braces - defer to str.format at render time
+            return
+
+        names = set()
+        for _literal, field_name, _spec, _conversion in parsed:
+            if field_name is None:
+                continue
+            # Root name of "{user.name}" / "{items[0]}"
+            root = field_name.split(".", 1)[0].split("[", 1)[0]
+            if not root or root.isdigit():
+                # Positional fields - defer to str.format at render time
+                return
+            names.add(root)
+
+        if names:
+            self._names = frozenset(names)
+        else:
+            self._static = "".join(literal for literal, *_ in parsed)
+
+    def render(self, params: Optional[Dict[str, Any]]) -> str:
+        """Render the template with optional parameters.
+
+        Args:
+            params: Dictionary of parameter values
+
+        Returns:
+            Rendered string
+        """
+        if not params:
+            return self.text
+        if self._static is not None:
+            return self._static
+        if self._names is not None and not self._names.issubset(params.keys()):
+            return self.text
+        try:
+            return self.text.format(**params)
+        except KeyError:
+            # Missing parameter - return text with placeholder intact
+            return self.text
+
+
 class JsonTranslationService(ITranslationService):
     """JSON file-based translation service.
 
@@ -47,8 +113,19 @@ class JsonTranslationService(ITranslationService):
 
     Thread Safety:
         Uses threading.Lock to protect current language state.
+        Translation tables are built once at load time and never mutated.
+
+    Performance:
+        Each language file is flattened at load time into a single
+        {dotted_key: template} dict, so get() is one dict lookup per
+        language tried. Templates are pre-parsed: strings without
+        placeholders skip str.format entirely, and missing parameters are
+        detected without raising.
     """
 
+    # Bound on templates cached for texts outside the loaded tables
+    _MAX_ADHOC_TEMPLATES = 4096
+
     def __init__(self, translations_dir: Path) -> None:
         """Initialize translation service.
 
@@ -67,7 +144,15 @@ class JsonTranslationService(ITranslationService):
 
         # Load all translations into memory (v1: simple, no lazy loading)
         self._translations: Dict[Language, Dict[str, Any]] = {}
+        self._tables: Dict[Language, Dict[str, _Template]] = {}
         self._load_translations()
+        # Templates parsed for _interpolate_params, keyed by text
+        self._templates: Dict[str, _Template] = {
+            template.text: template
+            for table in self._tables.values()
+            for template in table.values()
+        }
+        self._adhoc_templates: Dict[str, _Template] = {}
 
         # Current language state (thread-safe)
         self._current_language = Language.ENGLISH
@@ -89,12 +174,62 @@ class JsonTranslationService(ITranslationService):
             with open(file_path, "r", encoding="utf-8") as f:
                 self._translations[language] = json.load(f)
 
+            # Flatten once and pre-parse templates so lookups are a single
+            # dict access instead of a nested walk per call
+            self._tables[language] = {
+                flat_key: _Template(text)
+                for flat_key, text in self._flatten(self._translations[language]).items()
+            }
+
+    def _flatten(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Flatten a nested translation dictionary into dot-separated keys.
+
+        Precedence mirrors the lookup order of the original nested walk:
+        a key reached through fewer nesting levels wins over a deeper one.
+        For "menu.file.open" the candidates are checked as
+            data["menu.file.open"]            (depth 0)
+            data["menu"]["file.open"]         (depth 1)
+            data["menu"]["file"]["open"]      (depth 2)
+        and the first one found is kept.
+
+        Only dot-free keys can be navigated through (a dotted key is always
+        the last segment), and None values are treated as missing.
+
+        Args:
+            data: Nested translation dictionary loaded from JSON
+
+        Returns:
+            Flat dictionary mapping full dotted keys to translation strings
+
+        Example:
+            data = {"menu": {"file": {"open": "Open"}}}
+            _flatten(data) → {"menu.file.open": "Open"}
+        """
+        flat: Dict[str, str] = {}
+        # Breadth-first so shallower entries are seen (and kept) first
+        level: list[tuple[str, Dict[str, Any]]] = [("", data)]
+        while level:
+            next_level: list[tuple[str, Dict[str, Any]]] = []
+            for prefix, node in level:
+                for name, value in node.items():
+                    full_key = f"{prefix}{name}"
+                    if isinstance(value, dict):
+                        if "." not in name:
+                            next_level.append((f"{full_key}.", value))
+                    elif value is not None and full_key not in flat:
+                        flat[full_key] = str(value)
+            level = next_level
+        return flat
+
     def _get_nested_value(
         self, data: Dict[str, Any], key: str
     ) -> Optional[str]:
         """Get value from nested dictionary using dot notation.
 
-        Handles both dot-separated keys within nested dicts and fully nested paths.
+        The dictionary is walked along the key's segments with the same
+        precedence as _flatten (shallower entries win), without flattening
+        the whole dictionary. Loaded languages are looked up with _lookup()
+        instead.
 
         Args:
             data: Dictionary to search
@@ -102,52 +237,32 @@ class JsonTranslationService(ITranslationService):
 
         Returns:
             Translation string if found, None otherwise
-
-        Example:
-            data = {"menu": {"file": {"open": "Open"}}}
-            _get_nested_value(data, "menu.file.open") → "Open"
         """
-        # Try direct lookup first (for keys with dots in them)
-        if key in data:
-            value = data[key]
-            return str(value) if value is not None else None
-
-        # Try nested lookup
-        parts = key.split(".")
-
-        # Try progressive nested lookup: navigate some levels, then look for rest as key
-        # For "menu.file.open", try:
-        #   depth=1: data["menu"]["file.open"]
-        #   depth=2: data["menu"]["file"]["open"]
-        for depth in range(1, len(parts)):
-            current = data
-
-            # Navigate to the specified depth
-            for part in parts[:depth]:
-                if isinstance(current, dict) and part in current:
-                    current = current[part]
-                else:
-                    break
-            else:
-                # Successfully navigated, check for remaining key
-                remaining = ".".join(parts[depth:])
-                if isinstance(current, dict) and remaining in current:
-                    value = current[remaining]
-                    return str(value) if value is not None else None
-
-        # Final attempt: fully nested lookup (all dots are levels)
-        current = data
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
+        segments = key.split(".")
+        node: Any = data
+        for depth in range(len(segments)):
+            value = node.get(".".join(segments[depth:]))
+            if value is not None and not isinstance(value, dict):
+                return str(value)
+            node = node.get(segments[depth])
+            if not isinstance(node, dict):
                 return None
+        return None
 
-        # Final value must be a string or convertible to string
-        if current is not None:
-            return str(current)
+    def _lookup(self, language: Language, key: str) -> Optional["_Template"]:
+        """Look up a pre-parsed template in a language's flat table.
 
-        return None
+        Args:
+            language: Language table to search
+            key: Full dotted translation key
+
+        Returns:
+            Template if found, None otherwise
+        """
+        table = self._tables.get(language)
+        if table is None:
+            return None
+        return table.get(key)
 
     def _interpolate_params(
         self, text: str, params: Optional[Dict[str, Any]]
@@ -166,15 +281,13 @@ class JsonTranslationService(ITranslationService):
             params = {"name": "Alice", "count": 5}
             → "Hello Alice, you have 5 messages"
         """
-        if not params:
-            return text
-
-        try:
-            return text.format(**params)
-        except KeyError as e:
-            # Missing parameter - return text with placeholder intact
-            # This is graceful degradation, not an error
-            return text
+        template = self._templates.get(text) or self._adhoc_templates.get(text)
+        if template is None:
+            template = _Template(text)
+            if len(self._adhoc_templates) >= self._MAX_ADHOC_TEMPLATES:
+                self._adhoc_templates.clear()
+            self._adhoc_templates[text] = template
+        return template.render(params)
 
     def get(
         self,
@@ -206,18 +319,15 @@ class JsonTranslationService(ITranslationService):
         key_str = key.key
 
         # Try requested language
-        if language in self._translations:
-            value = self._get_nested_value(self._translations[language], key_str)
-            if value is not None:
-                return self._interpolate_params(value, params)
+        template = self._lookup(language, key_str)
+        if template is not None:
+            return template.render(params)
 
         # Fallback to English
-        if language != Language.ENGLISH and Language.ENGLISH in self._translations:
-            value = self._get_nested_value(
-                self._translations[Language.ENGLISH], key_str
-            )
-            if value is not None:
-                return self._interpolate_params(value, params)
+        if language != Language.ENGLISH:
+            template = self._lookup(Language.ENGLISH, key_str)
+            if template is not None:
+                return template.render(params)
 
         # Fallback to key itself (graceful degradation)
         return key_str
@@ -263,11 +373,7 @@ class JsonTranslationService(ITranslationService):
             service.has_key(key, Language.ENGLISH)  # True
             service.has_key(key, Language.ARABIC)   # True/False
         """
-        if language not in self._translations:
-            return False
-
-        value = self._get_nested_value(self._translations[language], key.key)
-        return value is not None
+        return self._lookup(language, key.key) is not None
 
     def translate(self, key: str) -> str:
         """Convenience method: translate using current language.
@@ -0,0 +1,666 @@
+"""Bulk migration and re-validation of all stored projects.
+
+After a new config.db version is shipped, FleetMigrationJob brings every
+project in a projects database up to date with it:
+
+1. Migration: set-based SQL per schema change, across all projects of an
+   entity at once (renamed fields move their values, removed fields lose
+   them). Type changes cannot be converted in SQL; affected values are
+   left as is and reported by re-validation.
+2. Re-validation: projects are streamed page by page (keyset pagination)
+   and validated against the new entity definitions, optionally in a
+   process pool. At most a few pages are held in memory at any time.
+   Workers receive the validation rules as schema JSON and rebuild the
+   definitions themselves, so any start method (fork or spawn) works.
+
+Progress is written to a JSON checkpoint after each migration step and
+each page, so an interrupted run resumes where it stopped. The finished
+run produces a FleetMigrationReport (also written next to the checkpoint).
+A finished run is only repeated for another schema, changes or renames
+(see needs_migration()); running it again for the same job re-validates
+the projects if they were edited since, so the report is never stale.
+"""
+
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.common.result import Failure, Result, Success
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_change import ChangeType, SchemaChange
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.validation.constraint_factory import ConstraintFactory
+from doc_helper.domain.validation.severity import Severity
+from doc_helper.domain.validation.validation_plan import ValidationPlan
+from doc_helper.infrastructure.persistence.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+
+# (project_id, name, entity_id, {field_id: raw value})
+_WorkItem = tuple[str, str, str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class FieldRename:
+    """Explicit rename of a field.
+
+    Schema comparison reports a rename as a removed and an added field
+    (no rename detection), so renames are declared by the caller. A
+    FIELD_REMOVED change for old_field_id is then treated as the rename.
+    """
+
+    entity_id: str
+    old_field_id: str
+    new_field_id: str
+
+
+@dataclass(frozen=True)
+class FleetProjectIssue:
+    """A project that does not validate against the new schema."""
+
+    project_id: str
+    name: str
+    entity_id: str
+    error_count: int
+    warning_count: int
+    messages: tuple[str, ...]
+    """First few issues as "field_path: constraint_type (message_key)"."""
+
+
+@dataclass(frozen=True)
+class FleetMigrationReport:
+    """Summary of a fleet migration run."""
+
+    total_projects: int
+    """Projects re-validated."""
+
+    renamed_values: int
+    """Stored values moved to a renamed field ID."""
+
+    removed_values: int
+    """Stored values of removed fields deleted."""
+
+    invalid_projects: tuple[FleetProjectIssue, ...]
+    """Projects with ERROR issues under the new schema."""
+
+    orphaned_project_ids: tuple[str, ...]
+    """Projects whose entity no longer exists in the new schema."""
+
+    review_locations: tuple[str, ...]
+    """Fields whose values were not migrated (type or option changes)."""
+
+    resumed: bool = False
+    """Whether this run continued from a checkpoint."""
+
+    @property
+    def valid_projects(self) -> int:
+        """Number of projects that validate (orphans excluded)."""
+        return self.total_projects - len(self.invalid_projects) - len(self.orphaned_project_ids)
+
+    def to_dict(self) -> dict:
+        """Report as JSON-serializable dict."""
+        data = asdict(self)
+        data["valid_projects"] = self.valid_projects
+        return data
+
+
+@dataclass
+class _Checkpoint:
+    """Progress of a run, persisted after every page."""
+
+    job_signature: str
+    migrated: bool = False
+    migrated_steps: list[str] = field(default_factory=list)
+    """Migration steps applied (and counted) so far."""
+    renamed_values: int = 0
+    removed_values: int = 0
+    last_project_id: Optional[str] = None
+    total_projects: int = 0
+    invalid_projects: list[dict] = field(default_factory=list)
+    orphaned_project_ids: list[str] = field(default_factory=list)
+    projects_stamp: Optional[str] = None
+    """Modification stamp of the projects when re-validation started."""
+    completed: bool = False
+
+
+def _plain_id(value: Any) -> Optional[str]:
+    """ID as a string (IDs may be given as strings or ID objects)."""
+    return getattr(value, "value", value)
+
+
+def _schema_payload(entity_definitions: Mapping[str, EntityDefinition]) -> str:
+    """Serialize the validation rules of entity definitions as JSON.
+
+    Keeps what a ValidationPlan reads (field IDs, types and constraints)
+    plus the attributes a FieldDefinition of each type requires.
+
+    Raises:
+        ValueError: If a constraint has no persisted form
+    """
+    factory = ConstraintFactory()
+    entities = {}
+    for entity_id, entity in entity_definitions.items():
+        fields = []
+        for field_def in entity.fields.values():
+            constraints = []
+            for constraint in field_def.constraints:
+                rule_type, rule_value = factory.serialize_to_raw(constraint)
+                if factory.create_from_raw(rule_type, rule_value) is None:
+                    raise ValueError(
+                        f"Constraint {type(constraint).__name__} of "
+                        f"{entity_id}.{field_def.id.value} cannot be serialized"
+                    )
+                constraints.append([rule_type, rule_value])
+            fields.append(
+                {
+                    "id": field_def.id.value,
+                    "field_type": field_def.field_type.value,
+                    "label_key": field_def.label_key.key,
+                    "required": field_def.required,
+                    "constraints": constraints,
+                    "formula": field_def.formula,
+                    "lookup_entity_id": _plain_id(field_def.lookup_entity_id),
+                    "child_entity_id": _plain_id(field_def.child_entity_id),
+                }
+            )
+        entities[entity_id] = {"name_key": entity.name_key.key, "fields": fields}
+    return json.dumps(entities, sort_keys=True)
+
+
+def _entities_from_payload(payload: str) -> dict[str, EntityDefinition]:
+    """Rebuild entity definitions from _schema_payload() JSON."""
+    factory = ConstraintFactory()
+    entities = {}
+    for entity_id, entity in json.loads(payload).items():
+        fields = {}
+        for data in entity["fields"]:
+            field_id = FieldDefinitionId.interned(data["id"])
+            fields[field_id] = FieldDefinition(
+                id=field_id,
+                field_type=FieldType(data["field_type"]),
+                label_key=TranslationKey(data["label_key"]),
+                required=data["required"],
+                constraints=tuple(
+                    factory.create_from_raw(rule_type, rule_value)
+                    for rule_type, rule_value in data["constraints"]
+                ),
+                formula=data["formula"],
+                lookup_entity_id=data["lookup_entity_id"],
+                child_entity_id=data["child_entity_id"],
+            )
+        entities[entity_id] = EntityDefinition(
+            id=EntityDefinitionId(entity_id),
+            name_key=TranslationKey(entity["name_key"]),
+            fields=fields,
+        )
+    return entities
+
+
+# Validation plans of a pool worker process, built once per worker
+_worker_plans: dict[str, ValidationPlan] = {}
+
+
+def _init_worker(schema_payload: str) -> None:
+    """Build the validation plans of a pool worker process.
+
+    Args:
+        schema_payload: Validation rules as _schema_payload() JSON
+    """
+    _worker_plans.clear()
+    _worker_plans.update(
+        (entity_id, ValidationPlan(entity))
+        for entity_id, entity in _entities_from_payload(schema_payload).items()
+    )
+
+
+def _validate_page(
+    items: Sequence[_WorkItem],
+    max_messages: int,
+    plans: Optional[Mapping[str, ValidationPlan]] = None,
+) -> tuple[list[dict], list[str]]:
+    """Validate one page of projects.
+
+    Args:
+        items: Projects to validate
+        max_messages: Maximum messages kept per invalid project
+        plans: Validation plans by entity ID (None = this worker's plans)
+
+    Returns:
+        (invalid project issues as dicts, orphaned project IDs)
+    """
+    plans = _worker_plans if plans is None else plans
+    invalid: list[dict] = []
+    orphaned: list[str] = []
+    for project_id, name, entity_id, values in items:
+        plan = plans.get(entity_id)
+        if plan is None:
+            orphaned.append(project_id)
+            continue
+        result = plan.validate(
+            {FieldDefinitionId.interned(field_id): value for field_id, value in values.items()}
+        )
+        if result.is_valid():
+            continue
+        errors = [e for e in result.errors if e.severity == Severity.ERROR]
+        if not errors:
+            continue
+        invalid.append(
+            asdict(
+                FleetProjectIssue(
+                    project_id=project_id,
+                    name=name,
+                    entity_id=entity_id,
+                    error_count=len(errors),
+                    warning_count=len(result.errors) - len(errors),
+                    messages=tuple(
+                        f"{e.field_path}: {e.constraint_type} ({e.message_key.key})"
+                        for e in errors[:max_messages]
+                    ),
+                )
+            )
+        )
+    return invalid, orphaned
+
+
+class FleetMigrationJob:
+    """Migrate and re-validate every project after a schema change.
+
+    Only projects of app_type_id are migrated and re-validated; projects of
+    other AppTypes follow other schemas and are left alone.
+
+    Example:
+        job = FleetMigrationJob(
+            repository=SqliteProjectRepository(
+                "projects.db", schema_repository=schema_repository
+            ),
+            entity_definitions={e.id.value: e for e in new_entities},
+            checkpoint_path=Path("fleet_migration.json"),
+            app_type_id="soil_investigation",
+            max_workers=4,
+        )
+        result = job.run(
+            changes=compatibility_result.changes,
+            renames=(FieldRename("project", "location", "site_location"),),
+        )
+        if result.is_success():
+            print(f"{len(result.value.invalid_projects)} projects need attention")
+    """
+
+    DEFAULT_PAGE_SIZE = 200
+    MAX_MESSAGES_PER_PROJECT = 5
+    CHECKPOINT_VERSION = 3
+
+    def __init__(
+        self,
+        repository: SqliteProjectRepository,
+        entity_definitions: Mapping[str, EntityDefinition],
+        checkpoint_path: str | Path,
+        app_type_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = 1,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            repository: Projects database to migrate (give it the new schema
+                repository, so TABLE values are stored as rows)
+            entity_definitions: Entity definitions of the new schema, by ID
+            checkpoint_path: JSON checkpoint file (the report is written
+                next to it with a ".report.json" suffix)
+            app_type_id: AppType whose projects follow the schema
+                (None = every project)
+            page_size: Projects loaded and validated per page
+            max_workers: Worker processes for re-validation (1 = in process)
+            mp_context: Multiprocessing context of the worker processes
+                (None = platform default)
+        """
+        if not isinstance(repository, SqliteProjectRepository):
+            raise TypeError("repository must be a SqliteProjectRepository")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+
+        self._repository = repository
+        self._entity_definitions = dict(entity_definitions)
+        # Serialized on first use (see _get_schema_payload)
+        self._schema_payload: Optional[str] = None
+        self._checkpoint_path = Path(checkpoint_path)
+        self._app_type_id = app_type_id
+        self._page_size = page_size
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+
+    @property
+    def report_path(self) -> Path:
+        """Path of the JSON summary report."""
+        return self._checkpoint_path.with_suffix(".report.json")
+
+    def needs_migration(
+        self,
+        changes: Sequence[SchemaChange] = (),
+        renames: Sequence[FieldRename] = (),
+    ) -> bool:
+        """Check if the job has not finished for this schema, changes and renames.
+
+        Args:
+            changes: Changes from the schema comparison
+            renames: Field renames declared by the caller
+
+        Returns:
+            False if a finished run of the same job is checkpointed
+
+        Raises:
+            ValueError: If a constraint of the schema cannot be serialized
+        """
+        checkpoint = self._load_checkpoint(self._job_signature(changes, renames))
+        return checkpoint is None or not checkpoint.completed
+
+    def run(
+        self,
+        changes: Sequence[SchemaChange] = (),
+        renames: Sequence[FieldRename] = (),
+    ) -> Result[FleetMigrationReport, str]:
+        """Run (or resume) the job.
+
+        A checkpoint of an earlier run with the same schema, changes and
+        renames is resumed; a checkpoint of a different job is discarded.
+        Migration steps are never repeated, but projects edited since the
+        checkpointed re-validation are validated again.
+
+        Args:
+            changes: Changes from the schema comparison (CompatibilityResult.changes)
+            renames: Field renames declared by the caller
+
+        Returns:
+            Success(FleetMigrationReport), Failure(error) on error
+        """
+        try:
+            signature = self._job_signature(changes, renames)
+        except ValueError as e:
+            return Failure(str(e))
+        checkpoint = self._load_checkpoint(signature)
+        resumed = checkpoint is not None
+        if checkpoint is None:
+            checkpoint = _Checkpoint(job_signature=signature)
+
+        if not checkpoint.migrated:
+            migrate_result = self._migrate(changes, renames, checkpoint)
+            if migrate_result.is_failure():
+                return migrate_result
+            checkpoint.migrated = True
+            self._save_checkpoint(checkpoint)
+
+        stamp_result = self._repository.get_modification_stamp(self._app_type_id)
+        if stamp_result.is_failure():
+            return Failure(f"Reading project state failed: {stamp_result.error}")
+        if checkpoint.completed and checkpoint.projects_stamp != stamp_result.value:
+            self._restart_revalidation(checkpoint)
+        if checkpoint.last_project_id is None:
+            checkpoint.projects_stamp = stamp_result.value
+
+        if not checkpoint.completed:
+            revalidate_result = self._revalidate(checkpoint)
+            if revalidate_result.is_failure():
+                return revalidate_result
+            checkpoint.completed = True
+            self._save_checkpoint(checkpoint)
+
+        report = FleetMigrationReport(
+            total_projects=checkpoint.total_projects,
+            renamed_values=checkpoint.renamed_values,
+            removed_values=checkpoint.removed_values,
+            invalid_projects=tuple(
+                FleetProjectIssue(**{**issue, "messages": tuple(issue["messages"])})
+                for issue in checkpoint.invalid_projects
+            ),
+            orphaned_project_ids=tuple(checkpoint.orphaned_project_ids),
+            review_locations=tuple(
+                change.location
+                for change in changes
+                if change.change_type
+                in (ChangeType.FIELD_TYPE_CHANGED, ChangeType.OPTION_REMOVED)
+            ),
+            resumed=resumed,
+        )
+        self._write_json(self.report_path, report.to_dict())
+        return Success(report)
+
+    # -------------------------------------------------------------------------
+    # Migration
+    # -------------------------------------------------------------------------
+
+    def _migrate(
+        self,
+        changes: Sequence[SchemaChange],
+        renames: Sequence[FieldRename],
+        checkpoint: _Checkpoint,
+    ) -> Result[None, str]:
+        """Apply renames and field removals as set-based SQL.
+
+        Each step is checkpointed with its count as soon as it is applied,
+        and a resumed run skips the steps already recorded. A step that was
+        interrupted before its checkpoint runs again, which moves or deletes
+        nothing more (the values are already gone).
+        """
+        done = set(checkpoint.migrated_steps)
+        renamed_fields = {(rename.entity_id, rename.old_field_id) for rename in renames}
+        for rename in renames:
+            step = f"rename:{rename.entity_id}.{rename.old_field_id}:{rename.new_field_id}"
+            if step in done:
+                continue
+            result = self._repository.rename_field_values(
+                EntityDefinitionId(rename.entity_id),
+                FieldDefinitionId(rename.old_field_id),
+                FieldDefinitionId(rename.new_field_id),
+                self._app_type_id,
+            )
+            if result.is_failure():
+                return Failure(
+                    f"Rename of {rename.entity_id}.{rename.old_field_id} failed: {result.error}"
+                )
+            checkpoint.renamed_values += result.value
+            self._complete_step(checkpoint, step)
+
+        for change in changes:
+            if change.change_type != ChangeType.FIELD_REMOVED:
+                continue
+            if (change.entity_id, change.field_id) in renamed_fields:
+                continue
+            step = f"remove:{change.location}"
+            if step in done:
+                continue
+            result = self._repository.delete_field_values(
+                EntityDefinitionId(change.entity_id),
+                FieldDefinitionId(change.field_id),
+                self._app_type_id,
+            )
+            if result.is_failure():
+                return Failure(f"Removal of {change.location} failed: {result.error}")
+            checkpoint.removed_values += result.value
+            self._complete_step(checkpoint, step)
+
+        return Success(None)
+
+    def _complete_step(self, checkpoint: _Checkpoint, step: str) -> None:
+        """Record an applied migration step and persist the checkpoint."""
+        checkpoint.migrated_steps.append(step)
+        self._save_checkpoint(checkpoint)
+
+    # -------------------------------------------------------------------------
+    # Re-validation
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _restart_revalidation(checkpoint: _Checkpoint) -> None:
+        """Drop the re-validation results of a checkpoint (migration is kept)."""
+        checkpoint.last_project_id = None
+        checkpoint.total_projects = 0
+        checkpoint.invalid_projects = []
+        checkpoint.orphaned_project_ids = []
+        checkpoint.completed = False
+
+    def _revalidate(self, checkpoint: _Checkpoint) -> Result[None, str]:
+        """Validate every project after the checkpoint, page by page."""
+        pages = self._pages(checkpoint.last_project_id)
+        try:
+            if self._max_workers == 1:
+                plans = {
+                    entity_id: ValidationPlan(entity)
+                    for entity_id, entity in self._entity_definitions.items()
+                }
+                for items in pages:
+                    self._record_page(
+                        checkpoint,
+                        items,
+                        _validate_page(items, self.MAX_MESSAGES_PER_PROJECT, plans),
+                    )
+            else:
+                self._revalidate_in_pool(checkpoint, pages)
+        except _PageLoadError as e:
+            return Failure(str(e))
+        return Success(None)
+
+    def _revalidate_in_pool(
+        self,
+        checkpoint: _Checkpoint,
+        pages: Iterator[list[_WorkItem]],
+    ) -> None:
+        """Validate pages in worker processes, recording them in page order.
+
+        Only a bounded number of pages is in flight, so memory stays flat
+        however many projects are stored.
+        """
+        in_flight: deque[tuple[list[_WorkItem], Future]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._get_schema_payload(),),
+        ) as executor:
+            for items in pages:
+                in_flight.append(
+                    (items, executor.submit(_validate_page, items, self.MAX_MESSAGES_PER_PROJECT))
+                )
+                if len(in_flight) >= self._max_workers * 2:
+                    done_items, future = in_flight.popleft()
+                    self._record_page(checkpoint, done_items, future.result())
+            while in_flight:
+                done_items, future = in_flight.popleft()
+                self._record_page(checkpoint, done_items, future.result())
+
+    def _pages(self, after_project_id: Optional[str]) -> Iterator[list[_WorkItem]]:
+        """Stream projects as pages of work items.
+
+        Raises:
+            _PageLoadError: If a page cannot be loaded
+        """
+        while True:
+            result = self._repository.get_page(
+                after_project_id, self._page_size, self._app_type_id
+            )
+            if result.is_failure():
+                raise _PageLoadError(f"Loading projects failed: {result.error}")
+            projects = result.value
+            if not projects:
+                return
+            yield [
+                (
+                    str(project.id.value),
+                    project.name,
+                    project.entity_definition_id.value,
+                    {
+                        field_id.value: field_value.value
+                        for field_id, field_value in project.field_values.items()
+                    },
+                )
+                for project in projects
+            ]
+            after_project_id = str(projects[-1].id.value)
+
+    def _record_page(
+        self,
+        checkpoint: _Checkpoint,
+        items: list[_WorkItem],
+        outcome: tuple[list[dict], list[str]],
+    ) -> None:
+        """Add a validated page to the checkpoint and persist it."""
+        invalid, orphaned = outcome
+        checkpoint.invalid_projects.extend(invalid)
+        checkpoint.orphaned_project_ids.extend(orphaned)
+        checkpoint.total_projects += len(items)
+        checkpoint.last_project_id = items[-1][0]
+        self._save_checkpoint(checkpoint)
+
+    # -------------------------------------------------------------------------
+    # Checkpoint
+    # -------------------------------------------------------------------------
+
+    def _get_schema_payload(self) -> str:
+        """Validation rules as _schema_payload() JSON, serialized once.
+
+        Raises:
+            ValueError: If a constraint of the schema cannot be serialized
+        """
+        if self._schema_payload is None:
+            self._schema_payload = _schema_payload(self._entity_definitions)
+        return self._schema_payload
+
+    def _job_signature(
+        self,
+        changes: Sequence[SchemaChange],
+        renames: Sequence[FieldRename],
+    ) -> str:
+        """Identify a job by its AppType, schema, changes and renames.
+
+        Raises:
+            ValueError: If a constraint of the schema cannot be serialized
+        """
+        payload = json.dumps(
+            [
+                self.CHECKPOINT_VERSION,
+                self._app_type_id,
+                self._get_schema_payload(),
+                [[change.change_type.value, change.location] for change in changes],
+                [asdict(rename) for rename in renames],
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_checkpoint(self, signature: str) -> Optional[_Checkpoint]:
+        """Load the checkpoint of the same job (None if absent or different)."""
+        try:
+            data = json.loads(self._checkpoint_path.read_text(encoding="utf-8"))
+            checkpoint = _Checkpoint(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        if checkpoint.job_signature != signature:
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: _Checkpoint) -> None:
+        """Persist the checkpoint."""
+        self._write_json(self._checkpoint_path, asdict(checkpoint))
+
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        """Write JSON atomically (an interrupted write keeps the old file)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+class _PageLoadError(Exception):
+    """A page of projects could not be loaded."""
@@ -0,0 +1,454 @@
+"""SQLite-backed content-addressed attachment store.
+
+Attachment files are stored once per distinct content under a sharded
+directory tree; the database tracks which attachments reference which
+content so duplicates cost no extra disk space.
+"""
+
+import hashlib
+import mmap
+import os
+import shutil
+import sqlite3
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from doc_helper.domain.common.result import Failure, Result, Success
+from doc_helper.domain.file.file_ids import AttachmentId
+from doc_helper.domain.file.repositories import IAttachmentBlobStore
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
+from doc_helper.domain.file.value_objects.storage_report import AttachmentStorageReport
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.infrastructure.persistence.sqlite_base import SqliteConnection
+
+
+class SqliteAttachmentBlobStore(IAttachmentBlobStore):
+    """Content-addressed attachment store with reference counting.
+
+    Layout (blob_root):
+        blobs/9f/86/9f86d081...e08.jpg          - one file per distinct content
+
+    Schema (same database as the attachments table):
+        CREATE TABLE attachment_blobs (
+            content_hash TEXT PRIMARY KEY,
+            size_bytes INTEGER NOT NULL,
+            extension TEXT NOT NULL DEFAULT '',
+            ref_count INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TABLE attachment_blob_refs (
+            attachment_id TEXT PRIMARY KEY,
+            project_id TEXT NOT NULL,
+            content_hash TEXT NOT NULL REFERENCES attachment_blobs(content_hash)
+        );
+
+    Each operation opens its own connection, so the store can be used from
+    the worker threads behind store_async(). Hashing uses memory-mapped
+    reads; hashlib releases the GIL while digesting large buffers.
+
+    Blob files are only created and deleted while holding the database
+    write lock (BEGIN IMMEDIATE): store() checks for and copies the file in
+    the same write transaction that adds its reference, and an unreferenced
+    blob is unlinked only after re-checking, under the write lock, that no
+    writer has referenced it again since it was released.
+
+    Example:
+        store = SqliteAttachmentBlobStore("project.db", project_dir / "attachments")
+        future = store.store_async(Path("photo.jpg"), attachment_id, project_id)
+        ...
+        result = future.result()  # Result[ContentHash, str]
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        blob_root: str | Path,
+        max_workers: int = 2,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            db_path: Path to SQLite database (typically project.db)
+            blob_root: Directory holding blob files
+            max_workers: Threads used by store_async()/hash_async()
+        """
+        if not isinstance(db_path, (str, Path)):
+            raise TypeError("db_path must be a string or Path")
+        if not isinstance(blob_root, (str, Path)):
+            raise TypeError("blob_root must be a string or Path")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        self.db_path = Path(db_path)
+        self.blob_root = Path(blob_root)
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._ensure_schema()
+
+    # -------------------------------------------------------------------------
+    # Hashing
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def hash_file(path: Path) -> ContentHash:
+        """Compute the content hash of a file using a memory-mapped read.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            ContentHash of the file bytes
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            # mmap cannot map empty files
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+        return ContentHash(digest.hexdigest())
+
+    def hash_async(self, path: Path) -> "Future[ContentHash]":
+        """Hash a file on a worker thread.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            Future resolving to the ContentHash (or raising OSError)
+        """
+        return self._get_executor().submit(self.hash_file, Path(path))
+
+    # -------------------------------------------------------------------------
+    # IAttachmentBlobStore
+    # -------------------------------------------------------------------------
+
+    def store(
+        self,
+        source_path: Path,
+        attachment_id: AttachmentId,
+        project_id: ProjectId,
+    ) -> Result[ContentHash, str]:
+        """Store a file for an attachment (copied only if content is new)."""
+        if not isinstance(attachment_id, AttachmentId):
+            return Failure(f"attachment_id must be AttachmentId, got {type(attachment_id)}")
+        if not isinstance(project_id, ProjectId):
+            return Failure(f"project_id must be ProjectId, got {type(project_id)}")
+
+        source_path = Path(source_path)
+        try:
+            content_hash = self.hash_file(source_path)
+            size_bytes = source_path.stat().st_size
+        except OSError as e:
+            return Failure(f"Cannot read attachment file {source_path}: {e}")
+
+        orphaned: Optional[tuple[ContentHash, str]] = None
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                # Hold the write lock while the blob file is checked and
+                # copied, so a concurrent release cannot unlink it in between
+                cursor.execute("BEGIN IMMEDIATE")
+
+                cursor.execute(
+                    "SELECT extension FROM attachment_blobs WHERE content_hash = ?",
+                    (content_hash.value,),
+                )
+                row = cursor.fetchone()
+                extension = row[0] if row else source_path.suffix.lower()
+
+                blob_path = self._blob_path(content_hash, extension)
+                if not blob_path.exists():
+                    self._copy_into_place(source_path, blob_path)
+
+                cursor.execute(
+                    "SELECT content_hash FROM attachment_blob_refs WHERE attachment_id = ?",
+                    (str(attachment_id.value),),
+                )
+                previous = cursor.fetchone()
+                if previous is not None and previous[0] == content_hash.value:
+                    return Success(content_hash)
+
+                cursor.execute(
+                    """
+                    INSERT INTO attachment_blobs (content_hash, size_bytes, extension, ref_count)
+                    VALUES (?, ?, ?, 1)
+                    ON CONFLICT(content_hash) DO UPDATE SET ref_count = ref_count + 1
+                    """,
+                    (content_hash.value, size_bytes, extension),
+                )
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO attachment_blob_refs (attachment_id, project_id, content_hash)
+                    VALUES (?, ?, ?)
+                    """,
+                    (str(attachment_id.value), str(project_id.value), content_hash.value),
+                )
+                if previous is not None:
+                    orphaned = self._decrement(cursor, ContentHash(previous[0]))
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+        except OSError as e:
+            return Failure(f"Cannot store attachment file {source_path}: {e}")
+
+        if orphaned is not None:
+            collected = self._collect(*orphaned)
+            if collected.is_failure():
+                return Failure(collected.error)
+        return Success(content_hash)
+
+    def store_async(
+        self,
+        source_path: Path,
+        attachment_id: AttachmentId,
+        project_id: ProjectId,
+    ) -> "Future[Result[ContentHash, str]]":
+        """Run store() on a worker thread so the caller never blocks.
+
+        Returns:
+            Future resolving to the Result of store()
+        """
+        return self._get_executor().submit(self.store, Path(source_path), attachment_id, project_id)
+
+    def release(self, attachment_id: AttachmentId) -> Result[None, str]:
+        """Drop an attachment's reference; delete the blob when unused."""
+        if not isinstance(attachment_id, AttachmentId):
+            return Failure(f"attachment_id must be AttachmentId, got {type(attachment_id)}")
+
+        orphaned: Optional[tuple[ContentHash, str]] = None
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(
+                    "SELECT content_hash FROM attachment_blob_refs WHERE attachment_id = ?",
+                    (str(attachment_id.value),),
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return Success(None)
+
+                cursor.execute(
+                    "DELETE FROM attachment_blob_refs WHERE attachment_id = ?",
+                    (str(attachment_id.value),),
+                )
+                orphaned = self._decrement(cursor, ContentHash(row[0]))
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+
+        if orphaned is not None:
+            return self._collect(*orphaned)
+        return Success(None)
+
+    def get_blob_path(self, content_hash: ContentHash) -> Result[Path, str]:
+        """Get the stored file for a content hash."""
+        if not isinstance(content_hash, ContentHash):
+            return Failure(f"content_hash must be ContentHash, got {type(content_hash)}")
+
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT extension FROM attachment_blobs WHERE content_hash = ?",
+                    (content_hash.value,),
+                )
+                row = cursor.fetchone()
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+
+        if row is None:
+            return Failure(f"Content {content_hash.value} is not stored")
+
+        blob_path = self._blob_path(content_hash, row[0])
+        if not blob_path.exists():
+            return Failure(f"Blob file missing for content {content_hash.value}")
+        return Success(blob_path)
+
+    def get_ref_count(self, content_hash: ContentHash) -> Result[int, str]:
+        """Get the number of attachments referencing a content hash.
+
+        Returns:
+            Success with reference count (0 if not stored) or Failure
+        """
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT ref_count FROM attachment_blobs WHERE content_hash = ?",
+                    (content_hash.value,),
+                )
+                row = cursor.fetchone()
+                return Success(row[0] if row else 0)
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+
+    def get_storage_report(self, project_id: ProjectId) -> Result[AttachmentStorageReport, str]:
+        """Report logical vs. deduplicated attachment size for a project."""
+        if not isinstance(project_id, ProjectId):
+            return Failure(f"project_id must be ProjectId, got {type(project_id)}")
+
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(b.size_bytes), 0)
+                    FROM attachment_blob_refs r
+                    JOIN attachment_blobs b ON b.content_hash = r.content_hash
+                    WHERE r.project_id = ?
+                    """,
+                    (str(project_id.value),),
+                )
+                attachment_count, logical_bytes = cursor.fetchone()
+                cursor.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(size_bytes), 0)
+                    FROM attachment_blobs
+                    WHERE content_hash IN (
+                        SELECT content_hash FROM attachment_blob_refs WHERE project_id = ?
+                    )
+                    """,
+                    (str(project_id.value),),
+                )
+                unique_blob_count, stored_bytes = cursor.fetchone()
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+
+        return Success(
+            AttachmentStorageReport(
+                project_id=project_id,
+                attachment_count=attachment_count,
+                unique_blob_count=unique_blob_count,
+                logical_bytes=logical_bytes,
+                stored_bytes=stored_bytes,
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads used by the async methods."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="attachment-blob",
+            )
+        return self._executor
+
+    def _blob_path(self, content_hash: ContentHash, extension: str) -> Path:
+        """Sharded location of a blob file."""
+        first, second = content_hash.shard
+        return self.blob_root / "blobs" / first / second / f"{content_hash.value}{extension}"
+
+    @staticmethod
+    def _copy_into_place(source_path: Path, blob_path: Path) -> None:
+        """Copy a file into the store atomically (temp file + replace)."""
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f".{blob_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, blob_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _decrement(
+        cursor: sqlite3.Cursor,
+        content_hash: ContentHash,
+    ) -> Optional[tuple[ContentHash, str]]:
+        """Decrement a blob's reference count, dropping the row at zero.
+
+        Returns:
+            (content_hash, extension) if the blob became unreferenced
+        """
+        cursor.execute(
+            "UPDATE attachment_blobs SET ref_count = ref_count - 1 WHERE content_hash = ?",
+            (content_hash.value,),
+        )
+        cursor.execute(
+            "SELECT ref_count, extension FROM attachment_blobs WHERE content_hash = ?",
+            (content_hash.value,),
+        )
+        row = cursor.fetchone()
+        if row is None or row[0] > 0:
+            return None
+        cursor.execute(
+            "DELETE FROM attachment_blobs WHERE content_hash = ?",
+            (content_hash.value,),
+        )
+        return content_hash, row[1]
+
+    def _collect(self, content_hash: ContentHash, extension: str) -> Result[None, str]:
+        """Delete a released blob file unless it was referenced again.
+
+        Runs after the release committed. The reference count is re-checked
+        under the write lock, which store() also holds while it checks for
+        and copies the file, so a writer can never reference a blob that is
+        being unlinked.
+        """
+        try:
+            with SqliteConnection(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(
+                    "SELECT 1 FROM attachment_blobs WHERE content_hash = ?",
+                    (content_hash.value,),
+                )
+                if cursor.fetchone() is None:
+                    self._blob_path(content_hash, extension).unlink(missing_ok=True)
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
+        except OSError as e:
+            return Failure(f"Cannot delete blob {content_hash.value}: {e}")
+        return Success(None)
+
+    def _ensure_schema(self) -> None:
+        """Create blob tables if they don't exist."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with SqliteConnection(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS attachment_blobs (
+                    content_hash TEXT PRIMARY KEY,
+                    size_bytes INTEGER NOT NULL,
+                    extension TEXT NOT NULL DEFAULT '',
+                    ref_count INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS attachment_blob_refs (
+                    attachment_id TEXT PRIMARY KEY,
+                    project_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL REFERENCES attachment_blobs(content_hash)
+                )
+                """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_attachment_blob_refs_project
+                ON attachment_blob_refs(project_id)
+                """
+            )
@@ -1,13 +1,14 @@
 """SQLite implementation of IAttachmentRepository."""
 
 import sqlite3
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 from uuid import UUID
 
 from doc_helper.domain.common.result import Result, Success, Failure
 from doc_helper.domain.file.entities.attachment import Attachment
 from doc_helper.domain.file.file_ids import AttachmentId
-from doc_helper.domain.file.repositories import IAttachmentRepository
+from doc_helper.domain.file.repositories import IAttachmentBlobStore, IAttachmentRepository
 from doc_helper.domain.file.value_objects.index_type import IndexType
 from doc_helper.domain.project.project_ids import ProjectId
 from doc_helper.domain.schema.schema_ids import FieldDefinitionId
@@ -33,16 +34,35 @@ class SqliteAttachmentRepository(IAttachmentRepository):
         CREATE INDEX idx_attachments_project ON attachments(project_id);
         CREATE INDEX idx_attachments_field ON attachments(project_id, field_id);
         CREATE INDEX idx_attachments_position ON attachments(project_id, field_id, position);
+
+    With a blob store, attachment files are written through it: saving an
+    attachment with a new file_path stores the file's content (deduplicated
+    by content hash) for the attachment, and deleting attachments releases
+    their references so unused content is removed.
     """
 
-    def __init__(self, connection: sqlite3.Connection):
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        blob_store: Optional[IAttachmentBlobStore] = None,
+        project_dir: Optional[Path] = None,
+    ):
         """Initialize repository with database connection.
 
         Args:
             connection: SQLite connection (must be open)
+            blob_store: Optional content-addressed store for attachment files
+            project_dir: Directory file_path is relative to (required with blob_store)
+
+        Raises:
+            ValueError: If blob_store is given without project_dir
         """
+        if blob_store is not None and project_dir is None:
+            raise ValueError("project_dir is required when a blob_store is given")
         self._conn = connection
         self._conn.row_factory = sqlite3.Row
+        self._blob_store = blob_store
+        self._project_dir = Path(project_dir) if project_dir is not None else None
 
     def get_by_id(self, attachment_id: AttachmentId) -> Result[Attachment, str]:
         """Retrieve attachment by ID."""
@@ -140,6 +160,8 @@ class SqliteAttachmentRepository(IAttachmentRepository):
         if not isinstance(attachment, Attachment):
             return Failure(f"attachment must be Attachment, got {type(attachment)}")
 
+        # A new attachment whose content was stored; released if saving fails
+        stored_content = False
         try:
             cursor = self._conn.cursor()
 
@@ -148,6 +170,22 @@ class SqliteAttachmentRepository(IAttachmentRepository):
             if not exists_result.is_success:
                 return Failure(f"Failed to check existence: {exists_result.error}")
 
+            if self._blob_store is not None:
+                cursor.execute(
+                    "SELECT file_path FROM attachments WHERE id = ?",
+                    (str(attachment.id.value),),
+                )
+                row = cursor.fetchone()
+                if row is None or row["file_path"] != attachment.file_path:
+                    store_result = self._blob_store.store(
+                        self._project_dir / attachment.file_path,
+                        attachment.id,
+                        attachment.project_id,
+                    )
+                    if store_result.is_failure():
+                        return Failure(f"Failed to store attachment file: {store_result.error}")
+                    stored_content = exists_result.value is False
+
             if exists_result.value:
                 # UPDATE
                 cursor.execute(
@@ -197,9 +235,13 @@ class SqliteAttachmentRepository(IAttachmentRepository):
 
         except sqlite3.Error as e:
             self._conn.rollback()
+            if stored_content:
+                self._blob_store.release(attachment.id)
             return Failure(f"Database error: {e}")
         except Exception as e:
             self._conn.rollback()
+            if stored_content:
+                self._blob_store.release(attachment.id)
             return Failure(f"Unexpected error: {e}")
 
     def delete(self, attachment_id: AttachmentId) -> Result[None, str]:
@@ -211,7 +253,7 @@ class SqliteAttachmentRepository(IAttachmentRepository):
             cursor = self._conn.cursor()
             cursor.execute("DELETE FROM attachments WHERE id = ?", (str(attachment_id.value),))
             self._conn.commit()
-            return Success(None)
+            return self._release_content([attachment_id])
 
         except sqlite3.Error as e:
             self._conn.rollback()
@@ -245,9 +287,15 @@ class SqliteAttachmentRepository(IAttachmentRepository):
 
         try:
             cursor = self._conn.cursor()
+            deleted_ids = self._select_ids(
+                cursor, "project_id = ?", (str(project_id.value),)
+            )
             cursor.execute("DELETE FROM attachments WHERE project_id = ?", (str(project_id.value),))
             deleted_count = cursor.rowcount
             self._conn.commit()
+            release_result = self._release_content(deleted_ids)
+            if release_result.is_failure():
+                return Failure(release_result.error)
             return Success(deleted_count)
 
         except sqlite3.Error as e:
@@ -271,12 +319,18 @@ class SqliteAttachmentRepository(IAttachmentRepository):
 
         try:
             cursor = self._conn.cursor()
+            deleted_ids = self._select_ids(
+                cursor, "project_id = ? AND field_id = ?", (str(project_id.value), field_id.value)
+            )
             cursor.execute(
                 "DELETE FROM attachments WHERE project_id = ? AND field_id = ?",
                 (str(project_id.value), field_id.value)
             )
             deleted_count = cursor.rowcount
             self._conn.commit()
+            release_result = self._release_content(deleted_ids)
+            if release_result.is_failure():
+                return Failure(release_result.error)
             return Success(deleted_count)
 
         except sqlite3.Error as e:
@@ -320,6 +374,25 @@ class SqliteAttachmentRepository(IAttachmentRepository):
             self._conn.rollback()
             return Failure(f"Unexpected error: {e}")
 
+    def _select_ids(
+        self, cursor: sqlite3.Cursor, where: str, params: tuple
+    ) -> List[AttachmentId]:
+        """IDs of the attachments matching a WHERE clause (only needed with a blob store)."""
+        if self._blob_store is None:
+            return []
+        cursor.execute(f"SELECT id FROM attachments WHERE {where}", params)
+        return [AttachmentId(UUID(row["id"])) for row in cursor.fetchall()]
+
+    def _release_content(self, attachment_ids: List[AttachmentId]) -> Result[None, str]:
+        """Release the stored content of deleted attachments (after commit)."""
+        if self._blob_store is None:
+            return Success(None)
+        for attachment_id in attachment_ids:
+            result = self._blob_store.release(attachment_id)
+            if result.is_failure():
+                return Failure(f"Failed to release attachment file: {result.error}")
+        return Success(None)
+
     def _row_to_entity(self, row: sqlite3.Row) -> Attachment:
         """Convert database row to Attachment entity.
 
@@ -13,14 +13,20 @@ from doc_helper.domain.common.i18n import TranslationKey
 from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.field_definition import FieldDefinition
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
-from doc_helper.domain.schema.schema_repository import ISchemaRepository
+from doc_helper.domain.schema.schema_repository import ISchemaBulkWriter, ISchemaRepository
 from doc_helper.domain.schema.field_type import FieldType
 from doc_helper.domain.validation.constraint_factory import ConstraintFactory
-from doc_helper.infrastructure.persistence.sqlite_base import SqliteConnection
+from doc_helper.infrastructure.persistence.sqlite.schema_dependency_index import (
+    SchemaDependencyIndex,
+)
+from doc_helper.infrastructure.persistence.sqlite_base import (
+    SqliteConnection,
+    SqliteSnapshotConnection,
+)
 from doc_helper.application.dto.export_dto import ControlRuleExportDTO
 
 
-class SqliteSchemaRepository(ISchemaRepository):
+class SqliteSchemaRepository(ISchemaRepository, ISchemaBulkWriter):
     """SQLite implementation of schema repository.
 
     Phase 2 Step 2 Scope:
@@ -31,6 +37,21 @@ class SqliteSchemaRepository(ISchemaRepository):
     - UPDATE operations (modify existing entities)
     - DELETE operations (remove entities)
 
+    Bulk import:
+    - replace_all() rewrites the whole schema in one transaction
+
+    Dependency queries:
+    - get_entity_dependencies() / get_field_dependencies() and the
+      transitive get_entity_impact() / get_field_impact() are answered from
+      an in-memory reverse-dependency index (see SchemaDependencyIndex),
+      reloaded per changed entity via schema_dependency_log
+
+    Read-only mode (read_only=True):
+    - config.db is copied once into an in-memory database at construction
+      (see SqliteSnapshotConnection); schema reads do no file I/O
+    - All write operations fail
+    - Used by runtime AppTypes; the Schema Designer keeps the writable path
+
     Database Schema (config.db):
         entities:
             - id TEXT PRIMARY KEY
@@ -55,11 +76,13 @@ class SqliteSchemaRepository(ISchemaRepository):
             - child_entity_id TEXT
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, read_only: bool = False) -> None:
         """Initialize repository.
 
         Args:
             db_path: Path to SQLite database file
+            read_only: Serve reads from an in-memory copy of the file
+                (writes fail)
 
         Raises:
             TypeError: If db_path is not string or Path
@@ -72,8 +95,14 @@ class SqliteSchemaRepository(ISchemaRepository):
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
 
-        self._connection = SqliteConnection(self.db_path)
+        self.read_only = read_only
+        self._connection = (
+            SqliteSnapshotConnection(self.db_path)
+            if read_only
+            else SqliteConnection(self.db_path)
+        )
         self._constraint_factory = ConstraintFactory()
+        self._dependency_index = SchemaDependencyIndex(static=read_only)
 
     # -------------------------------------------------------------------------
     # Read Operations (Phase 1 + Phase 2 Step 1)
@@ -895,170 +924,109 @@ class SqliteSchemaRepository(ISchemaRepository):
             # Table doesn't exist - that's okay, nothing to delete
             pass
 
+    def _refreshed_dependency_index(self) -> SchemaDependencyIndex:
+        """Return the dependency index, brought up to date with the database."""
+        with self._connection as conn:
+            self._dependency_index.refresh(conn)
+        return self._dependency_index
+
     def get_entity_dependencies(self, entity_id: EntityDefinitionId) -> Result[dict, str]:
         """Get all dependencies on an entity (Phase 2 Step 3 - Decision 4).
 
         See ISchemaRepository.get_entity_dependencies for documentation.
+        Answered from the reverse-dependency index; the result additionally
+        contains "referenced_by_relationships": [(relationship_id,
+        other_entity_id), ...].
         """
         try:
-            with self._connection as conn:
-                cursor = conn.cursor()
-
-                entity_id_str = str(entity_id.value)
-
-                # Check if entity exists
-                cursor.execute("SELECT id FROM entities WHERE id = ?", (entity_id_str,))
-                if not cursor.fetchone():
-                    return Failure(f"Entity '{entity_id.value}' does not exist")
-
-                dependencies = {
-                    "referenced_by_table_fields": [],
-                    "referenced_by_lookup_fields": [],
-                    "child_entities": [],
-                }
-
-                # Find TABLE fields referencing this entity (child_entity_id)
-                cursor.execute(
-                    """
-                    SELECT entity_id, id
-                    FROM fields
-                    WHERE child_entity_id = ? AND field_type = 'TABLE'
-                    """,
-                    (entity_id_str,),
-                )
-                for row in cursor.fetchall():
-                    dependencies["referenced_by_table_fields"].append((row[0], row[1]))
-
-                # Find LOOKUP fields referencing this entity (lookup_entity_id)
-                cursor.execute(
-                    """
-                    SELECT entity_id, id
-                    FROM fields
-                    WHERE lookup_entity_id = ? AND field_type = 'LOOKUP'
-                    """,
-                    (entity_id_str,),
-                )
-                for row in cursor.fetchall():
-                    dependencies["referenced_by_lookup_fields"].append((row[0], row[1]))
-
-                # Find child entities (entities with parent_entity_id = this entity)
-                cursor.execute(
-                    """
-                    SELECT id
-                    FROM entities
-                    WHERE parent_entity_id = ?
-                    """,
-                    (entity_id_str,),
-                )
-                for row in cursor.fetchall():
-                    dependencies["child_entities"].append(row[0])
-
-                return Success(dependencies)
-
+            index = self._refreshed_dependency_index()
         except sqlite3.Error as e:
             return Failure(f"Failed to check entity dependencies: {e}")
 
+        entity_id_str = str(entity_id.value)
+        if not index.has_entity(entity_id_str):
+            return Failure(f"Entity '{entity_id.value}' does not exist")
+        return Success(index.entity_dependencies(entity_id_str))
+
     def get_field_dependencies(
         self, entity_id: EntityDefinitionId, field_id: FieldDefinitionId
     ) -> Result[dict, str]:
         """Get all dependencies on a field (Phase 2 Step 3 - Decision 4).
 
         See ISchemaRepository.get_field_dependencies for documentation.
+        Answered from the reverse-dependency index; the result additionally
+        contains:
+            "referenced_by_control_rules": [(entity_id, field_id), ...]
+            "referenced_by_output_mappings": [(output_type, target_tag), ...]
+
+        Formula and control rule references are the field references of the
+        parsed formula ({{field_id}} or bare field_id); function names and
+        string literals do not count.
         """
         try:
-            with self._connection as conn:
-                cursor = conn.cursor()
-
-                entity_id_str = str(entity_id.value)
-                field_id_str = str(field_id.value)
-
-                # Check if entity exists
-                cursor.execute("SELECT id FROM entities WHERE id = ?", (entity_id_str,))
-                if not cursor.fetchone():
-                    return Failure(f"Entity '{entity_id.value}' does not exist")
-
-                # Check if field exists
-                cursor.execute(
-                    "SELECT id FROM fields WHERE id = ? AND entity_id = ?",
-                    (field_id_str, entity_id_str),
-                )
-                if not cursor.fetchone():
-                    return Failure(
-                        f"Field '{field_id.value}' not found in entity '{entity_id.value}'"
-                    )
+            index = self._refreshed_dependency_index()
+        except sqlite3.Error as e:
+            return Failure(f"Failed to check field dependencies: {e}")
 
-                dependencies = {
-                    "referenced_by_formulas": [],
-                    "referenced_by_controls_source": [],
-                    "referenced_by_controls_target": [],
-                    "referenced_by_lookup_display": [],
-                }
+        entity_id_str = str(entity_id.value)
+        field_id_str = str(field_id.value)
+        if not index.has_entity(entity_id_str):
+            return Failure(f"Entity '{entity_id.value}' does not exist")
+        if not index.has_field(entity_id_str, field_id_str):
+            return Failure(f"Field '{field_id.value}' not found in entity '{entity_id.value}'")
+        return Success(index.field_dependencies(entity_id_str, field_id_str))
 
-                # Find formulas referencing this field ({{field_id}})
-                # Formula syntax uses {{field_id}} to reference fields
-                pattern = f"%{{{{{field_id_str}}}}}%"
-                cursor.execute(
-                    """
-                    SELECT entity_id, id
-                    FROM fields
-                    WHERE formula IS NOT NULL AND formula LIKE ?
-                    """,
-                    (pattern,),
-                )
-                for row in cursor.fetchall():
-                    dependencies["referenced_by_formulas"].append((row[0], row[1]))
+    def get_entity_impact(self, entity_id: EntityDefinitionId) -> Result[dict, str]:
+        """Get everything that breaks if an entity is deleted (transitively).
 
-                # Find control rules where this field is source
-                # Note: control_relations table structure varies by implementation
-                # This assumes a control_relations table with source_field_id and target_field_id
-                # If this table doesn't exist or has different structure, this query will fail gracefully
-                try:
-                    # Build full field identifier for controls
-                    full_field_id = f"{entity_id_str}.{field_id_str}"
+        Follows TABLE/LOOKUP references to the entity and every reference to
+        its fields through formulas, control rules, control relations and
+        lookup display fields, to a fixed point.
 
-                    cursor.execute(
-                        """
-                        SELECT target_entity_id, target_field_id
-                        FROM control_relations
-                        WHERE source_entity_id = ? AND source_field_id = ?
-                        """,
-                        (entity_id_str, field_id_str),
-                    )
-                    for row in cursor.fetchall():
-                        dependencies["referenced_by_controls_source"].append((row[0], row[1]))
+        Args:
+            entity_id: Entity definition ID to analyse
 
-                    # Find control rules where this field is target
-                    cursor.execute(
-                        """
-                        SELECT source_entity_id, source_field_id
-                        FROM control_relations
-                        WHERE target_entity_id = ? AND target_field_id = ?
-                        """,
-                        (entity_id_str, field_id_str),
-                    )
-                    for row in cursor.fetchall():
-                        dependencies["referenced_by_controls_target"].append((row[0], row[1]))
+        Returns:
+            Result containing dict:
+            {
+                "entities": [entity_id, ...],  # child and related entities
+                "fields": [(entity_id, field_id), ...],  # fields of other entities
+            }
+            or error message
+        """
+        try:
+            index = self._refreshed_dependency_index()
+        except sqlite3.Error as e:
+            return Failure(f"Failed to analyse entity impact: {e}")
 
-                except sqlite3.OperationalError:
-                    # control_relations table might not exist - that's okay, skip it
-                    pass
+        entity_id_str = str(entity_id.value)
+        if not index.has_entity(entity_id_str):
+            return Failure(f"Entity '{entity_id.value}' does not exist")
+        return Success(index.entity_impact(entity_id_str))
 
-                # Find LOOKUP fields using this field as lookup_display_field
-                cursor.execute(
-                    """
-                    SELECT entity_id, id
-                    FROM fields
-                    WHERE lookup_display_field = ? AND field_type = 'LOOKUP'
-                    """,
-                    (field_id_str,),
-                )
-                for row in cursor.fetchall():
-                    dependencies["referenced_by_lookup_display"].append((row[0], row[1]))
+    def get_field_impact(
+        self, entity_id: EntityDefinitionId, field_id: FieldDefinitionId
+    ) -> Result[tuple, str]:
+        """Get every field that breaks if a field is deleted (transitively).
 
-                return Success(dependencies)
+        Args:
+            entity_id: Parent entity definition ID
+            field_id: Field definition ID to analyse
 
+        Returns:
+            Result containing tuple of (entity_id, field_id) pairs, sorted,
+            or error message
+        """
+        try:
+            index = self._refreshed_dependency_index()
         except sqlite3.Error as e:
-            return Failure(f"Failed to check field dependencies: {e}")
+            return Failure(f"Failed to analyse field impact: {e}")
+
+        entity_id_str = str(entity_id.value)
+        field_id_str = str(field_id.value)
+        if not index.has_field(entity_id_str, field_id_str):
+            return Failure(f"Field '{field_id.value}' not found in entity '{entity_id.value}'")
+        return Success(tuple(index.field_impact(entity_id_str, field_id_str)))
 
     # -------------------------------------------------------------------------
     # Delete Operations (Phase 2 Step 3)
@@ -1194,3 +1162,198 @@ class SqliteSchemaRepository(ISchemaRepository):
 
         except sqlite3.Error as e:
             return Failure(f"Failed to purge CALCULATED field constraints: {e}")
+
+    # -------------------------------------------------------------------------
+    # Bulk Operations (Schema Import)
+    # -------------------------------------------------------------------------
+
+    # Child tables first; entities last. Missing optional tables are skipped.
+    _REPLACE_ALL_DELETE_ORDER = (
+        "relationships",
+        "control_relations",
+        "output_mappings",
+        "control_rules",
+        "validation_rules",
+        "field_options",
+        "fields",
+        "entities",
+    )
+
+    def replace_all(
+        self,
+        entities: tuple[EntityDefinition, ...],
+        relationships: tuple = (),
+    ) -> Result[None, str]:
+        """Replace the whole schema in a single transaction.
+
+        Deletes every stored entity, field, constraint, option, control rule
+        and relationship, then inserts the new definitions with executemany()
+        (one statement per table instead of one per row). Foreign key checks
+        are deferred to COMMIT so entities may reference each other in any
+        order. Any error rolls back to the previous schema.
+
+        Output mappings are not written (not part of this repository's
+        save path either).
+
+        Args:
+            entities: Entity definitions making up the new schema
+            relationships: RelationshipDefinition objects to store
+
+        Returns:
+            Result with None on success or error message
+        """
+        import uuid
+
+        entity_rows = []
+        field_rows = []
+        constraint_rows = []
+        control_rule_rows = []
+        option_rows = []
+        try:
+            for entity in entities:
+                entity_id = str(entity.id.value)
+                entity_rows.append(
+                    (
+                        entity_id,
+                        entity.name_key.key,
+                        entity.description_key.key if entity.description_key else None,
+                        1 if entity.is_root_entity else 0,
+                        str(entity.parent_entity_id.value) if entity.parent_entity_id else None,
+                        0,  # Default display order
+                    )
+                )
+                for field_def in entity.get_all_fields():
+                    field_id = str(field_def.id.value)
+                    field_rows.append(
+                        (
+                            field_id,
+                            entity_id,
+                            field_def.field_type.value,
+                            field_def.label_key.key,
+                            field_def.help_text_key.key if field_def.help_text_key else None,
+                            1 if field_def.required else 0,
+                            field_def.default_value,
+                            0,  # Default display order
+                            field_def.formula,
+                            field_def.lookup_entity_id,
+                            field_def.lookup_display_field,
+                            field_def.child_entity_id,
+                        )
+                    )
+                    for constraint in field_def.constraints:
+                        rule_type, rule_value = self._constraint_to_db_row(constraint)
+                        constraint_rows.append(
+                            (str(uuid.uuid4()), field_id, rule_type, rule_value, None)
+                        )
+                    for control_rule in field_def.control_rules:
+                        if isinstance(control_rule, ControlRuleExportDTO):
+                            control_rule_rows.append(
+                                (
+                                    field_id,
+                                    control_rule.rule_type.strip().upper(),
+                                    control_rule.formula_text.strip(),
+                                )
+                            )
+                    for order, (value, label_key) in enumerate(field_def.options):
+                        option_rows.append(
+                            (
+                                str(uuid.uuid4()),
+                                field_id,
+                                str(value),
+                                label_key.key if isinstance(label_key, TranslationKey) else str(label_key),
+                                order,
+                            )
+                        )
+        except (ValueError, TypeError) as e:
+            return Failure(f"Failed to prepare schema rows: {e}")
+
+        relationship_rows = [
+            (
+                str(relationship.id.value),
+                str(relationship.source_entity_id.value),
+                str(relationship.target_entity_id.value),
+                relationship.relationship_type.value,
+                relationship.name_key.key,
+                relationship.description_key.key if relationship.description_key else None,
+                relationship.inverse_name_key.key if relationship.inverse_name_key else None,
+            )
+            for relationship in relationships
+        ]
+
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN TRANSACTION")
+                try:
+                    cursor.execute("PRAGMA defer_foreign_keys = ON")
+
+                    for table in self._REPLACE_ALL_DELETE_ORDER:
+                        try:
+                            cursor.execute(f"DELETE FROM {table}")
+                        except sqlite3.OperationalError:
+                            # Optional table missing in older databases
+                            if table in ("entities", "fields"):
+                                raise
+
+                    cursor.executemany(
+                        """
+                        INSERT INTO entities (id, name_key, description_key, is_root_entity, parent_entity_id, display_order)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        entity_rows,
+                    )
+                    cursor.executemany(
+                        """
+                        INSERT INTO fields (id, entity_id, field_type, label_key, help_text_key, required,
+                                            default_value, display_order, formula, lookup_entity_id,
+                                            lookup_display_field, child_entity_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        field_rows,
+                    )
+                    if constraint_rows:
+                        cursor.executemany(
+                            """
+                            INSERT INTO validation_rules (id, field_id, rule_type, rule_value, error_message_key)
+                            VALUES (?, ?, ?, ?, ?)
+                            """,
+                            constraint_rows,
+                        )
+                    if control_rule_rows:
+                        cursor.executemany(
+                            """
+                            INSERT OR REPLACE INTO control_rules (field_id, rule_type, formula_text)
+                            VALUES (?, ?, ?)
+                            """,
+                            control_rule_rows,
+                        )
+                    if option_rows:
+                        cursor.executemany(
+                            """
+                            INSERT INTO field_options (id, field_id, value, label_key, display_order)
+                            VALUES (?, ?, ?, ?, ?)
+                            """,
+                            option_rows,
+                        )
+                    if relationship_rows:
+                        cursor.executemany(
+                            """
+                            INSERT INTO relationships (
+                                id, source_entity_id, target_entity_id, relationship_type,
+                                name_key, description_key, inverse_name_key
+                            )
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            relationship_rows,
+                        )
+
+                    # Deferred foreign keys are checked here
+                    cursor.execute("COMMIT")
+                    return Success(None)
+
+                except sqlite3.Error as e:
+                    cursor.execute("ROLLBACK")
+                    return Failure(f"Failed to import schema: {e}")
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {e}")
@@ -10,7 +10,9 @@ PURPOSE:
 BEHAVIOR:
     - Check if config.db exists at given path
     - If NOT: Create file and ALL authoritative schema tables
-    - If YES: Do nothing (idempotent - safe to call multiple times)
+    - If YES: Sanitize data and run forward migrations, unless the database
+      is stamped clean and unmodified since (idempotent - safe to call
+      multiple times)
 
 FAILURE MODE:
     - If database creation fails: FATAL error (no silent recovery)
@@ -233,7 +235,144 @@ CREATE INDEX IF NOT EXISTS idx_output_mappings_field ON output_mappings(field_id
 """
 
 
-def _sanitize_calculated_field_constraints(db_path: Path) -> int:
+# ============================================================================
+# DEPENDENCY CHANGE LOG
+# ============================================================================
+# Records which entity owns each written row (see schema_dependency_index.py)
+# so SqliteSchemaRepository reloads only changed entities into its
+# reverse-dependency index. One row per entity, deleted and re-inserted
+# (moving it to a new seq) on every write, so the log never grows past the
+# number of entities. Plain DELETE + INSERT rather than INSERT OR REPLACE:
+# an outer OR IGNORE statement would override the trigger's conflict
+# clause and drop the log entry.
+
+DEPENDENCY_LOG_TABLE = "schema_dependency_log"
+
+DEPENDENCY_LOG_TABLE_DDL = f"""
+CREATE TABLE IF NOT EXISTS {DEPENDENCY_LOG_TABLE} (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,  -- Increases on every logged write
+    entity_id TEXT NOT NULL UNIQUE          -- Entity owning the written row
+);
+"""
+
+# Table -> SQL expression of the owning entity (evaluated for OLD and NEW rows)
+_DEPENDENCY_OWNERS = {
+    "entities": "{row}.id",
+    "fields": "{row}.entity_id",
+    "control_rules": "(SELECT entity_id FROM fields WHERE id = {row}.field_id)",
+    "output_mappings": "{row}.entity_id",
+    "control_relations": "{row}.target_entity_id",
+    "relationships": "{row}.source_entity_id",
+}
+
+
+def _dependency_log_triggers_ddl(table: str) -> str:
+    """DDL of the triggers that log the owning entity of writes to a table."""
+    owner = _DEPENDENCY_OWNERS[table]
+    rows_by_event = {"INSERT": ("NEW",), "UPDATE": ("OLD", "NEW"), "DELETE": ("OLD",)}
+    return "".join(
+        f"""
+CREATE TRIGGER IF NOT EXISTS {DEPENDENCY_LOG_TABLE}_{table}_{event.lower()}
+AFTER {event} ON {table}
+BEGIN
+"""
+        + "".join(
+            f"""    DELETE FROM {DEPENDENCY_LOG_TABLE} WHERE entity_id = {owner.format(row=row)};
+    INSERT INTO {DEPENDENCY_LOG_TABLE} (entity_id)
+    SELECT owner FROM (SELECT {owner.format(row=row)} AS owner) WHERE owner IS NOT NULL;
+"""
+            for row in rows
+        )
+        + "END;\n"
+        for event, rows in rows_by_event.items()
+    )
+
+
+# ============================================================================
+# CLEAN-PASS STAMP
+# ============================================================================
+# After the sanitizers and forward migrations have run, the database is
+# stamped clean: PRAGMA user_version records the sanitizer version, and a
+# dirty flag in schema_bootstrap_state is cleared. Triggers set the flag on
+# any write to the tables the sanitizers inspect, so later startups skip
+# the sanitizing scans until the schema is modified (or the sanitizers
+# change, which bumps SANITIZER_VERSION).
+
+# Bump whenever a sanitizer or forward migration is added or changed
+SANITIZER_VERSION = 2
+
+# Tables whose rows the sanitizers inspect
+_SANITIZED_TABLES = ("fields", "validation_rules")
+
+BOOTSTRAP_STATE_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS schema_bootstrap_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),  -- Single row
+    dirty INTEGER NOT NULL DEFAULT 1        -- 1 = modified since last clean pass
+);
+INSERT OR IGNORE INTO schema_bootstrap_state (id, dirty) VALUES (1, 1);
+"""
+
+
+def _bootstrap_state_triggers_ddl(table: str) -> str:
+    """DDL of the triggers that mark the database dirty on writes to a table."""
+    return "".join(
+        f"""
+CREATE TRIGGER IF NOT EXISTS schema_bootstrap_dirty_{table}_{event.lower()}
+AFTER {event} ON {table}
+BEGIN
+    UPDATE schema_bootstrap_state SET dirty = 1 WHERE id = 1 AND dirty = 0;
+END;
+"""
+        for event in ("INSERT", "UPDATE", "DELETE")
+    )
+
+
+def _is_clean(cursor: sqlite3.Cursor) -> bool:
+    """Check if the database is stamped clean for the current sanitizers.
+
+    Args:
+        cursor: Open database cursor
+
+    Returns:
+        True if the last clean pass used SANITIZER_VERSION and the
+        sanitized tables were not modified since
+    """
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] != SANITIZER_VERSION:
+        return False
+    try:
+        cursor.execute("SELECT dirty FROM schema_bootstrap_state WHERE id = 1")
+    except sqlite3.Error:
+        return False
+    row = cursor.fetchone()
+    return row is not None and row[0] == 0
+
+
+def _stamp_clean(cursor: sqlite3.Cursor) -> None:
+    """Record a clean pass (creates the state table and triggers if needed).
+
+    Databases without the sanitized tables are not stamped (there is
+    nothing to track); they are re-checked on every start.
+
+    Args:
+        cursor: Open database cursor
+    """
+    placeholders = ",".join("?" * len(_SANITIZED_TABLES))
+    cursor.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+        _SANITIZED_TABLES,
+    )
+    if cursor.fetchone()[0] != len(_SANITIZED_TABLES):
+        return
+
+    cursor.executescript(BOOTSTRAP_STATE_TABLE_DDL)
+    for table in _SANITIZED_TABLES:
+        cursor.executescript(_bootstrap_state_triggers_ddl(table))
+    cursor.execute("UPDATE schema_bootstrap_state SET dirty = 0 WHERE id = 1")
+    cursor.execute(f"PRAGMA user_version = {SANITIZER_VERSION}")
+
+
+def _sanitize_calculated_field_constraints(cursor: sqlite3.Cursor) -> int:
     """Purge all validation constraints from CALCULATED fields.
 
     CALCULATED FIELD INVARIANT: CALCULATED fields NEVER have constraints.
@@ -243,7 +382,7 @@ def _sanitize_calculated_field_constraints(db_path: Path) -> int:
     idempotent - safe to run multiple times.
 
     Args:
-        db_path: Path to the schema database file (config.db)
+        cursor: Open cursor on the schema database (config.db)
 
     Returns:
         Number of constraints deleted (0 if none found, or 0 if tables don't exist)
@@ -253,66 +392,30 @@ def _sanitize_calculated_field_constraints(db_path: Path) -> int:
         don't exist, it returns 0 without error. This handles edge cases like
         databases with content but not the expected schema.
     """
-    conn = None
-    try:
-        conn = sqlite3.connect(str(db_path))
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
-
-        # Check if required tables exist (defensive - handle non-standard databases)
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name IN ('fields', 'validation_rules')
-            """
-        )
-        existing_tables = {row[0] for row in cursor.fetchall()}
-
-        if 'fields' not in existing_tables or 'validation_rules' not in existing_tables:
-            # Tables don't exist - nothing to sanitize
-            conn.close()
-            return 0
-
-        # Find all CALCULATED fields
-        cursor.execute(
-            """
-            SELECT id FROM fields WHERE field_type = 'calculated'
-            """
-        )
-        calculated_field_ids = [row[0] for row in cursor.fetchall()]
-
-        if not calculated_field_ids:
-            conn.close()
-            return 0
-
-        # Delete all validation_rules for CALCULATED fields
-        placeholders = ",".join("?" * len(calculated_field_ids))
-        cursor.execute(
-            f"""
-            DELETE FROM validation_rules
-            WHERE field_id IN ({placeholders})
-            """,
-            calculated_field_ids,
-        )
-
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
-
-        return deleted_count
-
-    except sqlite3.Error:
-        # Silently ignore errors - sanitization is best-effort
-        # The read-path safety net in schema_repository handles corrupted data at load time
-        if conn:
-            try:
-                conn.close()
-            except sqlite3.Error:
-                pass
+    # Check if required tables exist (defensive - handle non-standard databases)
+    cursor.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name IN ('fields', 'validation_rules')
+        """
+    )
+    existing_tables = {row[0] for row in cursor.fetchall()}
+
+    if 'fields' not in existing_tables or 'validation_rules' not in existing_tables:
+        # Tables don't exist - nothing to sanitize
         return 0
 
+    # Delete all validation_rules for CALCULATED fields
+    cursor.execute(
+        """
+        DELETE FROM validation_rules
+        WHERE field_id IN (SELECT id FROM fields WHERE field_type = 'calculated')
+        """
+    )
+    return cursor.rowcount
 
-def _sanitize_lookup_fields_without_entity_id(db_path: Path) -> int:
+
+def _sanitize_lookup_fields_without_entity_id(cursor: sqlite3.Cursor) -> int:
     """Delete LOOKUP fields that are missing required lookup_entity_id.
 
     LOOKUP FIELD INVARIANT: LOOKUP fields MUST have lookup_entity_id.
@@ -325,7 +428,7 @@ def _sanitize_lookup_fields_without_entity_id(db_path: Path) -> int:
     idempotent - safe to run multiple times.
 
     Args:
-        db_path: Path to the schema database file (config.db)
+        cursor: Open cursor on the schema database (config.db)
 
     Returns:
         Number of corrupted LOOKUP fields deleted (0 if none found, or 0 if table doesn't exist)
@@ -335,56 +438,77 @@ def _sanitize_lookup_fields_without_entity_id(db_path: Path) -> int:
         doesn't exist, it returns 0 without error. This handles edge cases like
         databases with content but not the expected schema.
     """
-    conn = None
-    try:
-        conn = sqlite3.connect(str(db_path))
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
-
-        # Check if fields table exists (defensive - handle non-standard databases)
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='fields'
-            """
-        )
-        if cursor.fetchone() is None:
-            # Table doesn't exist - nothing to sanitize
-            conn.close()
-            return 0
-
-        # Delete LOOKUP fields with NULL or empty lookup_entity_id
-        cursor.execute(
-            """
-            DELETE FROM fields
-            WHERE field_type = 'lookup'
-            AND (lookup_entity_id IS NULL OR lookup_entity_id = '')
-            """
-        )
-
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
-
-        return deleted_count
-
-    except sqlite3.Error:
-        # Silently ignore errors - sanitization is best-effort
-        # The read-path safety net in schema_repository handles corrupted data at load time
-        if conn:
-            try:
-                conn.close()
-            except sqlite3.Error:
-                pass
+    # Check if fields table exists (defensive - handle non-standard databases)
+    cursor.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='fields'
+        """
+    )
+    if cursor.fetchone() is None:
+        # Table doesn't exist - nothing to sanitize
         return 0
 
+    # Delete LOOKUP fields with NULL or empty lookup_entity_id
+    cursor.execute(
+        """
+        DELETE FROM fields
+        WHERE field_type = 'lookup'
+        AND (lookup_entity_id IS NULL OR lookup_entity_id = '')
+        """
+    )
+    return cursor.rowcount
+
 
-def _ensure_control_rules_table(db_path: Path) -> None:
+def _ensure_control_rules_table(cursor: sqlite3.Cursor) -> None:
     """Ensure control_rules table exists in existing databases (Phase A5.4 migration).
 
     This is a forward migration that adds the control_rules table if it doesn't exist.
     It is idempotent - safe to run multiple times.
 
+    Args:
+        cursor: Open cursor on the schema database (config.db)
+    """
+    # Check if control_rules table exists
+    cursor.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='control_rules'
+        """
+    )
+    if cursor.fetchone() is None:
+        # Table doesn't exist - create it
+        cursor.executescript(CONTROL_RULES_TABLE_DDL)
+        cursor.executescript(CONTROL_RULES_INDEXES_DDL)
+
+
+def _ensure_dependency_log(cursor: sqlite3.Cursor) -> None:
+    """Ensure the dependency change log and its triggers exist.
+
+    Triggers are only created for tables that exist. This is a forward
+    migration - idempotent, safe to run multiple times.
+
+    Args:
+        cursor: Open cursor on the schema database (config.db)
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+    if "entities" not in existing_tables or "fields" not in existing_tables:
+        return
+
+    cursor.executescript(DEPENDENCY_LOG_TABLE_DDL)
+    for table in _DEPENDENCY_OWNERS:
+        if table in existing_tables:
+            cursor.executescript(_dependency_log_triggers_ddl(table))
+
+
+def _sanitize_existing_database(db_path: Path) -> None:
+    """Run sanitization and forward migrations unless stamped clean.
+
+    All steps share one connection. Each step commits on its own, so a
+    failing step does not undo the others; the clean stamp is only
+    written when every step succeeded.
+
     Args:
         db_path: Path to the schema database file (config.db)
     """
@@ -394,23 +518,33 @@ def _ensure_control_rules_table(db_path: Path) -> None:
         conn.execute("PRAGMA foreign_keys = ON")
         cursor = conn.cursor()
 
-        # Check if control_rules table exists
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='control_rules'
-            """
-        )
-        if cursor.fetchone() is None:
-            # Table doesn't exist - create it
-            cursor.executescript(CONTROL_RULES_TABLE_DDL)
-            cursor.executescript(CONTROL_RULES_INDEXES_DDL)
-            conn.commit()
+        if _is_clean(cursor):
+            return
 
-        conn.close()
+        all_succeeded = True
+        for step in (
+            _sanitize_calculated_field_constraints,
+            _sanitize_lookup_fields_without_entity_id,
+            _ensure_control_rules_table,  # Phase A5.4 migration
+            _ensure_dependency_log,  # After all tracked tables exist
+        ):
+            try:
+                step(cursor)
+                conn.commit()
+            except sqlite3.Error:
+                # Best-effort - the read-path safety net in schema_repository
+                # handles corrupted data at load time
+                conn.rollback()
+                all_succeeded = False
+
+        if all_succeeded:
+            _stamp_clean(cursor)
+            conn.commit()
 
     except sqlite3.Error:
-        # Silently ignore errors - migration is best-effort
+        # Silently ignore errors - sanitization is best-effort
+        pass
+    finally:
         if conn:
             try:
                 conn.close()
@@ -427,7 +561,9 @@ def bootstrap_schema_database(db_path: Path) -> None:
 
     ALSO runs:
     - Data sanitization to enforce invariants
-    - Forward migrations to add missing tables (e.g., control_rules)
+    - Forward migrations to add missing tables (e.g., control_rules, the
+      dependency change log)
+    Both are skipped while the database is stamped clean (see SANITIZER_VERSION).
 
     Args:
         db_path: Path to the schema database file (config.db)
@@ -450,9 +586,8 @@ def bootstrap_schema_database(db_path: Path) -> None:
     # Check if database already exists
     if db_path.exists() and db_path.stat().st_size > 0:
         # Database exists - run sanitization and forward migrations
-        _sanitize_calculated_field_constraints(db_path)
-        _sanitize_lookup_fields_without_entity_id(db_path)
-        _ensure_control_rules_table(db_path)  # Phase A5.4 migration
+        # (skipped if nothing changed since the last clean pass)
+        _sanitize_existing_database(db_path)
         return
 
     # Ensure parent directory exists
@@ -498,6 +633,12 @@ def bootstrap_schema_database(db_path: Path) -> None:
         cursor.executescript(OUTPUT_MAPPINGS_TABLE_DDL)
         cursor.executescript(OUTPUT_MAPPINGS_INDEXES_DDL)
 
+        # 9. dependency change log (triggers on the tables above)
+        _ensure_dependency_log(cursor)
+
+        # A new database has nothing to sanitize
+        _stamp_clean(cursor)
+
         conn.commit()
         conn.close()
 
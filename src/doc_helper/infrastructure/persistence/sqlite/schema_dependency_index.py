@@ -0,0 +1,463 @@
+"""Reverse-dependency index over the schema database.
+
+Answers "what references this entity / field?" for SqliteSchemaRepository
+from memory instead of scanning fields, control rules, output mappings and
+relationships on every call.
+
+OWNERSHIP:
+    Every reference belongs to exactly one entity - the entity whose rows
+    declare it:
+    - a field's TABLE/LOOKUP links, formula and control rules belong to
+      the field's entity (output mappings to their entity_id)
+    - a control relation belongs to its target entity
+    - a relationship belongs to its source entity
+    - a parent link belongs to the child entity
+    Reloading an entity drops the references it owns and re-reads its rows,
+    so one change costs O(size of that entity).
+
+CHANGE TRACKING:
+    bootstrap_schema_database installs triggers that record the owning
+    entity of every written row in schema_dependency_log (one row per
+    entity, re-sequenced on each write). Before answering, the index reloads
+    the entities logged since it last looked - this covers writes made
+    through other repositories and connections. A schema (DDL) change
+    rebuilds the index. Databases without the log are rebuilt before every
+    query; read-only snapshots never change and are built once.
+"""
+
+import re
+import sqlite3
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+from doc_helper.domain.formula.dependency_tracker import DependencyTracker
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
+from doc_helper.infrastructure.persistence.sqlite.schema_bootstrap import (
+    DEPENDENCY_LOG_TABLE,
+)
+
+ENTITY_DEPENDENCY_KINDS = (
+    "referenced_by_table_fields",
+    "referenced_by_lookup_fields",
+    "child_entities",
+    "referenced_by_relationships",
+)
+
+FIELD_DEPENDENCY_KINDS = (
+    "referenced_by_formulas",
+    "referenced_by_controls_source",
+    "referenced_by_controls_target",
+    "referenced_by_lookup_display",
+    "referenced_by_control_rules",
+    "referenced_by_output_mappings",
+)
+
+# Field-level references whose referrer is a field that breaks with its target
+_FIELD_KINDS_TO_FIELDS = (
+    "referenced_by_formulas",
+    "referenced_by_lookup_display",
+    "referenced_by_control_rules",
+)
+
+_BRACED_REFERENCE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_.]*)\s*\}\}")
+_STRING_LITERAL = re.compile(r"'[^']*'|\"[^\"]*\"")
+_IDENTIFIER = re.compile(r"(?<![A-Za-z0-9_])[A-Za-z_][A-Za-z0-9_]*")
+_DEPENDENCY_TRACKER = DependencyTracker()
+
+
+def _formula_references(
+    formula: Optional[str], parse_cache: FormulaParseCache
+) -> frozenset[str]:
+    """Fields a formula references.
+
+    The formula is parsed, so function names, keywords and string literals
+    are not references; 'table.column' references the TABLE field.
+    {{field_id}} markers are read as bare field IDs. A formula that does
+    not parse falls back to every identifier outside string literals, so
+    a broken formula still protects the fields it names.
+    """
+    if not formula:
+        return frozenset()
+    text = _BRACED_REFERENCE.sub(r"\1", formula)
+    try:
+        node = parse_cache.parse(text)
+    except ValueError:
+        return frozenset(_IDENTIFIER.findall(_STRING_LITERAL.sub(" ", text)))
+    return frozenset(_DEPENDENCY_TRACKER.extract_dependencies(node))
+
+
+def _select(
+    cursor: sqlite3.Cursor,
+    sql: str,
+    owner_column: str,
+    entity_ids: Optional[tuple[str, ...]],
+    optional: bool = True,
+) -> list:
+    """Run a load query, restricted to entity_ids when given.
+
+    Optional tables that do not exist in older databases yield no rows.
+    """
+    params: tuple = ()
+    if entity_ids is not None:
+        sql = f"{sql} WHERE {owner_column} IN ({','.join('?' * len(entity_ids))})"
+        params = entity_ids
+    try:
+        cursor.execute(sql, params)
+    except sqlite3.OperationalError:
+        if not optional:
+            raise
+        return []
+    return cursor.fetchall()
+
+
+class SchemaDependencyIndex:
+    """Reverse references between schema entities and fields.
+
+    Thread-safe: refresh and queries are serialized by an internal lock.
+
+    Usage:
+        index = SchemaDependencyIndex()
+        with connection as conn:
+            index.refresh(conn)
+        deps = index.entity_dependencies("borehole")
+    """
+
+    def __init__(self, static: bool = False) -> None:
+        """Initialize an empty index.
+
+        Args:
+            static: The database never changes (read-only snapshot);
+                build once and skip change tracking
+        """
+        self._static = static
+        self._lock = threading.Lock()
+        # Rebuilds and reloads re-read formulas that rarely change
+        self._parse_cache = FormulaParseCache()
+        self._built = False
+        self._tracked = False
+        self._schema_version: Optional[int] = None
+        self._log_seq = 0
+        self._entities: set[str] = set()
+        self._field_entity: dict[str, str] = {}
+        self._entity_fields: dict[str, set[str]] = {}
+        # owner entity -> [(key, kind, referrer)]
+        self._owned: dict[str, list[tuple]] = {}
+        # key -> kind -> referrer -> reference count
+        self._reverse: dict[tuple, dict[str, dict]] = {}
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def refresh(self, conn: sqlite3.Connection) -> None:
+        """Bring the index up to date with the database.
+
+        Args:
+            conn: Open connection to the schema database
+
+        Raises:
+            sqlite3.Error: If the entities or fields table cannot be read
+        """
+        with self._lock:
+            if self._built and self._static:
+                return
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA schema_version")
+            schema_version = cursor.fetchone()[0]
+            if (
+                not self._built
+                or not self._tracked
+                or schema_version != self._schema_version
+            ):
+                self._rebuild(cursor)
+                self._schema_version = schema_version
+                return
+
+            # Log rows are read before the data, so a write racing with the
+            # reload is at worst reloaded again next time
+            cursor.execute(
+                f"SELECT seq, entity_id FROM {DEPENDENCY_LOG_TABLE} WHERE seq > ? ORDER BY seq",
+                (self._log_seq,),
+            )
+            changes = cursor.fetchall()
+            if changes:
+                self._load(cursor, tuple({row[1] for row in changes}))
+                self._log_seq = changes[-1][0]
+
+    def _rebuild(self, cursor: sqlite3.Cursor) -> None:
+        """Load the whole schema, recording the current log position."""
+        try:
+            cursor.execute(f"SELECT COALESCE(MAX(seq), 0) FROM {DEPENDENCY_LOG_TABLE}")
+            self._log_seq = cursor.fetchone()[0]
+            self._tracked = True
+        except sqlite3.OperationalError:
+            # Database not bootstrapped with change tracking
+            self._tracked = False
+        self._entities = set()
+        self._field_entity = {}
+        self._entity_fields = {}
+        self._owned = {}
+        self._reverse = {}
+        self._load(cursor, None)
+        self._built = True
+
+    def _load(self, cursor: sqlite3.Cursor, entity_ids: Optional[tuple[str, ...]]) -> None:
+        """(Re)load everything owned by entity_ids (all entities if None)."""
+        if entity_ids is not None:
+            for entity_id in entity_ids:
+                self._drop(entity_id)
+
+        for entity_id, parent_id in _select(
+            cursor,
+            "SELECT id, parent_entity_id FROM entities",
+            "id",
+            entity_ids,
+            optional=False,
+        ):
+            self._entities.add(entity_id)
+            if parent_id:
+                self._add(entity_id, ("entity", parent_id), "child_entities", entity_id)
+
+        for (
+            field_id,
+            entity_id,
+            field_type,
+            formula,
+            lookup_entity_id,
+            lookup_display_field,
+            child_entity_id,
+        ) in _select(
+            cursor,
+            """
+            SELECT id, entity_id, field_type, formula, lookup_entity_id,
+                   lookup_display_field, child_entity_id
+            FROM fields
+            """,
+            "entity_id",
+            entity_ids,
+            optional=False,
+        ):
+            self._field_entity[field_id] = entity_id
+            self._entity_fields.setdefault(entity_id, set()).add(field_id)
+            referrer = (entity_id, field_id)
+            field_type = (field_type or "").upper()
+            if field_type == "TABLE" and child_entity_id:
+                self._add(
+                    entity_id, ("entity", child_entity_id), "referenced_by_table_fields", referrer
+                )
+            if field_type == "LOOKUP":
+                if lookup_entity_id:
+                    self._add(
+                        entity_id,
+                        ("entity", lookup_entity_id),
+                        "referenced_by_lookup_fields",
+                        referrer,
+                    )
+                if lookup_display_field:
+                    self._add(
+                        entity_id,
+                        ("field", lookup_display_field),
+                        "referenced_by_lookup_display",
+                        referrer,
+                    )
+            for reference in _formula_references(formula, self._parse_cache) - {field_id}:
+                self._add(entity_id, ("field", reference), "referenced_by_formulas", referrer)
+
+        for entity_id, field_id, formula_text in _select(
+            cursor,
+            """
+            SELECT f.entity_id, cr.field_id, cr.formula_text
+            FROM control_rules cr JOIN fields f ON f.id = cr.field_id
+            """,
+            "f.entity_id",
+            entity_ids,
+        ):
+            for reference in (
+                _formula_references(formula_text, self._parse_cache) - {field_id}
+            ):
+                self._add(
+                    entity_id,
+                    ("field", reference),
+                    "referenced_by_control_rules",
+                    (entity_id, field_id),
+                )
+
+        for entity_id, field_id, output_type, target_tag in _select(
+            cursor,
+            "SELECT entity_id, field_id, output_type, target_tag FROM output_mappings",
+            "entity_id",
+            entity_ids,
+        ):
+            self._add(
+                entity_id,
+                ("field", field_id),
+                "referenced_by_output_mappings",
+                (output_type, target_tag),
+            )
+
+        for target_entity_id, target_field_id, source_entity_id, source_field_id in _select(
+            cursor,
+            """
+            SELECT target_entity_id, target_field_id, source_entity_id, source_field_id
+            FROM control_relations
+            """,
+            "target_entity_id",
+            entity_ids,
+        ):
+            self._add(
+                target_entity_id,
+                ("control", source_entity_id, source_field_id),
+                "referenced_by_controls_source",
+                (target_entity_id, target_field_id),
+            )
+            self._add(
+                target_entity_id,
+                ("control", target_entity_id, target_field_id),
+                "referenced_by_controls_target",
+                (source_entity_id, source_field_id),
+            )
+
+        for source_entity_id, relationship_id, target_entity_id in _select(
+            cursor,
+            "SELECT source_entity_id, id, target_entity_id FROM relationships",
+            "source_entity_id",
+            entity_ids,
+        ):
+            self._add(
+                source_entity_id,
+                ("entity", target_entity_id),
+                "referenced_by_relationships",
+                (relationship_id, source_entity_id),
+            )
+            if target_entity_id != source_entity_id:
+                self._add(
+                    source_entity_id,
+                    ("entity", source_entity_id),
+                    "referenced_by_relationships",
+                    (relationship_id, target_entity_id),
+                )
+
+    def _add(self, owner: str, key: tuple, kind: str, referrer) -> None:
+        self._owned.setdefault(owner, []).append((key, kind, referrer))
+        referrers = self._reverse.setdefault(key, {}).setdefault(kind, {})
+        referrers[referrer] = referrers.get(referrer, 0) + 1
+
+    def _drop(self, owner: str) -> None:
+        """Remove the entity, its fields and every reference it owns."""
+        self._entities.discard(owner)
+        for field_id in self._entity_fields.pop(owner, ()):
+            if self._field_entity.get(field_id) == owner:
+                del self._field_entity[field_id]
+        for key, kind, referrer in self._owned.pop(owner, ()):
+            kinds = self._reverse[key]
+            referrers = kinds[kind]
+            if referrers[referrer] > 1:
+                referrers[referrer] -= 1
+                continue
+            del referrers[referrer]
+            if not referrers:
+                del kinds[kind]
+                if not kinds:
+                    del self._reverse[key]
+
+    # -------------------------------------------------------------------------
+    # Queries (O(result size))
+    # -------------------------------------------------------------------------
+
+    def has_entity(self, entity_id: str) -> bool:
+        with self._lock:
+            return entity_id in self._entities
+
+    def has_field(self, entity_id: str, field_id: str) -> bool:
+        with self._lock:
+            return field_id in self._entity_fields.get(entity_id, ())
+
+    def _referrers(self, key: tuple, kind: str) -> list:
+        return sorted(self._reverse.get(key, {}).get(kind, ()))
+
+    def entity_dependencies(self, entity_id: str) -> dict:
+        """Direct references to an entity, keyed by ENTITY_DEPENDENCY_KINDS."""
+        with self._lock:
+            key = ("entity", entity_id)
+            return {kind: self._referrers(key, kind) for kind in ENTITY_DEPENDENCY_KINDS}
+
+    def field_dependencies(self, entity_id: str, field_id: str) -> dict:
+        """Direct references to a field, keyed by FIELD_DEPENDENCY_KINDS."""
+        with self._lock:
+            field_key = ("field", field_id)
+            control_key = ("control", entity_id, field_id)
+            dependencies = {
+                kind: self._referrers(field_key, kind) for kind in FIELD_DEPENDENCY_KINDS
+            }
+            dependencies["referenced_by_controls_source"] = self._referrers(
+                control_key, "referenced_by_controls_source"
+            )
+            dependencies["referenced_by_controls_target"] = self._referrers(
+                control_key, "referenced_by_controls_target"
+            )
+            return dependencies
+
+    def field_impact(self, entity_id: str, field_id: str) -> list[tuple[str, str]]:
+        """Fields that break, directly or transitively, if a field is deleted."""
+        with self._lock:
+            return sorted(self._closure([(entity_id, field_id)], {field_id}))
+
+    def entity_impact(self, entity_id: str) -> dict:
+        """What breaks, directly or transitively, if an entity is deleted.
+
+        Returns:
+            {
+                "entities": [entity_id, ...],   # child and related entities
+                "fields": [(entity_id, field_id), ...],  # fields of other entities
+            }
+        """
+        with self._lock:
+            key = ("entity", entity_id)
+            own_fields = self._entity_fields.get(entity_id, set())
+            linked = [
+                referrer
+                for kind in ("referenced_by_table_fields", "referenced_by_lookup_fields")
+                for referrer in self._reverse.get(key, {}).get(kind, ())
+                if referrer[1] not in own_fields
+            ]
+            roots = [(entity_id, field_id) for field_id in own_fields]
+            fields = self._closure(roots, set(own_fields))
+            fields.update(linked)
+            fields.update(self._closure(linked, set(own_fields)))
+
+            entities = set(self._reverse.get(key, {}).get("child_entities", ()))
+            entities.update(
+                other
+                for _, other in self._reverse.get(key, {}).get("referenced_by_relationships", ())
+            )
+            entities.discard(entity_id)
+            return {"entities": sorted(entities), "fields": sorted(fields)}
+
+    def _closure(
+        self, roots: Iterable[tuple[str, str]], excluded_field_ids: set[str]
+    ) -> set[tuple[str, str]]:
+        """Fields reachable from roots over field-to-field references.
+
+        Roots themselves are not part of the result; fields in
+        excluded_field_ids are neither reported nor followed.
+        """
+        seen: set[tuple[str, str]] = set()
+        queue = deque(roots)
+        while queue:
+            entity_id, field_id = queue.popleft()
+            kinds = self._reverse.get(("field", field_id), {})
+            dependents = [
+                referrer for kind in _FIELD_KINDS_TO_FIELDS for referrer in kinds.get(kind, ())
+            ]
+            dependents.extend(
+                self._reverse.get(("control", entity_id, field_id), {}).get(
+                    "referenced_by_controls_source", ()
+                )
+            )
+            for dependent in dependents:
+                if dependent in seen or dependent[1] in excluded_field_ids:
+                    continue
+                seen.add(dependent)
+                queue.append(dependent)
+        return seen
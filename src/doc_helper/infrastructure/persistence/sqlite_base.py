@@ -1,6 +1,7 @@
 """SQLite connection management."""
 
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -80,3 +81,85 @@ class SqliteConnection:
         """
         if not self.exists:
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
+
+
+class SqliteSnapshotConnection:
+    """Read-only in-memory copy of a SQLite database file.
+
+    The file is opened once read-only (mode=ro&immutable=1, so SQLite takes
+    no locks and keeps no journal) and copied into an in-memory database
+    with the backup API. Every later query runs against that copy, with no
+    file I/O. Writes fail with sqlite3.OperationalError (query_only).
+
+    Drop-in replacement for SqliteConnection where the file is only read
+    (e.g. a runtime AppType's config.db). Changes made to the file after
+    construction are not seen.
+
+    Example:
+        connection = SqliteSnapshotConnection(db_path)
+        with connection as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM table")
+            results = cursor.fetchall()
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        """Copy the database file into memory.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Raises:
+            FileNotFoundError: If database file does not exist
+            sqlite3.Error: If the file cannot be read
+        """
+        if not isinstance(db_path, (str, Path)):
+            raise TypeError("db_path must be a string or Path")
+
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database file not found: {self.db_path}")
+
+        source = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1", uri=True
+        )
+        try:
+            # One connection shared by all threads, serialized by _lock
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+            source.backup(self._connection)
+        finally:
+            source.close()
+
+        self._connection.row_factory = sqlite3.Row  # Enable dict-like access
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA query_only = ON")
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> sqlite3.Connection:
+        """Enter context manager.
+
+        Returns:
+            The in-memory connection
+        """
+        self._lock.acquire()
+        return self._connection
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager (ends any open read transaction)."""
+        try:
+            self._connection.rollback()
+        finally:
+            self._lock.release()
+
+    @property
+    def exists(self) -> bool:
+        """Check if database file exists.
+
+        Returns:
+            True if database file exists
+        """
+        return self.db_path.exists()
+
+    def close(self) -> None:
+        """Release the in-memory copy."""
+        self._connection.close()
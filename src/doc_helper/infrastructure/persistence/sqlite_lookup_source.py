@@ -0,0 +1,276 @@
+"""SQLite implementation of the LOOKUP option source.
+
+LOOKUP fields reference another entity; that entity's records are the
+child records of a TABLE field of the project (see SqliteTableRowStore).
+Options are paged straight from those rows through indexes, so opening a
+form never loads every record of a large reference entity.
+
+Only records held by the same project are found: the referenced entity
+must be the child entity of a TABLE field of the project's own entity.
+SqliteLookupSourceFactory finds that TABLE field from the LOOKUP field's
+target entity.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from doc_helper.application.lookup import (
+    ILookupSource,
+    ILookupSourceFactory,
+    LookupMatchMode,
+    fold_lookup_text,
+)
+from doc_helper.domain.common.result import Failure, Result, Success
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId
+from doc_helper.domain.schema.schema_repository import ISchemaRepository
+from doc_helper.infrastructure.persistence.sqlite_base import SqliteConnection
+from doc_helper.infrastructure.persistence.sqlite_table_row_store import (
+    SqliteTableRowStore,
+)
+
+
+class SqliteLookupSource(ILookupSource):
+    """Options of one LOOKUP field, read from a TABLE field's rows.
+
+    The TABLE field must belong to the project itself (project_id): records
+    of other projects or of nested tables are never options.
+
+    Each record of the TABLE field is one option:
+    - display_text: the record's display_column (the LOOKUP field's
+      lookup_display_field)
+    - value: the record's value_column (a key field of the referenced
+      entity); defaults to the display column
+
+    Matching is case-insensitive for ASCII letters (SQLite lower()).
+    Prefix searches are range scans of an index on lower(display_column);
+    substring searches walk that index in display order and stop when the
+    page is filled. Display texts are resolved through an index on
+    value_column. Records not yet migrated to row storage (JSON in
+    field_values) are filtered in memory.
+
+    Example:
+        source = SqliteLookupSource(
+            db_path="projects.db",
+            project_id="proj-123",
+            table_field_id="boreholes",
+            display_column="name",
+            value_column="borehole_id",
+        )
+        result = source.search("bh", LookupMatchMode.PREFIX, offset=0, limit=50)
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        project_id: str,
+        table_field_id: str,
+        display_column: str,
+        value_column: Optional[str] = None,
+    ) -> None:
+        """Initialize lookup source.
+
+        Args:
+            db_path: Path to the project database
+            project_id: Project whose records are the options
+            table_field_id: TABLE field holding the referenced entity's records
+            display_column: Child field shown to the user
+            value_column: Child field stored as the LOOKUP value
+                (None: the display text is the value)
+
+        Raises:
+            TypeError: If db_path is not string or Path
+        """
+        if not isinstance(db_path, (str, Path)):
+            raise TypeError("db_path must be a string or Path")
+        self._connection = SqliteConnection(db_path)
+        self._project_id = project_id
+        self._table_field_id = table_field_id
+        self._display_column = display_column
+        self._value_column = value_column or display_column
+        self._table_rows = SqliteTableRowStore()
+
+    def search(
+        self,
+        query: str,
+        match_mode: LookupMatchMode,
+        offset: int,
+        limit: int,
+    ) -> Result[list[tuple[Any, str]], str]:
+        """Get options whose display text matches query.
+
+        See ILookupSource.search for documentation.
+        """
+        if offset < 0 or limit <= 0:
+            return Failure("offset must not be negative and limit must be positive")
+        folded_query = fold_lookup_text(query)
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                records = self._unmigrated_records(cursor)
+                if records is None:
+                    rows = self._table_rows.search_rows(
+                        cursor,
+                        self._project_id,
+                        self._table_field_id,
+                        self._display_column,
+                        folded_query,
+                        match_mode is LookupMatchMode.SUBSTRING,
+                        offset,
+                        limit,
+                        required_column=self._value_column,
+                    )
+                    return Success(self._options(record for _, record in rows))
+
+                matching = sorted(
+                    (
+                        (fold_lookup_text(str(record[self._display_column])), position, record)
+                        for position, record in enumerate(records)
+                        if self._value_column in record
+                        and self._has_text(record, self._display_column)
+                        and match_mode.matches(
+                            fold_lookup_text(str(record[self._display_column])), folded_query
+                        )
+                    ),
+                    key=lambda item: item[:2],
+                )
+                return Success(
+                    self._options(record for _, _, record in matching[offset:offset + limit])
+                )
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+
+    def resolve(self, values: Iterable[Any]) -> Result[dict[Any, str], str]:
+        """Get the display texts of values.
+
+        See ILookupSource.resolve for documentation.
+        """
+        values = list(values)
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                records = self._unmigrated_records(cursor)
+                if records is None:
+                    records = [
+                        record
+                        for _, record in self._table_rows.find_rows_in(
+                            cursor,
+                            self._project_id,
+                            self._table_field_id,
+                            self._value_column,
+                            values,
+                        )
+                    ]
+                wanted = set(values)
+                return Success(
+                    {
+                        value: display_text
+                        for value, display_text in self._options(records)
+                        if value in wanted
+                    }
+                )
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+
+    def _unmigrated_records(self, cursor: sqlite3.Cursor) -> Optional[list[dict]]:
+        """Records still stored as JSON in field_values (None if stored as rows)."""
+        cursor.execute(
+            "SELECT value, is_table FROM field_values WHERE project_id = ? AND field_id = ?",
+            (self._project_id, self._table_field_id),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return []
+        if row["is_table"]:
+            return None
+        records = json.loads(row["value"])
+        return records if self._table_rows.is_table_value(records) else []
+
+    def _options(self, records: Iterable[dict]) -> list[tuple[Any, str]]:
+        """(value, display_text) of the records that have both."""
+        return [
+            (record[self._value_column], str(record[self._display_column]))
+            for record in records
+            if self._value_column in record and self._has_text(record, self._display_column)
+        ]
+
+    @staticmethod
+    def _has_text(record: dict, column: str) -> bool:
+        """Check if a record has a text or number cell in column."""
+        value = record.get(column)
+        return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+class SqliteLookupSourceFactory(ILookupSourceFactory):
+    """Creates SqliteLookupSources keyed off the LOOKUP field's target entity.
+
+    The source reads the TABLE field of the project's entity whose child
+    entity is the LOOKUP field's lookup_entity_id. Projects without such a
+    TABLE field (or with several, which would be ambiguous) get no source.
+
+    Example:
+        factory = SqliteLookupSourceFactory("projects.db", schema_repository)
+        source = factory.create_source("proj-123", "borehole", "name")
+    """
+
+    def __init__(self, db_path: str | Path, schema_repository: ISchemaRepository) -> None:
+        """Initialize lookup source factory.
+
+        Args:
+            db_path: Path to the project database
+            schema_repository: Schema of the projects' entities
+
+        Raises:
+            TypeError: If db_path is not string or Path
+        """
+        if not isinstance(db_path, (str, Path)):
+            raise TypeError("db_path must be a string or Path")
+        self._db_path = db_path
+        self._connection = SqliteConnection(db_path)
+        self._schema_repository = schema_repository
+
+    def create_source(
+        self,
+        project_id: str,
+        lookup_entity_id: str,
+        display_field: str,
+    ) -> Optional[ILookupSource]:
+        """Create the source of a LOOKUP field's options.
+
+        See ILookupSourceFactory.create_source for documentation. The
+        display field is also the stored value.
+        """
+        table_field_id = self._table_field_of(project_id, lookup_entity_id)
+        if table_field_id is None:
+            return None
+        return SqliteLookupSource(self._db_path, project_id, table_field_id, display_field)
+
+    def _table_field_of(self, project_id: str, lookup_entity_id: str) -> Optional[str]:
+        """TABLE field of the project's entity that holds lookup_entity_id records."""
+        try:
+            with self._connection as conn:
+                row = conn.execute(
+                    "SELECT entity_definition_id FROM projects WHERE project_id = ?",
+                    (project_id,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        entity_result = self._schema_repository.get_by_id(
+            EntityDefinitionId(row["entity_definition_id"])
+        )
+        if not entity_result.is_success():
+            return None
+        table_fields = [
+            field.id.value
+            for field in entity_result.value.get_all_fields()
+            if field.field_type == FieldType.TABLE
+            and field.child_entity_id is not None
+            and field.child_entity_id.value == lookup_entity_id
+        ]
+        return table_fields[0] if len(table_fields) == 1 else None
@@ -4,18 +4,26 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.project.field_value import FieldValue
 from doc_helper.domain.project.project import Project
 from doc_helper.domain.project.project_ids import ProjectId
-from doc_helper.domain.project.project_repository import IProjectRepository
+from doc_helper.domain.project.project_repository import (
+    IProjectRepository,
+    ITableRowRepository,
+)
+from doc_helper.domain.schema.field_type import FieldType
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.schema.schema_repository import ISchemaRepository
 from doc_helper.infrastructure.persistence.sqlite_base import SqliteConnection
+from doc_helper.infrastructure.persistence.sqlite_table_row_store import (
+    SqliteTableRowStore,
+)
 
 
-class SqliteProjectRepository(IProjectRepository):
+class SqliteProjectRepository(IProjectRepository, ITableRowRepository):
     """SQLite implementation of project repository.
 
     Stores projects in a SQLite database separate from config.db.
@@ -23,6 +31,8 @@ class SqliteProjectRepository(IProjectRepository):
     Database schema:
     - projects table: Project metadata
     - field_values table: Field values for each project
+    - "table_rows:<field_id>" tables: TABLE field records, one row per
+      record (see SqliteTableRowStore); their field_values row has is_table=1
 
     Example:
         repo = SqliteProjectRepository(db_path="projects.db")
@@ -31,17 +41,26 @@ class SqliteProjectRepository(IProjectRepository):
             print("Project saved")
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(
+        self,
+        db_path: str | Path,
+        schema_repository: Optional[ISchemaRepository] = None,
+    ) -> None:
         """Initialize repository.
 
         Args:
             db_path: Path to projects SQLite database
+            schema_repository: Schema that tells which fields are TABLE
+                fields; their records are saved as rows. Without it every
+                value is saved as JSON (rows already stored still load).
         """
         if not isinstance(db_path, (str, Path)):
             raise TypeError("db_path must be a string or Path")
 
         self.db_path = Path(db_path)
         self._connection = SqliteConnection(self.db_path)
+        self._schema_repository = schema_repository
+        self._table_rows = SqliteTableRowStore()
 
         # Create tables if database is new
         self._ensure_schema()
@@ -88,12 +107,22 @@ class SqliteProjectRepository(IProjectRepository):
                         ),
                     )
 
+                    # Remember which fields were stored as rows
+                    cursor.execute(
+                        "SELECT field_id FROM field_values "
+                        "WHERE project_id = ? AND is_table = 1",
+                        (str(project.id.value),),
+                    )
+                    previous_table_fields = {row[0] for row in cursor.fetchall()}
+
                     # Delete existing field values
                     cursor.execute(
                         "DELETE FROM field_values WHERE project_id = ?",
                         (str(project.id.value),),
                     )
                 else:
+                    previous_table_fields = set()
+
                     # Insert new project
                     cursor.execute(
                         """
@@ -114,28 +143,44 @@ class SqliteProjectRepository(IProjectRepository):
                         ),
                     )
 
-                # Insert field values
+                # Insert field values; TABLE records go to their row table,
+                # where only changed records are written
+                table_fields = set()
+                table_field_ids = self._table_field_ids(project)
                 for field_id, field_value in project.field_values.items():
+                    is_table = (
+                        field_id.value in table_field_ids
+                        and self._table_rows.is_table_value(field_value.value)
+                    )
+                    if is_table:
+                        table_fields.add(field_id.value)
+                        self._table_rows.replace_rows(
+                            cursor, str(project.id.value), field_id.value, field_value.value
+                        )
                     cursor.execute(
                         """
                         INSERT INTO field_values
                         (project_id, field_id, value, is_computed, computed_from,
-                         is_override, original_computed_value)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                         is_override, original_computed_value, is_table)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                         """,
                         (
                             str(project.id.value),
                             field_id.value,
-                            json.dumps(field_value.value),
+                            json.dumps(None if is_table else field_value.value),
                             field_value.is_computed,
                             field_value.computed_from,
                             field_value.is_override,
                             json.dumps(field_value.original_computed_value)
                             if field_value.original_computed_value is not None
                             else None,
+                            is_table,
                         ),
                     )
 
+                for field_id in previous_table_fields - table_fields:
+                    self._table_rows.delete_field(cursor, str(project.id.value), field_id)
+
                 return Success(None)
 
         except sqlite3.Error as e:
@@ -176,26 +221,9 @@ class SqliteProjectRepository(IProjectRepository):
                 )
                 value_rows = cursor.fetchall()
 
-                # Build field_values dict
-                field_values = {}
-                for row in value_rows:
-                    field_id = FieldDefinitionId(row["field_id"])
-                    value = json.loads(row["value"])
-                    original_computed_value = (
-                        json.loads(row["original_computed_value"])
-                        if row["original_computed_value"]
-                        else None
-                    )
-
-                    field_value = FieldValue(
-                        field_id=field_id,
-                        value=value,
-                        is_computed=bool(row["is_computed"]),
-                        computed_from=row["computed_from"],
-                        is_override=bool(row["is_override"]),
-                        original_computed_value=original_computed_value,
-                    )
-                    field_values[field_id] = field_value
+                field_values = self._field_values_from_rows(
+                    cursor, str(project_id.value), value_rows
+                )
 
                 # Build Project
                 # Use default app_type_id if not present (backward compatibility)
@@ -207,7 +235,7 @@ class SqliteProjectRepository(IProjectRepository):
                 except (KeyError, IndexError):
                     app_type_id = self.DEFAULT_APP_TYPE_ID
 
-                project = Project(
+                project = Project.restore(
                     id=project_id,
                     name=project_row["name"],
                     app_type_id=app_type_id,
@@ -259,6 +287,229 @@ class SqliteProjectRepository(IProjectRepository):
         except Exception as e:
             return Failure(f"Error loading projects: {str(e)}")
 
+    def get_page(
+        self,
+        after_project_id: Optional[str] = None,
+        limit: int = 100,
+        app_type_id: Optional[str] = None,
+    ) -> Result[list, str]:
+        """Get a page of projects in project ID order (keyset pagination).
+
+        Lets bulk jobs stream every project without loading them all.
+
+        Args:
+            after_project_id: Last project ID of the previous page
+                (None = first page)
+            limit: Maximum number of projects in the page
+            app_type_id: Only projects of this AppType (None = all projects)
+
+        Returns:
+            Success(list of Projects) if successful, Failure(error) otherwise
+        """
+        if limit < 1:
+            return Failure("limit must be positive")
+
+        app_type_filter, app_type_params = self._app_type_filter(app_type_id)
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT project_id FROM projects WHERE project_id > ?{app_type_filter} "
+                    "ORDER BY project_id LIMIT ?",
+                    (after_project_id or "", *app_type_params, limit),
+                )
+                project_ids = [
+                    ProjectId(self._parse_uuid(row["project_id"]))
+                    for row in cursor.fetchall()
+                ]
+
+                projects = []
+                for project_id in project_ids:
+                    project = self._load_project_from_connection(conn, project_id)
+                    if project is not None:
+                        projects.append(project)
+
+                return Success(projects)
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+        except Exception as e:
+            return Failure(f"Error loading projects: {str(e)}")
+
+    def get_modification_stamp(self, app_type_id: Optional[str] = None) -> Result[str, str]:
+        """Get a stamp that changes whenever projects are saved, added or deleted.
+
+        Args:
+            app_type_id: Only projects of this AppType (None = all projects)
+
+        Returns:
+            Success(stamp: project count and latest modification time),
+            Failure(error) on error
+        """
+        app_type_filter, app_type_params = self._app_type_filter(app_type_id)
+        try:
+            with self._connection as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*), MAX(modified_at) FROM projects "
+                    f"WHERE 1 = 1{app_type_filter}",
+                    app_type_params,
+                ).fetchone()
+                return Success(f"{row[0]}:{row[1] or ''}")
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+
+    def rename_field_values(
+        self,
+        entity_definition_id: EntityDefinitionId,
+        old_field_id: FieldDefinitionId,
+        new_field_id: FieldDefinitionId,
+        app_type_id: Optional[str] = None,
+    ) -> Result[int, str]:
+        """Move stored values of a renamed field to its new ID.
+
+        Applies to every project of the entity in one UPDATE; only TABLE
+        values stored as rows are moved project by project. Projects that
+        already have a value for the new ID keep it, and their value for
+        the old ID is dropped.
+
+        Args:
+            entity_definition_id: Entity whose projects are migrated
+            old_field_id: Field ID before the rename
+            new_field_id: Field ID after the rename
+            app_type_id: Only projects of this AppType (None = all projects)
+
+        Returns:
+            Success(number of values renamed), Failure(error) on error
+        """
+        if not isinstance(entity_definition_id, EntityDefinitionId):
+            return Failure("entity_definition_id must be an EntityDefinitionId")
+        if not isinstance(old_field_id, FieldDefinitionId):
+            return Failure("old_field_id must be a FieldDefinitionId")
+        if not isinstance(new_field_id, FieldDefinitionId):
+            return Failure("new_field_id must be a FieldDefinitionId")
+        if old_field_id == new_field_id:
+            return Success(0)
+
+        entity_projects, entity_params = self._entity_projects(entity_definition_id, app_type_id)
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+
+                # TABLE records live in a per-field row table
+                cursor.execute(
+                    "SELECT project_id FROM field_values AS old "
+                    f"WHERE field_id = ? AND is_table = 1 AND project_id IN ({entity_projects}) "
+                    "AND NOT EXISTS (SELECT 1 FROM field_values AS new "
+                    "WHERE new.project_id = old.project_id AND new.field_id = ?)",
+                    (old_field_id.value, *entity_params, new_field_id.value),
+                )
+                for (project_id,) in cursor.fetchall():
+                    records = self._table_rows.load_rows(cursor, project_id, old_field_id.value)
+                    self._table_rows.replace_rows(cursor, project_id, new_field_id.value, records)
+                    self._table_rows.delete_field(cursor, project_id, old_field_id.value)
+
+                cursor.execute(
+                    "UPDATE OR IGNORE field_values SET field_id = ? "
+                    f"WHERE field_id = ? AND project_id IN ({entity_projects})",
+                    (new_field_id.value, old_field_id.value, *entity_params),
+                )
+                renamed = cursor.rowcount
+
+                # Values left under the old ID were shadowed by a new value
+                self._delete_field_values(cursor, entity_definition_id, old_field_id, app_type_id)
+
+                return Success(renamed)
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+        except Exception as e:
+            return Failure(f"Error renaming field values: {str(e)}")
+
+    def delete_field_values(
+        self,
+        entity_definition_id: EntityDefinitionId,
+        field_id: FieldDefinitionId,
+        app_type_id: Optional[str] = None,
+    ) -> Result[int, str]:
+        """Delete stored values of a removed field from every project of an entity.
+
+        Args:
+            entity_definition_id: Entity whose projects are migrated
+            field_id: Removed field ID
+            app_type_id: Only projects of this AppType (None = all projects)
+
+        Returns:
+            Success(number of values deleted), Failure(error) on error
+        """
+        if not isinstance(entity_definition_id, EntityDefinitionId):
+            return Failure("entity_definition_id must be an EntityDefinitionId")
+        if not isinstance(field_id, FieldDefinitionId):
+            return Failure("field_id must be a FieldDefinitionId")
+
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                return Success(
+                    self._delete_field_values(cursor, entity_definition_id, field_id, app_type_id)
+                )
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+        except Exception as e:
+            return Failure(f"Error deleting field values: {str(e)}")
+
+    def _delete_field_values(
+        self,
+        cursor: sqlite3.Cursor,
+        entity_definition_id: EntityDefinitionId,
+        field_id: FieldDefinitionId,
+        app_type_id: Optional[str] = None,
+    ) -> int:
+        """Delete a field's values (and TABLE rows) for an entity's projects.
+
+        Args:
+            cursor: Active database cursor
+            entity_definition_id: Entity whose projects are migrated
+            field_id: Field ID
+            app_type_id: Only projects of this AppType (None = all projects)
+
+        Returns:
+            Number of field_values rows deleted
+        """
+        entity_projects, entity_params = self._entity_projects(entity_definition_id, app_type_id)
+        cursor.execute(
+            "SELECT project_id FROM field_values "
+            f"WHERE field_id = ? AND is_table = 1 AND project_id IN ({entity_projects})",
+            (field_id.value, *entity_params),
+        )
+        for (project_id,) in cursor.fetchall():
+            self._table_rows.delete_field(cursor, project_id, field_id.value)
+
+        cursor.execute(
+            f"DELETE FROM field_values WHERE field_id = ? AND project_id IN ({entity_projects})",
+            (field_id.value, *entity_params),
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def _app_type_filter(app_type_id: Optional[str]) -> tuple[str, tuple]:
+        """SQL condition (appended with AND) and parameters restricting projects to an AppType."""
+        if app_type_id is None:
+            return "", ()
+        return " AND app_type_id = ?", (app_type_id,)
+
+    @classmethod
+    def _entity_projects(
+        cls, entity_definition_id: EntityDefinitionId, app_type_id: Optional[str]
+    ) -> tuple[str, tuple]:
+        """Subquery and parameters selecting the projects of an entity."""
+        app_type_filter, app_type_params = cls._app_type_filter(app_type_id)
+        return (
+            f"SELECT project_id FROM projects WHERE entity_definition_id = ?{app_type_filter}",
+            (entity_definition_id.value, *app_type_params),
+        )
+
     def delete(self, project_id: ProjectId) -> Result[None, str]:
         """Delete a project.
 
@@ -276,6 +527,7 @@ class SqliteProjectRepository(IProjectRepository):
                 cursor = conn.cursor()
 
                 # Delete field values first (foreign key)
+                self._table_rows.delete_project(cursor, str(project_id.value))
                 cursor.execute(
                     "DELETE FROM field_values WHERE project_id = ?",
                     (str(project_id.value),),
@@ -366,6 +618,203 @@ class SqliteProjectRepository(IProjectRepository):
         except Exception as e:
             return Failure(f"Error loading recent projects: {str(e)}")
 
+    # -------------------------------------------------------------------------
+    # TABLE field rows
+    # -------------------------------------------------------------------------
+
+    def insert_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+        record: dict[str, Any],
+    ) -> Result[None, str]:
+        """Insert one child record into a TABLE field.
+
+        Only the new row is written; later rows move down by one.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Position of the new row (0..row count)
+            record: Child record
+
+        Returns:
+            Success(None) if inserted, Failure(error) otherwise
+        """
+
+        def insert(cursor: sqlite3.Cursor, pid: str, fid: str, count: int) -> Optional[str]:
+            if not 0 <= position <= count:
+                return f"Row position {position} out of range (0..{count})"
+            self._table_rows.insert_row(cursor, pid, fid, position, record)
+            return None
+
+        return self._edit_table_rows(project_id, field_id, record, insert)
+
+    def update_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+        record: dict[str, Any],
+    ) -> Result[None, str]:
+        """Replace one child record of a TABLE field.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Row position
+            record: Updated child record
+
+        Returns:
+            Success(None) if updated, Failure(error) otherwise
+        """
+
+        def update(cursor: sqlite3.Cursor, pid: str, fid: str, count: int) -> Optional[str]:
+            if not 0 <= position < count:
+                return f"Row position {position} out of range (0..{count - 1})"
+            self._table_rows.update_row(cursor, pid, fid, position, record)
+            return None
+
+        return self._edit_table_rows(project_id, field_id, record, update)
+
+    def delete_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        position: int,
+    ) -> Result[None, str]:
+        """Delete one child record of a TABLE field.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Row position
+
+        Returns:
+            Success(None) if deleted, Failure(error) otherwise
+        """
+
+        def delete(cursor: sqlite3.Cursor, pid: str, fid: str, count: int) -> Optional[str]:
+            if not 0 <= position < count:
+                return f"Row position {position} out of range (0..{count - 1})"
+            self._table_rows.delete_row(cursor, pid, fid, position)
+            return None
+
+        return self._edit_table_rows(project_id, field_id, {}, delete)
+
+    def move_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        from_position: int,
+        to_position: int,
+    ) -> Result[None, str]:
+        """Move one child record of a TABLE field to another position.
+
+        Args:
+            project_id: Project ID
+            field_id: TABLE field ID
+            from_position: Current row position
+            to_position: New row position
+
+        Returns:
+            Success(None) if moved, Failure(error) otherwise
+        """
+
+        def move(cursor: sqlite3.Cursor, pid: str, fid: str, count: int) -> Optional[str]:
+            for position in (from_position, to_position):
+                if not 0 <= position < count:
+                    return f"Row position {position} out of range (0..{count - 1})"
+            self._table_rows.move_row(cursor, pid, fid, from_position, to_position)
+            return None
+
+        return self._edit_table_rows(project_id, field_id, {}, move)
+
+    def _edit_table_rows(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        record: dict[str, Any],
+        edit: Callable[[sqlite3.Cursor, str, str, int], Optional[str]],
+    ) -> Result[None, str]:
+        """Run a row-level edit on a TABLE field in one transaction.
+
+        Makes sure the field is stored as rows first (creating it, or moving
+        a JSON-encoded value to its row table), then calls
+        edit(cursor, project_id, field_id, row_count), which returns an
+        error message or None, and touches the project's modified_at.
+        """
+        if not isinstance(project_id, ProjectId):
+            return Failure("project_id must be a ProjectId")
+        if not isinstance(field_id, FieldDefinitionId):
+            return Failure("field_id must be a FieldDefinitionId")
+        if not isinstance(record, dict) or not all(isinstance(key, str) for key in record):
+            return Failure("record must be a dict with string keys")
+
+        pid = str(project_id.value)
+        fid = field_id.value
+        try:
+            with self._connection as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM projects WHERE project_id = ?", (pid,))
+                if cursor.fetchone() is None:
+                    return Failure(f"Project '{project_id.value}' not found")
+
+                cursor.execute(
+                    "SELECT value, is_table FROM field_values "
+                    "WHERE project_id = ? AND field_id = ?",
+                    (pid, fid),
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    cursor.execute(
+                        """
+                        INSERT INTO field_values (project_id, field_id, value, is_table)
+                        VALUES (?, ?, ?, 1)
+                        """,
+                        (pid, fid, json.dumps(None)),
+                    )
+                elif not row["is_table"]:
+                    records = json.loads(row["value"])
+                    if self._table_rows.is_table_value(records):
+                        self._table_rows.replace_rows(cursor, pid, fid, records)
+                    elif records not in (None, []):
+                        return Failure(f"Field '{fid}' does not hold table rows")
+                    cursor.execute(
+                        "UPDATE field_values SET value = ?, is_table = 1 "
+                        "WHERE project_id = ? AND field_id = ?",
+                        (json.dumps(None), pid, fid),
+                    )
+
+                error = edit(cursor, pid, fid, self._table_rows.row_count(cursor, pid, fid))
+                if error is not None:
+                    return Failure(error)
+
+                cursor.execute(
+                    "UPDATE projects SET modified_at = ? WHERE project_id = ?",
+                    (datetime.now().isoformat(), pid),
+                )
+                return Success(None)
+
+        except sqlite3.Error as e:
+            return Failure(f"Database error: {str(e)}")
+        except Exception as e:
+            return Failure(f"Error editing table rows: {str(e)}")
+
+    def _table_field_ids(self, project: Project) -> frozenset[str]:
+        """IDs of the TABLE fields of a project's entity (empty if unknown)."""
+        if self._schema_repository is None:
+            return frozenset()
+        result = self._schema_repository.get_by_id(project.entity_definition_id)
+        if result.is_failure():
+            return frozenset()
+        return frozenset(
+            field.id.value
+            for field in result.value.get_all_fields()
+            if field.field_type == FieldType.TABLE
+        )
+
     # Default app_type_id for migration of existing projects
     DEFAULT_APP_TYPE_ID = "soil_investigation"
 
@@ -412,6 +861,7 @@ class SqliteProjectRepository(IProjectRepository):
                     computed_from TEXT,
                     is_override INTEGER NOT NULL DEFAULT 0,
                     original_computed_value TEXT,
+                    is_table INTEGER NOT NULL DEFAULT 0,
                     PRIMARY KEY (project_id, field_id),
                     FOREIGN KEY (project_id) REFERENCES projects(project_id)
                         ON DELETE CASCADE
@@ -419,6 +869,9 @@ class SqliteProjectRepository(IProjectRepository):
                 """
             )
 
+            # Migration: Add is_table column if it doesn't exist (for existing databases)
+            self._migrate_add_is_table(cursor)
+
             # Create index for faster queries
             cursor.execute(
                 """
@@ -458,6 +911,26 @@ class SqliteProjectRepository(IProjectRepository):
                 """
             )
 
+    def _migrate_add_is_table(self, cursor: sqlite3.Cursor) -> None:
+        """Migration: Add is_table column to field_values.
+
+        Existing TABLE values stay JSON-encoded in field_values (is_table=0)
+        and move to their row table the next time the project is saved.
+
+        Args:
+            cursor: Active database cursor
+        """
+        cursor.execute("PRAGMA table_info(field_values)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if "is_table" not in columns:
+            cursor.execute(
+                """
+                ALTER TABLE field_values
+                ADD COLUMN is_table INTEGER NOT NULL DEFAULT 0
+                """
+            )
+
     @staticmethod
     def _parse_uuid(uuid_str: str) -> Any:
         """Parse UUID string to UUID object.
@@ -472,6 +945,45 @@ class SqliteProjectRepository(IProjectRepository):
 
         return UUID(uuid_str)
 
+    def _field_values_from_rows(
+        self, cursor: sqlite3.Cursor, project_id: str, value_rows: list
+    ) -> dict:
+        """Build a project's field_values dict from field_values rows.
+
+        Rows were validated when saved, so they are restored on the
+        trusted path with shared field IDs. TABLE values are read from
+        their row tables.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID string
+            value_rows: Rows from the field_values table
+
+        Returns:
+            Dict[FieldDefinitionId, FieldValue]
+        """
+        field_values = {}
+        for row in value_rows:
+            field_id = FieldDefinitionId.interned(row["field_id"])
+            original_computed_value = row["original_computed_value"]
+            field_values[field_id] = FieldValue.restore(
+                field_id=field_id,
+                value=(
+                    self._table_rows.load_rows(cursor, project_id, field_id.value)
+                    if row["is_table"]
+                    else json.loads(row["value"])
+                ),
+                is_computed=bool(row["is_computed"]),
+                computed_from=row["computed_from"],
+                is_override=bool(row["is_override"]),
+                original_computed_value=(
+                    json.loads(original_computed_value)
+                    if original_computed_value
+                    else None
+                ),
+            )
+        return field_values
+
     def _load_project_from_connection(
         self, conn: sqlite3.Connection, project_id: ProjectId
     ) -> Optional[Project]:
@@ -503,26 +1015,9 @@ class SqliteProjectRepository(IProjectRepository):
         )
         value_rows = cursor.fetchall()
 
-        # Build field_values dict
-        field_values = {}
-        for row in value_rows:
-            field_id = FieldDefinitionId(row["field_id"])
-            value = json.loads(row["value"])
-            original_computed_value = (
-                json.loads(row["original_computed_value"])
-                if row["original_computed_value"]
-                else None
-            )
-
-            field_value = FieldValue(
-                field_id=field_id,
-                value=value,
-                is_computed=bool(row["is_computed"]),
-                computed_from=row["computed_from"],
-                is_override=bool(row["is_override"]),
-                original_computed_value=original_computed_value,
-            )
-            field_values[field_id] = field_value
+        field_values = self._field_values_from_rows(
+            cursor, str(project_id.value), value_rows
+        )
 
         # Build Project
         # Use default app_type_id if not present (backward compatibility)
@@ -534,7 +1029,7 @@ class SqliteProjectRepository(IProjectRepository):
         except (KeyError, IndexError):
             app_type_id = self.DEFAULT_APP_TYPE_ID
 
-        project = Project(
+        return Project.restore(
             id=project_id,
             name=project_row["name"],
             app_type_id=app_type_id,
@@ -544,10 +1039,6 @@ class SqliteProjectRepository(IProjectRepository):
             field_values=field_values,
             description=project_row["description"],
             file_path=project_row["file_path"],
+            created_at=datetime.fromisoformat(project_row["created_at"]),
+            modified_at=datetime.fromisoformat(project_row["modified_at"]),
         )
-
-        # Restore timestamps
-        project.created_at = datetime.fromisoformat(project_row["created_at"])
-        project.modified_at = datetime.fromisoformat(project_row["modified_at"])
-
-        return project
@@ -4,6 +4,8 @@ ADR-026: Search Architecture
 - Read-only search operations
 - Joins schema database (config.db) with project database (project.db)
 - Case-insensitive partial matching on field labels, IDs, and values
+- TABLE field values stored as rows (SqliteTableRowStore) are matched on
+  their cells
 """
 
 import json
@@ -14,6 +16,9 @@ from typing import Any
 from doc_helper.application.search import ISearchRepository
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.infrastructure.persistence.sqlite_base import SqliteConnection
+from doc_helper.infrastructure.persistence.sqlite_table_row_store import (
+    SqliteTableRowStore,
+)
 
 
 class SqliteSearchRepository(ISearchRepository):
@@ -69,6 +74,7 @@ class SqliteSearchRepository(ISearchRepository):
             raise FileNotFoundError(f"Schema database not found: {schema_db_path}")
 
         self._connection = SqliteConnection(self.project_db_path)
+        self._table_rows = SqliteTableRowStore()
 
     def search_fields(
         self,
@@ -88,6 +94,9 @@ class SqliteSearchRepository(ISearchRepository):
         4. Order by match relevance: label matches, then field_id matches, then value matches
         5. Limit results to prevent performance issues
 
+        TABLE fields stored as rows match by value when any cell of their
+        records matches; their current_value is the list of records.
+
         Args:
             project_id: Project ID to search within
             search_term: Search term (case-insensitive partial match)
@@ -131,7 +140,21 @@ class SqliteSearchRepository(ISearchRepository):
                 # Match priority: label > field_id > value
                 search_pattern = f"%{search_term}%"
 
-                query = """
+                # TABLE records live in per-field row tables, not in fv.value
+                table_field_ids = set(self._table_rows.field_ids(cursor))
+                row_matches = [
+                    field_id
+                    for field_id in sorted(table_field_ids)
+                    if self._table_rows.contains_text(
+                        cursor, project_id, field_id, search_pattern
+                    )
+                ]
+                value_match = "fv.value LIKE ? COLLATE NOCASE"
+                if row_matches:
+                    placeholders = ", ".join("?" * len(row_matches))
+                    value_match = f"({value_match} OR fv.field_id IN ({placeholders}))"
+
+                query = f"""
                     WITH search_results AS (
                         SELECT
                             f.id AS field_id,
@@ -143,7 +166,7 @@ class SqliteSearchRepository(ISearchRepository):
                             CASE
                                 WHEN f.label LIKE ? COLLATE NOCASE THEN 'label'
                                 WHEN f.id LIKE ? COLLATE NOCASE THEN 'field_id'
-                                WHEN fv.value LIKE ? COLLATE NOCASE THEN 'value'
+                                WHEN {value_match} THEN 'value'
                                 ELSE 'none'
                             END AS match_type
                         FROM schema_db.fields f
@@ -152,7 +175,7 @@ class SqliteSearchRepository(ISearchRepository):
                         WHERE
                             f.label LIKE ? COLLATE NOCASE
                             OR f.id LIKE ? COLLATE NOCASE
-                            OR fv.value LIKE ? COLLATE NOCASE
+                            OR {value_match}
                     )
                     SELECT * FROM search_results
                     WHERE match_type != 'none'
@@ -172,16 +195,27 @@ class SqliteSearchRepository(ISearchRepository):
                         search_pattern,  # label match check
                         search_pattern,  # field_id match check
                         search_pattern,  # value match check
+                        *row_matches,    # TABLE row match check
                         project_id,      # project filter
                         search_pattern,  # label WHERE clause
                         search_pattern,  # field_id WHERE clause
                         search_pattern,  # value WHERE clause
+                        *row_matches,    # TABLE row WHERE clause
                         limit,           # result limit
                     ),
                 )
 
                 rows = cursor.fetchall()
 
+                # Records of TABLE fields stored as rows (fv.value is JSON null)
+                table_values = {
+                    row["field_id"]: self._table_rows.load_rows(
+                        cursor, project_id, row["field_id"]
+                    )
+                    for row in rows
+                    if row["field_id"] in table_field_ids and row["current_value"] == "null"
+                }
+
                 # Detach schema database
                 cursor.execute("DETACH DATABASE schema_db")
 
@@ -189,7 +223,9 @@ class SqliteSearchRepository(ISearchRepository):
                 results = []
                 for row in rows:
                     # Deserialize value if it's JSON
-                    current_value = self._deserialize_value(row["current_value"])
+                    current_value = table_values.get(
+                        row["field_id"], self._deserialize_value(row["current_value"])
+                    )
 
                     results.append({
                         "field_id": row["field_id"],
@@ -0,0 +1,587 @@
+"""Row storage for TABLE field values.
+
+A TABLE field holds child records (a list of dicts). Instead of encoding
+the whole list into one field_values cell, each TABLE field gets its own
+SQLite table with one row per record and one column per child field:
+
+    "table_rows:<field_id>" (project_id, position, "col:<child_field>", ...)
+
+so a single record can be inserted, updated, moved or deleted without
+rewriting the others, and records can be searched by column value.
+
+Cell encoding (lossless round trip):
+- str, 64-bit int, float other than NaN: stored natively (searchable,
+  indexable)
+- anything else (None, bool, wider ints, NaN, lists, dicts): JSON as a BLOB
+- SQL NULL: the record has no such key
+
+Which fields are TABLE fields is a schema question: callers only store a
+value as rows when its field is a FieldType.TABLE field and
+is_table_value() accepts its shape.
+"""
+
+import json
+import sqlite3
+from typing import Any, Optional
+
+
+class SqliteTableRowStore:
+    """Reads and writes TABLE field records inside a caller's transaction.
+
+    All methods take a cursor so they take part in the repository's
+    transaction. Columns are added on demand as new child field keys
+    appear; per-column indexes are created on first search.
+
+    Example:
+        store = SqliteTableRowStore()
+        with connection as conn:
+            cursor = conn.cursor()
+            store.replace_rows(cursor, "proj-1", "samples", [{"depth": 1.5}])
+            store.find_rows_in(cursor, "proj-1", "samples", "depth", [1.5])
+    """
+
+    TABLE_PREFIX = "table_rows:"
+    COLUMN_PREFIX = "col:"
+
+    # SQLite INTEGER range
+    _MIN_INTEGER = -(2**63)
+    _MAX_INTEGER = 2**63 - 1
+
+    @staticmethod
+    def is_table_value(value: Any) -> bool:
+        """Check if a TABLE field value is a non-empty list of child records.
+
+        Args:
+            value: Field value
+
+        Returns:
+            True if value should be stored as rows
+        """
+        return (
+            isinstance(value, list)
+            and len(value) > 0
+            and all(
+                isinstance(record, dict) and all(isinstance(key, str) for key in record)
+                for record in value
+            )
+        )
+
+    def load_rows(
+        self, cursor: sqlite3.Cursor, project_id: str, field_id: str
+    ) -> list[dict[str, Any]]:
+        """Load a TABLE field's records in order.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+
+        Returns:
+            Child records (empty if the field has none)
+        """
+        if not self._table_exists(cursor, field_id):
+            return []
+        columns = self._columns(cursor, field_id)
+        cursor.execute(
+            f"SELECT {self._row_columns(columns)} FROM {self._table(field_id)} "
+            "WHERE project_id = ? ORDER BY position",
+            (project_id,),
+        )
+        return [
+            self._decode_record(columns, tuple(row)[1:]) for row in cursor.fetchall()
+        ]
+
+    def row_count(self, cursor: sqlite3.Cursor, project_id: str, field_id: str) -> int:
+        """Count a TABLE field's records.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+
+        Returns:
+            Number of records
+        """
+        if not self._table_exists(cursor, field_id):
+            return 0
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {self._table(field_id)} WHERE project_id = ?",
+            (project_id,),
+        )
+        return cursor.fetchone()[0]
+
+    def replace_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        records: list[dict[str, Any]],
+    ) -> int:
+        """Make the stored records equal to records, writing only changed rows.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            records: Child records in order
+
+        Returns:
+            Number of rows written or deleted
+        """
+        columns = self._ensure_columns(cursor, field_id, records)
+        table = self._table(field_id)
+        cursor.execute(
+            f"SELECT {self._row_columns(columns)} FROM {table} WHERE project_id = ?",
+            (project_id,),
+        )
+        stored = {row[0]: tuple(row)[1:] for row in cursor.fetchall()}
+
+        changed = [
+            (position, encoded)
+            for position, encoded in enumerate(
+                self._encode_record(columns, record) for record in records
+            )
+            if not self._same_cells(stored.get(position), encoded)
+        ]
+        if changed:
+            cursor.executemany(
+                self._upsert_sql(field_id, columns),
+                [(project_id, position, *encoded) for position, encoded in changed],
+            )
+
+        stale = sum(1 for position in stored if position >= len(records))
+        if stale:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE project_id = ? AND position >= ?",
+                (project_id, len(records)),
+            )
+        return len(changed) + stale
+
+    def update_row(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        position: int,
+        record: dict[str, Any],
+    ) -> None:
+        """Insert or replace the record at a position.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Row position
+            record: Child record
+        """
+        columns = self._ensure_columns(cursor, field_id, [record])
+        cursor.execute(
+            self._upsert_sql(field_id, columns),
+            (project_id, position, *self._encode_record(columns, record)),
+        )
+
+    def insert_row(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        position: int,
+        record: dict[str, Any],
+    ) -> None:
+        """Insert a record, shifting later rows down by one.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Position of the new row
+            record: Child record
+        """
+        self._ensure_columns(cursor, field_id, [record])
+        self._shift(cursor, field_id, project_id, position, None, 1)
+        self.update_row(cursor, project_id, field_id, position, record)
+
+    def delete_row(
+        self, cursor: sqlite3.Cursor, project_id: str, field_id: str, position: int
+    ) -> bool:
+        """Delete a record, shifting later rows up by one.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            position: Row position
+
+        Returns:
+            True if a row was deleted
+        """
+        if not self._table_exists(cursor, field_id):
+            return False
+        cursor.execute(
+            f"DELETE FROM {self._table(field_id)} WHERE project_id = ? AND position = ?",
+            (project_id, position),
+        )
+        if cursor.rowcount == 0:
+            return False
+        self._shift(cursor, field_id, project_id, position + 1, None, -1)
+        return True
+
+    def move_row(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        from_position: int,
+        to_position: int,
+    ) -> bool:
+        """Move a record to another position, keeping the others in order.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            from_position: Current row position
+            to_position: New row position
+
+        Returns:
+            True if the row exists
+        """
+        if not self._table_exists(cursor, field_id):
+            return False
+        table = self._table(field_id)
+        cursor.execute(
+            f"UPDATE {table} SET position = -1 WHERE project_id = ? AND position = ?",
+            (project_id, from_position),
+        )
+        if cursor.rowcount == 0:
+            return False
+        if from_position < to_position:
+            self._shift(cursor, field_id, project_id, from_position + 1, to_position, -1)
+        elif from_position > to_position:
+            self._shift(cursor, field_id, project_id, to_position, from_position - 1, 1)
+        cursor.execute(
+            f"UPDATE {table} SET position = ? WHERE project_id = ? AND position = -1",
+            (to_position, project_id),
+        )
+        return True
+
+    def find_rows_in(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        column: str,
+        values: list[Any],
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Find records whose column equals any of values, using a column index.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            column: Child field key
+            values: Values to match
+
+        Returns:
+            (position, record) pairs in row order
+        """
+        columns = self._columns(cursor, field_id)
+        if column not in columns or not values:
+            return []
+        table = self._table(field_id)
+        quoted = self._column(column)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS "
+            f"{self._quote(f'idx_{self.TABLE_PREFIX}{field_id}:{column}')} "
+            f"ON {table} (project_id, {quoted})"
+        )
+        rows = []
+        # Stay below SQLite's bound parameter limit
+        for start in range(0, len(values), 500):
+            chunk = [self._encode_cell(value) for value in values[start:start + 500]]
+            cursor.execute(
+                f"SELECT {self._row_columns(columns)} FROM {table} "
+                f"WHERE project_id = ? AND {quoted} IN ({', '.join('?' * len(chunk))})",
+                (project_id, *chunk),
+            )
+            rows.extend(cursor.fetchall())
+        rows.sort(key=lambda row: row[0])
+        return [(row[0], self._decode_record(columns, tuple(row)[1:])) for row in rows]
+
+    def search_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        project_id: str,
+        field_id: str,
+        column: str,
+        folded_text: str,
+        substring: bool,
+        offset: int,
+        limit: int,
+        required_column: Optional[str] = None,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Page through records whose column text matches, in lower(column) order.
+
+        Uses an index on (project_id, lower(column)): a prefix is a range
+        scan of that index; a substring is tested on the index entries in
+        order and the scan stops once the page is filled.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            column: Child field key (text, int or float cells)
+            folded_text: Query, ASCII-lowercased like SQLite's lower()
+            substring: Match anywhere instead of at the start
+            offset: Number of matching records to skip
+            limit: Maximum number of records
+            required_column: Only records that have this child field
+
+        Returns:
+            (position, record) pairs
+        """
+        columns = self._columns(cursor, field_id)
+        if column not in columns or (required_column and required_column not in columns):
+            return []
+        table = self._table(field_id)
+        folded = f"lower({self._column(column)})"
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS "
+            f"{self._quote(f'idx_{self.TABLE_PREFIX}{field_id}:{column}:lower')} "
+            f"ON {table} (project_id, {folded})"
+        )
+        if substring:
+            condition, params = f"instr({folded}, ?) > 0", (folded_text,)
+        else:
+            # U+10FFFF sorts after every character that can follow the prefix
+            condition = f"{folded} >= ? AND {folded} < ?"
+            params = (folded_text, folded_text + "\U0010ffff")
+        if required_column:
+            condition += f" AND {self._column(required_column)} IS NOT NULL"
+        cursor.execute(
+            f"SELECT {self._row_columns(columns)} FROM {table} "
+            f"WHERE project_id = ? AND {condition} "
+            f"AND typeof({self._column(column)}) IN ('text', 'integer', 'real') "
+            f"ORDER BY {folded}, position LIMIT ? OFFSET ?",
+            (project_id, *params, limit, offset),
+        )
+        return [
+            (row[0], self._decode_record(columns, tuple(row)[1:]))
+            for row in cursor.fetchall()
+        ]
+
+    def field_ids(self, cursor: sqlite3.Cursor) -> list[str]:
+        """IDs of the TABLE fields that have row storage.
+
+        Args:
+            cursor: Active database cursor
+
+        Returns:
+            TABLE field IDs (of any project)
+        """
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?",
+            (f"{self.TABLE_PREFIX}%",),
+        )
+        return [row[0][len(self.TABLE_PREFIX):] for row in cursor.fetchall()]
+
+    def contains_text(
+        self, cursor: sqlite3.Cursor, project_id: str, field_id: str, pattern: str
+    ) -> bool:
+        """Check if any cell of a project's records matches a LIKE pattern.
+
+        Matching is case-insensitive for ASCII letters. JSON-encoded cells
+        are matched on their JSON text.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+            pattern: LIKE pattern (e.g. "%clay%")
+
+        Returns:
+            True if some record of the project matches
+        """
+        columns = self._columns(cursor, field_id)
+        if not columns:
+            return False
+        condition = " OR ".join(
+            f"CAST({self._column(column)} AS TEXT) LIKE ? COLLATE NOCASE" for column in columns
+        )
+        cursor.execute(
+            f"SELECT 1 FROM {self._table(field_id)} "
+            f"WHERE project_id = ? AND ({condition}) LIMIT 1",
+            (project_id, *([pattern] * len(columns))),
+        )
+        return cursor.fetchone() is not None
+
+    def delete_field(self, cursor: sqlite3.Cursor, project_id: str, field_id: str) -> None:
+        """Delete all records of one TABLE field.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+            field_id: TABLE field ID
+        """
+        if self._table_exists(cursor, field_id):
+            cursor.execute(
+                f"DELETE FROM {self._table(field_id)} WHERE project_id = ?",
+                (project_id,),
+            )
+
+    def delete_project(self, cursor: sqlite3.Cursor, project_id: str) -> None:
+        """Delete all TABLE field records of a project.
+
+        Args:
+            cursor: Active database cursor
+            project_id: Project ID
+        """
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?",
+            (f"{self.TABLE_PREFIX}%",),
+        )
+        for (table_name,) in cursor.fetchall():
+            cursor.execute(
+                f"DELETE FROM {self._quote(table_name)} WHERE project_id = ?",
+                (project_id,),
+            )
+
+    # -------------------------------------------------------------------------
+    # Internal Methods
+    # -------------------------------------------------------------------------
+
+    def _shift(
+        self,
+        cursor: sqlite3.Cursor,
+        field_id: str,
+        project_id: str,
+        low: int,
+        high: Optional[int],
+        delta: int,
+    ) -> None:
+        """Add delta to the positions in [low, high] (high=None: to the end).
+
+        Positions are a primary key, so rows are first parked at unique
+        negative positions (-new - 2) and then flipped back.
+        """
+        table = self._table(field_id)
+        bound = "" if high is None else " AND position <= ?"
+        params = (project_id, low) if high is None else (project_id, low, high)
+        cursor.execute(
+            f"UPDATE {table} SET position = -(position + ?) - 2 "
+            f"WHERE project_id = ? AND position >= ?{bound}",
+            (delta, *params),
+        )
+        cursor.execute(
+            f"UPDATE {table} SET position = -position - 2 "
+            "WHERE project_id = ? AND position <= -2",
+            (project_id,),
+        )
+
+    def _ensure_columns(
+        self,
+        cursor: sqlite3.Cursor,
+        field_id: str,
+        records: list[dict[str, Any]],
+    ) -> list[str]:
+        """Create the field's table and any missing columns.
+
+        Returns:
+            All child field keys of the table, in column order
+        """
+        table = self._table(field_id)
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "project_id TEXT NOT NULL, "
+            "position INTEGER NOT NULL, "
+            "PRIMARY KEY (project_id, position)"
+            ") WITHOUT ROWID"
+        )
+        columns = self._columns(cursor, field_id)
+        known = set(columns)
+        for record in records:
+            for key in record:
+                if key not in known:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {self._column(key)}")
+                    columns.append(key)
+                    known.add(key)
+        return columns
+
+    def _columns(self, cursor: sqlite3.Cursor, field_id: str) -> list[str]:
+        """Child field keys of the field's table (empty if no table)."""
+        cursor.execute(f"PRAGMA table_info({self._table(field_id)})")
+        prefix = self.COLUMN_PREFIX
+        return [
+            row[1][len(prefix):] for row in cursor.fetchall() if row[1].startswith(prefix)
+        ]
+
+    def _table_exists(self, cursor: sqlite3.Cursor, field_id: str) -> bool:
+        """Check if the field's table exists."""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (f"{self.TABLE_PREFIX}{field_id}",),
+        )
+        return cursor.fetchone() is not None
+
+    def _table(self, field_id: str) -> str:
+        """Quoted table name for a TABLE field."""
+        return self._quote(f"{self.TABLE_PREFIX}{field_id}")
+
+    def _column(self, key: str) -> str:
+        """Quoted column name for a child field key."""
+        return self._quote(f"{self.COLUMN_PREFIX}{key}")
+
+    def _row_columns(self, columns: list[str]) -> str:
+        """Select list of position followed by the quoted child columns."""
+        return ", ".join(["position"] + [self._column(key) for key in columns])
+
+    def _upsert_sql(self, field_id: str, columns: list[str]) -> str:
+        """INSERT OR REPLACE statement for one row of the field's table."""
+        placeholders = ", ".join("?" * (len(columns) + 2))
+        return (
+            f"INSERT OR REPLACE INTO {self._table(field_id)} "
+            f"(project_id, {self._row_columns(columns)}) VALUES ({placeholders})"
+        )
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        """Quote an SQL identifier."""
+        return '"' + identifier.replace('"', '""') + '"'
+
+    @classmethod
+    def _encode_record(cls, columns: list[str], record: dict[str, Any]) -> tuple:
+        """Encode a record into cells, in column order (missing key -> NULL)."""
+        return tuple(
+            cls._encode_cell(record[key]) if key in record else None for key in columns
+        )
+
+    @classmethod
+    def _encode_cell(cls, value: Any) -> Any:
+        """Encode a cell value: native for str/int/float, JSON BLOB otherwise."""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, float):
+            # SQLite stores NaN as NULL, which would drop the key
+            if value == value:
+                return value
+        elif isinstance(value, int) and not isinstance(value, bool):
+            if cls._MIN_INTEGER <= value <= cls._MAX_INTEGER:
+                return value
+        return json.dumps(value).encode("utf-8")
+
+    @staticmethod
+    def _same_cells(stored: Optional[tuple], encoded: tuple) -> bool:
+        """Check if stored cells equal encoded cells, including type (1 vs 1.0)."""
+        return stored is not None and all(
+            a == b and type(a) is type(b) for a, b in zip(stored, encoded)
+        )
+
+    @staticmethod
+    def _decode_record(columns: list[str], row: tuple) -> dict[str, Any]:
+        """Decode a row of cells into a record (NULL -> key absent)."""
+        record = {}
+        for key, cell in zip(columns, row):
+            if cell is None:
+                continue
+            record[key] = json.loads(cell) if isinstance(cell, bytes) else cell
+        return record
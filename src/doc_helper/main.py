@@ -17,11 +17,25 @@ V2 PLATFORM INTEGRATION:
 - AppTypes discovered from app_types/ directory at startup
 - Schema loading routed through AppType implementation
 - Projects associated with app_type_id for multi-app-type support
+
+STARTUP PERFORMANCE:
+- Document adapters (python-docx, openpyxl, PyMuPDF) are NOT imported at
+  module top; they are registered lazily by import path and only imported
+  and constructed on first resolve through the Container
+- configure_container(lazy=False) restores eager construction of every
+  lazily registered singleton
+- The fleet migration job is registered lazily too; it only runs after the
+  first window is shown, in a background thread, and only when the shipped
+  schema (or the declared renames) changed since its last finished run
 """
 
+import logging
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from doc_helper.application.commands.create_project_command import (
@@ -35,6 +49,7 @@ from doc_helper.application.commands.import_project_command import (
 )
 from doc_helper.application.commands.save_project_command import SaveProjectCommand
 from doc_helper.application.commands.update_field_command import UpdateFieldCommand
+from doc_helper.application.commands.update_table_row_command import UpdateTableRowCommand
 from doc_helper.application.queries.get_field_history_query import (
     GetFieldHistoryQuery,
 )
@@ -52,17 +67,25 @@ from doc_helper.application.services.translation_service import TranslationAppli
 from doc_helper.application.services.validation_service import ValidationService
 from doc_helper.application.usecases.document_usecases import DocumentUseCases
 from doc_helper.application.usecases.project_usecases import ProjectUseCases
+from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+    EvaluateProjectRuntimeUseCase,
+)
+from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 from doc_helper.application.usecases.welcome_usecases import WelcomeUseCases
 from doc_helper.domain.document.document_format import DocumentFormat
 from doc_helper.domain.override.repositories import IOverrideRepository
 from doc_helper.domain.project.field_history_repository import IFieldHistoryRepository
 from doc_helper.application.search import ISearchRepository
+from doc_helper.application.lookup import ILookupSourceFactory
 from doc_helper.infrastructure.persistence.sqlite_override_repository import (
     SqliteOverrideRepository,
 )
 from doc_helper.infrastructure.persistence.sqlite_field_history_repository import (
     SqliteFieldHistoryRepository,
 )
+from doc_helper.infrastructure.persistence.sqlite_lookup_source import (
+    SqliteLookupSourceFactory,
+)
 from doc_helper.infrastructure.persistence.sqlite_search_repository import (
     SqliteSearchRepository,
 )
@@ -94,7 +117,10 @@ from doc_helper.domain.document.transformers import (
     YesNoTransformer,
 )
 from doc_helper.domain.common.translation import ITranslationService
-from doc_helper.domain.project.project_repository import IProjectRepository
+from doc_helper.domain.project.project_repository import (
+    IProjectRepository,
+    ITableRowRepository,
+)
 from doc_helper.domain.schema.schema_repository import ISchemaRepository
 from doc_helper.infrastructure.di.container import (
     Container,
@@ -105,13 +131,6 @@ from doc_helper.infrastructure.i18n.json_translation_service import (
     JsonTranslationService,
 )
 from doc_helper.presentation.adapters.qt_translation_adapter import QtTranslationAdapter
-from doc_helper.infrastructure.document.excel_document_adapter import (
-    ExcelDocumentAdapter,
-)
-from doc_helper.infrastructure.document.pdf_document_adapter import PdfDocumentAdapter
-from doc_helper.infrastructure.document.word_document_adapter import (
-    WordDocumentAdapter,
-)
 from doc_helper.infrastructure.persistence.sqlite_project_repository import (
     SqliteProjectRepository,
 )
@@ -121,7 +140,7 @@ from doc_helper.infrastructure.persistence.sqlite.repositories.schema_repository
 from doc_helper.infrastructure.persistence.sqlite.schema_bootstrap import (
     bootstrap_schema_database,
 )
-from doc_helper.presentation.viewmodels.project_viewmodel import ProjectViewModel
+from doc_helper.presentation.factories import FieldWidgetFactory
 from doc_helper.presentation.viewmodels.welcome_viewmodel import WelcomeViewModel
 from doc_helper.presentation.views.welcome_view import WelcomeView
 from doc_helper.presentation.adapters.adapter_registration import (
@@ -132,6 +151,7 @@ from doc_helper.presentation.adapters.adapter_registration import (
 from doc_helper.platform.discovery.app_type_discovery_service import (
     AppTypeDiscoveryService,
 )
+from doc_helper.platform.discovery.manifest_index import ManifestIndex
 from doc_helper.platform.platform_services import PlatformServices
 from doc_helper.platform.registry.app_type_registry import AppTypeRegistry
 from doc_helper.platform.routing.app_type_router import AppTypeRouter, IAppTypeRouter
@@ -143,17 +163,164 @@ from doc_helper.app_types.soil_investigation import (
 )
 from doc_helper.app_types.schema_designer import SchemaDesignerAppType
 
+# Lazily registered document adapters (import path -> factory below)
+_WORD_ADAPTER = "doc_helper.infrastructure.document.word_document_adapter.WordDocumentAdapter"
+_EXCEL_ADAPTER = "doc_helper.infrastructure.document.excel_document_adapter.ExcelDocumentAdapter"
+_PDF_ADAPTER = "doc_helper.infrastructure.document.pdf_document_adapter.PdfDocumentAdapter"
+_FLEET_MIGRATION_JOB = (
+    "doc_helper.infrastructure.persistence.fleet_migration_job.FleetMigrationJob"
+)
+
+# Translation files ship at the repository root, next to src/
+TRANSLATIONS_DIR = Path(__file__).resolve().parents[2] / "translations"
+
+logger = logging.getLogger(__name__)
+
+
+def _create_word_adapter() -> object:
+    """Import and construct the Word adapter (pulls in python-docx)."""
+    from doc_helper.infrastructure.document.word_document_adapter import (
+        WordDocumentAdapter,
+    )
+
+    return WordDocumentAdapter()
+
+
+def _create_excel_adapter() -> object:
+    """Import and construct the Excel adapter (pulls in openpyxl)."""
+    from doc_helper.infrastructure.document.excel_document_adapter import (
+        ExcelDocumentAdapter,
+    )
+
+    return ExcelDocumentAdapter()
+
+
+def _create_pdf_adapter() -> object:
+    """Import and construct the PDF adapter (PyMuPDF is imported per call)."""
+    from doc_helper.infrastructure.document.pdf_document_adapter import (
+        PdfDocumentAdapter,
+    )
+
+    return PdfDocumentAdapter()
+
+
+def _create_document_generation_service(
+    container: Container,
+) -> DocumentGenerationService:
+    """Construct DocumentGenerationService, resolving adapters on demand."""
+    from doc_helper.infrastructure.document.excel_document_adapter import (
+        ExcelDocumentAdapter,
+    )
+    from doc_helper.infrastructure.document.pdf_document_adapter import (
+        PdfDocumentAdapter,
+    )
+    from doc_helper.infrastructure.document.word_document_adapter import (
+        WordDocumentAdapter,
+    )
+
+    return DocumentGenerationService(
+        adapters={
+            DocumentFormat.WORD.value: container.resolve(WordDocumentAdapter),
+            DocumentFormat.EXCEL.value: container.resolve(ExcelDocumentAdapter),
+            DocumentFormat.PDF.value: container.resolve(PdfDocumentAdapter),
+        },
+        transformer_registry=container.resolve(TransformerRegistry),
+    )
+
 
-def configure_container() -> Container:
+def _create_fleet_migration_job(
+    projects_db_path: Path,
+    schema_repository: ISchemaRepository,
+    checkpoint_path: Path,
+) -> object:
+    """Construct the job that re-validates stored projects against the schema."""
+    from doc_helper.infrastructure.persistence.fleet_migration_job import (
+        FleetMigrationJob,
+    )
+
+    entities_result = schema_repository.get_all()
+    entities = entities_result.value if entities_result.is_success() else ()
+    return FleetMigrationJob(
+        repository=SqliteProjectRepository(
+            db_path=projects_db_path, schema_repository=schema_repository
+        ),
+        entity_definitions={entity.id.value: entity for entity in entities},
+        checkpoint_path=checkpoint_path,
+        app_type_id=DEFAULT_APP_TYPE_ID,
+    )
+
+
+def _run_fleet_migration(job) -> None:
+    """Run the fleet migration job if the schema changed; log failures.
+
+    Args:
+        job: FleetMigrationJob
+    """
+    try:
+        if not job.needs_migration():
+            return
+        result = job.run()
+    except Exception:
+        logger.exception("Fleet migration failed")
+        return
+    if result.is_failure():
+        logger.error("Fleet migration failed: %s", result.error)
+        return
+    logger.info(
+        "Fleet migration finished: %d projects, %d need attention (see %s)",
+        result.value.total_projects,
+        len(result.value.invalid_projects) + len(result.value.orphaned_project_ids),
+        job.report_path,
+    )
+
+
+def start_fleet_migration(container: Container) -> Optional[threading.Thread]:
+    """Start the fleet migration job in a background thread.
+
+    The job is checkpointed, so a run cut short when the application exits
+    resumes on the next start.
+
+    Args:
+        container: Configured DI container
+
+    Returns:
+        The started thread, or None if the job could not be created
+    """
+    from doc_helper.infrastructure.persistence.fleet_migration_job import (
+        FleetMigrationJob,
+    )
+
+    try:
+        job = container.resolve(FleetMigrationJob)
+    except Exception:
+        logger.exception("Fleet migration job could not be created")
+        return None
+    thread = threading.Thread(
+        target=_run_fleet_migration, args=(job,), name="fleet-migration", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def configure_container(lazy: bool = True) -> Container:
     """Configure the dependency injection container.
 
     This is the single composition root for the entire application.
 
+    Args:
+        lazy: If True (default), heavy document adapters are imported and
+            constructed on first resolve. If False, every lazily registered
+            singleton is built before returning (eager startup).
+
     Returns:
         Configured container with all services registered
     """
     container = Container()
 
+    # Application data directory: the project database and the AppType
+    # manifest index live side by side
+    data_dir = Path("data")
+
     # ========================================================================
     # PLATFORM: AppType Discovery and Registry (v2 Architecture)
     # ========================================================================
@@ -166,7 +333,11 @@ def configure_container() -> Container:
     # Note: For v1, we also manually register SoilInvestigationAppType
     # to ensure it's available even if discovery doesn't find manifest
     app_types_dir = Path(__file__).parent / "app_types"
-    discovery_service = AppTypeDiscoveryService()
+    # Parsed manifests are cached in an index so unchanged AppTypes are not
+    # re-parsed on every launch
+    discovery_service = AppTypeDiscoveryService(
+        index=ManifestIndex(data_dir / "app_types_index.json"),
+    )
     discovery_result = discovery_service.discover(app_types_dir)
 
     # Register discovered AppTypes
@@ -204,10 +375,27 @@ def configure_container() -> Container:
     # Note: v1 uses a single database file for all projects,
     # but the repository instance is scoped to ensure proper lifecycle management.
     # New instance created on begin_scope(), cleared on end_scope().
-    projects_db_path = Path("data/projects.db")
+    projects_db_path = data_dir / "projects.db"
     container.register_scoped(
         IProjectRepository,
-        lambda: SqliteProjectRepository(db_path=projects_db_path),
+        lambda: SqliteProjectRepository(
+            db_path=projects_db_path, schema_repository=schema_repository
+        ),
+    )
+    # Row-level TABLE edits go to the same repository instance
+    container.register_scoped(
+        ITableRowRepository,
+        lambda: container.resolve(IProjectRepository),
+    )
+
+    # Fleet migration job - re-validates all stored projects against the
+    # shipped config.db. Started in the background after the first window is
+    # shown, and only does work when the schema changed (see main()).
+    container.register_lazy(
+        _FLEET_MIGRATION_JOB,
+        lambda: _create_fleet_migration_job(
+            projects_db_path, schema_repository, data_dir / "fleet_migration.json"
+        ),
     )
 
     # Override repository - SQLite persistent storage
@@ -231,6 +419,15 @@ def configure_container() -> Container:
         lambda: SqliteSearchRepository(db_path=projects_db_path),
     )
 
+    # LOOKUP option sources - records of the referenced entity are the rows
+    # of the project's TABLE field whose child entity is the LOOKUP target
+    container.register_singleton(
+        ILookupSourceFactory,
+        lambda: SqliteLookupSourceFactory(
+            db_path=projects_db_path, schema_repository=schema_repository
+        ),
+    )
+
     # ========================================================================
     # INFRASTRUCTURE: Import/Export Services (Singleton - ADR-039)
     # ========================================================================
@@ -252,27 +449,20 @@ def configure_container() -> Container:
     # ========================================================================
 
     # Translation service - loads translations from JSON files
-    translations_dir = Path("translations")
     container.register_singleton(
         ITranslationService,
-        lambda: JsonTranslationService(translations_dir=translations_dir),
+        lambda: JsonTranslationService(translations_dir=TRANSLATIONS_DIR),
     )
 
     # ========================================================================
-    # INFRASTRUCTURE: Document Adapters (Singleton)
+    # INFRASTRUCTURE: Document Adapters (Singleton - Lazy)
     # ========================================================================
 
-    # Word adapter
-    word_adapter = WordDocumentAdapter()
-    container.register_instance(WordDocumentAdapter, word_adapter)
-
-    # Excel adapter
-    excel_adapter = ExcelDocumentAdapter()
-    container.register_instance(ExcelDocumentAdapter, excel_adapter)
-
-    # PDF adapter
-    pdf_adapter = PdfDocumentAdapter()
-    container.register_instance(PdfDocumentAdapter, pdf_adapter)
+    # Registered by import path: python-docx / openpyxl are only loaded when
+    # a document is first generated, not before the welcome window appears
+    container.register_lazy(_WORD_ADAPTER, _create_word_adapter)
+    container.register_lazy(_EXCEL_ADAPTER, _create_excel_adapter)
+    container.register_lazy(_PDF_ADAPTER, _create_pdf_adapter)
 
     # ========================================================================
     # DOMAIN: Transformer Registry (Singleton)
@@ -364,14 +554,7 @@ def configure_container() -> Container:
     # Document generation service
     container.register_singleton(
         DocumentGenerationService,
-        lambda: DocumentGenerationService(
-            adapters={
-                DocumentFormat.WORD.value: container.resolve(WordDocumentAdapter),
-                DocumentFormat.EXCEL.value: container.resolve(ExcelDocumentAdapter),
-                DocumentFormat.PDF.value: container.resolve(PdfDocumentAdapter),
-            },
-            transformer_registry=container.resolve(TransformerRegistry),
-        ),
+        lambda: _create_document_generation_service(container),
     )
 
     # ========================================================================
@@ -401,6 +584,13 @@ def configure_container() -> Container:
         ),
     )
 
+    container.register_singleton(
+        UpdateTableRowCommand,
+        lambda: UpdateTableRowCommand(
+            table_row_repository=container.resolve(ITableRowRepository),
+        ),
+    )
+
     # Import/Export commands (ADR-039)
     container.register_singleton(
         ExportProjectCommand,
@@ -418,7 +608,7 @@ def configure_container() -> Container:
             schema_repository=container.resolve(ISchemaRepository),
             project_importer=container.resolve(JsonProjectImporter),
             validation_service=container.resolve(ValidationService),
-            app_type_registry=container.resolve(IAppTypeRegistry),
+            app_type_registry=container.resolve(AppTypeRegistry),
         ),
     )
 
@@ -521,6 +711,7 @@ def configure_container() -> Container:
             import_project_command=container.resolve(ImportProjectCommand),
             search_fields_query=container.resolve(SearchFieldsQuery),
             get_field_history_query=container.resolve(GetFieldHistoryQuery),
+            update_table_row_command=container.resolve(UpdateTableRowCommand),
         ),
     )
 
@@ -529,10 +720,30 @@ def configure_container() -> Container:
     from doc_helper.application.commands.generate_document_command import (
         GenerateDocumentCommand,
     )
+    # Project-level runtime evaluation (Phase R-7): the one evaluation behind
+    # the pre-generation checklist and document generation
+    container.register_singleton(
+        SchemaUseCases,
+        lambda: SchemaUseCases(
+            schema_repository=container.resolve(ISchemaRepository),
+            relationship_repository=None,
+            translation_service=container.resolve(ITranslationService),
+        ),
+    )
+    container.register_singleton(
+        EvaluateProjectRuntimeUseCase,
+        lambda: EvaluateProjectRuntimeUseCase(
+            schema_usecases=container.resolve(SchemaUseCases),
+        ),
+    )
     container.register_singleton(
         GenerateDocumentCommand,
         lambda: GenerateDocumentCommand(
-            document_generation_service=container.resolve(DocumentGenerationService),
+            project_repository=container.resolve(IProjectRepository),
+            save_command=container.resolve(SaveProjectCommand),
+            document_service=container.resolve(DocumentGenerationService),
+            override_service=container.resolve(OverrideService),
+            project_runtime_use_case=container.resolve(EvaluateProjectRuntimeUseCase),
         ),
     )
     container.register_singleton(
@@ -542,6 +753,15 @@ def configure_container() -> Container:
         ),
     )
 
+    # Field widget factory - LOOKUP widgets page their options through
+    # LookupSourceService (and its TypeAheadCompleter) over the sources above
+    container.register_singleton(
+        FieldWidgetFactory,
+        lambda: FieldWidgetFactory(
+            lookup_source_factory=container.resolve(ILookupSourceFactory),
+        ),
+    )
+
     # WelcomeViewModel (singleton - no project context, v2 PHASE 4: AppType-aware)
     # Note: tool_app_types captured from PLATFORM section above
     # Rule 0: ViewModel depends ONLY on use-case, not commands/queries
@@ -563,6 +783,9 @@ def configure_container() -> Container:
     # - OverrideViewModel (scoped)
     # - DocumentGenerationViewModel (scoped)
 
+    if not lazy:
+        container.warm_up()
+
     return container
 
 
@@ -583,18 +806,16 @@ def create_app(container: Container) -> QApplication:
     return app
 
 
-def main() -> int:
-    """Application entry point.
+def show_welcome_window(container: Container, app: QApplication) -> WelcomeView:
+    """Register the Qt translation adapter and show the welcome window.
+
+    Args:
+        container: Configured DI container
+        app: Running QApplication
 
     Returns:
-        Exit code (0 = success, non-zero = error)
+        The shown WelcomeView (first window)
     """
-    # Configure dependency injection
-    container = configure_container()
-
-    # Create Qt application
-    app = create_app(container)
-
     # ========================================================================
     # PRESENTATION: Qt Translation Adapter (Singleton - requires QApplication)
     # ========================================================================
@@ -615,6 +836,29 @@ def main() -> int:
     welcome_view = WelcomeView(parent=None, viewmodel=welcome_vm)
     welcome_view.show()
 
+    return welcome_view
+
+
+def main() -> int:
+    """Application entry point.
+
+    Returns:
+        Exit code (0 = success, non-zero = error)
+    """
+    # Configure dependency injection (document adapters load on first use)
+    container = configure_container()
+
+    # Create Qt application
+    app = create_app(container)
+
+    # Keep a reference so the window is not garbage collected
+    welcome_view = show_welcome_window(container, app)  # noqa: F841
+
+    # Once the event loop runs, bring stored projects up to date with the
+    # shipped schema in the background; the report
+    # (data/fleet_migration.report.json) lists projects that need attention
+    QTimer.singleShot(0, lambda: start_fleet_migration(container))
+
     # Start event loop
     exit_code = app.exec()
 
@@ -3,6 +3,7 @@
 This package handles discovering and parsing AppType modules:
 - ManifestParser: Parse and validate manifest.json files
 - AppTypeDiscoveryService: Scan app_types/ for valid AppType packages
+- ManifestIndex: Cache parsed manifests across launches
 
 Discovery Process (ADR-V2-002):
 1. Scan app_types/ directory for subdirectories
@@ -14,6 +15,7 @@ Discovery Process (ADR-V2-002):
 from doc_helper.platform.discovery.app_type_discovery_service import (
     AppTypeDiscoveryService,
 )
+from doc_helper.platform.discovery.manifest_index import ManifestIndex
 from doc_helper.platform.discovery.manifest_parser import (
     ManifestParseError,
     ManifestParser,
@@ -23,4 +25,5 @@ __all__ = [
     "ManifestParser",
     "ManifestParseError",
     "AppTypeDiscoveryService",
+    "ManifestIndex",
 ]
@@ -10,6 +10,7 @@ from typing import Optional
 
 from doc_helper.domain.common.result import Failure, Result, Success
 from doc_helper.domain.common.value_object import ValueObject
+from doc_helper.platform.discovery.manifest_index import ManifestIndex
 from doc_helper.platform.discovery.manifest_parser import (
     ManifestParseError,
     ManifestParser,
@@ -76,6 +77,12 @@ class AppTypeDiscoveryService:
             for error in result.errors:
                 print(f"Error: {error.message}")
 
+    Manifest Index (optional):
+        When constructed with a ManifestIndex, AppTypes whose directory and
+        manifest.json are unchanged since the last launch are loaded from
+        the index without reading or re-validating the manifest. Only new
+        or changed manifests are parsed, and the index is saved afterwards.
+
     Phase 1 Behavior:
         In Phase 1, app_types/ is empty (no AppTypes migrated yet).
         The discovery service handles this gracefully, returning an
@@ -84,13 +91,19 @@ class AppTypeDiscoveryService:
 
     MANIFEST_FILENAME = "manifest.json"
 
-    def __init__(self, parser: Optional[ManifestParser] = None) -> None:
+    def __init__(
+        self,
+        parser: Optional[ManifestParser] = None,
+        index: Optional[ManifestIndex] = None,
+    ) -> None:
         """Initialize discovery service.
 
         Args:
             parser: ManifestParser instance (default: create new)
+            index: Optional ManifestIndex caching parsed manifests across runs
         """
         self._parser = parser or ManifestParser()
+        self._index = index
 
     def discover(self, app_types_path: Path) -> DiscoveryResult:
         """Discover all AppTypes in the given directory.
@@ -108,6 +121,7 @@ class AppTypeDiscoveryService:
         """
         manifests: list[ParsedManifest] = []
         errors: list[ManifestParseError] = []
+        indexed_keys: set[str] = set()
 
         # Handle non-existent directory gracefully
         if not app_types_path.exists():
@@ -135,6 +149,15 @@ class AppTypeDiscoveryService:
                 logger.debug(f"No manifest.json in {item.name}, skipping")
                 continue
 
+            # Unchanged AppTypes are served from the index without parsing
+            if self._index is not None:
+                cached = self._index.lookup(item.name, item, manifest_path)
+                if cached is not None:
+                    logger.debug(f"Discovered (indexed): {cached.metadata.name}")
+                    manifests.append(cached)
+                    indexed_keys.add(item.name)
+                    continue
+
             # Parse manifest
             logger.info(f"Discovering AppType: {item.name}")
             result = self._parser.parse(manifest_path)
@@ -146,11 +169,18 @@ class AppTypeDiscoveryService:
                     f"(v{manifest.metadata.version})"
                 )
                 manifests.append(manifest)
+                if self._index is not None:
+                    self._index.store(item.name, item, manifest_path, manifest)
+                    indexed_keys.add(item.name)
             else:
                 error = result.error
                 logger.warning(f"Failed to parse manifest in {item.name}: {error.message}")
                 errors.append(error)
 
+        if self._index is not None:
+            self._index.retain(indexed_keys)
+            self._index.save()
+
         logger.info(
             f"Discovery complete: {len(manifests)} AppTypes found, "
             f"{len(errors)} errors"
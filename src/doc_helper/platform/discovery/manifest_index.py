@@ -0,0 +1,291 @@
+"""Persistent index of discovered AppType manifests.
+
+Caches ParsedManifest results between launches so unchanged AppTypes
+skip manifest parsing and validation at startup.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from doc_helper.app_types.contracts.app_type_metadata import AppTypeKind, AppTypeMetadata
+from doc_helper.domain.common.value_object import ValueObject
+from doc_helper.platform.discovery.manifest_parser import (
+    ManifestCapabilities,
+    ManifestSchema,
+    ManifestTemplates,
+    ParsedManifest,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ManifestFingerprint(ValueObject):
+    """Cheap change-detection key for one AppType directory.
+
+    Attributes:
+        dir_mtime_ns: Modification time of the AppType directory
+        manifest_mtime_ns: Modification time of manifest.json
+        manifest_size: Size of manifest.json in bytes
+    """
+
+    dir_mtime_ns: int
+    manifest_mtime_ns: int
+    manifest_size: int
+
+    @staticmethod
+    def of(app_type_dir: Path, manifest_path: Path) -> "ManifestFingerprint":
+        """Build fingerprint from filesystem metadata (two stat calls)."""
+        dir_stat = app_type_dir.stat()
+        manifest_stat = manifest_path.stat()
+        return ManifestFingerprint(
+            dir_mtime_ns=dir_stat.st_mtime_ns,
+            manifest_mtime_ns=manifest_stat.st_mtime_ns,
+            manifest_size=manifest_stat.st_size,
+        )
+
+
+class ManifestIndex:
+    """Single-file index of parsed manifests keyed by fingerprint and hash.
+
+    Each entry records the directory/manifest fingerprint, the SHA-256 of the
+    manifest bytes and the parsed manifest fields. On lookup:
+    - Fingerprint unchanged → cached manifest returned (no read, no parse)
+    - Fingerprint changed but hash unchanged → cached manifest returned
+      (e.g. directory touched or file rewritten with the same content)
+    - Hash changed or no entry → caller must parse and validate
+
+    Only successfully parsed manifests are indexed; failures are always
+    re-parsed so their errors keep being reported.
+
+    Index File Format:
+        {
+            "version": 1,
+            "entries": {
+                "soil_investigation": {
+                    "dir_mtime_ns": ..., "manifest_mtime_ns": ...,
+                    "manifest_size": ..., "sha256": "...",
+                    "manifest": {...}
+                }
+            }
+        }
+
+    Usage:
+        index = ManifestIndex(Path("data/app_types_index.json"))
+        cached = index.lookup("soil_investigation", app_type_dir, manifest_path)
+        if cached is None:
+            ...  # parse, then index.store(...)
+        index.save()
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, index_path: Path) -> None:
+        """Initialize index and load it from disk if present.
+
+        Args:
+            index_path: Path to the index JSON file
+        """
+        self._index_path = Path(index_path)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def index_path(self) -> Path:
+        """Path to the index file."""
+        return self._index_path
+
+    def _load(self) -> None:
+        """Load index file; a missing or corrupt index is treated as empty."""
+        if not self._index_path.exists():
+            return
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable manifest index {self._index_path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != self.FORMAT_VERSION:
+            logger.info("Manifest index format changed, rebuilding")
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        """Compute SHA-256 of a file's bytes."""
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def lookup(
+        self,
+        key: str,
+        app_type_dir: Path,
+        manifest_path: Path,
+    ) -> Optional[ParsedManifest]:
+        """Return cached manifest if the AppType is unchanged.
+
+        Args:
+            key: AppType directory name
+            app_type_dir: AppType directory
+            manifest_path: Path to its manifest.json
+
+        Returns:
+            Cached ParsedManifest, or None if the manifest must be parsed
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            fingerprint = ManifestFingerprint.of(app_type_dir, manifest_path)
+            if not self._fingerprint_matches(entry, fingerprint):
+                if entry.get("sha256") != self.hash_file(manifest_path):
+                    return None
+                # Same content, new timestamps - refresh the fingerprint
+                self._entries[key] = {**entry, **self._fingerprint_dict(fingerprint)}
+                self._dirty = True
+            return self._manifest_from_dict(entry["manifest"], manifest_path)
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Manifest index entry for {key} unusable: {e}")
+            return None
+
+    def store(
+        self,
+        key: str,
+        app_type_dir: Path,
+        manifest_path: Path,
+        manifest: ParsedManifest,
+    ) -> None:
+        """Record a freshly parsed manifest.
+
+        Args:
+            key: AppType directory name
+            app_type_dir: AppType directory
+            manifest_path: Path to its manifest.json
+            manifest: Successfully parsed manifest
+        """
+        try:
+            fingerprint = ManifestFingerprint.of(app_type_dir, manifest_path)
+            sha256 = self.hash_file(manifest_path)
+        except OSError as e:
+            logger.debug(f"Could not index manifest for {key}: {e}")
+            return
+
+        self._entries[key] = {
+            **self._fingerprint_dict(fingerprint),
+            "sha256": sha256,
+            "manifest": self._manifest_to_dict(manifest),
+        }
+        self._dirty = True
+
+    def retain(self, keys: set[str]) -> None:
+        """Drop entries for AppTypes that are no longer present or valid.
+
+        Args:
+            keys: Directory names to keep
+        """
+        stale = set(self._entries) - keys
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to disk if it changed (atomic replace)."""
+        if not self._dirty:
+            return
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.FORMAT_VERSION, "entries": self._entries},
+                    f,
+                    indent=2,
+                    sort_keys=True,
+                )
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
+        except OSError as e:
+            # The index is only a cache - discovery still succeeded
+            logger.warning(f"Could not write manifest index {self._index_path}: {e}")
+
+    @staticmethod
+    def _fingerprint_matches(entry: dict[str, Any], fingerprint: ManifestFingerprint) -> bool:
+        """Check whether an entry was recorded with the given fingerprint."""
+        return (
+            entry.get("dir_mtime_ns") == fingerprint.dir_mtime_ns
+            and entry.get("manifest_mtime_ns") == fingerprint.manifest_mtime_ns
+            and entry.get("manifest_size") == fingerprint.manifest_size
+        )
+
+    @staticmethod
+    def _fingerprint_dict(fingerprint: ManifestFingerprint) -> dict[str, int]:
+        """Serialize fingerprint fields for the index file."""
+        return {
+            "dir_mtime_ns": fingerprint.dir_mtime_ns,
+            "manifest_mtime_ns": fingerprint.manifest_mtime_ns,
+            "manifest_size": fingerprint.manifest_size,
+        }
+
+    @staticmethod
+    def _manifest_to_dict(manifest: ParsedManifest) -> dict[str, Any]:
+        """Serialize a ParsedManifest for the index file."""
+        metadata = manifest.metadata
+        return {
+            "metadata": {
+                "app_type_id": metadata.app_type_id,
+                "name": metadata.name,
+                "version": metadata.version,
+                "kind": metadata.kind.value,
+                "description": metadata.description,
+                "icon_path": metadata.icon_path,
+            },
+            "schema": {
+                "source": manifest.schema.source,
+                "schema_type": manifest.schema.schema_type,
+            },
+            "templates": {
+                "word": list(manifest.templates.word),
+                "excel": list(manifest.templates.excel),
+                "default": manifest.templates.default,
+            },
+            "capabilities": {
+                "supports_pdf_export": manifest.capabilities.supports_pdf_export,
+                "supports_excel_export": manifest.capabilities.supports_excel_export,
+                "supports_word_export": manifest.capabilities.supports_word_export,
+            },
+        }
+
+    @staticmethod
+    def _manifest_from_dict(data: dict[str, Any], manifest_path: Path) -> ParsedManifest:
+        """Rebuild a ParsedManifest from an index entry (no JSON re-parse)."""
+        metadata = data["metadata"]
+        templates = data["templates"]
+        return ParsedManifest(
+            metadata=AppTypeMetadata(
+                app_type_id=metadata["app_type_id"],
+                name=metadata["name"],
+                version=metadata["version"],
+                kind=AppTypeKind(metadata["kind"]),
+                description=metadata["description"],
+                icon_path=metadata["icon_path"],
+            ),
+            schema=ManifestSchema(**data["schema"]),
+            templates=ManifestTemplates(
+                word=tuple(templates["word"]),
+                excel=tuple(templates["excel"]),
+                default=templates["default"],
+            ),
+            capabilities=ManifestCapabilities(**data["capabilities"]),
+            manifest_path=manifest_path,
+        )
@@ -9,6 +9,8 @@ RULES (AGENT_RULES.md Section 3-4, ADR-012):
 from typing import Dict, Optional, Type
 
 from doc_helper.application.dto import FieldDefinitionDTO
+from doc_helper.application.lookup import ILookupSourceFactory
+from doc_helper.application.services.lookup_source_service import LookupSourceService
 from doc_helper.presentation.widgets.calculated_widget import CalculatedFieldWidget
 from doc_helper.presentation.widgets.checkbox_widget import CheckboxFieldWidget
 from doc_helper.presentation.widgets.date_widget import DateFieldWidget
@@ -36,14 +38,23 @@ class FieldWidgetFactory:
     - Can register custom widget types
     - Plugin system for new field types
 
+    LOOKUP widgets created for a project get a LookupSourceService over the
+    source that lookup_source_factory creates for the field; without a
+    factory (or a source) they fall back to fixed lookup options.
+
     Example:
-        factory = FieldWidgetFactory()
-        widget = factory.create_widget(field_definition_dto)
+        factory = FieldWidgetFactory(lookup_source_factory)
+        widget = factory.create_widget(field_definition_dto, project_id)
         widget.set_value(initial_value)
     """
 
-    def __init__(self) -> None:
-        """Initialize factory with default widget type registry."""
+    def __init__(self, lookup_source_factory: Optional[ILookupSourceFactory] = None) -> None:
+        """Initialize factory with default widget type registry.
+
+        Args:
+            lookup_source_factory: Creates LOOKUP option sources (optional)
+        """
+        self._lookup_source_factory = lookup_source_factory
         # Registry mapping field type strings to widget classes
         self._registry: Dict[str, Type[IFieldWidget]] = {}
 
@@ -80,12 +91,13 @@ class FieldWidgetFactory:
         self._registry[field_type.lower()] = widget_class
 
     def create_widget(
-        self, field_definition: FieldDefinitionDTO
+        self, field_definition: FieldDefinitionDTO, project_id: Optional[str] = None
     ) -> Optional[IFieldWidget]:
         """Create a widget for the given field definition.
 
         Args:
             field_definition: Field definition DTO (NOT domain object)
+            project_id: Project being edited (needed for LOOKUP option sources)
 
         Returns:
             Widget instance or None if field type not recognized
@@ -103,7 +115,27 @@ class FieldWidgetFactory:
             return None
 
         widget_class = self._registry[field_type]
-        return widget_class(field_definition)
+        widget = widget_class(field_definition)
+        if isinstance(widget, LookupFieldWidget) and project_id is not None:
+            widget.set_lookup_source(self._create_lookup_source(field_definition, project_id))
+        return widget
+
+    def _create_lookup_source(
+        self, field_definition: FieldDefinitionDTO, project_id: str
+    ) -> Optional[LookupSourceService]:
+        """Paged option source of a LOOKUP field, or None if it has none."""
+        if (
+            self._lookup_source_factory is None
+            or field_definition.lookup_entity_id is None
+            or field_definition.lookup_display_field is None
+        ):
+            return None
+        source = self._lookup_source_factory.create_source(
+            project_id,
+            field_definition.lookup_entity_id,
+            field_definition.lookup_display_field,
+        )
+        return LookupSourceService(source) if source is not None else None
 
     def supports_field_type(self, field_type: str) -> bool:
         """Check if a field type is supported.
@@ -0,0 +1,20 @@
+"""Qt event loop helpers for deferred ViewModel notifications."""
+
+from typing import Callable
+
+from PyQt6.QtCore import QTimer
+
+
+def post_to_event_loop(callback: Callable[[], None]) -> None:
+    """Run callback on the next Qt event loop iteration.
+
+    Intended as the scheduler for BaseViewModel.set_deferred_dispatch(),
+    so all notifications raised while handling one UI event are coalesced
+    into a single dispatch after the event:
+
+        viewmodel.set_deferred_dispatch(post_to_event_loop)
+
+    Args:
+        callback: Zero-argument callable to run
+    """
+    QTimer.singleShot(0, callback)
@@ -3,7 +3,26 @@
 Provides common functionality for all ViewModels including property change notification.
 """
 
-from typing import Any, Callable, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Optional
+
+
+@dataclass
+class NotificationStats:
+    """Counters for property change notifications.
+
+    Attributes:
+        notifications: notify_change() calls (including batched duplicates)
+        dispatches: Property dispatches actually performed
+        handler_calls: Handler invocations
+        handler_calls_by_property: Handler invocations per property name
+    """
+
+    notifications: int = 0
+    dispatches: int = 0
+    handler_calls: int = 0
+    handler_calls_by_property: dict[str, int] = field(default_factory=dict)
 
 
 class BaseViewModel:
@@ -18,6 +37,17 @@ class BaseViewModel:
     - ViewModels coordinate calls to Application Layer
     - ViewModels provide data in formats suitable for UI
 
+    NOTIFICATION BATCHING:
+    - Inside `with self.batch_updates():` notify_change() only records the
+      property name. When the outermost batch exits, each distinct property
+      is dispatched once, and a handler subscribed to several of the
+      changed properties is invoked once.
+    - With a deferred scheduler (set_deferred_dispatch), changes are
+      collected the same way and flushed by the scheduler instead, e.g. on
+      the next Qt event loop iteration.
+    - notification_stats / track_notifications() count handler invocations,
+      so the cost of a user action can be measured and tracked.
+
     Example:
         class MyViewModel(BaseViewModel):
             def __init__(self):
@@ -32,11 +62,93 @@ class BaseViewModel:
                 # Call application layer, update state
                 self._data = "loaded"
                 self.notify_change("data")
+
+        with vm.track_notifications() as stats:
+            vm.load_data()
+        stats.handler_calls
     """
 
     def __init__(self) -> None:
         """Initialize base ViewModel."""
         self._change_handlers: dict[str, list[Callable]] = {}
+        # Batching state (dict used as an insertion-ordered set)
+        self._batch_depth = 0
+        self._pending_changes: dict[str, None] = {}
+        self._deferred_scheduler: Optional[Callable[[Callable[[], None]], None]] = None
+        self._flush_scheduled = False
+        # Instrumentation: lifetime stats first, then active trackers
+        self._notification_stats: list[NotificationStats] = [NotificationStats()]
+
+    @property
+    def notification_stats(self) -> NotificationStats:
+        """Notification counters since creation or the last reset."""
+        return self._notification_stats[0]
+
+    def reset_notification_stats(self) -> NotificationStats:
+        """Reset lifetime notification counters.
+
+        Returns:
+            The counters collected before the reset
+        """
+        previous = self._notification_stats[0]
+        self._notification_stats[0] = NotificationStats()
+        return previous
+
+    @contextmanager
+    def track_notifications(self) -> Iterator[NotificationStats]:
+        """Count notifications caused by the enclosed block (one user action).
+
+        Deferred flushes that run after the block are not included.
+
+        Yields:
+            NotificationStats filled in while the block runs
+        """
+        stats = NotificationStats()
+        self._notification_stats.append(stats)
+        try:
+            yield stats
+        finally:
+            self._notification_stats.remove(stats)
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Collect notifications and dispatch them once at the end.
+
+        Batches nest; only the outermost batch dispatches. Changes are
+        dispatched even if the block raises, so observers never miss
+        state that was already modified.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._deferred_scheduler is None:
+                    self._flush_pending_changes()
+                else:
+                    self._schedule_flush()
+
+    def set_deferred_dispatch(
+        self,
+        scheduler: Optional[Callable[[Callable[[], None]], None]],
+    ) -> None:
+        """Enable or disable deferred notification dispatch.
+
+        Args:
+            scheduler: Callable that runs the given flush callback later
+                (e.g. presentation.utils.qt_dispatch.post_to_event_loop),
+                or None for synchronous dispatch. Pending changes are
+                flushed when deferred dispatch is disabled.
+        """
+        self._deferred_scheduler = scheduler
+        if scheduler is None and self._batch_depth == 0:
+            self._flush_pending_changes()
+
+    def flush_notifications(self) -> None:
+        """Dispatch pending notifications now (no-op inside a batch)."""
+        if self._batch_depth == 0:
+            self._flush_pending_changes()
 
     def subscribe(self, property_name: str, handler: Callable) -> None:
         """Subscribe to property changes.
@@ -63,12 +175,22 @@ class BaseViewModel:
     def notify_change(self, property_name: str) -> None:
         """Notify subscribers that a property has changed.
 
+        Dispatches immediately, unless inside batch_updates() or in
+        deferred dispatch mode, where the change is queued instead.
+
         Args:
             property_name: Name of property that changed
         """
-        if property_name in self._change_handlers:
-            for handler in self._change_handlers[property_name]:
-                handler()
+        for stats in self._notification_stats:
+            stats.notifications += 1
+
+        if self._batch_depth or self._deferred_scheduler is not None:
+            self._pending_changes[property_name] = None
+            if self._batch_depth == 0:
+                self._schedule_flush()
+            return
+
+        self._dispatch(property_name, self._change_handlers.get(property_name, ()))
 
     def dispose(self) -> None:
         """Clean up resources.
@@ -76,3 +198,44 @@ class BaseViewModel:
         Override in subclasses to release resources.
         """
         self._change_handlers.clear()
+        self._pending_changes.clear()
+        self._deferred_scheduler = None
+
+    def _schedule_flush(self) -> None:
+        """Ask the deferred scheduler for one flush of pending changes."""
+        if self._flush_scheduled or not self._pending_changes:
+            return
+        self._flush_scheduled = True
+        self._deferred_scheduler(self._flush_pending_changes)
+
+    def _flush_pending_changes(self) -> None:
+        """Dispatch each pending property once, each handler at most once."""
+        self._flush_scheduled = False
+        if not self._pending_changes:
+            return
+
+        pending = list(self._pending_changes)
+        self._pending_changes.clear()
+
+        # Compared with == (not by identity), so the same bound method
+        # subscribed to several properties is recognized
+        called: list[Callable] = []
+        for property_name in pending:
+            handlers = []
+            for handler in self._change_handlers.get(property_name, ()):
+                if handler not in called:
+                    called.append(handler)
+                    handlers.append(handler)
+            self._dispatch(property_name, handlers)
+
+    def _dispatch(self, property_name: str, handlers: Iterable[Callable]) -> None:
+        """Invoke handlers for one property and record the stats."""
+        handlers = list(handlers)
+        for stats in self._notification_stats:
+            stats.dispatches += 1
+            if handlers:
+                stats.handler_calls += len(handlers)
+                by_property = stats.handler_calls_by_property
+                by_property[property_name] = by_property.get(property_name, 0) + len(handlers)
+        for handler in handlers:
+            handler()
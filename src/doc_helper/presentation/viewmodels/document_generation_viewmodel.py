@@ -18,7 +18,8 @@ ARCHITECTURE ENFORCEMENT (Rule 0 Compliance):
 from pathlib import Path
 from typing import Optional
 
-from doc_helper.application.dto import ValidationResultDTO, DocumentFormatDTO
+from doc_helper.application.dto import DocumentFormatDTO, ValidationErrorDTO
+from doc_helper.application.dto.runtime_dto import ProjectRuntimeEvaluationResultDTO
 from doc_helper.application.usecases.document_usecases import DocumentUseCases
 from doc_helper.presentation.viewmodels.base_viewmodel import BaseViewModel
 
@@ -36,7 +37,8 @@ class DocumentGenerationViewModel(BaseViewModel):
     v1 Scope:
     - Basic Word/Excel/PDF generation
     - Simple output naming (project name based)
-    - Pre-generation validation checklist (errors only)
+    - Pre-generation checklist from the project runtime evaluation (R-7),
+      the same result generation blocks on
 
     v2+ Deferred:
     - Advanced naming patterns with tokens
@@ -45,7 +47,8 @@ class DocumentGenerationViewModel(BaseViewModel):
 
     Example:
         vm = DocumentGenerationViewModel(document_usecases)
-        vm.set_project(project_id, entity_def_id, validation_result)
+        vm.set_project(project_id, entity_def_id)
+        errors = vm.checklist_errors  # for PreGenerationChecklistDialog
         if vm.can_generate:
             vm.generate_document(template_path, output_path, format_dto)
     """
@@ -69,7 +72,7 @@ class DocumentGenerationViewModel(BaseViewModel):
         # Store IDs and DTOs, NOT domain objects
         self._project_id: Optional[str] = None
         self._entity_definition_id: Optional[str] = None
-        self._validation_result: Optional[ValidationResultDTO] = None
+        self._runtime_result: Optional[ProjectRuntimeEvaluationResultDTO] = None
 
         self._is_generating = False
         self._generation_progress = 0.0
@@ -127,11 +130,23 @@ class DocumentGenerationViewModel(BaseViewModel):
 
         # ADR-025: Check for blocking errors only (ERROR severity)
         # WARNING and INFO severity do not block generation
-        if self._validation_result and self._validation_result.blocks_workflow():
+        if self._runtime_result and self._runtime_result.is_blocked:
             return False
 
         return True
 
+    @property
+    def checklist_errors(self) -> tuple[ValidationErrorDTO, ...]:
+        """Get the pre-generation checklist issues (all severities).
+
+        Returns:
+            Tuple of validation error DTOs for PreGenerationChecklistDialog
+        """
+        if not self._runtime_result:
+            return ()
+
+        return self._runtime_result.to_validation_error_dtos()
+
     @property
     def validation_errors(self) -> list[str]:
         """Get all validation error messages (all severities).
@@ -139,10 +154,7 @@ class DocumentGenerationViewModel(BaseViewModel):
         Returns:
             List of all validation error messages
         """
-        if not self._validation_result:
-            return []
-
-        return [error.message for error in self._validation_result.errors]
+        return [error.message for error in self.checklist_errors]
 
     @property
     def has_blocking_errors(self) -> bool:
@@ -153,10 +165,7 @@ class DocumentGenerationViewModel(BaseViewModel):
         Returns:
             True if blocking errors exist
         """
-        if not self._validation_result:
-            return False
-
-        return self._validation_result.has_blocking_errors()
+        return self._has_severity("ERROR")
 
     @property
     def has_warnings(self) -> bool:
@@ -167,10 +176,7 @@ class DocumentGenerationViewModel(BaseViewModel):
         Returns:
             True if warnings exist
         """
-        if not self._validation_result:
-            return False
-
-        return self._validation_result.has_warnings()
+        return self._has_severity("WARNING")
 
     @property
     def has_info(self) -> bool:
@@ -181,27 +187,41 @@ class DocumentGenerationViewModel(BaseViewModel):
         Returns:
             True if info messages exist
         """
-        if not self._validation_result:
-            return False
+        return self._has_severity("INFO")
 
-        return self._validation_result.has_info()
+    def _has_severity(self, severity: str) -> bool:
+        """Check if any checklist issue has a severity."""
+        return any(error.severity.upper() == severity for error in self.checklist_errors)
 
     def set_project(
         self,
         project_id: str,
         entity_definition_id: str,
-        validation_result: ValidationResultDTO,
     ) -> None:
-        """Set current project for generation.
+        """Set current project for generation and evaluate its checklist.
 
         Args:
             project_id: Project ID (string)
             entity_definition_id: Entity definition ID (string)
-            validation_result: Current validation result DTO
         """
         self._project_id = project_id
         self._entity_definition_id = entity_definition_id
-        self._validation_result = validation_result
+        self.refresh_checklist()
+
+    def refresh_checklist(self) -> None:
+        """Re-evaluate the project runtime for the pre-generation checklist.
+
+        Call after field values changed; generation itself always evaluates
+        the saved project again.
+        """
+        self._runtime_result = None
+        if self._project_id:
+            result = self._document_usecases.evaluate_pre_generation(self._project_id)
+            if result.is_success():
+                self._runtime_result = result.value
+            else:
+                self._error_message = f"Pre-generation check failed: {result.error}"
+                self.notify_change("error_message")
 
         self.notify_change("can_generate")
         self.notify_change("validation_errors")
@@ -285,4 +305,4 @@ class DocumentGenerationViewModel(BaseViewModel):
         super().dispose()
         self._project_id = None
         self._entity_definition_id = None
-        self._validation_result = None
+        self._runtime_result = None
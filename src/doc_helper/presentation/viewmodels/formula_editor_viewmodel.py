@@ -84,6 +84,7 @@ from doc_helper.application.dto.formula_dto import (
     # Phase F-3
     FormulaDependencyAnalysisResultDTO,
     FormulaDependencyDTO,
+    FormulaDiagnosticsDTO,
     # Phase F-6
     FormulaGovernanceResultDTO,
     FormulaGovernanceStatus,
@@ -173,6 +174,11 @@ class FormulaEditorViewModel(BaseViewModel):
         all_warnings = vm.all_diagnostic_warnings  # All warnings
         status = vm.diagnostic_status  # Overall status
 
+        # Keystroke-driven editing: coalesce edits, diagnose once
+        vm.schedule_formula("field1 +")
+        vm.schedule_formula("field1 + field2")
+        vm.flush_diagnostics()  # one pass, one "diagnostics" notification
+
     Observable Properties:
         - formula_text: Current formula text
         - validation_result: Latest validation result DTO
@@ -208,8 +214,60 @@ class FormulaEditorViewModel(BaseViewModel):
         - binding_status: Binding status enum value (Phase F-7)
         - binding_status_message: Human-readable binding status (Phase F-7)
         - can_save_binding: Whether binding can be saved (Phase F-7)
+        - diagnostics: Consolidated result of the latest diagnostics pass;
+          notified once per pass, after the individual properties
     """
 
+    # Properties derived from each diagnostics DTO (notified only when
+    # that DTO changed in a pass)
+    _VALIDATION_PROPERTIES = (
+        "validation_result",
+        "is_valid",
+        "inferred_type",
+        "field_references",
+        "errors",
+        "warnings",
+        "has_errors",
+        "has_warnings",
+    )
+    _DEPENDENCY_PROPERTIES = (
+        "dependency_analysis_result",
+        "dependencies",
+        "known_dependencies",
+        "unknown_fields",
+        "has_unknown_fields",
+        "dependency_count",
+        "unknown_count",
+    )
+    _CYCLE_PROPERTIES = (
+        "cycle_analysis_result",
+        "has_cycles",
+        "cycles",
+        "cycle_count",
+        "all_cycle_field_ids",
+        "cycle_errors",
+        "analyzed_field_count",
+    )
+    _AGGREGATE_PROPERTIES = (
+        "all_diagnostic_errors",
+        "all_diagnostic_warnings",
+        "all_diagnostic_info",
+        "diagnostic_status",
+        "status_message",
+        "has_diagnostics",
+        "diagnostic_error_count",
+        "diagnostic_warning_count",
+    )
+    _GOVERNANCE_PROPERTIES = (
+        "governance_result",
+        "governance_status",
+        "is_formula_allowed",
+        "is_formula_blocked",
+        "governance_message",
+        "governance_blocking_reasons",
+        "governance_warning_reasons",
+    )
+
     def __init__(
         self,
         formula_usecases: FormulaUseCases,
@@ -225,6 +283,7 @@ class FormulaEditorViewModel(BaseViewModel):
         """
         super().__init__()
         self._formula_usecases = formula_usecases
+        self._diagnostics_session = formula_usecases.create_diagnostics_session()
 
         # State
         self._formula_text: str = ""
@@ -236,6 +295,9 @@ class FormulaEditorViewModel(BaseViewModel):
         # Phase F-7: Binding state
         self._binding_target: Optional[FormulaBindingTarget] = None
         self._binding_target_id: str = ""
+        # Consolidated diagnostics pipeline
+        self._diagnostics: Optional[FormulaDiagnosticsDTO] = None
+        self._diagnostics_pending: bool = False
 
     # =========================================================================
     # Properties (Observable)
@@ -246,6 +308,16 @@ class FormulaEditorViewModel(BaseViewModel):
         """Get current formula text."""
         return self._formula_text
 
+    @property
+    def diagnostics(self) -> Optional[FormulaDiagnosticsDTO]:
+        """Get the result of the latest diagnostics pass."""
+        return self._diagnostics
+
+    @property
+    def has_pending_diagnostics(self) -> bool:
+        """Check if scheduled formula text has not been diagnosed yet."""
+        return self._diagnostics_pending
+
     @property
     def validation_result(self) -> Optional[FormulaValidationResultDTO]:
         """Get latest validation result."""
@@ -944,6 +1016,31 @@ class FormulaEditorViewModel(BaseViewModel):
         # Validate the formula
         self._validate_formula()
 
+    def schedule_formula(self, formula_text: str) -> None:
+        """Record edited formula text without diagnosing it yet.
+
+        Consecutive calls (e.g. one per keystroke) are coalesced: only the
+        latest text is diagnosed, by the next flush_diagnostics() call.
+
+        Args:
+            formula_text: New formula text
+        """
+        self._formula_text = formula_text
+        self._diagnostics_pending = True
+        self.notify_change("formula_text")
+        self.notify_change("has_formula")
+
+    def flush_diagnostics(self) -> bool:
+        """Diagnose the latest scheduled formula text, if any.
+
+        Returns:
+            True if a diagnostics pass ran, False if nothing was pending
+        """
+        if not self._diagnostics_pending:
+            return False
+        self._validate_formula()
+        return True
+
     def clear_formula(self) -> None:
         """Clear formula text, validation result, dependency analysis, cycle analysis, governance, and binding."""
         self._formula_text = ""
@@ -951,57 +1048,62 @@ class FormulaEditorViewModel(BaseViewModel):
         self._dependency_analysis_result = None
         self._cycle_analysis_result = None
         self._governance_result = None
+        self._diagnostics = None
+        self._diagnostics_pending = False
+        self._diagnostics_session.clear_entity_dependencies()
         # Note: binding target is NOT cleared - it's context, not formula data
 
-        self.notify_change("formula_text")
-        self.notify_change("has_formula")
-        self.notify_change("validation_result")
-        self.notify_change("is_valid")
-        self.notify_change("inferred_type")
-        self.notify_change("field_references")
-        self.notify_change("errors")
-        self.notify_change("warnings")
-        self.notify_change("has_errors")
-        self.notify_change("has_warnings")
-        # Phase F-3 notifications
-        self.notify_change("dependency_analysis_result")
-        self.notify_change("dependencies")
-        self.notify_change("known_dependencies")
-        self.notify_change("unknown_fields")
-        self.notify_change("has_unknown_fields")
-        self.notify_change("dependency_count")
-        self.notify_change("unknown_count")
-        # Phase F-4 notifications
-        self.notify_change("cycle_analysis_result")
-        self.notify_change("has_cycles")
-        self.notify_change("cycles")
-        self.notify_change("cycle_count")
-        self.notify_change("all_cycle_field_ids")
-        self.notify_change("cycle_errors")
-        self.notify_change("analyzed_field_count")
-        # Phase F-5 notifications (diagnostic aggregation)
-        self.notify_change("all_diagnostic_errors")
-        self.notify_change("all_diagnostic_warnings")
-        self.notify_change("all_diagnostic_info")
-        self.notify_change("diagnostic_status")
-        self.notify_change("status_message")
-        self.notify_change("has_diagnostics")
-        self.notify_change("diagnostic_error_count")
-        self.notify_change("diagnostic_warning_count")
-        # Phase F-6 notifications (governance)
-        self.notify_change("governance_result")
-        self.notify_change("governance_status")
-        self.notify_change("is_formula_allowed")
-        self.notify_change("is_formula_blocked")
-        self.notify_change("governance_message")
-        self.notify_change("governance_blocking_reasons")
-        self.notify_change("governance_warning_reasons")
-        # Phase F-7 notifications (binding status may change with cleared formula)
-        self.notify_change("is_binding_allowed")
-        self.notify_change("binding_block_reason")
-        self.notify_change("binding_status")
-        self.notify_change("binding_status_message")
-        self.notify_change("can_save_binding")
+        with self.batch_updates():
+            self.notify_change("formula_text")
+            self.notify_change("has_formula")
+            self.notify_change("validation_result")
+            self.notify_change("is_valid")
+            self.notify_change("inferred_type")
+            self.notify_change("field_references")
+            self.notify_change("errors")
+            self.notify_change("warnings")
+            self.notify_change("has_errors")
+            self.notify_change("has_warnings")
+            # Phase F-3 notifications
+            self.notify_change("dependency_analysis_result")
+            self.notify_change("dependencies")
+            self.notify_change("known_dependencies")
+            self.notify_change("unknown_fields")
+            self.notify_change("has_unknown_fields")
+            self.notify_change("dependency_count")
+            self.notify_change("unknown_count")
+            # Phase F-4 notifications
+            self.notify_change("cycle_analysis_result")
+            self.notify_change("has_cycles")
+            self.notify_change("cycles")
+            self.notify_change("cycle_count")
+            self.notify_change("all_cycle_field_ids")
+            self.notify_change("cycle_errors")
+            self.notify_change("analyzed_field_count")
+            # Phase F-5 notifications (diagnostic aggregation)
+            self.notify_change("all_diagnostic_errors")
+            self.notify_change("all_diagnostic_warnings")
+            self.notify_change("all_diagnostic_info")
+            self.notify_change("diagnostic_status")
+            self.notify_change("status_message")
+            self.notify_change("has_diagnostics")
+            self.notify_change("diagnostic_error_count")
+            self.notify_change("diagnostic_warning_count")
+            # Phase F-6 notifications (governance)
+            self.notify_change("governance_result")
+            self.notify_change("governance_status")
+            self.notify_change("is_formula_allowed")
+            self.notify_change("is_formula_blocked")
+            self.notify_change("governance_message")
+            self.notify_change("governance_blocking_reasons")
+            self.notify_change("governance_warning_reasons")
+            # Phase F-7 notifications (binding status may change with cleared formula)
+            self.notify_change("is_binding_allowed")
+            self.notify_change("binding_block_reason")
+            self.notify_change("binding_status")
+            self.notify_change("binding_status_message")
+            self.notify_change("can_save_binding")
+            self.notify_change("diagnostics")
 
     def validate(self) -> FormulaValidationResultDTO:
         """Manually trigger validation.
@@ -1041,13 +1143,14 @@ class FormulaEditorViewModel(BaseViewModel):
         self._binding_target_id = target_id
 
         # Notify binding-related properties
-        self.notify_change("binding_target")
-        self.notify_change("binding_target_id")
-        self.notify_change("is_binding_allowed")
-        self.notify_change("binding_block_reason")
-        self.notify_change("binding_status")
-        self.notify_change("binding_status_message")
-        self.notify_change("can_save_binding")
+        with self.batch_updates():
+            self.notify_change("binding_target")
+            self.notify_change("binding_target_id")
+            self.notify_change("is_binding_allowed")
+            self.notify_change("binding_block_reason")
+            self.notify_change("binding_status")
+            self.notify_change("binding_status_message")
+            self.notify_change("can_save_binding")
 
     def clear_binding_target(self) -> None:
         """Clear the binding target (Phase F-7).
@@ -1062,13 +1165,14 @@ class FormulaEditorViewModel(BaseViewModel):
         self._binding_target_id = ""
 
         # Notify binding-related properties
-        self.notify_change("binding_target")
-        self.notify_change("binding_target_id")
-        self.notify_change("is_binding_allowed")
-        self.notify_change("binding_block_reason")
-        self.notify_change("binding_status")
-        self.notify_change("binding_status_message")
-        self.notify_change("can_save_binding")
+        with self.batch_updates():
+            self.notify_change("binding_target")
+            self.notify_change("binding_target_id")
+            self.notify_change("is_binding_allowed")
+            self.notify_change("binding_block_reason")
+            self.notify_change("binding_status")
+            self.notify_change("binding_status_message")
+            self.notify_change("can_save_binding")
 
     def get_binding_result(self) -> FormulaBindingResultDTO:
         """Get the binding result for current formula and target (Phase F-7).
@@ -1156,8 +1260,10 @@ class FormulaEditorViewModel(BaseViewModel):
                 for cycle in result.cycles:
                     print(f"Cycle detected: {cycle.cycle_path}")
         """
-        self._cycle_analysis_result = self._formula_usecases.detect_cycles(
-            formula_dependencies=formula_dependencies,
+        # The session keeps the graph so later edits of the bound field only
+        # re-check the cycles that edit can affect
+        self._cycle_analysis_result = self._diagnostics_session.load_entity_dependencies(
+            formula_dependencies,
         )
 
         # Re-evaluate governance after cycle analysis (Phase F-6)
@@ -1169,28 +1275,30 @@ class FormulaEditorViewModel(BaseViewModel):
         )
 
         # Notify observers of cycle-related property changes
-        self.notify_change("cycle_analysis_result")
-        self.notify_change("has_cycles")
-        self.notify_change("cycles")
-        self.notify_change("cycle_count")
-        self.notify_change("all_cycle_field_ids")
-        self.notify_change("cycle_errors")
-        self.notify_change("analyzed_field_count")
-        # Phase F-5 notifications (cycle changes affect diagnostics)
-        self.notify_change("all_diagnostic_errors")
-        self.notify_change("all_diagnostic_info")
-        self.notify_change("diagnostic_status")
-        self.notify_change("status_message")
-        self.notify_change("has_diagnostics")
-        self.notify_change("diagnostic_error_count")
-        # Phase F-6 notifications (cycle changes affect governance)
-        self.notify_change("governance_result")
-        self.notify_change("governance_status")
-        self.notify_change("is_formula_allowed")
-        self.notify_change("is_formula_blocked")
-        self.notify_change("governance_message")
-        self.notify_change("governance_blocking_reasons")
-        self.notify_change("governance_warning_reasons")
+        with self.batch_updates():
+            self.notify_change("cycle_analysis_result")
+            self.notify_change("has_cycles")
+            self.notify_change("cycles")
+            self.notify_change("cycle_count")
+            self.notify_change("all_cycle_field_ids")
+            self.notify_change("cycle_errors")
+            self.notify_change("analyzed_field_count")
+            # Phase F-5 notifications (cycle changes affect diagnostics)
+            self.notify_change("all_diagnostic_errors")
+            self.notify_change("all_diagnostic_info")
+            self.notify_change("diagnostic_status")
+            self.notify_change("status_message")
+            self.notify_change("has_diagnostics")
+            self.notify_change("diagnostic_error_count")
+            # Phase F-6 notifications (cycle changes affect governance)
+            self.notify_change("governance_result")
+            self.notify_change("governance_status")
+            self.notify_change("is_formula_allowed")
+            self.notify_change("is_formula_blocked")
+            self.notify_change("governance_message")
+            self.notify_change("governance_blocking_reasons")
+            self.notify_change("governance_warning_reasons")
+            self.notify_change("diagnostics")
 
         return self._cycle_analysis_result
 
@@ -1201,6 +1309,7 @@ class FormulaEditorViewModel(BaseViewModel):
         or when the formula dependencies have changed significantly.
         """
         self._cycle_analysis_result = None
+        self._diagnostics_session.clear_entity_dependencies()
 
         # Re-evaluate governance without cycle data (Phase F-6)
         self._governance_result = self._formula_usecases.evaluate_governance(
@@ -1209,99 +1318,86 @@ class FormulaEditorViewModel(BaseViewModel):
             cycle_result=None,
         )
 
-        self.notify_change("cycle_analysis_result")
-        self.notify_change("has_cycles")
-        self.notify_change("cycles")
-        self.notify_change("cycle_count")
-        self.notify_change("all_cycle_field_ids")
-        self.notify_change("cycle_errors")
-        self.notify_change("analyzed_field_count")
-        # Phase F-5 notifications (cycle changes affect diagnostics)
-        self.notify_change("all_diagnostic_errors")
-        self.notify_change("all_diagnostic_info")
-        self.notify_change("diagnostic_status")
-        self.notify_change("status_message")
-        self.notify_change("has_diagnostics")
-        self.notify_change("diagnostic_error_count")
-        # Phase F-6 notifications (cycle changes affect governance)
-        self.notify_change("governance_result")
-        self.notify_change("governance_status")
-        self.notify_change("is_formula_allowed")
-        self.notify_change("is_formula_blocked")
-        self.notify_change("governance_message")
-        self.notify_change("governance_blocking_reasons")
-        self.notify_change("governance_warning_reasons")
+        with self.batch_updates():
+            self.notify_change("cycle_analysis_result")
+            self.notify_change("has_cycles")
+            self.notify_change("cycles")
+            self.notify_change("cycle_count")
+            self.notify_change("all_cycle_field_ids")
+            self.notify_change("cycle_errors")
+            self.notify_change("analyzed_field_count")
+            # Phase F-5 notifications (cycle changes affect diagnostics)
+            self.notify_change("all_diagnostic_errors")
+            self.notify_change("all_diagnostic_info")
+            self.notify_change("diagnostic_status")
+            self.notify_change("status_message")
+            self.notify_change("has_diagnostics")
+            self.notify_change("diagnostic_error_count")
+            # Phase F-6 notifications (cycle changes affect governance)
+            self.notify_change("governance_result")
+            self.notify_change("governance_status")
+            self.notify_change("is_formula_allowed")
+            self.notify_change("is_formula_blocked")
+            self.notify_change("governance_message")
+            self.notify_change("governance_blocking_reasons")
+            self.notify_change("governance_warning_reasons")
 
     # =========================================================================
     # Internal Methods
     # =========================================================================
 
     def _validate_formula(self) -> None:
-        """Validate current formula text, analyze dependencies, and evaluate governance.
+        """Run one diagnostics pass over the current formula text.
 
         Internal method that:
-        1. Calls use-case for validation (Phase F-1)
-        2. Calls use-case for dependency analysis (Phase F-3)
-        3. Calls use-case for governance evaluation (Phase F-6)
-        4. Updates all result states
-        5. Notifies all relevant observers
+        1. Runs validation (F-1), dependency analysis (F-3), cycle re-check
+           of the bound field (F-4, only once analyze_entity_cycles() has
+           loaded the entity graph) and governance (F-6) in one session pass
+        2. Updates all result states
+        3. Notifies observers of the property groups whose DTO changed,
+           then publishes one consolidated "diagnostics" notification
         """
-        # Validate via use-case (Phase F-1)
-        self._validation_result = self._formula_usecases.validate_formula(
-            formula_text=self._formula_text,
-            schema_fields=self._schema_fields,
+        previous = (
+            self._validation_result,
+            self._dependency_analysis_result,
+            self._cycle_analysis_result,
+            self._governance_result,
         )
 
-        # Analyze dependencies via use-case (Phase F-3)
-        self._dependency_analysis_result = self._formula_usecases.analyze_dependencies(
+        diagnostics = self._diagnostics_session.diagnose(
             formula_text=self._formula_text,
             schema_fields=self._schema_fields,
+            field_id=self._binding_target_id,
         )
-
-        # Evaluate governance via use-case (Phase F-6)
-        # Note: Cycle analysis is handled separately via analyze_entity_cycles()
-        # so we pass None for cycle_result here. Entity-wide governance
-        # evaluation should be triggered by calling evaluate_entity_governance().
-        self._governance_result = self._formula_usecases.evaluate_governance(
-            formula_text=self._formula_text,
-            validation_result=self._validation_result,
-            cycle_result=self._cycle_analysis_result,
-        )
-
-        # Notify all observers
-        self.notify_change("validation_result")
-        self.notify_change("is_valid")
-        self.notify_change("inferred_type")
-        self.notify_change("field_references")
-        self.notify_change("errors")
-        self.notify_change("warnings")
-        self.notify_change("has_errors")
-        self.notify_change("has_warnings")
-        # Phase F-3 notifications
-        self.notify_change("dependency_analysis_result")
-        self.notify_change("dependencies")
-        self.notify_change("known_dependencies")
-        self.notify_change("unknown_fields")
-        self.notify_change("has_unknown_fields")
-        self.notify_change("dependency_count")
-        self.notify_change("unknown_count")
-        # Phase F-5 notifications (diagnostic aggregation)
-        self.notify_change("all_diagnostic_errors")
-        self.notify_change("all_diagnostic_warnings")
-        self.notify_change("all_diagnostic_info")
-        self.notify_change("diagnostic_status")
-        self.notify_change("status_message")
-        self.notify_change("has_diagnostics")
-        self.notify_change("diagnostic_error_count")
-        self.notify_change("diagnostic_warning_count")
-        # Phase F-6 notifications (governance)
-        self.notify_change("governance_result")
-        self.notify_change("governance_status")
-        self.notify_change("is_formula_allowed")
-        self.notify_change("is_formula_blocked")
-        self.notify_change("governance_message")
-        self.notify_change("governance_blocking_reasons")
-        self.notify_change("governance_warning_reasons")
+        self._diagnostics = diagnostics
+        self._diagnostics_pending = False
+        self._validation_result = diagnostics.validation_result
+        self._dependency_analysis_result = diagnostics.dependency_analysis_result
+        if diagnostics.cycle_analysis_result is not None:
+            self._cycle_analysis_result = diagnostics.cycle_analysis_result
+        self._governance_result = diagnostics.governance_result
+
+        validation_changed = previous[0] != self._validation_result
+        dependencies_changed = previous[1] != self._dependency_analysis_result
+        cycles_changed = previous[2] != self._cycle_analysis_result
+        governance_changed = previous[3] != self._governance_result
+
+        changed: list[str] = []
+        if validation_changed:
+            changed.extend(self._VALIDATION_PROPERTIES)
+        if dependencies_changed:
+            changed.extend(self._DEPENDENCY_PROPERTIES)
+        if cycles_changed:
+            changed.extend(self._CYCLE_PROPERTIES)
+        if validation_changed or dependencies_changed or cycles_changed:
+            changed.extend(self._AGGREGATE_PROPERTIES)
+        if governance_changed:
+            changed.extend(self._GOVERNANCE_PROPERTIES)
+
+        with self.batch_updates():
+            for property_name in changed:
+                self.notify_change(property_name)
+            self.notify_change("diagnostics")
 
     def dispose(self) -> None:
         """Clean up resources."""
@@ -1311,6 +1407,9 @@ class FormulaEditorViewModel(BaseViewModel):
         self._dependency_analysis_result = None
         self._cycle_analysis_result = None
         self._governance_result = None
+        self._diagnostics = None
+        self._diagnostics_pending = False
+        self._diagnostics_session.clear_entity_dependencies()
         self._schema_fields = ()
         # Phase F-7: Clear binding state
         self._binding_target = None
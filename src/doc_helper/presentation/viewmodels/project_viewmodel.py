@@ -190,6 +190,18 @@ class ProjectViewModel(BaseViewModel):
         """
         return self._error_message
 
+    @property
+    def runtime_memo_hit_rate(self) -> float:
+        """Get the runtime evaluation memo hit rate (diagnostics).
+
+        Returns:
+            Fraction of runtime evaluations answered from the memo
+            (0.0 if runtime evaluation is not available)
+        """
+        if not self._evaluate_runtime_usecase:
+            return 0.0
+        return self._evaluate_runtime_usecase.memo.hit_rate
+
     @property
     def project_name(self) -> str:
         """Get current project name.
@@ -329,6 +341,57 @@ class ProjectViewModel(BaseViewModel):
             self.notify_change("error_message")
             return False
 
+    def update_table_row(
+        self,
+        field_id: str,
+        kind: str,
+        index: int,
+        record: Optional[dict[str, Any]] = None,
+        to_index: Optional[int] = None,
+    ) -> bool:
+        """Write a single-record edit of a TABLE field.
+
+        Only the edited record is stored, so editing one row of a large
+        table does not save the whole project. Row edits bypass the undo
+        stack.
+
+        Args:
+            field_id: TABLE field ID as string (DTO-only MVVM compliance)
+            kind: "insert", "update", "delete" or "move"
+            index: Row index (the source row for "move")
+            record: New record for "insert" and "update"
+            to_index: Destination row for "move"
+
+        Returns:
+            True if the row was written
+        """
+        if not self._project_id:
+            self._error_message = "No project loaded"
+            self.notify_change("error_message")
+            return False
+
+        result = self._project_usecases.update_table_row(
+            project_id=self._project_id,
+            field_id=field_id,
+            kind=kind,
+            index=index,
+            record=record,
+            to_index=to_index,
+        )
+        if result.is_failure():
+            self._error_message = f"Failed to update table row: {result.error}"
+            self.notify_change("error_message")
+            return False
+
+        reload_result = self._project_usecases.get_project(self._project_id)
+        if reload_result.is_success() and reload_result.value:
+            self._project_dto = reload_result.value
+
+        self._has_unsaved_changes = True
+        self.notify_change("current_project")
+        self.notify_change("has_unsaved_changes")
+        return True
+
     def save_project(self) -> bool:
         """Save current project.
 
@@ -110,7 +110,11 @@ from doc_helper.application.dto.import_dto import (
 )
 from doc_helper.application.dto.operation_result import OperationResult
 from doc_helper.application.dto.relationship_dto import RelationshipDTO
-from doc_helper.application.dto.schema_dto import EntityDefinitionDTO, FieldDefinitionDTO
+from doc_helper.application.dto.schema_dto import (
+    EntityChangeResult,
+    EntityDefinitionDTO,
+    FieldDefinitionDTO,
+)
 from doc_helper.application.usecases.control_rule_usecases import ControlRuleUseCases
 from doc_helper.application.usecases.formula_usecases import FormulaUseCases
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
@@ -531,53 +535,123 @@ class SchemaDesignerViewModel(BaseViewModel):
             - NO command, query, or repository access
             - Selection restored via IDs, not domain objects
         """
-        # Step 1: Save current selection IDs for restoration
-        saved_entity_id = self._selected_entity_id
-        saved_field_id = self._selected_field_id
+        # All notifications (including those of the nested loads) are
+        # dispatched once, after the state is fully rebuilt
+        with self.batch_updates():
+            # Step 1: Save current selection IDs for restoration
+            saved_entity_id = self._selected_entity_id
+            saved_field_id = self._selected_field_id
+
+            # Step 2: Re-execute authoritative query
+            self._entities = self._schema_usecases.get_all_entities()
+            self._relationships = self._schema_usecases.get_all_relationships()
+            self._error_message = None
 
-        # Step 2: Re-execute authoritative query
-        self._entities = self._schema_usecases.get_all_entities()
-        self._relationships = self._schema_usecases.get_all_relationships()
-        self._error_message = None
+            # Step 3: Reset selection to force proper re-selection
+            self._selected_entity_id = None
+            self._selected_field_id = None
+
+            # Step 4: Validate and restore entity selection if still valid
+            if saved_entity_id:
+                for entity in self._entities:
+                    if entity.id == saved_entity_id:
+                        self._selected_entity_id = saved_entity_id
+                        break
+
+            # Step 4b: Validate and restore field selection if entity is still selected
+            if self._selected_entity_id and saved_field_id:
+                for entity in self._entities:
+                    if entity.id == self._selected_entity_id:
+                        for field in entity.fields:
+                            if field.id == saved_field_id:
+                                self._selected_field_id = saved_field_id
+                                break
+                        break
+
+            # Step 5: Notify ALL affected properties
+            self.notify_change("entities")
+            self.notify_change("relationships")
+            self.notify_change("entity_relationships")
+            self.notify_change("selected_entity_id")
+            self.notify_change("selected_field_id")
+            self.notify_change("fields")
+            self.notify_change("validation_rules")
+            self.notify_change("error_message")
 
-        # Step 3: Reset selection to force proper re-selection
-        self._selected_entity_id = None
-        self._selected_field_id = None
+            # Update formula editor context if field is selected
+            if self._selected_field_id:
+                self._update_formula_editor_context()
+                # Reload associated data for selected field
+                self.load_control_rules()
+                self.load_output_mappings()
+                self.load_field_options()
 
-        # Step 4: Validate and restore entity selection if still valid
-        if saved_entity_id:
-            for entity in self._entities:
-                if entity.id == saved_entity_id:
-                    self._selected_entity_id = saved_entity_id
-                    break
+    def _apply_entity_change(
+        self,
+        result: OperationResult,
+        reload_field_data: bool = False,
+    ) -> None:
+        """Patch ViewModel state from a mutation result.
 
-        # Step 4b: Validate and restore field selection if entity is still selected
-        if self._selected_entity_id and saved_field_id:
-            for entity in self._entities:
-                if entity.id == self._selected_entity_id:
-                    for field in entity.fields:
-                        if field.id == saved_field_id:
-                            self._selected_field_id = saved_field_id
-                            break
-                    break
+        Mutation use cases return the changed entity (or the removed entity
+        ID), so only that entity is replaced and only the properties that
+        depend on it are notified - the schema is not re-read. Results
+        without entity data fall back to a full reload.
 
-        # Step 5: Notify ALL affected properties
-        self.notify_change("entities")
-        self.notify_change("relationships")
-        self.notify_change("entity_relationships")
-        self.notify_change("selected_entity_id")
-        self.notify_change("selected_field_id")
-        self.notify_change("fields")
-        self.notify_change("validation_rules")
-        self.notify_change("error_message")
+        Args:
+            result: Successful result of a schema mutation
+            reload_field_data: Also reload control rules, output mappings and
+                options of the selected field (field mutations)
+        """
+        changed = result if isinstance(result, EntityChangeResult) else None
+        if changed is None or (changed.entity is None and changed.removed_entity_id is None):
+            if reload_field_data:
+                self._reload_schema_state()
+            else:
+                self.load_entities()
+            return
 
-        # Update formula editor context if field is selected
-        if self._selected_field_id:
-            self._update_formula_editor_context()
-            # Reload associated data for selected field
-            self.load_control_rules()
-            self.load_output_mappings()
-            self.load_field_options()
+        with self.batch_updates():
+            if changed.removed_entity_id is not None:
+                entity_id = changed.removed_entity_id
+                self._entities = tuple(e for e in self._entities if e.id != entity_id)
+                if self._selected_entity_id == entity_id:
+                    self.clear_selection()
+                # Relationships of the removed entity are gone as well
+                self.load_relationships()
+            else:
+                entity = changed.entity
+                entity_id = entity.id
+                entities = list(self._entities)
+                for index, existing in enumerate(entities):
+                    if existing.id == entity_id:
+                        entities[index] = entity
+                        break
+                else:
+                    # New entities are appended; display order is reconciled
+                    # on the next full load
+                    entities.append(entity)
+                self._entities = tuple(entities)
+
+                if self._selected_entity_id == entity_id:
+                    if self._selected_field_id and not any(
+                        f.id == self._selected_field_id for f in entity.fields
+                    ):
+                        self._selected_field_id = None
+                        self.notify_change("selected_field_id")
+                        if self._formula_editor_viewmodel:
+                            self._formula_editor_viewmodel.clear_formula()
+                    self.notify_change("fields")
+                    self.notify_change("validation_rules")
+                    if self._selected_field_id and reload_field_data:
+                        self._update_formula_editor_context()
+                        self.load_control_rules()
+                        self.load_output_mappings()
+                        self.load_field_options()
+
+            self._error_message = None
+            self.notify_change("entities")
+            self.notify_change("error_message")
 
     def select_entity(self, entity_id: str) -> None:
         """Select an entity.
@@ -702,8 +776,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Reload entities to show new entity
-            self.load_entities()
+            # Add the new entity to the in-memory schema
+            self._apply_entity_change(result)
 
         return result
 
@@ -733,8 +807,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Reload entities to show updated entity
-            self.load_entities()
+            # Replace the updated entity in the in-memory schema
+            self._apply_entity_change(result)
 
         return result
 
@@ -754,8 +828,8 @@ class SchemaDesignerViewModel(BaseViewModel):
             # Clear selection if deleted entity was selected
             if self._selected_entity_id == entity_id:
                 self.clear_selection()
-            # Reload entities to reflect deletion
-            self.load_entities()
+            # Drop the entity from the in-memory schema
+            self._apply_entity_change(result)
 
         return result
 
@@ -800,9 +874,9 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Phase S-3 Bug Fix: Use _reload_schema_state() to ensure
-            # immediate UI update of Fields and Validation Rules panels
-            self._reload_schema_state()
+            # Patch the changed entity so the Fields and Validation Rules
+            # panels update immediately without re-reading the schema
+            self._apply_entity_change(result, reload_field_data=True)
 
         return result
 
@@ -851,9 +925,9 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Phase S-3 Bug Fix: Use _reload_schema_state() to ensure
-            # immediate UI update of Fields and Validation Rules panels
-            self._reload_schema_state()
+            # Patch the changed entity so the Fields and Validation Rules
+            # panels update immediately without re-reading the schema
+            self._apply_entity_change(result, reload_field_data=True)
 
         return result
 
@@ -874,11 +948,9 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Phase S-3 Bug Fix: Use _reload_schema_state() to ensure
-            # immediate UI update of Fields and Validation Rules panels.
-            # Note: _reload_schema_state() handles selection restoration via IDs,
-            # so deleted field will naturally be deselected (ID no longer exists).
-            self._reload_schema_state()
+            # Patch the changed entity; a deleted selected field is
+            # deselected because its ID is no longer in the entity
+            self._apply_entity_change(result, reload_field_data=True)
 
         return result
 
@@ -1082,8 +1154,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         )
 
         if result.success:
-            # Reload entities to refresh constraint data
-            self.load_entities()
+            # Patch the entity to refresh constraint data
+            self._apply_entity_change(result)
             # Notify about validation rules change
             self.notify_change("validation_rules")
             # Notify about fields change (is_required may have changed)
@@ -1486,8 +1558,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload control rules to show new rule
             self.load_control_rules()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1527,8 +1599,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload control rules to show updated rule
             self.load_control_rules()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1564,8 +1636,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload control rules to reflect deletion
             self.load_control_rules()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1631,8 +1703,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload output mappings to show new mapping
             self.load_output_mappings()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1671,8 +1743,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload output mappings to show updated mapping
             self.load_output_mappings()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1708,8 +1780,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload output mappings to reflect deletion
             self.load_output_mappings()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1776,8 +1848,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload field options to show new option
             self.load_field_options()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1817,8 +1889,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload field options to show updated option
             self.load_field_options()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1854,8 +1926,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload field options to reflect deletion
             self.load_field_options()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
@@ -1893,8 +1965,8 @@ class SchemaDesignerViewModel(BaseViewModel):
         if result.success:
             # Reload field options to reflect new order
             self.load_field_options()
-            # Reload entities to update field metadata
-            self.load_entities()
+            # Patch the entity to update field metadata
+            self._apply_entity_change(result)
 
         return result
 
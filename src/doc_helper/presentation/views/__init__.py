@@ -1,5 +1,20 @@
-"""Views for the application."""
+"""Views for the application.
 
-from doc_helper.presentation.views.schema_designer_view import SchemaDesignerView
+Views are exported lazily (PEP 562) so importing one view - e.g. the welcome
+window at startup - does not pull in every other view module.
+"""
+
+from typing import Any
 
 __all__ = ["SchemaDesignerView"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported views on first attribute access."""
+    if name == "SchemaDesignerView":
+        from doc_helper.presentation.views.schema_designer_view import (
+            SchemaDesignerView,
+        )
+
+        return SchemaDesignerView
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
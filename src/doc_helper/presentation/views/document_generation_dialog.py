@@ -21,6 +21,10 @@ from PyQt6.QtWidgets import (
 )
 
 from doc_helper.application.dto.document_dto import DocumentFormatDTO
+from doc_helper.presentation.adapters.qt_translation_adapter import QtTranslationAdapter
+from doc_helper.presentation.dialogs.pre_generation_checklist_dialog import (
+    PreGenerationChecklistDialog,
+)
 from doc_helper.presentation.viewmodels.document_generation_viewmodel import (
     DocumentGenerationViewModel,
 )
@@ -50,15 +54,19 @@ class DocumentGenerationDialog(BaseView):
         self,
         parent: QWidget,
         viewmodel: DocumentGenerationViewModel,
+        translation_adapter: Optional[QtTranslationAdapter] = None,
     ) -> None:
         """Initialize document generation dialog.
 
         Args:
             parent: Parent widget
             viewmodel: DocumentGenerationViewModel instance
+            translation_adapter: Qt translation adapter for the pre-generation
+                checklist (None = generate without showing the checklist)
         """
         super().__init__(parent)
         self._viewmodel = viewmodel
+        self._translation_adapter = translation_adapter
 
         # UI components
         self._template_entry: Optional[QLineEdit] = None
@@ -257,6 +265,17 @@ class DocumentGenerationDialog(BaseView):
                 is_available=True,
             )
 
+        # ADR-025: Pre-generation checklist from the same runtime evaluation
+        # generation blocks on
+        if self._translation_adapter is not None:
+            self._viewmodel.refresh_checklist()
+            if not PreGenerationChecklistDialog.check_and_confirm(
+                self._root,
+                self._viewmodel.checklist_errors,
+                self._translation_adapter,
+            ):
+                return
+
         # Generate document
         success = self._viewmodel.generate_document(
             template_path=Path(template_path),
@@ -14,12 +14,16 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QStatusBar,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from doc_helper.application.dto import EntityDefinitionDTO, FieldDefinitionDTO, ValidationErrorDTO
-from doc_helper.application.dto.runtime_dto import FormRuntimeStateDTO
+from doc_helper.application.dto.runtime_dto import (
+    FormFieldRuntimeStateDTO,
+    FormRuntimeStateDTO,
+)
 # Domain imports removed - presentation layer uses strings, not typed IDs (DTO-only MVVM)
 from doc_helper.presentation.adapters.qt_translation_adapter import QtTranslationAdapter
 from doc_helper.presentation.dialogs import (
@@ -32,6 +36,8 @@ from doc_helper.presentation.factories import FieldWidgetFactory
 from doc_helper.presentation.viewmodels.project_viewmodel import ProjectViewModel
 from doc_helper.presentation.views.base_view import BaseView
 from doc_helper.presentation.widgets.field_widget import IFieldWidget
+from doc_helper.presentation.widgets.table_rows_model import TableRowsModel
+from doc_helper.presentation.widgets.table_widget import TableFieldWidget, TableRowChange
 
 
 class ProjectView(BaseView):
@@ -52,10 +58,23 @@ class ProjectView(BaseView):
     - Quick search
     - Field history
 
+    Virtualized rendering (large entities):
+    - Field containers are created in batches as the form is scrolled
+      towards its end, instead of all up front
+    - Runtime state for fields not created yet is kept and applied when
+      they are created; only created widgets are touched
+    - TABLE fields are shown in a QTableView over a TableRowsModel, which
+      fetches rows as the table is scrolled
+
     RULES (AGENT_RULES.md Section 3-4, unified_upgrade_plan.md):
     - Presentation layer uses DTOs, NOT domain objects
     """
 
+    # Entities with more fields than this render virtualized by default
+    VIRTUALIZATION_THRESHOLD = 100
+    # Field containers created per batch in virtualized mode
+    MATERIALIZE_BATCH_SIZE = 30
+
     def __init__(
         self,
         parent: Optional[QWidget],
@@ -63,6 +82,7 @@ class ProjectView(BaseView):
         entity_definition: EntityDefinitionDTO,
         translation_adapter: QtTranslationAdapter,
         widget_factory: Optional[FieldWidgetFactory] = None,
+        virtualized: Optional[bool] = None,
     ) -> None:
         """Initialize project view.
 
@@ -72,12 +92,18 @@ class ProjectView(BaseView):
             entity_definition: Entity definition DTO (NOT domain object)
             translation_adapter: Qt translation adapter for i18n with RTL/LTR support
             widget_factory: Factory for creating field widgets (default: new instance)
+            virtualized: Create field containers lazily while scrolling
+                (default: only for entities with more than
+                VIRTUALIZATION_THRESHOLD fields)
         """
         super().__init__(parent)
         self._viewmodel = viewmodel
         self._entity_definition = entity_definition
         self._translation_adapter = translation_adapter
         self._widget_factory = widget_factory or FieldWidgetFactory()
+        if virtualized is None:
+            virtualized = len(entity_definition.fields) > self.VIRTUALIZATION_THRESHOLD
+        self._virtualized = virtualized
 
         # UI components
         self._fields_widget: Optional[QWidget] = None
@@ -98,6 +124,12 @@ class ProjectView(BaseView):
         self._field_widgets: dict[str, IFieldWidget] = {}
         # Field containers (QWidgets) mapped by field ID for navigation
         self._field_containers: dict[str, QWidget] = {}
+        # Row models of TABLE fields mapped by field ID
+        self._table_models: dict[str, TableRowsModel] = {}
+        # Number of entity fields (in order) whose containers exist
+        self._materialized_count = 0
+        # Runtime state received for fields not materialized yet
+        self._pending_field_states: dict[str, FormFieldRuntimeStateDTO] = {}
 
         # Track if we've shown undo restoration message (ADR-031)
         self._shown_undo_restore_message = False
@@ -136,6 +168,11 @@ class ProjectView(BaseView):
 
         main_layout.addWidget(self._scroll_area, 1)  # Stretch factor 1
 
+        if self._virtualized:
+            scroll_bar = self._scroll_area.verticalScrollBar()
+            scroll_bar.valueChanged.connect(self._on_fields_scrolled)
+            scroll_bar.rangeChanged.connect(self._on_fields_range_changed)
+
         # Build field widgets
         self._build_field_widgets()
 
@@ -293,8 +330,10 @@ class ProjectView(BaseView):
     def _build_field_widgets(self) -> None:
         """Build field widgets based on entity definition.
 
-        Creates widgets for all fields in entity definition using FieldWidgetFactory.
-        Wires up value change callbacks to sync with ProjectViewModel.
+        Creates widgets for all fields in entity definition using FieldWidgetFactory
+        (in virtualized mode only the first batch; the rest follow as the
+        form is scrolled). Wires up value change callbacks to sync with
+        ProjectViewModel.
         """
         if not self._fields_widget:
             return
@@ -306,35 +345,112 @@ class ProjectView(BaseView):
         # Clear existing widgets
         self._field_widgets.clear()
         self._field_containers.clear()
+        self._dispose_table_models()
+        self._materialized_count = 0
+        self._pending_field_states.clear()
 
-        # Create widget for each field in entity definition
-        for field_def in self._entity_definition.fields:
-            # Create field widget using factory
-            widget = self._widget_factory.create_widget(field_def)
-            if not widget:
-                # Unknown field type - skip (should not happen in v1)
-                continue
+        # Add stretch to push fields to top (containers are inserted above it)
+        layout.addStretch()
+
+        if self._virtualized:
+            self._materialize_fields(self.MATERIALIZE_BATCH_SIZE)
+        else:
+            self._materialize_fields(len(self._entity_definition.fields))
+
+    def _materialize_fields(self, count: int) -> None:
+        """Create widgets and containers for the next fields in entity order.
+
+        Args:
+            count: Maximum number of fields to materialize
+        """
+        layout = self._fields_widget.layout() if self._fields_widget else None
+        if not layout:
+            return
 
-            # Create field container with label and widget
-            field_container = self._create_field_container(field_def, widget)
-            layout.addWidget(field_container)
+        fields = self._entity_definition.fields
+        end = min(self._materialized_count + count, len(fields))
+        for field_def in fields[self._materialized_count:end]:
+            self._materialize_field(field_def, layout)
+        self._materialized_count = end
 
-            # Store widget by field ID for later access
-            self._field_widgets[field_def.id] = widget
-            # Store container for navigation (ADR-026)
-            self._field_containers[field_def.id] = field_container
+    def _materialize_field(self, field_def: FieldDefinitionDTO, layout) -> None:
+        """Create widget and container for one field.
 
-            # Wire up value change callback
-            field_id_value = field_def.id  # Capture for closure
-            widget.on_value_changed(
-                lambda value, fid=field_id_value: self._on_field_value_changed(fid, value)
+        Args:
+            field_def: Field definition DTO
+            layout: Fields layout (the container goes above the trailing stretch)
+        """
+        # Create field widget using factory
+        widget = self._widget_factory.create_widget(field_def, self._viewmodel.project_id)
+        if not widget:
+            # Unknown field type - skip (should not happen in v1)
+            return
+
+        # Create field container with label and widget
+        field_container = self._create_field_container(field_def, widget)
+        layout.insertWidget(layout.count() - 1, field_container)
+
+        # Store widget by field ID for later access
+        self._field_widgets[field_def.id] = widget
+        # Store container for navigation (ADR-026)
+        self._field_containers[field_def.id] = field_container
+
+        # Wire up value change callback
+        field_id_value = field_def.id  # Capture for closure
+        widget.on_value_changed(
+            lambda value, fid=field_id_value: self._on_field_value_changed(fid, value)
+        )
+        if isinstance(widget, TableFieldWidget):
+            # Row edits write only the edited record
+            widget.on_row_changed(
+                lambda change, fid=field_id_value: self._on_table_row_changed(fid, change)
             )
 
-            # Set initial value from project
-            self._set_initial_field_value(field_def.id, widget)
+        # Set initial value from project
+        self._set_initial_field_value(field_def.id, widget)
 
-        # Add stretch to push fields to top
-        layout.addStretch()
+        # Apply runtime state received before the field was materialized
+        pending_state = self._pending_field_states.pop(field_def.id, None)
+        if pending_state is not None:
+            self._apply_field_runtime_state(pending_state, widget)
+
+    def _has_unmaterialized_fields(self) -> bool:
+        """Check if some fields have no container yet."""
+        return self._materialized_count < len(self._entity_definition.fields)
+
+    def _on_fields_scrolled(self, value: int) -> None:
+        """Materialize the next batch when the form is scrolled near its end.
+
+        Args:
+            value: Vertical scroll bar position
+        """
+        if not self._scroll_area or not self._has_unmaterialized_fields():
+            return
+        scroll_bar = self._scroll_area.verticalScrollBar()
+        if value >= scroll_bar.maximum() - scroll_bar.pageStep() // 2:
+            self._materialize_fields(self.MATERIALIZE_BATCH_SIZE)
+
+    def _on_fields_range_changed(self, minimum: int, maximum: int) -> None:
+        """Keep materializing while the created fields do not fill the viewport.
+
+        Args:
+            minimum: Scroll bar minimum
+            maximum: Scroll bar maximum (0 = everything fits)
+        """
+        if maximum == 0 and self._has_unmaterialized_fields():
+            self._materialize_fields(self.MATERIALIZE_BATCH_SIZE)
+
+    def _materialize_through(self, field_id: str) -> None:
+        """Materialize all fields up to and including a field.
+
+        Args:
+            field_id: Field ID
+        """
+        for position, field_def in enumerate(self._entity_definition.fields):
+            if field_def.id == field_id:
+                if position >= self._materialized_count:
+                    self._materialize_fields(position + 1 - self._materialized_count)
+                return
 
     def _create_field_container(
         self, field_def: FieldDefinitionDTO, widget: IFieldWidget
@@ -373,11 +489,20 @@ class ProjectView(BaseView):
             help_label.setWordWrap(True)
             container_layout.addWidget(help_label)
 
-        # Widget placeholder (actual Qt widget will be added by widget implementation)
-        # For now, just add a placeholder label for the widget
-        widget_placeholder = QLabel(f"[{field_def.field_type} widget placeholder]")
-        widget_placeholder.setStyleSheet("padding: 4px; background-color: #f0f0f0; border: 1px solid #cccccc;")
-        container_layout.addWidget(widget_placeholder)
+        if isinstance(widget, TableFieldWidget):
+            # TABLE fields: rows are fetched into the view as it scrolls
+            table_model = TableRowsModel(widget)
+            self._table_models[field_def.id] = table_model
+            table_view = QTableView()
+            table_view.setModel(table_model)
+            table_view.setMinimumHeight(200)
+            container_layout.addWidget(table_view)
+        else:
+            # Widget placeholder (actual Qt widget will be added by widget implementation)
+            # For now, just add a placeholder label for the widget
+            widget_placeholder = QLabel(f"[{field_def.field_type} widget placeholder]")
+            widget_placeholder.setStyleSheet("padding: 4px; background-color: #f0f0f0; border: 1px solid #cccccc;")
+            container_layout.addWidget(widget_placeholder)
 
         # Enable context menu for field history (ADR-027)
         container.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -419,6 +544,23 @@ class ProjectView(BaseView):
         # This is pull-based: explicit call, not observer
         self._update_runtime_state()
 
+    def _on_table_row_changed(self, field_id: str, change: TableRowChange) -> None:
+        """Handle a single-row edit of a TABLE field.
+
+        Args:
+            field_id: TABLE field ID
+            change: Row edit reported by the widget
+        """
+        self._viewmodel.update_table_row(
+            field_id,
+            change.kind,
+            change.index,
+            record=change.record,
+            to_index=change.to_index,
+        )
+
+        self._update_runtime_state()
+
     def _update_validation(self) -> None:
         """Update validation state for all fields.
 
@@ -482,67 +624,86 @@ class ProjectView(BaseView):
             # Find widget by field ID
             widget = self._field_widgets.get(field_state.field_id)
             if not widget:
+                # Not materialized yet (virtualized mode): apply on creation
+                if self._has_unmaterialized_fields():
+                    self._pending_field_states[field_state.field_id] = field_state
                 continue
 
-            # Apply visibility (control rule state)
-            widget.set_visible(field_state.visible)
-
-            # Apply enabled state (control rule state)
-            widget.set_enabled(field_state.enabled)
+            self._apply_field_runtime_state(field_state, widget)
 
-            # Apply validation messages with severity (ADR-025)
-            # Convert tuple of strings to ValidationErrorDTO list
-            error_dtos: list[ValidationErrorDTO] = []
+    def _apply_field_runtime_state(
+        self, field_state: FormFieldRuntimeStateDTO, widget: IFieldWidget
+    ) -> None:
+        """Apply runtime state to one materialized field widget.
 
-            # ERROR severity (blocking)
-            for msg in field_state.validation_errors:
-                error_dtos.append(
-                    ValidationErrorDTO(
-                        field_id=field_state.field_id,
-                        message=msg,
-                        constraint_type="RUNTIME_ERROR",
-                        severity="ERROR",
-                    )
+        Args:
+            field_state: Runtime state of the field
+            widget: The field's widget
+        """
+        # Apply visibility (control rule state)
+        widget.set_visible(field_state.visible)
+
+        # Apply enabled state (control rule state)
+        widget.set_enabled(field_state.enabled)
+
+        # Apply validation messages with severity (ADR-025)
+        # Convert tuple of strings to ValidationErrorDTO list
+        error_dtos: list[ValidationErrorDTO] = []
+
+        # ERROR severity (blocking)
+        for msg in field_state.validation_errors:
+            error_dtos.append(
+                ValidationErrorDTO(
+                    field_id=field_state.field_id,
+                    message=msg,
+                    constraint_type="RUNTIME_ERROR",
+                    severity="ERROR",
                 )
+            )
 
-            # WARNING severity (non-blocking)
-            for msg in field_state.validation_warnings:
-                error_dtos.append(
-                    ValidationErrorDTO(
-                        field_id=field_state.field_id,
-                        message=msg,
-                        constraint_type="RUNTIME_WARNING",
-                        severity="WARNING",
-                    )
+        # WARNING severity (non-blocking)
+        for msg in field_state.validation_warnings:
+            error_dtos.append(
+                ValidationErrorDTO(
+                    field_id=field_state.field_id,
+                    message=msg,
+                    constraint_type="RUNTIME_WARNING",
+                    severity="WARNING",
                 )
+            )
 
-            # INFO severity (informational)
-            for msg in field_state.validation_info:
-                error_dtos.append(
-                    ValidationErrorDTO(
-                        field_id=field_state.field_id,
-                        message=msg,
-                        constraint_type="RUNTIME_INFO",
-                        severity="INFO",
-                    )
+        # INFO severity (informational)
+        for msg in field_state.validation_info:
+            error_dtos.append(
+                ValidationErrorDTO(
+                    field_id=field_state.field_id,
+                    message=msg,
+                    constraint_type="RUNTIME_INFO",
+                    severity="INFO",
                 )
+            )
 
-            widget.set_validation_error_dtos(error_dtos)
+        widget.set_validation_error_dtos(error_dtos)
 
-            # Update field container visibility to match widget
-            container = self._field_containers.get(field_state.field_id)
-            if container:
-                container.setVisible(field_state.visible)
+        # Update field container visibility to match widget
+        container = self._field_containers.get(field_state.field_id)
+        if container:
+            container.setVisible(field_state.visible)
 
     def _get_current_field_values(self) -> dict[str, any]:
         """Get current field values from widgets.
 
         Collects values from all field widgets for runtime evaluation.
+        Fields not materialized yet have no widget and no edits, so they
+        contribute None (the value of a freshly created widget).
 
         Returns:
             Dictionary mapping field_id to current widget value
         """
         field_values: dict[str, any] = {}
+        if self._has_unmaterialized_fields():
+            for field_def in self._entity_definition.fields[self._materialized_count:]:
+                field_values[field_def.id] = None
         for field_id, widget in self._field_widgets.items():
             field_values[field_id] = widget.get_value()
         return field_values
@@ -894,7 +1055,8 @@ class ProjectView(BaseView):
 
         entity_id, field_id = parts
 
-        # Find field container by field ID
+        # Find field container by field ID (creating it if not materialized yet)
+        self._materialize_through(field_id)
         container = self._field_containers.get(field_id)
         if not container or not self._scroll_area:
             self._status_bar.showMessage(f"Field not found: {field_id}")
@@ -1024,6 +1186,12 @@ class ProjectView(BaseView):
         self._on_close()
         event.accept()
 
+    def _dispose_table_models(self) -> None:
+        """Detach TABLE row models from their widgets."""
+        for table_model in self._table_models.values():
+            table_model.dispose()
+        self._table_models.clear()
+
     def dispose(self) -> None:
         """Dispose of the view."""
         # Unsubscribe from ViewModel
@@ -1036,9 +1204,11 @@ class ProjectView(BaseView):
             self._viewmodel.unsubscribe("can_go_forward", self._on_nav_forward_state_changed)
 
         # Dispose field widgets
+        self._dispose_table_models()
         for widget in self._field_widgets.values():
             widget.dispose()
         self._field_widgets.clear()
         self._field_containers.clear()
+        self._pending_field_states.clear()
 
         super().dispose()
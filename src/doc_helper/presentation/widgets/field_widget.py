@@ -68,6 +68,15 @@ class IFieldWidget(ABC):
         """
         return self._value
 
+    @property
+    def is_enabled(self) -> bool:
+        """Get enabled state.
+
+        Returns:
+            True if the widget accepts input
+        """
+        return self._is_enabled
+
     @property
     def has_validation_errors(self) -> bool:
         """Check if field has validation errors (any severity).
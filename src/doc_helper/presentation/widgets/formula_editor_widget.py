@@ -372,17 +372,8 @@ class FormulaEditorWidget(QWidget):
 
     def _subscribe_to_viewmodel(self) -> None:
         """Subscribe to ViewModel property changes."""
-        self._viewmodel.subscribe("validation_result", self._update_from_viewmodel)
-        self._viewmodel.subscribe("is_valid", self._update_validity_indicator)
-        self._viewmodel.subscribe("inferred_type", self._update_type_display)
-        self._viewmodel.subscribe("errors", self._update_error_display)
-        self._viewmodel.subscribe("warnings", self._update_error_display)
-        self._viewmodel.subscribe("field_references", self._update_references_display)
-        # Phase F-5: Subscribe to diagnostic aggregation properties
-        self._viewmodel.subscribe("all_diagnostic_errors", self._update_errors_panel)
-        self._viewmodel.subscribe("all_diagnostic_warnings", self._update_warnings_panel)
-        self._viewmodel.subscribe("all_diagnostic_info", self._update_info_panel)
-        self._viewmodel.subscribe("status_message", self._update_status_hint)
+        # One consolidated update per diagnostics pass refreshes every panel
+        self._viewmodel.subscribe("diagnostics", self._update_from_viewmodel)
 
     def _update_from_viewmodel(self) -> None:
         """Update all UI elements from ViewModel state."""
@@ -399,28 +390,28 @@ class FormulaEditorWidget(QWidget):
     def _on_text_changed(self) -> None:
         """Handle formula text change.
 
-        Uses debouncing to avoid validating on every keystroke.
+        Uses debouncing to avoid validating on every keystroke: the text is
+        handed to the ViewModel immediately, diagnostics run once the user
+        pauses typing.
         """
         if self._suppress_text_change:
             return
 
-        # Cancel any pending validation
-        if self._debounce_timer:
-            self._debounce_timer.stop()
+        self._viewmodel.schedule_formula(self._formula_input.toPlainText())
 
-        # Create new timer for debounced validation
-        self._debounce_timer = QTimer()
-        self._debounce_timer.setSingleShot(True)
-        self._debounce_timer.timeout.connect(self._validate_formula)
+        # Restart the single shared timer (coalesces keystrokes)
+        if self._debounce_timer is None:
+            self._debounce_timer = QTimer(self)
+            self._debounce_timer.setSingleShot(True)
+            self._debounce_timer.timeout.connect(self._validate_formula)
         self._debounce_timer.start(self.VALIDATION_DEBOUNCE_MS)
 
     def _validate_formula(self) -> None:
-        """Validate the current formula text.
+        """Diagnose the latest formula text.
 
         Called after debounce delay.
         """
-        formula_text = self._formula_input.toPlainText()
-        self._viewmodel.set_formula(formula_text)
+        self._viewmodel.flush_diagnostics()
 
     def _update_validity_indicator(self) -> None:
         """Update the validity indicator (checkmark or X)."""
@@ -652,6 +643,8 @@ class FormulaEditorWidget(QWidget):
             self._formula_input.setPlainText(formula_text)
         finally:
             self._suppress_text_change = False
+        if self._debounce_timer:
+            self._debounce_timer.stop()
 
         # Validate immediately
         self._viewmodel.set_formula(formula_text)
@@ -671,6 +664,8 @@ class FormulaEditorWidget(QWidget):
             self._formula_input.clear()
         finally:
             self._suppress_text_change = False
+        if self._debounce_timer:
+            self._debounce_timer.stop()
 
         self._viewmodel.clear_formula()
 
@@ -2,6 +2,14 @@
 
 from typing import Any, Optional
 
+from doc_helper.application.dto import FieldDefinitionDTO
+from doc_helper.application.dto.lookup_dto import LookupPageDTO
+from doc_helper.application.lookup import LookupMatchMode
+from doc_helper.application.services.lookup_source_service import (
+    LookupSourceService,
+    TypeAheadCompleter,
+)
+from doc_helper.domain.common.result import Failure, Result
 from doc_helper.presentation.widgets.field_widget import IFieldWidget
 
 
@@ -15,6 +23,12 @@ class LookupFieldWidget(IFieldWidget):
     - Displays related entity records
     - Reference to another entity's field
 
+    Option sources:
+    - lookup_options: small, fixed option lists (kept in a value -> text dict)
+    - lookup_source: large reference entities; options are paged and
+      completed on demand through LookupSourceService, never loaded whole
+      (FieldWidgetFactory injects it when given an ILookupSourceFactory)
+
     tkinter Implementation Notes (for future):
     - Use ttk.Combobox with state='readonly'
     - Populate from related entity records
@@ -22,14 +36,24 @@ class LookupFieldWidget(IFieldWidget):
     - May include "Add New" button to create related record
     """
 
-    def __init__(self, lookup_options: Optional[list[tuple[Any, str]]] = None) -> None:
+    def __init__(
+        self,
+        field_definition: Optional[FieldDefinitionDTO] = None,
+        lookup_options: Optional[list[tuple[Any, str]]] = None,
+        lookup_source: Optional[LookupSourceService] = None,
+    ) -> None:
         """Initialize lookup widget.
 
         Args:
+            field_definition: Field definition DTO
             lookup_options: List of (value, display_text) tuples
+            lookup_source: Paged option source (takes precedence over
+                lookup_options)
         """
-        super().__init__()
-        self._lookup_options = lookup_options or []
+        super().__init__(field_definition)
+        self._lookup_source = lookup_source
+        self._completer: Optional[TypeAheadCompleter] = None
+        self.set_lookup_options(lookup_options or [])
 
     def set_lookup_options(self, options: list[tuple[Any, str]]) -> None:
         """Set available lookup options.
@@ -38,8 +62,46 @@ class LookupFieldWidget(IFieldWidget):
             options: List of (value, display_text) tuples
         """
         self._lookup_options = options
+        self._display_by_value = dict(options)
         # In tkinter implementation: update Combobox values
 
+    def set_lookup_source(self, source: Optional[LookupSourceService]) -> None:
+        """Set the paged option source.
+
+        Args:
+            source: Lookup source service, or None to use lookup_options
+        """
+        self._lookup_source = source
+        self._completer = None
+
+    def complete(self, text: str) -> Result[LookupPageDTO, str]:
+        """Get the first page of options matching typed text.
+
+        Args:
+            text: Text typed into the input
+
+        Returns:
+            Success(LookupPageDTO) or Failure(error)
+        """
+        if self._lookup_source is None:
+            return Failure("Lookup widget has no lookup source")
+        if self._completer is None:
+            self._completer = self._lookup_source.create_completer(LookupMatchMode.SUBSTRING)
+        # In tkinter implementation: refill the Combobox drop-down from the page
+        return self._completer.update(text)
+
+    def get_display_text(self) -> Optional[str]:
+        """Get the display text of the current value.
+
+        Returns:
+            Display text, or None if no value is set
+        """
+        if self._value is None:
+            return None
+        if self._lookup_source is not None:
+            return self._lookup_source.get_display_text(self._value)
+        return self._display_by_value.get(self._value)
+
     def set_value(self, value: Any) -> None:
         """Set field value.
 
@@ -47,11 +109,12 @@ class LookupFieldWidget(IFieldWidget):
             value: Lookup value (typically an ID)
         """
         # Check if value exists in lookup options
-        valid_values = [v for v, _ in self._lookup_options]
-        if value is None or value in valid_values:
-            self._value = value
-        else:
+        if value is None:
             self._value = None
+        elif self._lookup_source is not None:
+            self._value = value if self._lookup_source.contains(value) else None
+        else:
+            self._value = value if value in self._display_by_value else None
         # In tkinter implementation: update Combobox selection
 
     def get_value(self) -> Optional[Any]:
@@ -0,0 +1,227 @@
+"""Qt item model over the rows of a TableFieldWidget.
+
+A QTableView bound to this model only creates view rows for the records
+it has fetched; further batches are fetched as the view scrolls
+(canFetchMore/fetchMore), so opening a table with thousands of child
+records does not build thousands of rows up front.
+"""
+
+from typing import Any, Optional, Sequence
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from doc_helper.presentation.widgets.table_widget import TableFieldWidget, TableRowChange
+
+
+class TableRowsModel(QAbstractTableModel):
+    """Lazily fetched table model backed by a TableFieldWidget.
+
+    The widget stays the owner of the records; the model exposes the first
+    fetched_row_count of them and follows row edits made through the
+    widget (insert/update/delete/move/reset). Cells edited in the view are
+    written back with TableFieldWidget.update_row(), so they are reported
+    as single-row changes.
+
+    Columns are either given up front (child field IDs) or discovered from
+    the keys of the fetched records.
+
+    Example:
+        model = TableRowsModel(table_widget, columns=("depth", "soil"))
+        view = QTableView()
+        view.setModel(model)  # the view fetches batches as it scrolls
+    """
+
+    FETCH_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        widget: TableFieldWidget,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> None:
+        """Initialize model.
+
+        Args:
+            widget: Table widget holding the records
+            columns: Column keys in display order (None = discover from records)
+            batch_size: Number of rows fetched per fetchMore() call
+        """
+        super().__init__()
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self._widget = widget
+        self._fixed_columns = columns is not None
+        self._columns: list[str] = list(columns) if columns is not None else []
+        self._batch_size = batch_size
+        self._fetched = 0
+        self._widget.add_row_observer(self._on_row_changed)
+
+    @property
+    def fetched_row_count(self) -> int:
+        """Number of rows fetched into the model so far."""
+        return self._fetched
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Column keys in display order."""
+        return tuple(self._columns)
+
+    def dispose(self) -> None:
+        """Stop following the widget's row edits."""
+        self._widget.remove_row_observer(self._on_row_changed)
+
+    # -------------------------------------------------------------------------
+    # QAbstractTableModel interface
+    # -------------------------------------------------------------------------
+
+    def rowCount(self, parent: Optional[QModelIndex] = None) -> int:
+        """Number of fetched rows."""
+        if parent is not None and parent.isValid():
+            return 0
+        return self._fetched
+
+    def columnCount(self, parent: Optional[QModelIndex] = None) -> int:
+        """Number of columns."""
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def canFetchMore(self, parent: Optional[QModelIndex] = None) -> bool:
+        """True while the widget has rows that are not fetched yet."""
+        if parent is not None and parent.isValid():
+            return False
+        return self._fetched < self._widget.row_count
+
+    def fetchMore(self, parent: Optional[QModelIndex] = None) -> None:
+        """Fetch the next batch of rows."""
+        if parent is not None and parent.isValid():
+            return
+        count = min(self._batch_size, self._widget.row_count - self._fetched)
+        if count <= 0:
+            return
+        self._discover_columns(range(self._fetched, self._fetched + count))
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Cell value (display text or raw value for editing)."""
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        record = self._widget.get_row(index.row())
+        if record is None:
+            return None
+        value = record.get(self._columns[index.column()])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "" if value is None else str(value)
+        return value
+
+    def setData(
+        self,
+        index: QModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Write an edited cell back to the widget as a row update."""
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        record = self._widget.get_row(index.row())
+        if record is None:
+            return False
+        updated = dict(record)
+        updated[self._columns[index.column()]] = value
+        self._widget.update_row(index.row(), updated)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Cells are selectable, and editable while the widget is enabled."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if self._widget.is_enabled:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Column keys as horizontal headers, 1-based row numbers as vertical."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._columns):
+                return self._columns[section]
+            return None
+        return str(section + 1)
+
+    # -------------------------------------------------------------------------
+    # Widget row edits
+    # -------------------------------------------------------------------------
+
+    def _on_row_changed(self, change: TableRowChange) -> None:
+        """Mirror a row edit made through the widget (already applied there)."""
+        if change.kind == "insert":
+            # Rows past the fetched range are picked up by fetchMore()
+            if change.index < self._fetched or self._fetched == self._widget.row_count - 1:
+                self._discover_columns((change.index,))
+                self.beginInsertRows(QModelIndex(), change.index, change.index)
+                self._fetched += 1
+                self.endInsertRows()
+        elif change.kind == "update":
+            if change.index < self._fetched:
+                self._discover_columns((change.index,))
+                self.dataChanged.emit(
+                    self.index(change.index, 0),
+                    self.index(change.index, max(len(self._columns) - 1, 0)),
+                )
+        elif change.kind == "delete":
+            if change.index < self._fetched:
+                self.beginRemoveRows(QModelIndex(), change.index, change.index)
+                self._fetched -= 1
+                self.endRemoveRows()
+        elif change.kind == "move" and change.to_index is not None:
+            self._on_row_moved(change.index, change.to_index)
+        else:
+            self.beginResetModel()
+            self._fetched = 0
+            if not self._fixed_columns:
+                self._columns = []
+            self.endResetModel()
+
+    def _on_row_moved(self, from_index: int, to_index: int) -> None:
+        """Mirror a row move."""
+        if from_index < self._fetched and to_index < self._fetched:
+            # Qt's destination is the row the moved row is placed before
+            destination = to_index + 1 if to_index > from_index else to_index
+            self.beginMoveRows(QModelIndex(), from_index, from_index, QModelIndex(), destination)
+            self.endMoveRows()
+        elif min(from_index, to_index) < self._fetched:
+            # The move crosses the fetched boundary; the fetched rows
+            # from the lower index onwards changed
+            self.dataChanged.emit(
+                self.index(min(from_index, to_index), 0),
+                self.index(self._fetched - 1, max(len(self._columns) - 1, 0)),
+            )
+
+    def _discover_columns(self, rows: Sequence[int]) -> None:
+        """Append columns for keys first seen in the given rows."""
+        if self._fixed_columns:
+            return
+        known = set(self._columns)
+        new_columns: list[str] = []
+        for row in rows:
+            record = self._widget.get_row(row) or {}
+            for key in record:
+                if key not in known:
+                    known.add(key)
+                    new_columns.append(key)
+        if new_columns:
+            first = len(self._columns)
+            self.beginInsertColumns(QModelIndex(), first, first + len(new_columns) - 1)
+            self._columns.extend(new_columns)
+            self.endInsertColumns()
@@ -1,10 +1,29 @@
 """Table field widget."""
 
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from doc_helper.presentation.widgets.field_widget import IFieldWidget
 
 
+@dataclass(frozen=True)
+class TableRowChange:
+    """A single-row edit made in a TableFieldWidget.
+
+    Attributes:
+        kind: "insert", "update", "delete" or "move" ("reset" when
+            set_value() replaced all rows; reported to row observers only)
+        index: Row affected (the source row for "move")
+        record: New record for "insert" and "update"
+        to_index: Destination row for "move"
+    """
+
+    kind: str
+    index: int
+    record: Optional[dict[str, Any]] = None
+    to_index: Optional[int] = None
+
+
 class TableFieldWidget(IFieldWidget):
     """Widget for TABLE field type.
 
@@ -29,6 +48,14 @@ class TableFieldWidget(IFieldWidget):
     - Child entity has its own EntityDefinition
     - Validation applies to each child record
     - Formulas can reference child table fields (e.g., SUM, COUNT)
+
+    Row edits:
+    - add_row/insert_row/update_row/delete_row/move_row change one row
+    - With on_row_changed registered, each edit is reported as a
+      TableRowChange (so only that row needs saving); otherwise the
+      whole list is reported through on_value_changed
+    - Row observers (e.g. a TableRowsModel) additionally receive every
+      edit and reset, independent of the callbacks above
     """
 
     def __init__(self, child_entity_name: Optional[str] = None) -> None:
@@ -40,6 +67,8 @@ class TableFieldWidget(IFieldWidget):
         super().__init__()
         self._child_entity_name = child_entity_name
         self._value: list[dict[str, Any]] = []
+        self._row_changed_callback: Optional[Callable[[TableRowChange], None]] = None
+        self._row_observers: list[Callable[[TableRowChange], None]] = []
 
     def set_child_entity(self, child_entity_name: str) -> None:
         """Set child entity definition.
@@ -66,6 +95,8 @@ class TableFieldWidget(IFieldWidget):
         else:
             self._value = []
         # In tkinter implementation: update Treeview rows
+        for observer in list(self._row_observers):
+            observer(TableRowChange("reset", 0))
 
     def get_value(self) -> Optional[list[dict[str, Any]]]:
         """Get field value.
@@ -77,17 +108,73 @@ class TableFieldWidget(IFieldWidget):
             return None
         return self._value
 
+    @property
+    def row_count(self) -> int:
+        """Get number of rows.
+
+        Returns:
+            Number of child records
+        """
+        return len(self._value)
+
+    def get_row(self, index: int) -> Optional[dict[str, Any]]:
+        """Get one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Child record or None if index is out of range
+        """
+        if 0 <= index < len(self._value):
+            return self._value[index]
+        return None
+
+    def on_row_changed(self, callback: Callable[[TableRowChange], None]) -> None:
+        """Register callback for single-row edits.
+
+        Args:
+            callback: Function called with a TableRowChange per edit
+        """
+        self._row_changed_callback = callback
+
+    def add_row_observer(self, observer: Callable[[TableRowChange], None]) -> None:
+        """Register an observer for row edits and resets.
+
+        Args:
+            observer: Function called with a TableRowChange per edit
+        """
+        if observer not in self._row_observers:
+            self._row_observers.append(observer)
+
+    def remove_row_observer(self, observer: Callable[[TableRowChange], None]) -> None:
+        """Unregister a row observer.
+
+        Args:
+            observer: Previously registered observer
+        """
+        if observer in self._row_observers:
+            self._row_observers.remove(observer)
+
     def add_row(self, record: dict[str, Any]) -> None:
         """Add a new row to the table.
 
         Args:
             record: Child record data
         """
-        self._value.append(record)
-        # In tkinter implementation: insert into Treeview
-        # Trigger value changed callback
-        if self._value_changed_callback:
-            self._value_changed_callback(self._value)
+        self.insert_row(len(self._value), record)
+
+    def insert_row(self, index: int, record: dict[str, Any]) -> None:
+        """Insert a new row before index.
+
+        Args:
+            index: Row index of the new row (0..row_count)
+            record: Child record data
+        """
+        if 0 <= index <= len(self._value):
+            self._value.insert(index, record)
+            # In tkinter implementation: insert into Treeview
+            self._notify_row_changed(TableRowChange("insert", index, record=record))
 
     def update_row(self, index: int, record: dict[str, Any]) -> None:
         """Update an existing row.
@@ -99,9 +186,7 @@ class TableFieldWidget(IFieldWidget):
         if 0 <= index < len(self._value):
             self._value[index] = record
             # In tkinter implementation: update Treeview row
-            # Trigger value changed callback
-            if self._value_changed_callback:
-                self._value_changed_callback(self._value)
+            self._notify_row_changed(TableRowChange("update", index, record=record))
 
     def delete_row(self, index: int) -> None:
         """Delete a row from the table.
@@ -112,9 +197,29 @@ class TableFieldWidget(IFieldWidget):
         if 0 <= index < len(self._value):
             del self._value[index]
             # In tkinter implementation: delete from Treeview
-            # Trigger value changed callback
-            if self._value_changed_callback:
-                self._value_changed_callback(self._value)
+            self._notify_row_changed(TableRowChange("delete", index))
+
+    def move_row(self, from_index: int, to_index: int) -> None:
+        """Move a row, keeping the other rows in order.
+
+        Args:
+            from_index: Current row index
+            to_index: New row index
+        """
+        count = len(self._value)
+        if 0 <= from_index < count and 0 <= to_index < count and from_index != to_index:
+            self._value.insert(to_index, self._value.pop(from_index))
+            # In tkinter implementation: Treeview.move
+            self._notify_row_changed(TableRowChange("move", from_index, to_index=to_index))
+
+    def _notify_row_changed(self, change: TableRowChange) -> None:
+        """Report a row edit (falls back to the whole value)."""
+        for observer in list(self._row_observers):
+            observer(change)
+        if self._row_changed_callback:
+            self._row_changed_callback(change)
+        elif self._value_changed_callback:
+            self._value_changed_callback(self._value)
 
     def _update_enabled_state(self) -> None:
         """Update UI to reflect enabled/disabled state."""
@@ -0,0 +1,315 @@
+"""Integration tests for the reverse-dependency index of SqliteSchemaRepository."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from doc_helper.application.commands.schema.delete_field_command import DeleteFieldCommand
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.infrastructure.persistence.sqlite.repositories.schema_repository import (
+    SqliteSchemaRepository,
+)
+from doc_helper.infrastructure.persistence.sqlite.schema_bootstrap import (
+    bootstrap_schema_database,
+)
+from doc_helper.infrastructure.persistence.sqlite.schema_dependency_index import (
+    SchemaDependencyIndex,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Bootstrapped schema database: project (root) with a borehole child.
+
+    project.depth_from <- project.depth_total (formula)
+    project.depth_total <- project.status (control rule)
+    borehole.project_ref is a LOOKUP on project displaying depth_total
+    """
+    path = tmp_path / "config.db"
+    bootstrap_schema_database(path)
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        INSERT INTO entities (id, name_key, is_root_entity) VALUES ('project', 'e.p', 1);
+        INSERT INTO entities (id, name_key, is_root_entity, parent_entity_id)
+            VALUES ('borehole', 'e.b', 0, 'project');
+        INSERT INTO fields (id, entity_id, field_type, label_key) VALUES
+            ('depth_from', 'project', 'number', 'f'),
+            ('status', 'project', 'text', 'f'),
+            ('boreholes', 'project', 'table', 'f');
+        UPDATE fields SET child_entity_id = 'borehole' WHERE id = 'boreholes';
+        INSERT INTO fields (id, entity_id, field_type, label_key, formula) VALUES
+            ('depth_total', 'project', 'calculated', 'f', '{{depth_from}} * 2');
+        INSERT INTO fields (id, entity_id, field_type, label_key, lookup_entity_id,
+                            lookup_display_field)
+            VALUES ('project_ref', 'borehole', 'lookup', 'f', 'project', 'depth_total');
+        INSERT INTO control_rules (field_id, rule_type, formula_text)
+            VALUES ('status', 'VISIBILITY', 'depth_total > 10');
+        INSERT INTO output_mappings (id, entity_id, field_id, output_type, target_tag)
+            VALUES ('m1', 'project', 'depth_total', 'WORD', '{{DEPTH}}');
+        """
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def repository(db_path: Path) -> SqliteSchemaRepository:
+    return SqliteSchemaRepository(db_path)
+
+
+def _execute(db_path: Path, sql: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(sql)
+    conn.commit()
+    conn.close()
+
+
+def _field_deps(repository, entity_id: str, field_id: str) -> dict:
+    return repository.get_field_dependencies(
+        EntityDefinitionId(entity_id), FieldDefinitionId(field_id)
+    ).value
+
+
+class TestDirectDependencies:
+    """Direct references served from the index."""
+
+    def test_field_references(self, repository):
+        """Formula, control rule, lookup display and output mapping references."""
+        assert _field_deps(repository, "project", "depth_from")["referenced_by_formulas"] == [
+            ("project", "depth_total")
+        ]
+        deps = _field_deps(repository, "project", "depth_total")
+        assert deps["referenced_by_control_rules"] == [("project", "status")]
+        assert deps["referenced_by_lookup_display"] == [("borehole", "project_ref")]
+        assert deps["referenced_by_output_mappings"] == [("WORD", "{{DEPTH}}")]
+
+    def test_entity_references(self, repository, db_path):
+        """TABLE, LOOKUP, child and relationship references."""
+        _execute(
+            db_path,
+            """
+            INSERT INTO relationships (id, source_entity_id, target_entity_id,
+                                       relationship_type, name_key)
+                VALUES ('project_has_boreholes', 'project', 'borehole', 'CONTAINS', 'r');
+            """,
+        )
+
+        project = repository.get_entity_dependencies(EntityDefinitionId("project")).value
+        borehole = repository.get_entity_dependencies(EntityDefinitionId("borehole")).value
+
+        assert project["referenced_by_lookup_fields"] == [("borehole", "project_ref")]
+        assert project["child_entities"] == ["borehole"]
+        assert project["referenced_by_relationships"] == [("project_has_boreholes", "borehole")]
+        assert borehole["referenced_by_table_fields"] == [("project", "boreholes")]
+        assert borehole["referenced_by_relationships"] == [("project_has_boreholes", "project")]
+
+    def test_string_literals_are_not_references(self, repository, db_path):
+        """A field name inside a string literal is not a reference."""
+        _execute(
+            db_path,
+            """
+            INSERT INTO fields (id, entity_id, field_type, label_key, formula)
+                VALUES ('label', 'project', 'calculated', 'f', 'concat("status: ", depth_from)');
+            """,
+        )
+
+        assert _field_deps(repository, "project", "status")["referenced_by_formulas"] == []
+        assert ("project", "label") in _field_deps(repository, "project", "depth_from")[
+            "referenced_by_formulas"
+        ]
+
+
+    def test_function_names_are_not_references(self, repository, db_path):
+        """Fields named like functions are only referenced as operands."""
+        _execute(
+            db_path,
+            """
+            INSERT INTO fields (id, entity_id, field_type, label_key) VALUES
+                ('min', 'project', 'number', 'f'),
+                ('sum_of', 'project', 'number', 'f');
+            INSERT INTO fields (id, entity_id, field_type, label_key, formula)
+                VALUES ('total', 'project', 'calculated', 'f',
+                        'min(depth_from, 3) + sum_of(boreholes.depth)');
+            """,
+        )
+
+        assert _field_deps(repository, "project", "min")["referenced_by_formulas"] == []
+        assert _field_deps(repository, "project", "sum_of")["referenced_by_formulas"] == []
+        assert ("project", "total") in _field_deps(repository, "project", "boreholes")[
+            "referenced_by_formulas"
+        ]
+        assert ("project", "total") in _field_deps(repository, "project", "depth_from")[
+            "referenced_by_formulas"
+        ]
+
+    def test_unparseable_formula_falls_back_to_identifiers(self, repository, db_path):
+        """A formula that does not parse still references the fields it names."""
+        _execute(
+            db_path,
+            "UPDATE fields SET formula = '{{depth_from}} + min(' WHERE id = 'depth_total'",
+        )
+
+        assert ("project", "depth_total") in _field_deps(repository, "project", "depth_from")[
+            "referenced_by_formulas"
+        ]
+
+    def test_field_used_by_broken_formula_cannot_be_deleted(self, repository, db_path):
+        """Deleting a field named only by an unparseable formula is blocked."""
+        _execute(db_path, "UPDATE fields SET formula = 'depth_from +' WHERE id = 'depth_total'")
+
+        result = DeleteFieldCommand(repository).execute("project", "depth_from")
+
+        assert result.is_failure()
+        assert "depth_total" in result.error
+        assert repository.get_by_id(EntityDefinitionId("project")).value.fields.get(
+            FieldDefinitionId("depth_from")
+        ) is not None
+
+
+class TestIncrementalMaintenance:
+    """Writes are picked up per changed entity, without a rebuild."""
+
+    def test_writes_reload_only_changed_entities(self, repository, db_path, monkeypatch):
+        """External writes are seen; only the logged entities are reloaded."""
+        repository.get_entity_dependencies(EntityDefinitionId("project"))
+        rebuilds = []
+        loads = []
+        original_load = SchemaDependencyIndex._load
+        monkeypatch.setattr(SchemaDependencyIndex, "_rebuild", lambda *args: rebuilds.append(1))
+        monkeypatch.setattr(
+            SchemaDependencyIndex,
+            "_load",
+            lambda self, cursor, ids: loads.append(ids) or original_load(self, cursor, ids),
+        )
+
+        _execute(
+            db_path,
+            """
+            UPDATE fields SET formula = '{{status}}' WHERE id = 'depth_total';
+            DELETE FROM control_rules WHERE field_id = 'status';
+            """,
+        )
+        deps = _field_deps(repository, "project", "depth_from")
+
+        assert deps["referenced_by_formulas"] == []
+        assert _field_deps(repository, "project", "status")["referenced_by_formulas"] == [
+            ("project", "depth_total")
+        ]
+        assert _field_deps(repository, "project", "depth_total")[
+            "referenced_by_control_rules"
+        ] == []
+        assert rebuilds == []
+        assert loads == [("project",)]
+
+    def test_deleted_entity_drops_its_references(self, repository):
+        """Deleting through the repository removes what the entity owned."""
+        repository.get_entity_dependencies(EntityDefinitionId("project"))
+
+        assert repository.delete(EntityDefinitionId("borehole")).is_success()
+
+        project = repository.get_entity_dependencies(EntityDefinitionId("project")).value
+        assert project["referenced_by_lookup_fields"] == []
+        assert project["child_entities"] == []
+        assert repository.get_entity_dependencies(EntityDefinitionId("borehole")).is_failure()
+
+    def test_schema_change_rebuilds(self, repository, db_path, monkeypatch):
+        """DDL changes (PRAGMA schema_version) rebuild the index."""
+        repository.get_entity_dependencies(EntityDefinitionId("project"))
+        _execute(db_path, "CREATE TABLE extra (id TEXT)")
+        rebuilds = []
+        original_rebuild = SchemaDependencyIndex._rebuild
+        monkeypatch.setattr(
+            SchemaDependencyIndex,
+            "_rebuild",
+            lambda self, cursor: rebuilds.append(1) or original_rebuild(self, cursor),
+        )
+
+        repository.get_entity_dependencies(EntityDefinitionId("project"))
+
+        assert rebuilds == [1]
+
+    def test_log_keeps_one_row_per_entity(self, repository, db_path):
+        """Repeated writes re-sequence the entity instead of growing the log."""
+        for value in range(5):
+            _execute(db_path, f"UPDATE fields SET formula = '{value}' WHERE id = 'depth_total'")
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT entity_id FROM schema_dependency_log").fetchall()
+        conn.close()
+        assert sorted(rows) == [("borehole",), ("project",)]
+
+
+class TestImpactAnalysis:
+    """Transitive closures."""
+
+    def test_field_impact_is_transitive(self, repository):
+        """depth_from -> depth_total -> status and borehole.project_ref."""
+        result = repository.get_field_impact(
+            EntityDefinitionId("project"), FieldDefinitionId("depth_from")
+        )
+
+        assert result.value == (
+            ("borehole", "project_ref"),
+            ("project", "depth_total"),
+            ("project", "status"),
+        )
+
+    def test_field_impact_handles_cycles(self, repository, db_path):
+        """Mutually referencing formulas terminate."""
+        _execute(db_path, "UPDATE fields SET formula = 'depth_total' WHERE id = 'depth_from'")
+
+        result = repository.get_field_impact(
+            EntityDefinitionId("project"), FieldDefinitionId("depth_from")
+        )
+
+        assert ("project", "depth_total") in result.value
+        assert ("project", "depth_from") not in result.value
+
+    def test_entity_impact(self, repository):
+        """Deleting borehole breaks the TABLE field; project fields are unaffected."""
+        borehole = repository.get_entity_impact(EntityDefinitionId("borehole")).value
+        project = repository.get_entity_impact(EntityDefinitionId("project")).value
+
+        assert borehole == {"entities": [], "fields": [("project", "boreholes")]}
+        assert project == {"entities": ["borehole"], "fields": [("borehole", "project_ref")]}
+
+    def test_unknown_field_fails(self, repository):
+        result = repository.get_field_impact(
+            EntityDefinitionId("project"), FieldDefinitionId("missing")
+        )
+
+        assert result.is_failure()
+
+
+class TestUntrackedDatabases:
+    """Databases without the change log."""
+
+    def test_read_only_snapshot(self, db_path):
+        """Read-only repositories build the index once."""
+        repository = SqliteSchemaRepository(db_path, read_only=True)
+
+        assert _field_deps(repository, "project", "depth_from")["referenced_by_formulas"] == [
+            ("project", "depth_total")
+        ]
+
+    def test_database_without_log_is_rebuilt_per_query(self, db_path):
+        """Without the log every query sees the current data."""
+        _execute(db_path, "DROP TABLE schema_dependency_log")
+        conn = sqlite3.connect(db_path)
+        triggers = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'schema_dependency%'"
+        ).fetchall()
+        for (name,) in triggers:
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.commit()
+        conn.close()
+        repository = SqliteSchemaRepository(db_path)
+        repository.get_entity_dependencies(EntityDefinitionId("project"))
+
+        _execute(db_path, "UPDATE fields SET formula = NULL WHERE id = 'depth_total'")
+
+        assert _field_deps(repository, "project", "depth_from")["referenced_by_formulas"] == []
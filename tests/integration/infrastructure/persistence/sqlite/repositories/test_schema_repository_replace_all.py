@@ -0,0 +1,174 @@
+"""Integration tests for bulk schema replacement (schema import).
+
+Tests that replace_all() writes a whole schema in one transaction and
+leaves the previous schema untouched when anything fails.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from doc_helper.application.dto.export_dto import ControlRuleExportDTO
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.relationship_definition import RelationshipDefinition
+from doc_helper.domain.schema.relationship_type import RelationshipType
+from doc_helper.domain.schema.schema_ids import (
+    EntityDefinitionId,
+    FieldDefinitionId,
+    RelationshipDefinitionId,
+)
+from doc_helper.domain.validation.constraints import MinLengthConstraint, RequiredConstraint
+from doc_helper.infrastructure.persistence.sqlite.repositories.schema_repository import (
+    SqliteSchemaRepository,
+)
+from doc_helper.infrastructure.persistence.sqlite.schema_bootstrap import (
+    bootstrap_schema_database,
+)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> SqliteSchemaRepository:
+    """Create repository on a freshly bootstrapped config database."""
+    db_path = tmp_path / "config.db"
+    bootstrap_schema_database(db_path)
+    return SqliteSchemaRepository(db_path)
+
+
+def _entity(entity_id: str, field_count: int = 3, is_root: bool = False) -> EntityDefinition:
+    """Build an entity with text, dropdown and constrained fields."""
+    fields = {}
+    for i in range(field_count):
+        field_id = FieldDefinitionId(f"{entity_id}_f{i}")
+        if i % 3 == 1:
+            field = FieldDefinition(
+                id=field_id,
+                field_type=FieldType.DROPDOWN,
+                label_key=TranslationKey(f"field.{field_id.value}"),
+                options=(
+                    ("a", TranslationKey("option.a")),
+                    ("b", TranslationKey("option.b")),
+                ),
+                control_rules=(
+                    ControlRuleExportDTO(
+                        rule_type="visibility", target_field_id=field_id.value, formula_text="true"
+                    ),
+                ),
+            )
+        else:
+            field = FieldDefinition(
+                id=field_id,
+                field_type=FieldType.TEXT,
+                label_key=TranslationKey(f"field.{field_id.value}"),
+                required=True,
+                constraints=(RequiredConstraint(), MinLengthConstraint(min_length=2)),
+            )
+        fields[field_id] = field
+    return EntityDefinition(
+        id=EntityDefinitionId(entity_id),
+        name_key=TranslationKey(f"entity.{entity_id}"),
+        is_root_entity=is_root,
+        fields=fields,
+    )
+
+
+def _count(repository: SqliteSchemaRepository, table: str) -> int:
+    conn = sqlite3.connect(repository.db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestReplaceAll:
+    """Tests for SqliteSchemaRepository.replace_all()."""
+
+    def test_writes_all_schema_tables(self, repository: SqliteSchemaRepository) -> None:
+        """Entities, fields, constraints, options, control rules and relationships are stored."""
+        project = _entity("project", is_root=True)
+        borehole = _entity("borehole")
+        relationship = RelationshipDefinition(
+            id=RelationshipDefinitionId("project_boreholes"),
+            source_entity_id=project.id,
+            target_entity_id=borehole.id,
+            relationship_type=RelationshipType.CONTAINS,
+            name_key=TranslationKey("relationship.project_boreholes"),
+        )
+
+        result = repository.replace_all((project, borehole), (relationship,))
+
+        assert result.is_success()
+        assert _count(repository, "entities") == 2
+        assert _count(repository, "fields") == 6
+        assert _count(repository, "validation_rules") == 8
+        assert _count(repository, "field_options") == 4
+        assert _count(repository, "control_rules") == 2
+        assert _count(repository, "relationships") == 1
+
+        loaded = repository.get_by_id(EntityDefinitionId("project")).value
+        assert loaded.is_root_entity is True
+        assert len(loaded.get_field(FieldDefinitionId("project_f0")).constraints) == 2
+
+    def test_replaces_previous_schema(self, repository: SqliteSchemaRepository) -> None:
+        """Entities missing from the new schema are removed."""
+        repository.replace_all((_entity("old", is_root=True),))
+
+        result = repository.replace_all((_entity("new", is_root=True),))
+
+        assert result.is_success()
+        ids = [e.id.value for e in repository.get_all().value]
+        assert ids == ["new"]
+        assert _count(repository, "validation_rules") == 4
+
+    def test_failure_rolls_back_everything(self, repository: SqliteSchemaRepository) -> None:
+        """A failing row leaves the previous schema untouched."""
+        repository.replace_all((_entity("original", is_root=True),))
+        dangling = RelationshipDefinition(
+            id=RelationshipDefinitionId("dangling"),
+            source_entity_id=EntityDefinitionId("replacement"),
+            target_entity_id=EntityDefinitionId("missing"),
+            relationship_type=RelationshipType.REFERENCES,
+            name_key=TranslationKey("relationship.dangling"),
+        )
+
+        result = repository.replace_all((_entity("replacement", is_root=True),), (dangling,))
+
+        assert result.is_failure()
+        ids = [e.id.value for e in repository.get_all().value]
+        assert ids == ["original"]
+        assert _count(repository, "fields") == 3
+        assert _count(repository, "relationships") == 0
+
+    def test_entities_may_reference_later_entities(self, repository: SqliteSchemaRepository) -> None:
+        """Foreign keys are checked at commit, not per row."""
+        child = EntityDefinition(
+            id=EntityDefinitionId("child"),
+            name_key=TranslationKey("entity.child"),
+            parent_entity_id=EntityDefinitionId("parent"),
+        )
+
+        result = repository.replace_all((child, _entity("parent", is_root=True)))
+
+        assert result.is_success()
+        assert _count(repository, "entities") == 2
+
+    @pytest.mark.slow
+    def test_benchmark_200_entity_import(self, repository: SqliteSchemaRepository) -> None:
+        """Importing 200 entities x 20 fields takes well under a second."""
+        entities = tuple(
+            _entity(f"entity_{i:03d}", field_count=20, is_root=(i == 0))
+            for i in range(200)
+        )
+
+        start = time.perf_counter()
+        result = repository.replace_all(entities)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nreplace_all: 200 entities / 4000 fields in {elapsed * 1000:.1f}ms")
+        assert result.is_success()
+        assert _count(repository, "fields") == 4000
+        assert elapsed < 1.0
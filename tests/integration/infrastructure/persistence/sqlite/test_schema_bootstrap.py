@@ -16,7 +16,9 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
+from doc_helper.infrastructure.persistence.sqlite import schema_bootstrap
 from doc_helper.infrastructure.persistence.sqlite.schema_bootstrap import (
+    SANITIZER_VERSION,
     SchemaBootstrapError,
     bootstrap_schema_database,
 )
@@ -655,3 +657,113 @@ class TestBootstrapSanitization:
             remaining = [row[0] for row in cursor.fetchall()]
             assert remaining == ["lookup3"]
             conn.close()
+
+
+class TestBootstrapCleanStamp:
+    """Test skip-if-clean sanitization.
+
+    A clean pass is stamped with PRAGMA user_version and a dirty flag that
+    triggers set on writes; sanitizers only re-run after modifications.
+    """
+
+    @pytest.fixture
+    def sanitizer_calls(self, monkeypatch) -> list:
+        """Record calls of the lookup sanitizer."""
+        calls = []
+        original = schema_bootstrap._sanitize_lookup_fields_without_entity_id
+
+        def counting(cursor):
+            calls.append(1)
+            return original(cursor)
+
+        monkeypatch.setattr(
+            schema_bootstrap, "_sanitize_lookup_fields_without_entity_id", counting
+        )
+        return calls
+
+    @staticmethod
+    def _stamp(db_path: Path) -> tuple:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            dirty = conn.execute("SELECT dirty FROM schema_bootstrap_state").fetchone()[0]
+            return user_version, dirty
+        finally:
+            conn.close()
+
+    def test_new_database_is_stamped_clean(self) -> None:
+        """A freshly created database needs no sanitizing."""
+        with TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_config.db"
+
+            bootstrap_schema_database(db_path)
+
+            assert self._stamp(db_path) == (SANITIZER_VERSION, 0)
+
+    def test_clean_database_skips_sanitizers(self, sanitizer_calls) -> None:
+        """Sanitizers do not run again on an unmodified database."""
+        with TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_config.db"
+            bootstrap_schema_database(db_path)
+
+            bootstrap_schema_database(db_path)
+            bootstrap_schema_database(db_path)
+
+            assert sanitizer_calls == []
+
+    def test_modification_triggers_sanitizers(self, sanitizer_calls) -> None:
+        """Writing to the sanitized tables marks the database dirty."""
+        with TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_config.db"
+            bootstrap_schema_database(db_path)
+
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(
+                "INSERT INTO entities (id, name_key, is_root_entity) VALUES (?, ?, ?)",
+                ("test_entity", "entity.test", 1),
+            )
+            conn.execute(
+                "INSERT INTO fields (id, entity_id, field_type, label_key) VALUES (?, ?, ?, ?)",
+                ("name", "test_entity", "text", "field.name"),
+            )
+            conn.commit()
+            conn.close()
+            assert self._stamp(db_path) == (SANITIZER_VERSION, 1)
+
+            bootstrap_schema_database(db_path)
+            assert sanitizer_calls == [1]
+            assert self._stamp(db_path) == (SANITIZER_VERSION, 0)
+
+            bootstrap_schema_database(db_path)
+            assert sanitizer_calls == [1]
+
+    def test_older_sanitizer_version_reruns(self, sanitizer_calls) -> None:
+        """A database stamped by older sanitizers is sanitized again."""
+        with TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_config.db"
+            bootstrap_schema_database(db_path)
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(f"PRAGMA user_version = {SANITIZER_VERSION - 1}")
+            conn.commit()
+            conn.close()
+
+            bootstrap_schema_database(db_path)
+
+            assert sanitizer_calls == [1]
+            assert self._stamp(db_path) == (SANITIZER_VERSION, 0)
+
+    def test_unstamped_database_is_sanitized_and_stamped(self, sanitizer_calls) -> None:
+        """A database created before stamping gets a full pass, then the stamp."""
+        with TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_config.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.executescript(schema_bootstrap.ENTITIES_TABLE_DDL)
+            conn.executescript(schema_bootstrap.FIELDS_TABLE_DDL)
+            conn.executescript(schema_bootstrap.VALIDATION_RULES_TABLE_DDL)
+            conn.commit()
+            conn.close()
+
+            bootstrap_schema_database(db_path)
+
+            assert sanitizer_calls == [1]
+            assert self._stamp(db_path) == (SANITIZER_VERSION, 0)
@@ -0,0 +1,438 @@
+"""Integration tests for FleetMigrationJob and the bulk repository methods."""
+
+import json
+import multiprocessing
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.common.result import Failure, Success
+from doc_helper.domain.project.field_value import FieldValue
+from doc_helper.domain.project.project import Project
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_change import ChangeType, SchemaChange
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.validation.constraints import MinValueConstraint, RequiredConstraint
+from doc_helper.infrastructure.persistence.fleet_migration_job import (
+    FieldRename,
+    FleetMigrationJob,
+)
+from doc_helper.infrastructure.persistence.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+
+
+def _project(values: dict, entity_id: str = "project") -> Project:
+    return Project(
+        id=ProjectId(uuid4()),
+        name="Site",
+        app_type_id="soil_investigation",
+        entity_definition_id=EntityDefinitionId(entity_id),
+        field_values={
+            FieldDefinitionId(key): FieldValue(field_id=FieldDefinitionId(key), value=value)
+            for key, value in values.items()
+        },
+    )
+
+
+def _new_schema() -> dict[str, EntityDefinition]:
+    """New schema: 'location' renamed to 'site_location', 'legacy' removed,
+    'depth' must be at least 0."""
+    fields = (
+        FieldDefinition(
+            id=FieldDefinitionId("site_location"),
+            field_type=FieldType.TEXT,
+            label_key=TranslationKey("field.site_location"),
+            required=True,
+            constraints=(RequiredConstraint(),),
+        ),
+        FieldDefinition(
+            id=FieldDefinitionId("depth"),
+            field_type=FieldType.NUMBER,
+            label_key=TranslationKey("field.depth"),
+            constraints=(MinValueConstraint(min_value=0),),
+        ),
+        FieldDefinition(
+            id=FieldDefinitionId("layers"),
+            field_type=FieldType.TABLE,
+            label_key=TranslationKey("field.layers"),
+            child_entity_id=EntityDefinitionId("layer"),
+        ),
+    )
+    entity = EntityDefinition(
+        id=EntityDefinitionId("project"),
+        name_key=TranslationKey("entity.project"),
+        fields={f.id: f for f in fields},
+    )
+    return {"project": entity}
+
+
+CHANGES = (
+    SchemaChange(ChangeType.FIELD_REMOVED, entity_id="project", field_id="location"),
+    SchemaChange(ChangeType.FIELD_ADDED, entity_id="project", field_id="site_location"),
+    SchemaChange(ChangeType.FIELD_REMOVED, entity_id="project", field_id="legacy"),
+    SchemaChange(
+        ChangeType.FIELD_TYPE_CHANGED,
+        entity_id="project",
+        field_id="depth",
+        old_value="TEXT",
+        new_value="NUMBER",
+    ),
+)
+RENAMES = (FieldRename("project", "location", "site_location"),)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> SqliteProjectRepository:
+    """Projects database whose TABLE fields come from the new schema."""
+    schema = _new_schema()
+    schema_repository = Mock()
+    schema_repository.get_by_id.side_effect = lambda entity_id: (
+        Success(schema[entity_id.value])
+        if entity_id.value in schema
+        else Failure(f"Entity '{entity_id.value}' not found")
+    )
+    return SqliteProjectRepository(tmp_path / "projects.db", schema_repository=schema_repository)
+
+
+def _job(repository, tmp_path, **kwargs) -> FleetMigrationJob:
+    return FleetMigrationJob(
+        repository=repository,
+        entity_definitions=_new_schema(),
+        checkpoint_path=tmp_path / "fleet.json",
+        **kwargs,
+    )
+
+
+class TestBulkFieldMigration:
+    """Tests for the set-based repository migrations."""
+
+    def test_rename_moves_values_and_table_rows(self, repository):
+        """Renamed field values (including TABLE rows) move to the new ID."""
+        project = _project({"location": "Berlin", "layers": [{"soil": "clay"}]})
+        other_entity = _project({"location": "Paris"}, entity_id="borehole")
+        repository.save(project)
+        repository.save(other_entity)
+
+        renamed = repository.rename_field_values(
+            EntityDefinitionId("project"),
+            FieldDefinitionId("location"),
+            FieldDefinitionId("site_location"),
+        )
+        repository.rename_field_values(
+            EntityDefinitionId("project"),
+            FieldDefinitionId("layers"),
+            FieldDefinitionId("strata"),
+        )
+
+        assert renamed.value == 1
+        loaded = repository.get_by_id(project.id).value
+        assert loaded.get_field_value(FieldDefinitionId("site_location")).value == "Berlin"
+        assert loaded.get_field_value(FieldDefinitionId("strata")).value == [{"soil": "clay"}]
+        assert FieldDefinitionId("location") not in loaded.field_values
+        assert FieldDefinitionId("layers") not in loaded.field_values
+        # Projects of other entities are untouched
+        untouched = repository.get_by_id(other_entity.id).value
+        assert untouched.get_field_value(FieldDefinitionId("location")).value == "Paris"
+
+    def test_rename_keeps_existing_new_value(self, repository):
+        """A value already stored under the new ID wins over the old one."""
+        project = _project({"location": "old", "site_location": "new"})
+        repository.save(project)
+
+        repository.rename_field_values(
+            EntityDefinitionId("project"),
+            FieldDefinitionId("location"),
+            FieldDefinitionId("site_location"),
+        )
+
+        loaded = repository.get_by_id(project.id).value
+        assert loaded.get_field_value(FieldDefinitionId("site_location")).value == "new"
+        assert FieldDefinitionId("location") not in loaded.field_values
+
+    def test_delete_field_values(self, repository):
+        """Removed field values are deleted from every project of the entity."""
+        projects = [_project({"legacy": i, "depth": i}) for i in range(3)]
+        for project in projects:
+            repository.save(project)
+
+        deleted = repository.delete_field_values(
+            EntityDefinitionId("project"), FieldDefinitionId("legacy")
+        )
+
+        assert deleted.value == 3
+        for project in projects:
+            loaded = repository.get_by_id(project.id).value
+            assert FieldDefinitionId("legacy") not in loaded.field_values
+            assert FieldDefinitionId("depth") in loaded.field_values
+
+    def test_get_page_walks_all_projects_in_id_order(self, repository):
+        """Keyset pages cover every project exactly once."""
+        ids = set()
+        for i in range(7):
+            project = _project({"depth": i})
+            repository.save(project)
+            ids.add(str(project.id.value))
+
+        seen = []
+        after = None
+        while True:
+            page = repository.get_page(after, limit=3).value
+            if not page:
+                break
+            seen.extend(str(project.id.value) for project in page)
+            after = seen[-1]
+
+        assert seen == sorted(ids)
+
+
+class TestFleetMigrationJob:
+    """Tests for FleetMigrationJob."""
+
+    def _populate(self, repository) -> dict[str, str]:
+        """Two valid projects, one invalid, one orphan."""
+        projects = {
+            "valid_a": _project({"location": "A", "depth": 1, "legacy": "x"}),
+            "valid_b": _project({"location": "B", "depth": 2}),
+            "invalid": _project({"location": "C", "depth": -5}),
+            "orphan": _project({"name": "gone"}, entity_id="removed_entity"),
+        }
+        for project in projects.values():
+            repository.save(project)
+        return {key: str(project.id.value) for key, project in projects.items()}
+
+    def test_run_migrates_and_reports(self, repository, tmp_path):
+        """Migrations are applied and invalid/orphaned projects reported."""
+        ids = self._populate(repository)
+
+        result = _job(repository, tmp_path, page_size=2).run(CHANGES, RENAMES)
+
+        assert result.is_success()
+        report = result.value
+        assert report.total_projects == 4
+        assert report.renamed_values == 3
+        assert report.removed_values == 1
+        assert [issue.project_id for issue in report.invalid_projects] == [ids["invalid"]]
+        assert report.invalid_projects[0].messages[0].startswith("depth: MinValueConstraint")
+        assert report.orphaned_project_ids == (ids["orphan"],)
+        assert report.review_locations == ("project.depth",)
+        assert report.valid_projects == 2
+        assert report.resumed is False
+
+        written = json.loads((tmp_path / "fleet.report.json").read_text())
+        assert written["valid_projects"] == 2
+
+    def test_interrupted_run_resumes_from_checkpoint(self, repository, tmp_path, monkeypatch):
+        """A rerun continues after the last recorded page."""
+        ids = self._populate(repository)
+        job = _job(repository, tmp_path, page_size=1)
+
+        original_record = FleetMigrationJob._record_page
+        recorded = []
+
+        def record_then_crash(self, checkpoint, items, outcome):
+            original_record(self, checkpoint, items, outcome)
+            recorded.append(items[0][0])
+            if len(recorded) == 2:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(FleetMigrationJob, "_record_page", record_then_crash)
+        with pytest.raises(KeyboardInterrupt):
+            job.run(CHANGES, RENAMES)
+        monkeypatch.setattr(FleetMigrationJob, "_record_page", original_record)
+
+        pages = []
+        original_get_page = repository.get_page
+        monkeypatch.setattr(
+            repository,
+            "get_page",
+            lambda after, *args: pages.append(after) or original_get_page(after, *args),
+        )
+        result = job.run(CHANGES, RENAMES)
+
+        report = result.value
+        assert report.resumed is True
+        assert pages[0] == recorded[-1]
+        assert report.total_projects == 4
+        assert report.renamed_values == 3
+        assert [issue.project_id for issue in report.invalid_projects] == [ids["invalid"]]
+
+    def test_checkpoint_of_other_job_is_discarded(self, repository, tmp_path):
+        """A checkpoint written for different changes is not resumed."""
+        self._populate(repository)
+        _job(repository, tmp_path).run(CHANGES, RENAMES)
+
+        result = _job(repository, tmp_path).run(CHANGES[:1], RENAMES)
+
+        assert result.value.resumed is False
+        assert result.value.total_projects == 4
+
+    def test_process_pool_gives_same_report(self, repository, tmp_path):
+        """Re-validation in worker processes reports the same projects."""
+        self._populate(repository)
+        sequential = _job(repository, tmp_path, page_size=1).run(CHANGES, RENAMES).value
+
+        pooled = FleetMigrationJob(
+            repository=repository,
+            entity_definitions=_new_schema(),
+            checkpoint_path=tmp_path / "pooled.json",
+            page_size=1,
+            max_workers=2,
+        ).run(CHANGES, RENAMES).value
+
+        assert pooled.invalid_projects == sequential.invalid_projects
+        assert pooled.orphaned_project_ids == sequential.orphaned_project_ids
+        assert pooled.total_projects == sequential.total_projects
+
+    def test_spawned_workers_rebuild_the_schema(self, repository, tmp_path):
+        """Workers started with spawn rebuild the definitions from schema JSON."""
+        self._populate(repository)
+        sequential = _job(repository, tmp_path).run(CHANGES, RENAMES).value
+
+        spawned = FleetMigrationJob(
+            repository=repository,
+            entity_definitions=_new_schema(),
+            checkpoint_path=tmp_path / "spawned.json",
+            page_size=1,
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+        ).run(CHANGES, RENAMES).value
+
+        assert spawned.invalid_projects == sequential.invalid_projects
+        assert spawned.orphaned_project_ids == sequential.orphaned_project_ids
+        assert spawned.total_projects == sequential.total_projects
+
+    def test_interrupted_migration_keeps_step_counts(self, repository, tmp_path, monkeypatch):
+        """Applied migration steps are checkpointed with their counts."""
+        self._populate(repository)
+        job = _job(repository, tmp_path)
+
+        original_delete = repository.delete_field_values
+
+        def crash(*args):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(repository, "delete_field_values", crash)
+        with pytest.raises(KeyboardInterrupt):
+            job.run(CHANGES, RENAMES)
+        monkeypatch.setattr(repository, "delete_field_values", original_delete)
+
+        renames = []
+        original_rename = repository.rename_field_values
+        monkeypatch.setattr(
+            repository,
+            "rename_field_values",
+            lambda *args: renames.append(args) or original_rename(*args),
+        )
+        report = job.run(CHANGES, RENAMES).value
+
+        assert renames == []
+        assert report.resumed is True
+        assert report.renamed_values == 3
+        assert report.removed_values == 1
+
+    def test_checkpoint_of_other_schema_is_discarded(self, repository, tmp_path):
+        """A checkpoint written against different definitions is not resumed."""
+        self._populate(repository)
+        _job(repository, tmp_path).run(CHANGES, RENAMES)
+        schema = _new_schema()
+        project = schema["project"]
+        depth = project.fields[FieldDefinitionId("depth")]
+        stricter = EntityDefinition(
+            id=project.id,
+            name_key=project.name_key,
+            fields={
+                **project.fields,
+                depth.id: FieldDefinition(
+                    id=depth.id,
+                    field_type=FieldType.NUMBER,
+                    label_key=depth.label_key,
+                    constraints=(MinValueConstraint(min_value=2),),
+                ),
+            },
+        )
+
+        result = FleetMigrationJob(
+            repository=repository,
+            entity_definitions={"project": stricter},
+            checkpoint_path=tmp_path / "fleet.json",
+        ).run(CHANGES, RENAMES)
+
+        assert result.value.resumed is False
+        assert len(result.value.invalid_projects) == 2
+
+    def test_projects_of_other_app_types_are_left_alone(self, repository, tmp_path):
+        """Projects of other AppTypes are neither migrated nor reported."""
+        ids = self._populate(repository)
+        other = _project({"location": "D", "depth": -1})
+        other = Project(
+            id=other.id,
+            name=other.name,
+            app_type_id="schema_designer",
+            entity_definition_id=other.entity_definition_id,
+            field_values=other.field_values,
+        )
+        repository.save(other)
+
+        report = _job(repository, tmp_path, app_type_id="soil_investigation").run(
+            CHANGES, RENAMES
+        ).value
+
+        assert report.total_projects == 4
+        assert report.renamed_values == 3
+        assert report.orphaned_project_ids == (ids["orphan"],)
+        stored = repository.get_by_id(other.id).value
+        assert FieldDefinitionId("location") in stored.field_values
+
+    def test_finished_job_needs_no_migration(self, repository, tmp_path):
+        """A finished run is only repeated for other changes or renames."""
+        self._populate(repository)
+        job = _job(repository, tmp_path)
+        assert job.needs_migration(CHANGES, RENAMES)
+
+        job.run(CHANGES, RENAMES)
+
+        assert not job.needs_migration(CHANGES, RENAMES)
+        assert job.needs_migration(CHANGES, ())
+
+    def test_edited_projects_are_revalidated(self, repository, tmp_path, monkeypatch):
+        """Rerunning a finished job refreshes the report, without migrating again."""
+        ids = self._populate(repository)
+        job = _job(repository, tmp_path)
+        job.run(CHANGES, RENAMES)
+        project = repository.get_by_id(ProjectId(UUID(ids["valid_a"]))).value
+        project.set_field_value(FieldDefinitionId("depth"), -3)
+        repository.save(project)
+        monkeypatch.setattr(
+            repository, "rename_field_values", Mock(side_effect=AssertionError("migrated"))
+        )
+
+        report = job.run(CHANGES, RENAMES).value
+
+        assert sorted(issue.project_id for issue in report.invalid_projects) == sorted(
+            [ids["invalid"], ids["valid_a"]]
+        )
+        assert report.total_projects == 4
+        assert report.renamed_values == 3
+
+    def test_unserializable_schema_fails_the_run(self, repository, tmp_path, monkeypatch):
+        """A schema that cannot be sent to workers is reported, not raised."""
+
+        def unserializable(entity_definitions):
+            raise ValueError("Constraint X of project.depth cannot be serialized")
+
+        monkeypatch.setattr(
+            "doc_helper.infrastructure.persistence.fleet_migration_job._schema_payload",
+            unserializable,
+        )
+
+        result = _job(repository, tmp_path).run(CHANGES, RENAMES)
+
+        assert result.is_failure()
+        assert "cannot be serialized" in result.error
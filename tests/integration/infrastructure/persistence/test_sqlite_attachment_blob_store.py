@@ -0,0 +1,188 @@
+"""Integration tests for SqliteAttachmentBlobStore."""
+
+import hashlib
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from doc_helper.domain.file.file_ids import AttachmentId
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.infrastructure.persistence.sqlite.repositories.attachment_blob_store import (
+    SqliteAttachmentBlobStore,
+)
+
+
+class TestSqliteAttachmentBlobStore:
+    """Integration tests for content-addressed attachment storage."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SqliteAttachmentBlobStore:
+        """Create store with database and blob root in a temp directory."""
+        blob_store = SqliteAttachmentBlobStore(tmp_path / "project.db", tmp_path / "attachments")
+        yield blob_store
+        blob_store.shutdown()
+
+    @pytest.fixture
+    def photo(self, tmp_path: Path) -> Path:
+        """Create a sample photo file."""
+        path = tmp_path / "site_photo.JPG"
+        path.write_bytes(b"\xff\xd8\xff" + b"x" * 5000)
+        return path
+
+    @pytest.fixture
+    def project_id(self) -> ProjectId:
+        return ProjectId(uuid4())
+
+    def _blob_files(self, store: SqliteAttachmentBlobStore) -> list[Path]:
+        return [p for p in (store.blob_root / "blobs").rglob("*") if p.is_file()]
+
+    def test_hash_file_matches_sha256(self, photo: Path) -> None:
+        """Memory-mapped hashing gives the plain SHA-256 digest."""
+        expected = hashlib.sha256(photo.read_bytes()).hexdigest()
+
+        assert SqliteAttachmentBlobStore.hash_file(photo) == ContentHash(expected)
+
+    def test_hash_empty_file(self, tmp_path: Path) -> None:
+        """Empty files hash without mmap."""
+        empty = tmp_path / "empty.txt"
+        empty.write_bytes(b"")
+
+        assert SqliteAttachmentBlobStore.hash_file(empty).value == hashlib.sha256(b"").hexdigest()
+
+    def test_store_copies_into_sharded_path(
+        self, store: SqliteAttachmentBlobStore, photo: Path, project_id: ProjectId
+    ) -> None:
+        """Stored blob lives under blobs/<aa>/<bb>/<hash><ext>."""
+        result = store.store(photo, AttachmentId(uuid4()), project_id)
+
+        assert result.is_success()
+        content_hash = result.value
+        blob_path = store.get_blob_path(content_hash).value
+        first, second = content_hash.shard
+        assert blob_path == store.blob_root / "blobs" / first / second / f"{content_hash.value}.jpg"
+        assert blob_path.read_bytes() == photo.read_bytes()
+
+    def test_identical_files_stored_once(
+        self, store: SqliteAttachmentBlobStore, photo: Path, tmp_path: Path, project_id: ProjectId
+    ) -> None:
+        """Same content attached twice shares one blob with two references."""
+        copy = tmp_path / "copy_of_photo.jpg"
+        copy.write_bytes(photo.read_bytes())
+
+        first = store.store(photo, AttachmentId(uuid4()), project_id).value
+        second = store.store(copy, AttachmentId(uuid4()), ProjectId(uuid4())).value
+
+        assert first == second
+        assert len(self._blob_files(store)) == 1
+        assert store.get_ref_count(first).value == 2
+
+    def test_restore_same_attachment_does_not_add_reference(
+        self, store: SqliteAttachmentBlobStore, photo: Path, project_id: ProjectId
+    ) -> None:
+        """Storing the same content for the same attachment is idempotent."""
+        attachment_id = AttachmentId(uuid4())
+
+        content_hash = store.store(photo, attachment_id, project_id).value
+        store.store(photo, attachment_id, project_id)
+
+        assert store.get_ref_count(content_hash).value == 1
+
+    def test_release_deletes_blob_after_last_reference(
+        self, store: SqliteAttachmentBlobStore, photo: Path, project_id: ProjectId
+    ) -> None:
+        """Blob survives until its last reference is released."""
+        first_id = AttachmentId(uuid4())
+        second_id = AttachmentId(uuid4())
+        content_hash = store.store(photo, first_id, project_id).value
+        store.store(photo, second_id, project_id)
+
+        assert store.release(first_id).is_success()
+        assert store.get_blob_path(content_hash).is_success()
+
+        assert store.release(second_id).is_success()
+        assert store.get_blob_path(content_hash).is_failure()
+        assert self._blob_files(store) == []
+
+    def test_release_unknown_attachment_is_noop(self, store: SqliteAttachmentBlobStore) -> None:
+        """Releasing an attachment without a blob succeeds."""
+        assert store.release(AttachmentId(uuid4())).is_success()
+
+    def test_replacing_content_releases_previous_blob(
+        self, store: SqliteAttachmentBlobStore, photo: Path, tmp_path: Path, project_id: ProjectId
+    ) -> None:
+        """Storing new content for an attachment drops its old reference."""
+        attachment_id = AttachmentId(uuid4())
+        old_hash = store.store(photo, attachment_id, project_id).value
+        other = tmp_path / "other.png"
+        other.write_bytes(b"png-bytes")
+
+        new_hash = store.store(other, attachment_id, project_id).value
+
+        assert new_hash != old_hash
+        assert store.get_blob_path(old_hash).is_failure()
+        assert store.get_ref_count(new_hash).value == 1
+
+    def test_store_missing_file_fails(
+        self, store: SqliteAttachmentBlobStore, tmp_path: Path, project_id: ProjectId
+    ) -> None:
+        """Unreadable source file returns Failure."""
+        result = store.store(tmp_path / "missing.jpg", AttachmentId(uuid4()), project_id)
+
+        assert result.is_failure()
+        assert "missing.jpg" in result.error
+
+    def test_store_async(
+        self, store: SqliteAttachmentBlobStore, photo: Path, project_id: ProjectId
+    ) -> None:
+        """Background store resolves to the same result as store()."""
+        futures = [store.store_async(photo, AttachmentId(uuid4()), project_id) for _ in range(8)]
+        results = [f.result(timeout=10) for f in futures]
+
+        assert all(r.is_success() for r in results)
+        content_hash = results[0].value
+        assert store.get_ref_count(content_hash).value == 8
+        assert len(self._blob_files(store)) == 1
+        assert store.hash_async(photo).result(timeout=10) == content_hash
+
+    def test_storage_report(
+        self, store: SqliteAttachmentBlobStore, photo: Path, tmp_path: Path, project_id: ProjectId
+    ) -> None:
+        """Report counts every attachment logically but each blob once."""
+        other = tmp_path / "plan.pdf"
+        other.write_bytes(b"%PDF" + b"y" * 996)
+        for _ in range(3):
+            store.store(photo, AttachmentId(uuid4()), project_id)
+        store.store(other, AttachmentId(uuid4()), project_id)
+        store.store(other, AttachmentId(uuid4()), ProjectId(uuid4()))
+
+        report = store.get_storage_report(project_id).value
+
+        photo_size = photo.stat().st_size
+        assert report.attachment_count == 4
+        assert report.unique_blob_count == 2
+        assert report.logical_bytes == 3 * photo_size + 1000
+        assert report.stored_bytes == photo_size + 1000
+        assert report.saved_bytes == 2 * photo_size
+
+    def test_blob_referenced_again_before_collection_is_kept(
+        self, store: SqliteAttachmentBlobStore, photo: Path, project_id: ProjectId, monkeypatch
+    ) -> None:
+        """A writer that references released content before it is unlinked keeps the file."""
+        first_id = AttachmentId(uuid4())
+        second_id = AttachmentId(uuid4())
+        content_hash = store.store(photo, first_id, project_id).value
+        collect = store._collect
+
+        def concurrent_store_then_collect(*args):
+            # Another writer stores the same content between release and unlink
+            assert store.store(photo, second_id, project_id).is_success()
+            return collect(*args)
+
+        monkeypatch.setattr(store, "_collect", concurrent_store_then_collect)
+
+        assert store.release(first_id).is_success()
+
+        assert store.get_ref_count(content_hash).value == 1
+        assert store.get_blob_path(content_hash).is_success()
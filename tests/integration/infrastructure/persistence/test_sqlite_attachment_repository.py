@@ -471,3 +471,95 @@ class TestSqliteAttachmentRepository:
 
         assert isinstance(result, Failure)
         assert "Attachment instances" in result.error
+
+
+class TestSqliteAttachmentRepositoryWithBlobStore:
+    """Attachment files written through the content-addressed blob store."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path: Path) -> Path:
+        (tmp_path / "attachments").mkdir()
+        (tmp_path / "attachments" / "a.jpg").write_bytes(b"photo")
+        (tmp_path / "attachments" / "b.jpg").write_bytes(b"photo")
+        return tmp_path
+
+    @pytest.fixture
+    def blob_store(self, project_dir: Path):
+        from doc_helper.infrastructure.persistence.sqlite.repositories.attachment_blob_store import (
+            SqliteAttachmentBlobStore,
+        )
+
+        store = SqliteAttachmentBlobStore(project_dir / "project.db", project_dir / "blobs")
+        yield store
+        store.shutdown()
+
+    @pytest.fixture
+    def repository(self, project_dir: Path, blob_store):
+        conn = sqlite3.connect(str(project_dir / "project.db"))
+        conn.execute(
+            """
+            CREATE TABLE attachments (
+                id TEXT PRIMARY KEY,
+                project_id TEXT NOT NULL,
+                field_id TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                index_type TEXT NOT NULL,
+                exclude_from_index INTEGER NOT NULL DEFAULT 0,
+                caption TEXT NOT NULL DEFAULT '',
+                position INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.commit()
+        yield SqliteAttachmentRepository(conn, blob_store=blob_store, project_dir=project_dir)
+        conn.close()
+
+    def _attachment(self, project_id: ProjectId, file_path: str) -> Attachment:
+        return Attachment(
+            id=AttachmentId(uuid4()),
+            project_id=project_id,
+            field_id=FieldDefinitionId("photos"),
+            file_path=file_path,
+        )
+
+    def test_save_stores_content_once(self, repository, blob_store) -> None:
+        """Identical files saved as two attachments share one blob."""
+        project_id = ProjectId(uuid4())
+        first = self._attachment(project_id, "attachments/a.jpg")
+        second = self._attachment(project_id, "attachments/b.jpg")
+
+        assert repository.save(first).is_success()
+        assert repository.save(second).is_success()
+
+        report = blob_store.get_storage_report(project_id).value
+        assert report.attachment_count == 2
+        assert report.unique_blob_count == 1
+
+    def test_save_missing_file_fails_without_row(self, repository) -> None:
+        attachment = self._attachment(ProjectId(uuid4()), "attachments/missing.jpg")
+
+        result = repository.save(attachment)
+
+        assert result.is_failure()
+        assert repository.exists(attachment.id).value is False
+
+    def test_delete_releases_content(self, repository, blob_store) -> None:
+        """Deleting the last attachment removes its blob."""
+        project_id = ProjectId(uuid4())
+        first = self._attachment(project_id, "attachments/a.jpg")
+        second = self._attachment(project_id, "attachments/b.jpg")
+        repository.save(first)
+        repository.save(second)
+        content_hash = blob_store.hash_file(blob_store.blob_root.parent / "attachments/a.jpg")
+
+        assert repository.delete(first.id).is_success()
+        assert blob_store.get_ref_count(content_hash).value == 1
+
+        assert repository.delete_by_project(project_id).value == 1
+        assert blob_store.get_blob_path(content_hash).is_failure()
+
+    def test_blob_store_requires_project_dir(self, blob_store) -> None:
+        with pytest.raises(ValueError, match="project_dir"):
+            SqliteAttachmentRepository(sqlite3.connect(":memory:"), blob_store=blob_store)
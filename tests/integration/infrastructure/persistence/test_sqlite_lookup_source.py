@@ -0,0 +1,206 @@
+"""Integration tests for SqliteLookupSource."""
+
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from doc_helper.application.lookup import LookupMatchMode
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.common.result import Success
+from doc_helper.domain.project.field_value import FieldValue
+from doc_helper.domain.project.project import Project
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.infrastructure.persistence.sqlite_lookup_source import (
+    SqliteLookupSource,
+    SqliteLookupSourceFactory,
+)
+from doc_helper.infrastructure.persistence.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+
+BOREHOLES = [
+    {"code": "bh-10", "name": "North Pit"},
+    {"code": "bh-02", "name": "south pit"},
+    {"code": "bh-03", "name": "Quarry"},
+    {"code": "bh-04", "name": "Pit Lane"},
+    {"code": "bh-05", "notes": "no name"},
+    {"name": "No code"},
+]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "projects.db"
+
+
+@pytest.fixture
+def schema_repository() -> Mock:
+    """Schema whose project entity holds boreholes in a TABLE field."""
+    boreholes = FieldDefinition(
+        id=FieldDefinitionId("boreholes"),
+        field_type=FieldType.TABLE,
+        label_key=TranslationKey("field.boreholes"),
+        child_entity_id=EntityDefinitionId("borehole"),
+    )
+    schema_repository = Mock()
+    schema_repository.get_by_id.return_value = Success(
+        EntityDefinition(
+            id=EntityDefinitionId("project"),
+            name_key=TranslationKey("entity.project"),
+            fields={boreholes.id: boreholes},
+        )
+    )
+    return schema_repository
+
+
+@pytest.fixture
+def project_id(db_path: Path, schema_repository: Mock) -> str:
+    """Project with a 'boreholes' TABLE field stored as rows."""
+    project = Project(
+        id=ProjectId(uuid4()),
+        name="Site",
+        app_type_id="soil_investigation",
+        entity_definition_id=EntityDefinitionId("project"),
+        field_values={
+            FieldDefinitionId("boreholes"): FieldValue(
+                field_id=FieldDefinitionId("boreholes"), value=BOREHOLES
+            )
+        },
+    )
+    repository = SqliteProjectRepository(db_path, schema_repository=schema_repository)
+    assert repository.save(project).is_success()
+    return str(project.id.value)
+
+
+def _source(db_path: Path, project_id: str, value_column="code") -> SqliteLookupSource:
+    return SqliteLookupSource(
+        db_path=db_path,
+        project_id=project_id,
+        table_field_id="boreholes",
+        display_column="name",
+        value_column=value_column,
+    )
+
+
+class TestSqliteLookupSource:
+    """Tests for SqliteLookupSource."""
+
+    def test_prefix_search_is_case_insensitive_and_ordered(self, db_path, project_id):
+        """Prefix matches ignore ASCII case and come in display order."""
+        result = _source(db_path, project_id).search("P", LookupMatchMode.PREFIX, 0, 10)
+
+        assert result.value == [("bh-04", "Pit Lane")]
+
+    def test_substring_search(self, db_path, project_id):
+        """Substring matches anywhere; records without a value are skipped."""
+        result = _source(db_path, project_id).search("PIT", LookupMatchMode.SUBSTRING, 0, 10)
+
+        assert result.value == [
+            ("bh-10", "North Pit"),
+            ("bh-04", "Pit Lane"),
+            ("bh-02", "south pit"),
+        ]
+
+    def test_pages_do_not_overlap(self, db_path, project_id):
+        """offset/limit page through all options in display order."""
+        source = _source(db_path, project_id)
+
+        pages = [source.search("", LookupMatchMode.PREFIX, offset, 2).value for offset in (0, 2, 4)]
+
+        assert pages == [
+            [("bh-10", "North Pit"), ("bh-04", "Pit Lane")],
+            [("bh-03", "Quarry"), ("bh-02", "south pit")],
+            [],
+        ]
+
+    def test_resolve_display_texts(self, db_path, project_id):
+        """Values resolve through the value column; unknown values are absent."""
+        result = _source(db_path, project_id).resolve(["bh-03", "bh-10", "bh-05", "zz"])
+
+        assert result.value == {"bh-03": "Quarry", "bh-10": "North Pit"}
+
+    def test_display_text_as_value(self, db_path, project_id):
+        """Without a value column the display text is the value."""
+        source = _source(db_path, project_id, value_column=None)
+
+        assert source.search("no", LookupMatchMode.PREFIX, 0, 10).value == [
+            ("No code", "No code"),
+            ("North Pit", "North Pit"),
+        ]
+        assert source.resolve(["Quarry"]).value == {"Quarry": "Quarry"}
+
+    def test_prefix_search_uses_lower_index(self, db_path, project_id):
+        """Searching creates the expression index the range scan relies on."""
+        _source(db_path, project_id).search("p", LookupMatchMode.PREFIX, 0, 10)
+
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            'EXPLAIN QUERY PLAN SELECT position FROM "table_rows:boreholes" '
+            'WHERE project_id = ? AND lower("col:name") >= ? AND lower("col:name") < ? '
+            'ORDER BY lower("col:name"), position',
+            (project_id, "p", "p\U0010ffff"),
+        ).fetchall()
+        conn.close()
+        assert any("idx_table_rows:boreholes:name:lower" in row[-1] for row in plan)
+
+    def test_unmigrated_json_records(self, db_path, project_id):
+        """Records still stored as JSON are filtered in memory the same way."""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "UPDATE field_values SET value = ?, is_table = 0 "
+            "WHERE project_id = ? AND field_id = 'boreholes'",
+            (json.dumps(BOREHOLES), project_id),
+        )
+        conn.commit()
+        conn.close()
+        source = _source(db_path, project_id)
+
+        assert source.search("pit", LookupMatchMode.SUBSTRING, 1, 5).value == [
+            ("bh-04", "Pit Lane"),
+            ("bh-02", "south pit"),
+        ]
+        assert source.resolve(["bh-02"]).value == {"bh-02": "south pit"}
+
+    def test_unknown_project_has_no_options(self, db_path, project_id):
+        source = SqliteLookupSource(db_path, "missing", "boreholes", "name")
+
+        assert source.search("", LookupMatchMode.PREFIX, 0, 10).value == []
+        assert source.resolve(["North Pit"]).value == {}
+
+
+class TestSqliteLookupSourceFactory:
+    """Tests for SqliteLookupSourceFactory."""
+
+    def test_source_reads_table_field_of_target_entity(
+        self, db_path, project_id, schema_repository
+    ):
+        """The TABLE field whose child entity is the LOOKUP target is the source."""
+        factory = SqliteLookupSourceFactory(db_path, schema_repository)
+
+        source = factory.create_source(project_id, "borehole", "name")
+
+        assert source.search("pit", LookupMatchMode.PREFIX, 0, 10).value == [
+            ("Pit Lane", "Pit Lane")
+        ]
+        schema_repository.get_by_id.assert_called_with(EntityDefinitionId("project"))
+
+    def test_no_source_for_entity_without_table_field(
+        self, db_path, project_id, schema_repository
+    ):
+        """Entities the project holds no records of have no source."""
+        factory = SqliteLookupSourceFactory(db_path, schema_repository)
+
+        assert factory.create_source(project_id, "sample", "name") is None
+
+    def test_no_source_for_unknown_project(self, db_path, project_id, schema_repository):
+        factory = SqliteLookupSourceFactory(db_path, schema_repository)
+
+        assert factory.create_source("missing", "borehole", "name") is None
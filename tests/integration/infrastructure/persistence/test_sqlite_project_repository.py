@@ -1,15 +1,24 @@
 """Integration tests for SqliteProjectRepository."""
 
+import json
+import sqlite3
 import tempfile
+import time
+import tracemalloc
 from pathlib import Path
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
+from doc_helper.domain.common.i18n import TranslationKey
 from doc_helper.domain.common.result import Failure, Success
 from doc_helper.domain.project.field_value import FieldValue
 from doc_helper.domain.project.project import Project
 from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
 from doc_helper.infrastructure.persistence.sqlite_project_repository import (
     SqliteProjectRepository,
@@ -31,9 +40,35 @@ class TestSqliteProjectRepository:
             temp_path.unlink()
 
     @pytest.fixture
-    def repository(self, temp_db: Path) -> SqliteProjectRepository:
+    def schema_repository(self) -> Mock:
+        """Create schema repository whose project entity has a 'samples' TABLE."""
+        fields = (
+            FieldDefinition(
+                id=FieldDefinitionId("samples"),
+                field_type=FieldType.TABLE,
+                label_key=TranslationKey("field.samples"),
+                child_entity_id=EntityDefinitionId("sample"),
+            ),
+            FieldDefinition(
+                id=FieldDefinitionId("notes"),
+                field_type=FieldType.TEXT,
+                label_key=TranslationKey("field.notes"),
+            ),
+        )
+        repository = Mock()
+        repository.get_by_id.return_value = Success(
+            EntityDefinition(
+                id=EntityDefinitionId("project"),
+                name_key=TranslationKey("entity.project"),
+                fields={f.id: f for f in fields},
+            )
+        )
+        return repository
+
+    @pytest.fixture
+    def repository(self, temp_db: Path, schema_repository: Mock) -> SqliteProjectRepository:
         """Create repository instance."""
-        return SqliteProjectRepository(temp_db)
+        return SqliteProjectRepository(temp_db, schema_repository=schema_repository)
 
     @pytest.fixture
     def sample_project(self) -> Project:
@@ -281,3 +316,247 @@ class TestSqliteProjectRepository:
 
         assert loaded_project.created_at == sample_project.created_at
         assert loaded_project.modified_at == sample_project.modified_at
+
+    @pytest.fixture
+    def table_project(self) -> Project:
+        """Create project with a TABLE field of child records."""
+        samples = FieldDefinitionId("samples")
+        return Project(
+            id=ProjectId(uuid4()),
+            name="Borehole Log",
+            app_type_id="soil_investigation",
+            entity_definition_id=EntityDefinitionId("project"),
+            field_values={
+                samples: FieldValue(
+                    field_id=samples,
+                    value=[
+                        {"depth": 1.5, "soil": "clay"},
+                        {"depth": 3.0, "soil": "sand"},
+                    ],
+                ),
+            },
+        )
+
+    def _samples(self, repository: SqliteProjectRepository, project: Project) -> list:
+        """Load the samples table of a project."""
+        loaded = repository.get_by_id(project.id).value
+        return loaded.get_field_value(FieldDefinitionId("samples")).value
+
+    def test_table_rows_round_trip(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """TABLE records should be stored as rows and load back in order."""
+        repository.save(table_project)
+
+        assert self._samples(repository, table_project) == [
+            {"depth": 1.5, "soil": "clay"},
+            {"depth": 3.0, "soil": "sand"},
+        ]
+
+    def test_table_row_edits(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """Row-level edits should change only the addressed rows."""
+        repository.save(table_project)
+        samples = FieldDefinitionId("samples")
+
+        assert repository.insert_table_row(
+            table_project.id, samples, 1, {"depth": 2.0, "soil": "silt"}
+        ).is_success()
+        assert repository.update_table_row(
+            table_project.id, samples, 0, {"depth": 1.0, "soil": "clay"}
+        ).is_success()
+        assert repository.move_table_row(table_project.id, samples, 2, 0).is_success()
+        assert repository.delete_table_row(table_project.id, samples, 2).is_success()
+
+        assert self._samples(repository, table_project) == [
+            {"depth": 3.0, "soil": "sand"},
+            {"depth": 1.0, "soil": "clay"},
+        ]
+
+    def test_table_row_position_out_of_range(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """Row-level edits should reject positions outside the table."""
+        repository.save(table_project)
+        samples = FieldDefinitionId("samples")
+
+        result = repository.update_table_row(table_project.id, samples, 2, {"depth": 9})
+
+        assert isinstance(result, Failure)
+        assert "out of range" in result.error
+
+    def test_table_row_edit_unknown_project(
+        self, repository: SqliteProjectRepository
+    ) -> None:
+        """Row-level edits should fail for missing projects."""
+        result = repository.insert_table_row(
+            ProjectId(uuid4()), FieldDefinitionId("samples"), 0, {"depth": 1}
+        )
+
+        assert isinstance(result, Failure)
+        assert "not found" in result.error
+
+    def test_insert_table_row_creates_field(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        """Inserting into a field without a value should create the table."""
+        repository.save(sample_project)
+
+        repository.insert_table_row(
+            sample_project.id, FieldDefinitionId("samples"), 0, {"depth": 1}
+        )
+
+        assert self._samples(repository, sample_project) == [{"depth": 1}]
+
+    def test_saving_non_table_value_drops_rows(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """Replacing a table with an empty list should remove its rows."""
+        repository.save(table_project)
+        table_project.set_field_value(FieldDefinitionId("samples"), [])
+
+        repository.save(table_project)
+
+        assert self._samples(repository, table_project) == []
+
+    def test_only_table_fields_are_stored_as_rows(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """A list of records in a non-TABLE field stays a JSON value."""
+        notes = [{"author": "ab", "text": "checked"}]
+        table_project.set_field_value(FieldDefinitionId("notes"), notes)
+
+        repository.save(table_project)
+
+        with sqlite3.connect(repository.db_path) as conn:
+            flags = dict(conn.execute("SELECT field_id, is_table FROM field_values"))
+        assert flags == {"samples": 1, "notes": 0}
+        loaded = repository.get_by_id(table_project.id).value
+        assert loaded.get_field_value(FieldDefinitionId("notes")).value == notes
+
+    def test_without_schema_values_are_stored_as_json(
+        self, temp_db: Path, table_project: Project
+    ) -> None:
+        """Without a schema repository no field is stored as rows."""
+        repository = SqliteProjectRepository(temp_db)
+
+        repository.save(table_project)
+
+        with sqlite3.connect(temp_db) as conn:
+            assert conn.execute("SELECT is_table FROM field_values").fetchall() == [(0,)]
+        assert self._samples(repository, table_project)[0] == {"depth": 1.5, "soil": "clay"}
+
+    def test_delete_project_removes_table_rows(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """Deleting a project should delete its table rows."""
+        repository.save(table_project)
+
+        repository.delete(table_project.id)
+
+        with sqlite3.connect(repository.db_path) as conn:
+            count = conn.execute('SELECT COUNT(*) FROM "table_rows:samples"').fetchone()[0]
+        assert count == 0
+
+    def test_legacy_json_table_is_migrated_on_row_edit(
+        self, repository: SqliteProjectRepository, table_project: Project
+    ) -> None:
+        """JSON-encoded tables from older databases should still load and edit."""
+        repository.save(table_project)
+        legacy = [{"depth": 1.5, "soil": "clay"}]
+        with sqlite3.connect(repository.db_path) as conn:
+            conn.execute(
+                "UPDATE field_values SET value = ?, is_table = 0 WHERE field_id = ?",
+                (json.dumps(legacy), "samples"),
+            )
+            conn.execute('DELETE FROM "table_rows:samples"')
+
+        assert self._samples(repository, table_project) == legacy
+
+        repository.insert_table_row(
+            table_project.id, FieldDefinitionId("samples"), 1, {"depth": 2.0}
+        )
+        assert self._samples(repository, table_project) == legacy + [{"depth": 2.0}]
+
+    def test_loaded_field_ids_are_shared(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        """Loaded field values should share interned field IDs."""
+        repository.save(sample_project)
+
+        first = repository.get_by_id(sample_project.id).value
+        second = repository.get_by_id(sample_project.id).value
+
+        for field_id, field_value in first.field_values.items():
+            assert field_value.field_id is field_id
+            assert second.field_values[field_id].field_id is field_id
+
+    @pytest.mark.slow
+    def test_benchmark_load_large_project_memory(
+        self, repository: SqliteProjectRepository
+    ) -> None:
+        """Memory benchmark: load a project with 50,000 field values."""
+        field_count = 50_000
+        field_values = {}
+        for i in range(field_count):
+            field_id = FieldDefinitionId(f"field_{i}")
+            field_values[field_id] = FieldValue(field_id=field_id, value=i * 1.5)
+        project = Project(
+            id=ProjectId(uuid4()),
+            name="Large Project",
+            app_type_id="soil_investigation",
+            entity_definition_id=EntityDefinitionId("project"),
+            field_values=field_values,
+        )
+        repository.save(project)
+        repository.get_by_id(project.id)  # warm up interned field IDs
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = repository.get_by_id(project.id)
+        elapsed = time.perf_counter() - start
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        loaded = result.value
+        print(
+            f"\nload 50,000 fields: {elapsed * 1000:.0f} ms, "
+            f"{retained / field_count:.0f} B/field retained, "
+            f"{peak / field_count:.0f} B/field peak"
+        )
+        assert loaded.field_count == field_count
+        assert retained / field_count < 250
+
+    @pytest.mark.slow
+    def test_benchmark_table_row_edit(
+        self, repository: SqliteProjectRepository
+    ) -> None:
+        """Microbenchmark: edit one row of a 5,000-row table."""
+        samples = FieldDefinitionId("samples")
+        project = Project(
+            id=ProjectId(uuid4()),
+            name="Boring Log",
+            app_type_id="soil_investigation",
+            entity_definition_id=EntityDefinitionId("project"),
+            field_values={
+                samples: FieldValue(
+                    field_id=samples,
+                    value=[
+                        {"depth": i * 0.5, "soil": "clay", "blows": i % 50}
+                        for i in range(5000)
+                    ],
+                ),
+            },
+        )
+        repository.save(project)
+
+        start = time.perf_counter()
+        result = repository.update_table_row(
+            project.id, samples, 2500, {"depth": 1250.0, "soil": "sand", "blows": 1}
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"\nedit 1 of 5,000 table rows: {elapsed * 1000:.1f} ms")
+        assert result.is_success()
+        assert elapsed < 0.5
@@ -0,0 +1,97 @@
+"""Integration tests for read-only, in-memory schema repositories."""
+
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from doc_helper.app_types.soil_investigation import SoilInvestigationAppType
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId
+from doc_helper.infrastructure.persistence.sqlite.repositories.schema_repository import (
+    SqliteSchemaRepository,
+)
+from doc_helper.infrastructure.persistence.sqlite_base import SqliteSnapshotConnection
+
+SOIL_CONFIG_DB = Path(SoilInvestigationAppType()._package_dir) / "config.db"
+
+
+@pytest.fixture
+def config_db(tmp_path: Path) -> Path:
+    """Copy of the soil investigation config.db."""
+    path = tmp_path / "config.db"
+    shutil.copyfile(SOIL_CONFIG_DB, path)
+    return path
+
+
+class TestSqliteSnapshotConnection:
+    """Tests for SqliteSnapshotConnection."""
+
+    def test_reads_do_not_touch_the_file(self, config_db: Path):
+        """Queries run against the in-memory copy once it is taken."""
+        connection = SqliteSnapshotConnection(config_db)
+        with connection as conn:
+            expected = conn.execute("SELECT COUNT(*) FROM fields").fetchone()[0]
+
+        config_db.unlink()
+
+        with connection as conn:
+            assert conn.execute("SELECT COUNT(*) FROM fields").fetchone()[0] == expected
+
+    def test_writes_fail(self, config_db: Path):
+        """The copy is query-only."""
+        connection = SqliteSnapshotConnection(config_db)
+        with pytest.raises(sqlite3.OperationalError):
+            with connection as conn:
+                conn.execute("DELETE FROM fields")
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        """A missing file is reported like SqliteSchemaRepository does."""
+        with pytest.raises(FileNotFoundError):
+            SqliteSnapshotConnection(tmp_path / "missing.db")
+
+    def test_shared_across_threads(self, config_db: Path):
+        """One snapshot serves concurrent readers."""
+        connection = SqliteSnapshotConnection(config_db)
+
+        def count_fields(_):
+            with connection as conn:
+                return conn.execute("SELECT COUNT(*) FROM fields").fetchone()[0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            counts = set(executor.map(count_fields, range(20)))
+
+        assert len(counts) == 1
+
+
+class TestReadOnlySchemaRepository:
+    """Tests for SqliteSchemaRepository(read_only=True)."""
+
+    def test_reads_match_writable_repository(self, config_db: Path):
+        """The in-memory copy returns the same schema as the file."""
+        writable = SqliteSchemaRepository(config_db)
+        read_only = SqliteSchemaRepository(config_db, read_only=True)
+
+        assert read_only.get_all().value == writable.get_all().value
+
+    def test_write_operations_fail(self, config_db: Path):
+        """Saving through a read-only repository returns a Failure."""
+        repository = SqliteSchemaRepository(config_db, read_only=True)
+        entity = EntityDefinition(
+            id=EntityDefinitionId("new_entity"),
+            name_key=TranslationKey("entity.new_entity"),
+        )
+
+        result = repository.save(entity)
+
+        assert result.is_failure()
+        assert not SqliteSchemaRepository(config_db).exists(EntityDefinitionId("new_entity"))
+
+    def test_runtime_app_type_is_read_only(self):
+        """Runtime AppTypes serve their schema read-only."""
+        repository = SoilInvestigationAppType().get_schema_repository()
+
+        assert repository.read_only is True
@@ -14,6 +14,9 @@ from doc_helper.domain.common.result import Failure, Success
 from doc_helper.infrastructure.persistence.sqlite_search_repository import (
     SqliteSearchRepository,
 )
+from doc_helper.infrastructure.persistence.sqlite_table_row_store import (
+    SqliteTableRowStore,
+)
 
 
 @pytest.fixture
@@ -386,3 +389,37 @@ class TestSqliteSearchRepository:
         )
 
         assert isinstance(result, Success)
+
+    def test_search_matches_table_rows(
+        self,
+        repository: SqliteSearchRepository,
+        temp_project_db: Path,
+        temp_schema_db: Path,
+    ):
+        """TABLE records stored as rows are found by their cell text."""
+        conn = sqlite3.connect(temp_schema_db)
+        conn.execute(
+            "INSERT INTO fields (id, entity_id, label, field_type, sort_order) "
+            "VALUES ('layers', 'project', 'Soil Layers', 'TABLE', 4)"
+        )
+        conn.commit()
+        conn.close()
+        records = [{"soil": "Sandy gravel", "depth": 1.5}, {"soil": "Silt", "depth": 3}]
+        conn = sqlite3.connect(temp_project_db)
+        cursor = conn.cursor()
+        store = SqliteTableRowStore()
+        store.replace_rows(cursor, "proj-123", "layers", records)
+        store.replace_rows(cursor, "proj-456", "layers", [{"soil": "Peat"}])
+        cursor.executemany(
+            "INSERT INTO field_values (project_id, field_id, value) VALUES (?, ?, ?)",
+            [("proj-123", "layers", json.dumps(None)), ("proj-456", "layers", json.dumps(None))],
+        )
+        conn.commit()
+        conn.close()
+
+        result = repository.search_fields(project_id="proj-123", search_term="GRAVEL")
+        other_project = repository.search_fields(project_id="proj-123", search_term="peat")
+
+        assert [(r["field_id"], r["match_type"]) for r in result.value] == [("layers", "value")]
+        assert result.value[0]["current_value"] == records
+        assert other_project.value == []
@@ -0,0 +1,189 @@
+"""Integration tests for SqliteTableRowStore."""
+
+import sqlite3
+
+import pytest
+
+from doc_helper.infrastructure.persistence.sqlite_table_row_store import (
+    SqliteTableRowStore,
+)
+
+
+class TestSqliteTableRowStore:
+    """Tests for SqliteTableRowStore."""
+
+    @pytest.fixture
+    def cursor(self) -> sqlite3.Cursor:
+        """Create cursor on an in-memory database."""
+        conn = sqlite3.connect(":memory:")
+        yield conn.cursor()
+        conn.close()
+
+    @pytest.fixture
+    def store(self) -> SqliteTableRowStore:
+        """Create store instance."""
+        return SqliteTableRowStore()
+
+    @pytest.fixture
+    def records(self) -> list:
+        """Sample child records."""
+        return [
+            {"depth": 1.5, "soil": "clay", "count": 3},
+            {"depth": 3.0, "soil": "sand", "count": 7},
+            {"depth": 4.5, "soil": "clay", "count": 2},
+        ]
+
+    def test_is_table_value(self) -> None:
+        """Only non-empty lists of string-keyed dicts are stored as rows."""
+        assert SqliteTableRowStore.is_table_value([{"a": 1}])
+        assert not SqliteTableRowStore.is_table_value([])
+        assert not SqliteTableRowStore.is_table_value([1, 2])
+        assert not SqliteTableRowStore.is_table_value([{1: "a"}])
+        assert not SqliteTableRowStore.is_table_value("text")
+
+    def test_round_trip_keeps_types_and_missing_keys(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore
+    ) -> None:
+        """Records should load exactly as written."""
+        records = [
+            {"name": "S1", "depth": 1, "ratio": 1.0, "ok": True, "note": None},
+            {"name": "S2", "tags": ["a", "b"], "meta": {"k": 1}},
+        ]
+
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        loaded = store.load_rows(cursor, "p1", "samples")
+        assert loaded == records
+        assert type(loaded[0]["depth"]) is int
+        assert type(loaded[0]["ratio"]) is float
+        assert loaded[0]["ok"] is True
+        assert "note" in loaded[0] and "tags" not in loaded[0]
+
+    def test_values_sqlite_cannot_hold_natively_round_trip(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore
+    ) -> None:
+        """Ints wider than 64 bits and NaN fall back to JSON cells."""
+        records = [{"big": 2**64, "small": -(2**63) - 1, "ratio": float("nan")}]
+
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        loaded = store.load_rows(cursor, "p1", "samples")[0]
+        assert loaded["big"] == 2**64 and loaded["small"] == -(2**63) - 1
+        assert loaded["ratio"] != loaded["ratio"]  # NaN, key kept
+        assert store.find_rows_in(cursor, "p1", "samples", "big", [2**64])[0][0] == 0
+
+    def test_one_column_per_child_field(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """Each child field should get its own column."""
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        cursor.execute('PRAGMA table_info("table_rows:samples")')
+        columns = [row[1] for row in cursor.fetchall()]
+        assert columns == ["project_id", "position", "col:depth", "col:soil", "col:count"]
+
+    def test_replace_rows_writes_only_changed_rows(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """Replacing with one changed record should write one row."""
+        store.replace_rows(cursor, "p1", "samples", records)
+        changed = [dict(record) for record in records]
+        changed[1]["count"] = 8
+
+        assert store.replace_rows(cursor, "p1", "samples", changed) == 1
+        assert store.replace_rows(cursor, "p1", "samples", changed) == 0
+        assert store.load_rows(cursor, "p1", "samples") == changed
+
+    def test_replace_rows_drops_extra_rows(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """Shorter replacement should delete trailing rows."""
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        store.replace_rows(cursor, "p1", "samples", records[:1])
+
+        assert store.load_rows(cursor, "p1", "samples") == records[:1]
+
+    def test_insert_row_shifts_later_rows(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """insert_row should keep the other rows in order."""
+        store.replace_rows(cursor, "p1", "samples", records)
+        new = {"depth": 2.0, "soil": "silt"}
+
+        store.insert_row(cursor, "p1", "samples", 1, new)
+
+        assert store.load_rows(cursor, "p1", "samples") == [
+            records[0], new, records[1], records[2]
+        ]
+
+    def test_delete_row_shifts_later_rows(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """delete_row should close the gap."""
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        assert store.delete_row(cursor, "p1", "samples", 0) is True
+
+        assert store.load_rows(cursor, "p1", "samples") == records[1:]
+        assert store.delete_row(cursor, "p1", "samples", 5) is False
+
+    @pytest.mark.parametrize(
+        ("from_position", "to_position", "expected"),
+        [(0, 2, [1, 2, 0]), (2, 0, [2, 0, 1]), (1, 1, [0, 1, 2])],
+    )
+    def test_move_row(
+        self,
+        cursor: sqlite3.Cursor,
+        store: SqliteTableRowStore,
+        records: list,
+        from_position: int,
+        to_position: int,
+        expected: list,
+    ) -> None:
+        """move_row should reorder rows."""
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        store.move_row(cursor, "p1", "samples", from_position, to_position)
+
+        assert store.load_rows(cursor, "p1", "samples") == [records[i] for i in expected]
+
+    def test_find_rows_in_uses_column_index(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """find_rows_in should match by value and index the column."""
+        store.replace_rows(cursor, "p1", "samples", records)
+        store.replace_rows(cursor, "p2", "samples", records)
+
+        found = store.find_rows_in(cursor, "p1", "samples", "soil", ["clay"])
+
+        assert found == [(0, records[0]), (2, records[2])]
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT position FROM \"table_rows:samples\" "
+            "WHERE project_id = ? AND \"col:soil\" = ?",
+            ("p1", "clay"),
+        )
+        assert "idx_table_rows:samples:soil" in " ".join(
+            str(row[-1]) for row in cursor.fetchall()
+        )
+
+    def test_find_rows_in_unknown_column(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """Unknown columns or fields should find nothing."""
+        store.replace_rows(cursor, "p1", "samples", records)
+
+        assert store.find_rows_in(cursor, "p1", "samples", "missing", [1]) == []
+        assert store.find_rows_in(cursor, "p1", "other", "soil", ["clay"]) == []
+
+    def test_projects_are_isolated(
+        self, cursor: sqlite3.Cursor, store: SqliteTableRowStore, records: list
+    ) -> None:
+        """Rows of one project should not affect another."""
+        store.replace_rows(cursor, "p1", "samples", records)
+        store.replace_rows(cursor, "p2", "samples", records[:1])
+
+        store.delete_project(cursor, "p1")
+
+        assert store.load_rows(cursor, "p1", "samples") == []
+        assert store.load_rows(cursor, "p2", "samples") == records[:1]
@@ -12,10 +12,13 @@ RULES (AGENT_RULES.md Section 2):
 
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
 import sys
 
 # Import main module to get configure_container
 from doc_helper.main import configure_container
+from doc_helper.domain.common.result import Failure
+from doc_helper.infrastructure.di.container import Container
 from doc_helper.application.commands.create_project_command import CreateProjectCommand
 from doc_helper.application.queries.get_project_query import GetRecentProjectsQuery
 from doc_helper.application.services.formula_service import FormulaService
@@ -229,3 +232,69 @@ class TestDependencyWiring:
         assert svc._transformer_registry is not None
         assert len(svc._adapters) == 3  # word, excel, pdf
         assert isinstance(svc._transformer_registry, TransformerRegistry)
+
+
+class TestFleetMigrationStartup:
+    """Tests for the background fleet migration started by main()."""
+
+    def test_up_to_date_job_is_not_run(self):
+        """Nothing runs while the schema is unchanged since the last run."""
+        from doc_helper.main import _run_fleet_migration
+
+        job = Mock()
+        job.needs_migration.return_value = False
+
+        _run_fleet_migration(job)
+
+        job.run.assert_not_called()
+
+    def test_failed_run_is_logged(self, caplog):
+        """A failed run is logged instead of aborting the application."""
+        from doc_helper.main import _run_fleet_migration
+
+        job = Mock()
+        job.needs_migration.return_value = True
+        job.run.return_value = Failure("Loading projects failed")
+
+        _run_fleet_migration(job)
+
+        assert "Fleet migration failed: Loading projects failed" in caplog.text
+
+    def test_raising_job_is_logged(self, caplog):
+        """Exceptions of the job are logged too."""
+        from doc_helper.main import _run_fleet_migration
+
+        job = Mock()
+        job.needs_migration.side_effect = ValueError("cannot be serialized")
+
+        _run_fleet_migration(job)
+
+        assert "Fleet migration failed" in caplog.text
+        assert "cannot be serialized" in caplog.text
+
+    def test_job_runs_in_background_thread(self):
+        """start_fleet_migration() resolves the job and runs it off the caller's thread."""
+        import threading
+
+        from doc_helper.infrastructure.persistence.fleet_migration_job import (
+            FleetMigrationJob,
+        )
+        from doc_helper.main import start_fleet_migration
+
+        threads = []
+        job = Mock()
+        job.needs_migration.side_effect = lambda: threads.append(threading.current_thread())
+        container = Container()
+        container.register_instance(FleetMigrationJob, job)
+
+        thread = start_fleet_migration(container)
+        thread.join(timeout=10)
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_job_that_cannot_be_created_is_logged(self, caplog):
+        """A failing job factory does not abort startup."""
+        from doc_helper.main import start_fleet_migration
+
+        assert start_fleet_migration(Container()) is None
+        assert "Fleet migration job could not be created" in caplog.text
@@ -0,0 +1,118 @@
+"""Startup regression tests: import cost and time-to-first-window.
+
+Runs the interpreter in a subprocess with `-X importtime` so module caching
+in the test process does not hide import cost. The subprocess runs in a
+temporary directory so files the app creates on startup stay out of the
+working tree.
+
+The hard assertion is that heavy document libraries stay off the startup
+path entirely. Wall-clock budgets depend on the machine and only run when
+DOC_HELPER_CHECK_STARTUP_BUDGET=1 is set.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parents[2]
+SRC_DIR = REPO_ROOT / "src"
+
+# Modules that must only be imported when a document is generated
+HEAVY_MODULES = ("docx", "openpyxl", "fitz", "lxml")
+
+IMPORT_BUDGET_SECONDS = 2.0
+FIRST_WINDOW_BUDGET_SECONDS = 5.0
+
+budget_check = pytest.mark.skipif(
+    os.environ.get("DOC_HELPER_CHECK_STARTUP_BUDGET") != "1",
+    reason="wall-clock budget; set DOC_HELPER_CHECK_STARTUP_BUDGET=1 to run",
+)
+
+
+def _run_python(code: str, cwd: Path, *flags: str) -> subprocess.CompletedProcess:
+    """Run a Python snippet in cwd with src/ on the path."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse `-X importtime` output into {module: cumulative_microseconds}."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        cumulative[parts[2].strip()] = int(parts[1])
+    return cumulative
+
+
+@pytest.mark.slow
+class TestStartupImportBudget:
+    """Regression tests for cold-start cost of doc_helper.main."""
+
+    def test_main_import_does_not_load_document_libraries(self, tmp_path: Path) -> None:
+        """Importing main must not pull in python-docx, openpyxl, PyMuPDF or lxml."""
+        result = _run_python("import doc_helper.main", tmp_path, "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+
+        imported = _parse_importtime(result.stderr)
+        loaded_heavy = [name for name in HEAVY_MODULES if name in imported]
+        assert loaded_heavy == []
+
+    @budget_check
+    def test_main_import_within_budget(self, tmp_path: Path) -> None:
+        """Cumulative import time of doc_helper.main stays within budget."""
+        result = _run_python("import doc_helper.main", tmp_path, "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+
+        imported = _parse_importtime(result.stderr)
+        elapsed = imported["doc_helper.main"] / 1_000_000
+        assert elapsed < IMPORT_BUDGET_SECONDS, f"import took {elapsed:.2f}s"
+
+    @budget_check
+    def test_time_to_first_window_within_budget(self, tmp_path: Path) -> None:
+        """main() reaches its event loop with WelcomeView shown within budget.
+
+        main() schedules start_fleet_migration for the first event loop
+        iteration, after the welcome window is shown; the test replaces it
+        to take the measurement and quit instead of starting the job.
+        """
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import doc_helper.main as app_main\n"
+            "from PyQt6.QtWidgets import QApplication\n"
+            "def first_window_shown(container):\n"
+            "    elapsed = time.perf_counter() - start\n"
+            "    shown = [w for w in QApplication.topLevelWidgets() if w.isVisible()]\n"
+            "    heavy = [m for m in ('docx', 'openpyxl', 'fitz') if m in sys.modules]\n"
+            "    print(f'STARTUP {elapsed:.4f} {len(shown)} {\",\".join(heavy)}')\n"
+            "    QApplication.quit()\n"
+            "app_main.start_fleet_migration = first_window_shown\n"
+            "sys.exit(app_main.main())\n"
+        )
+        result = _run_python(code, tmp_path)
+        assert result.returncode == 0, result.stderr
+
+        report = next(
+            line for line in result.stdout.splitlines() if line.startswith("STARTUP ")
+        )
+        _, elapsed_text, shown_text, *heavy = report.split(" ")
+        elapsed = float(elapsed_text)
+        assert int(shown_text) >= 1
+        assert elapsed < FIRST_WINDOW_BUDGET_SECONDS, f"first window took {elapsed:.2f}s"
+        assert heavy in ([], [""])
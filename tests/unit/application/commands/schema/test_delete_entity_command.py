@@ -218,6 +218,30 @@ class TestDeleteEntityCommand:
         # Verify no delete attempted
         mock_repository.delete.assert_not_called()
 
+    def test_reject_entity_with_relationships(
+        self,
+        command: DeleteEntityCommand,
+        mock_repository: Mock,
+    ) -> None:
+        """Should reject deletion if relationships point from or to the entity."""
+        # Setup
+        mock_repository.exists.return_value = True
+        mock_repository.get_entity_dependencies.return_value = Success({
+            "referenced_by_table_fields": [],
+            "referenced_by_lookup_fields": [],
+            "child_entities": [],
+            "referenced_by_relationships": [("project_has_boreholes", "project")],
+        })
+
+        # Execute
+        result = command.execute(entity_id="borehole")
+
+        # Assert
+        assert result.is_failure()
+        assert "relationship" in result.error
+        assert "project_has_boreholes (with project)" in result.error
+        mock_repository.delete.assert_not_called()
+
     def test_dependency_check_failure_propagated(
         self,
         command: DeleteEntityCommand,
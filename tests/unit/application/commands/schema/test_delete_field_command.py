@@ -358,6 +358,34 @@ class TestDeleteFieldCommand:
         # Verify no save attempted
         mock_repository.save.assert_not_called()
 
+    def test_reject_field_referenced_by_control_rule_formula(
+        self,
+        command: DeleteFieldCommand,
+        mock_repository: Mock,
+        mock_entity_with_two_fields: EntityDefinition,
+        empty_dependencies: dict,
+    ) -> None:
+        """Should reject deletion if another field's control rule uses the field."""
+        # Setup
+        mock_repository.exists.return_value = True
+        mock_repository.get_by_id.return_value = Success(mock_entity_with_two_fields)
+        mock_repository.get_field_dependencies.return_value = Success({
+            **empty_dependencies,
+            "referenced_by_control_rules": [("test_entity", "field_number")],
+        })
+
+        # Execute
+        result = command.execute(
+            entity_id="test_entity",
+            field_id="field_text",
+        )
+
+        # Assert
+        assert result.is_failure()
+        assert "control rule formula" in result.error
+        assert "test_entity.field_number" in result.error
+        mock_repository.save.assert_not_called()
+
     def test_repository_save_failure_propagated(
         self,
         command: DeleteFieldCommand,
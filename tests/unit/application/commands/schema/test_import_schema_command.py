@@ -15,6 +15,11 @@ from doc_helper.domain.schema.entity_definition import EntityDefinition
 from doc_helper.domain.schema.field_definition import FieldDefinition
 from doc_helper.domain.schema.field_type import FieldType
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.schema.schema_repository import ISchemaBulkWriter, ISchemaRepository
+
+
+class _BulkSchemaRepository(ISchemaRepository, ISchemaBulkWriter):
+    """Spec for a repository that supports bulk replacement."""
 
 
 class TestImportSchemaCommand:
@@ -502,6 +507,45 @@ class TestImportSchemaCommand:
         assert result.success is False
         assert "save" in result.error.lower()
 
+    def test_bulk_writer_replaces_schema_in_one_call(
+        self,
+        valid_import_data: dict,
+        existing_entity: EntityDefinition,
+    ) -> None:
+        """Should use replace_all() instead of per-entity delete/save."""
+        repository = Mock(spec=_BulkSchemaRepository)
+        repository.get_all.return_value = Success((existing_entity,))
+        repository.replace_all.return_value = Success(None)
+        command = ImportSchemaCommand(repository)
+
+        result = command.execute_from_data(
+            valid_import_data,
+            identical_action=IdenticalSchemaAction.REPLACE,
+        )
+
+        assert result.success is True
+        repository.replace_all.assert_called_once()
+        entities, relationships = repository.replace_all.call_args.args
+        assert [e.id.value for e in entities] == ["project"]
+        assert relationships == ()
+        repository.delete.assert_not_called()
+        repository.save.assert_not_called()
+
+    def test_bulk_writer_failure_returns_error(
+        self,
+        valid_import_data: dict,
+    ) -> None:
+        """Should return the bulk write error unchanged."""
+        repository = Mock(spec=_BulkSchemaRepository)
+        repository.get_all.return_value = Success(())
+        repository.replace_all.return_value = Failure("Failed to import schema: boom")
+        command = ImportSchemaCommand(repository)
+
+        result = command.execute_from_data(valid_import_data)
+
+        assert result.success is False
+        assert result.error == "Failed to import schema: boom"
+
     # =========================================================================
     # Result Content Tests
     # =========================================================================
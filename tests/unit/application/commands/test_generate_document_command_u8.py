@@ -4,6 +4,7 @@ U8 BEHAVIOR TESTED:
 - Auto-save project before document generation
 - Override cleanup after successful generation
 - Cleanup failures don't block generation
+- Project runtime evaluation (R-7) blocks generation and feeds the checklist
 """
 
 from pathlib import Path
@@ -19,8 +20,18 @@ from doc_helper.application.commands.save_project_command import SaveProjectComm
 from doc_helper.application.document.document_generation_service import (
     DocumentGenerationService,
 )
+from doc_helper.application.dto.runtime_dto import (
+    EntityControlRulesEvaluationResultDTO,
+    ProjectEntityRuntimeResultDTO,
+    ProjectRuntimeEvaluationResultDTO,
+    RuntimeEvaluationResultDTO,
+    ValidationEvaluationResultDTO,
+    ValidationIssueDTO,
+)
 from doc_helper.application.services.override_service import OverrideService
-from doc_helper.application.services.validation_service import ValidationService
+from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+    EvaluateProjectRuntimeUseCase,
+)
 from doc_helper.domain.common.result import Failure, Success
 from doc_helper.domain.document.document_format import DocumentFormat
 from doc_helper.domain.project.project import Project
@@ -66,6 +77,25 @@ class FakeProjectRepository(IProjectRepository):
         return Success(tuple(projects[:limit]))
 
 
+def _runtime_result(*errors: ValidationIssueDTO) -> ProjectRuntimeEvaluationResultDTO:
+    """Project runtime result for the 'project' entity with the given errors."""
+    validation = ValidationEvaluationResultDTO.success_result(
+        errors=errors,
+        warnings=(),
+        info=(),
+        evaluated_fields=(),
+        failed_fields=tuple(issue.field_id for issue in errors),
+    )
+    runtime_result = RuntimeEvaluationResultDTO.success(
+        control_rules_result=EntityControlRulesEvaluationResultDTO.default("project"),
+        validation_result=validation,
+        output_mappings_result=None,
+        is_blocked=validation.blocking,
+        blocking_reason="Validation failed" if validation.blocking else None,
+    )
+    return ProjectRuntimeEvaluationResultDTO.from_entity_results(
+        (ProjectEntityRuntimeResultDTO.from_results("project", runtime_result, None),)
+    )
 
 
 class TestGenerateDocumentCommandU8:
@@ -117,18 +147,16 @@ class TestGenerateDocumentCommandU8:
         return mock
 
     @pytest.fixture
-    def validation_service(self):
-        """Create mock validation service."""
-        from doc_helper.domain.validation.validation_result import ValidationResult
-
-        mock = create_autospec(ValidationService, instance=True)
-        # Default: validation passes (no errors)
-        mock.validate_by_project_id.return_value = Success(ValidationResult.success())
+    def project_runtime(self):
+        """Create mock project runtime use case."""
+        mock = create_autospec(EvaluateProjectRuntimeUseCase, instance=True)
+        # Default: nothing blocks
+        mock.execute_for_project.return_value = _runtime_result()
         return mock
 
     @pytest.fixture
     def command(
-        self, project_repository, save_command, document_service, override_service, validation_service
+        self, project_repository, save_command, document_service, override_service, project_runtime
     ):
         """Create generate document command with all dependencies."""
         return GenerateDocumentCommand(
@@ -136,7 +164,7 @@ class TestGenerateDocumentCommandU8:
             save_command=save_command,
             document_service=document_service,
             override_service=override_service,
-            validation_service=validation_service,
+            project_runtime_use_case=project_runtime,
         )
 
     def test_auto_save_called_before_generation(
@@ -326,3 +354,54 @@ class TestGenerateDocumentCommandU8:
 
         assert isinstance(result, Failure)
         assert "format must be a DocumentFormat" in result.error
+
+    def test_runtime_errors_block_generation(
+        self,
+        command,
+        project,
+        project_id,
+        document_service,
+        override_service,
+        project_runtime,
+    ):
+        """Test that ERROR-level runtime validation blocks generation."""
+        project_runtime.execute_for_project.return_value = _runtime_result(
+            ValidationIssueDTO(
+                field_id="name",
+                field_label="Name",
+                constraint_type="RequiredConstraint",
+                severity="ERROR",
+                message="Name is required",
+                code="REQUIRED_FIELD_EMPTY",
+            )
+        )
+
+        result = command.execute(
+            project_id=project_id,
+            template_path="template.docx",
+            output_path="output.docx",
+            format=DocumentFormat.WORD,
+        )
+
+        assert isinstance(result, Failure)
+        assert "Cannot generate document" in result.error
+        project_runtime.execute_for_project.assert_called_once_with(project)
+        document_service.generate.assert_not_called()
+        override_service.cleanup_synced_overrides.assert_not_called()
+
+    def test_evaluate_runtime_returns_the_result_generation_checks(
+        self, command, project, project_id, project_runtime
+    ):
+        """Test that the checklist gets the runtime result generation blocks on."""
+        result = command.evaluate_runtime(project_id)
+
+        assert isinstance(result, Success)
+        assert result.value is project_runtime.execute_for_project.return_value
+        project_runtime.execute_for_project.assert_called_once_with(project)
+
+    def test_evaluate_runtime_unknown_project_fails(self, command, project_runtime):
+        """Test that evaluating an unknown project returns failure."""
+        result = command.evaluate_runtime(ProjectId(uuid4()))
+
+        assert isinstance(result, Failure)
+        project_runtime.execute_for_project.assert_not_called()
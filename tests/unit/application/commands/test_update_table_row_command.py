@@ -0,0 +1,125 @@
+"""Unit tests for UpdateTableRowCommand."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from doc_helper.application.commands.update_table_row_command import UpdateTableRowCommand
+from doc_helper.domain.common.result import Failure, Result, Success
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.project.project_repository import ITableRowRepository
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
+
+
+class RecordingTableRowRepository(ITableRowRepository):
+    """Table row repository that records the calls it receives."""
+
+    def __init__(self) -> None:
+        """Initialize repository."""
+        self.calls: list[tuple] = []
+
+    def insert_table_row(
+        self, project_id: ProjectId, field_id: FieldDefinitionId, position: int, record: dict
+    ) -> Result[None, str]:
+        """Record an insert."""
+        self.calls.append(("insert", field_id.value, position, record))
+        return Success(None)
+
+    def update_table_row(
+        self, project_id: ProjectId, field_id: FieldDefinitionId, position: int, record: dict
+    ) -> Result[None, str]:
+        """Record an update."""
+        self.calls.append(("update", field_id.value, position, record))
+        return Success(None)
+
+    def delete_table_row(
+        self, project_id: ProjectId, field_id: FieldDefinitionId, position: int
+    ) -> Result[None, str]:
+        """Record a delete."""
+        self.calls.append(("delete", field_id.value, position))
+        return Success(None)
+
+    def move_table_row(
+        self,
+        project_id: ProjectId,
+        field_id: FieldDefinitionId,
+        from_position: int,
+        to_position: int,
+    ) -> Result[None, str]:
+        """Record a move."""
+        self.calls.append(("move", field_id.value, from_position, to_position))
+        return Success(None)
+
+
+class TestUpdateTableRowCommand:
+    """Tests for UpdateTableRowCommand."""
+
+    @pytest.fixture
+    def repository(self) -> RecordingTableRowRepository:
+        """Create recording repository."""
+        return RecordingTableRowRepository()
+
+    @pytest.fixture
+    def command(self, repository: RecordingTableRowRepository) -> UpdateTableRowCommand:
+        """Create command."""
+        return UpdateTableRowCommand(table_row_repository=repository)
+
+    @pytest.fixture
+    def project_id(self) -> ProjectId:
+        """Create project ID."""
+        return ProjectId(uuid4())
+
+    def test_requires_table_row_repository(self) -> None:
+        """Command should reject other repositories."""
+        with pytest.raises(TypeError):
+            UpdateTableRowCommand(table_row_repository="not a repository")  # type: ignore
+
+    @pytest.mark.parametrize(
+        "kind, kwargs, expected",
+        [
+            ("insert", {"record": {"depth": 1.0}}, ("insert", "samples", 2, {"depth": 1.0})),
+            ("update", {"record": {"depth": 2.0}}, ("update", "samples", 2, {"depth": 2.0})),
+            ("delete", {}, ("delete", "samples", 2)),
+            ("move", {"to_index": 0}, ("move", "samples", 2, 0)),
+        ],
+    )
+    def test_dispatches_each_kind(
+        self,
+        command: UpdateTableRowCommand,
+        repository: RecordingTableRowRepository,
+        project_id: ProjectId,
+        kind: str,
+        kwargs: dict[str, Any],
+        expected: tuple,
+    ) -> None:
+        """Each row change should reach its repository method."""
+        result = command.execute(project_id, FieldDefinitionId("samples"), kind, 2, **kwargs)
+
+        assert isinstance(result, Success)
+        assert repository.calls == [expected]
+
+    @pytest.mark.parametrize(
+        "kind, kwargs",
+        [("reset", {}), ("insert", {}), ("update", {}), ("move", {})],
+    )
+    def test_incomplete_change_fails(
+        self,
+        command: UpdateTableRowCommand,
+        repository: RecordingTableRowRepository,
+        project_id: ProjectId,
+        kind: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Unknown kinds, or a missing record or destination, should fail."""
+        result = command.execute(project_id, FieldDefinitionId("samples"), kind, 0, **kwargs)
+
+        assert isinstance(result, Failure)
+        assert repository.calls == []
+
+    def test_rejects_untyped_ids(
+        self, command: UpdateTableRowCommand, project_id: ProjectId
+    ) -> None:
+        """String IDs should be rejected."""
+        assert isinstance(command.execute("p1", FieldDefinitionId("samples"), "delete", 0), Failure)  # type: ignore
+        assert isinstance(command.execute(project_id, "samples", "delete", 0), Failure)  # type: ignore
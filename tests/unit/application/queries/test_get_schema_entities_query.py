@@ -0,0 +1,199 @@
+"""Unit tests for GetSchemaEntitiesQuery translation memo."""
+
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from doc_helper.application.queries.schema.get_schema_entities_query import (
+    GetSchemaEntitiesQuery,
+)
+from doc_helper.domain.common.i18n import Language, TranslationKey
+from doc_helper.domain.common.result import Success
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.infrastructure.i18n.json_translation_service import (
+    JsonTranslationService,
+)
+
+TRANSLATIONS_DIR = Path(__file__).parents[4] / "translations"
+
+
+def _build_schema(entity_count: int, fields_per_entity: int) -> tuple:
+    """Build a synthetic schema with translated labels and options."""
+    entities = []
+    for e in range(entity_count):
+        fields = {}
+        for f in range(fields_per_entity):
+            field_id = FieldDefinitionId(f"field_{e}_{f}")
+            is_choice = f % 5 == 0
+            fields[field_id] = FieldDefinition(
+                id=field_id,
+                field_type=FieldType.DROPDOWN if is_choice else FieldType.TEXT,
+                label_key=TranslationKey("menu.file.open"),
+                help_text_key=TranslationKey("welcome.title"),
+                options=(
+                    (
+                        ("a", TranslationKey("menu.edit")),
+                        ("b", TranslationKey("menu.help")),
+                    )
+                    if is_choice
+                    else ()
+                ),
+            )
+        entities.append(
+            EntityDefinition(
+                id=EntityDefinitionId(f"entity_{e}"),
+                name_key=TranslationKey("app.name"),
+                fields=fields,
+            )
+        )
+    return tuple(entities)
+
+
+class TestGetSchemaEntitiesQueryMemo:
+    """Tests for per-language memoization of translated field DTOs."""
+
+    @pytest.fixture
+    def translation_service(self) -> Mock:
+        """Create a translation service that records calls."""
+        service = Mock()
+        service.get_current_language.return_value = Language.ENGLISH
+        service.get.side_effect = lambda key, lang, params=None: f"{lang.code}:{key.key}"
+        return service
+
+    @pytest.fixture
+    def schema_repository(self) -> Mock:
+        """Create a schema repository returning a small schema."""
+        repository = Mock()
+        repository.get_all.return_value = Success(_build_schema(2, 5))
+        return repository
+
+    def test_second_execute_reuses_translated_fields(
+        self, schema_repository: Mock, translation_service: Mock
+    ) -> None:
+        """Repeated execute() should not re-translate unchanged fields."""
+        query = GetSchemaEntitiesQuery(schema_repository, translation_service)
+
+        first = query.execute().value
+        calls_after_first = translation_service.get.call_count
+        second = query.execute().value
+
+        assert first == second
+        # Only entity names are re-translated on the second pass
+        assert translation_service.get.call_count - calls_after_first == 2
+
+    def test_language_switch_rebuilds_labels(
+        self, schema_repository: Mock, translation_service: Mock
+    ) -> None:
+        """Switching language should produce labels in the new language."""
+        query = GetSchemaEntitiesQuery(schema_repository, translation_service)
+        english = query.execute().value
+
+        translation_service.get_current_language.return_value = Language.ARABIC
+        arabic = query.execute().value
+
+        assert english[0].fields[0].label == "en:menu.file.open"
+        assert arabic[0].fields[0].label == "ar:menu.file.open"
+
+    def test_changed_field_is_retranslated(
+        self, schema_repository: Mock, translation_service: Mock
+    ) -> None:
+        """A field whose definition changed must not be served from the memo."""
+        query = GetSchemaEntitiesQuery(schema_repository, translation_service)
+        query.execute()
+
+        field_id = FieldDefinitionId("field_0_1")
+        changed = FieldDefinition(
+            id=field_id,
+            field_type=FieldType.TEXT,
+            label_key=TranslationKey("menu.edit"),
+        )
+        schema_repository.get_all.return_value = Success(
+            (
+                EntityDefinition(
+                    id=EntityDefinitionId("entity_0"),
+                    name_key=TranslationKey("app.name"),
+                    fields={field_id: changed},
+                ),
+            )
+        )
+
+        result = query.execute().value
+
+        assert result[0].fields[0].label == "en:menu.edit"
+
+    def test_execute_for_entity_replaces_entity_memo(
+        self, schema_repository: Mock, translation_service: Mock
+    ) -> None:
+        """Repeated single-entity reads keep only the entity's current fields."""
+        query = GetSchemaEntitiesQuery(schema_repository, translation_service)
+        for version in range(20):
+            field_id = FieldDefinitionId("field_0_0")
+            schema_repository.get_by_id.return_value = Success(
+                EntityDefinition(
+                    id=EntityDefinitionId("entity_0"),
+                    name_key=TranslationKey("app.name"),
+                    fields={
+                        field_id: FieldDefinition(
+                            id=field_id,
+                            field_type=FieldType.TEXT,
+                            label_key=TranslationKey(f"label.{version}"),
+                        )
+                    },
+                )
+            )
+            result = query.execute_for_entity("entity_0").value
+
+        assert result.fields[0].label == "en:label.19"
+        assert len(query._field_dto_memo[Language.ENGLISH]["entity_0"]) == 1
+
+    def test_invalidate_drops_entity_memo(
+        self, schema_repository: Mock, translation_service: Mock
+    ) -> None:
+        """After invalidate() an entity's fields are translated again."""
+        query = GetSchemaEntitiesQuery(schema_repository, translation_service)
+        query.execute()
+        schema_repository.get_by_id.return_value = Success(_build_schema(1, 5)[0])
+        calls_before = translation_service.get.call_count
+
+        query.execute_for_entity("entity_0")
+        memo_hit_calls = translation_service.get.call_count - calls_before
+        query.invalidate("entity_0")
+        calls_before = translation_service.get.call_count
+        query.execute_for_entity("entity_0")
+
+        # Entity name only, then the name plus every field label and option
+        assert memo_hit_calls == 1
+        assert translation_service.get.call_count - calls_before > 1
+
+    @pytest.mark.slow
+    def test_benchmark_translate_full_schema(self) -> None:
+        """Microbenchmark: translate a 200 x 25 field schema, cold and warm."""
+        translation_service = JsonTranslationService(translations_dir=TRANSLATIONS_DIR)
+        translation_service.get = Mock(wraps=translation_service.get)
+        repository = Mock()
+        repository.get_all.return_value = Success(_build_schema(200, 25))
+        query = GetSchemaEntitiesQuery(repository, translation_service)
+
+        start = time.perf_counter()
+        cold = query.execute().value
+        cold_elapsed = time.perf_counter() - start
+
+        cold_calls = translation_service.get.call_count
+        start = time.perf_counter()
+        warm = query.execute().value
+        warm_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ntranslate 5000 fields: cold={cold_elapsed * 1000:.1f}ms "
+            f"warm={warm_elapsed * 1000:.1f}ms"
+        )
+        assert cold == warm
+        assert cold[0].fields[0].label == "Open Project"
+        # The warm pass re-translates entity names only
+        assert repository.get_all.call_count == 2
+        assert translation_service.get.call_count - cold_calls == len(warm)
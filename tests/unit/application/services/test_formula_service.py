@@ -105,6 +105,35 @@ class TestFormulaService:
         assert isinstance(result, Failure)
         assert "b" in result.error.lower()
 
+    def test_evaluate_formula_table_aggregates(self, service: FormulaService) -> None:
+        """TABLE aggregates are available without passing functions."""
+        layers = [{"thickness": 1.5, "spt_n": 60}, {"thickness": 2.0, "spt_n": 20}]
+        table_columns: dict = {}
+
+        total = service.evaluate_formula(
+            "sum_of(layers.thickness)", {"layers": layers}, table_columns=table_columns
+        )
+        dense = service.evaluate_formula(
+            "count_where(layers.spt_n > 50)", {"layers": layers}, table_columns=table_columns
+        )
+
+        assert total.value == 3.5
+        assert dense.value == 1
+        # Both formulas read the one cached view of the table
+        assert list(table_columns) == ["layers"]
+
+    def test_evaluate_formula_functions_extend_aggregates(
+        self, service: FormulaService
+    ) -> None:
+        """Caller functions are added to the TABLE aggregates."""
+        result = service.evaluate_formula(
+            "double(max_of(layers.depth))",
+            {"layers": [{"depth": 3}, {"depth": 7}]},
+            functions={"double": lambda x: x * 2},
+        )
+
+        assert result.value == 14
+
     def test_evaluate_project_formulas_success(
         self,
         service: FormulaService,
@@ -143,6 +172,15 @@ class TestFormulaService:
         assert isinstance(result, Success)
         assert result.value == {"a", "b", "c"}
 
+    def test_get_field_dependencies_includes_table_of_column(
+        self, service: FormulaService
+    ) -> None:
+        """get_field_dependencies should report the TABLE field of table.column."""
+        result = service.get_field_dependencies("sum_of(layers.thickness) + depth")
+
+        assert isinstance(result, Success)
+        assert result.value == {"layers", "depth"}
+
     def test_get_field_dependencies_with_error(self, service: FormulaService) -> None:
         """get_field_dependencies should return error for invalid formula."""
         result = service.get_field_dependencies("a +")  # Incomplete formula
@@ -0,0 +1,209 @@
+"""Unit tests for LookupSourceService and TypeAheadCompleter."""
+
+import pytest
+
+from doc_helper.application.lookup import ILookupSource, LookupMatchMode, fold_lookup_text
+from doc_helper.application.services.lookup_source_service import LookupSourceService
+from doc_helper.domain.common.result import Failure, Success
+
+
+class FakeLookupSource(ILookupSource):
+    """In-memory source recording every call."""
+
+    def __init__(self, options: list[tuple[str, str]]) -> None:
+        self.options = sorted(options, key=lambda option: fold_lookup_text(option[1]))
+        self.search_calls: list[tuple] = []
+        self.resolve_calls: list[list] = []
+        self.fail = False
+
+    def search(self, query, match_mode, offset, limit):
+        self.search_calls.append((query, match_mode, offset, limit))
+        if self.fail:
+            return Failure("source unavailable")
+        folded = fold_lookup_text(query)
+        matching = [
+            option
+            for option in self.options
+            if match_mode.matches(fold_lookup_text(option[1]), folded)
+        ]
+        return Success(matching[offset:offset + limit])
+
+    def resolve(self, values):
+        values = list(values)
+        self.resolve_calls.append(values)
+        by_value = dict(self.options)
+        return Success({value: by_value[value] for value in values if value in by_value})
+
+
+@pytest.fixture
+def source() -> FakeLookupSource:
+    """25 boreholes BH-00..BH-24 plus two lab codes."""
+    options = [(f"bh{i:02d}", f"BH-{i:02d}") for i in range(25)]
+    options += [("lab1", "Lab Clay"), ("lab2", "Lab Sand")]
+    return FakeLookupSource(options)
+
+
+@pytest.fixture
+def service(source: FakeLookupSource) -> LookupSourceService:
+    return LookupSourceService(source, page_size=10, max_cached_pages=2)
+
+
+class TestLookupSourceService:
+    """Tests for paging, the page cache and display text resolution."""
+
+    def test_pages_and_has_more(self, service: LookupSourceService) -> None:
+        """Pages hold page_size options; the last page has no more."""
+        first = service.get_page("bh").value
+        last = service.get_page("bh", page_index=2).value
+
+        assert [option.value for option in first.options] == [f"bh{i:02d}" for i in range(10)]
+        assert first.has_more is True
+        assert len(last.options) == 5
+        assert last.has_more is False
+
+    def test_cached_page_not_fetched_again(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """A repeated page request is served from the cache."""
+        service.get_page("bh")
+        service.get_page("bh")
+
+        assert len(source.search_calls) == 1
+
+    def test_least_recently_used_page_evicted(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """The cache keeps max_cached_pages, dropping the least recently used."""
+        service.get_page("bh", page_index=0)
+        service.get_page("bh", page_index=1)
+        service.get_page("bh", page_index=0)  # refresh page 0
+        service.get_page("bh", page_index=2)  # evicts page 1
+        service.get_page("bh", page_index=0)
+        service.get_page("bh", page_index=1)
+
+        assert [call[2] for call in source.search_calls] == [0, 10, 20, 10]
+
+    def test_display_text_from_hash_index(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """Values seen on a page resolve without asking the source."""
+        service.get_page("lab", LookupMatchMode.PREFIX)
+
+        assert service.get_display_text("lab2") == "Lab Sand"
+        assert source.resolve_calls == []
+
+    def test_display_texts_resolved_in_one_batch(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """Unseen values are fetched together; unknown values are remembered."""
+        result = service.resolve_display_texts(["bh03", "bh20", "missing", None])
+
+        assert result.value == {"bh03": "BH-03", "bh20": "BH-20"}
+        assert source.resolve_calls == [["bh03", "bh20", "missing"]]
+
+        assert service.contains("missing") is False
+        assert service.contains("bh20") is True
+        assert len(source.resolve_calls) == 1
+
+    def test_display_and_unknown_caches_are_bounded(self, source: FakeLookupSource) -> None:
+        """Least recently used display texts and unknown values are evicted."""
+        service = LookupSourceService(source, max_cached_values=3)
+
+        result = service.resolve_display_texts(["bh00", "bh01", "bh02", "bh03", "bh04"])
+        service.resolve_display_texts([f"gone{i}" for i in range(5)])
+
+        assert len(result.value) == 5
+        assert len(service._display_by_value) == 3
+        assert len(service._unknown_values) == 3
+
+        service.get_display_text("bh04")
+        service.get_display_text("gone4")
+        assert len(source.resolve_calls) == 2
+        service.get_display_text("bh00")
+        service.get_display_text("gone0")
+        assert len(source.resolve_calls) == 4
+
+    def test_invalidate_drops_caches(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """After invalidate() pages and display texts are fetched again."""
+        service.get_page("bh")
+        service.get_display_text("missing")
+        service.invalidate()
+
+        service.get_page("bh")
+        service.get_display_text("missing")
+
+        assert len(source.search_calls) == 2
+        assert len(source.resolve_calls) == 2
+
+    def test_source_failure_propagated(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        source.fail = True
+
+        result = service.get_page("bh")
+
+        assert result.is_failure()
+        assert "source unavailable" in result.error
+
+    def test_rejects_invalid_arguments(self, source: FakeLookupSource) -> None:
+        with pytest.raises(TypeError):
+            LookupSourceService(object())
+        with pytest.raises(ValueError):
+            LookupSourceService(source, page_size=0)
+        with pytest.raises(ValueError):
+            LookupSourceService(source, max_cached_values=0)
+        assert LookupSourceService(source).get_page("x", page_index=-1).is_failure()
+
+
+class TestTypeAheadCompleter:
+    """Tests for incremental completion."""
+
+    def test_complete_result_narrowed_in_memory(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """Typing on from a single-page result does not query the source."""
+        completer = service.create_completer(LookupMatchMode.SUBSTRING)
+
+        completer.update("la")
+        page = completer.update("LAB S").value
+
+        assert [option.value for option in page.options] == ["lab2"]
+        assert len(source.search_calls) == 1
+
+    def test_incomplete_result_queries_source(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """A multi-page result cannot be narrowed locally."""
+        completer = service.create_completer(LookupMatchMode.PREFIX)
+
+        completer.update("b")
+        page = completer.update("bh-2").value
+
+        assert [option.value for option in page.options] == [f"bh{i}" for i in range(20, 25)]
+        assert [call[0] for call in source.search_calls] == ["b", "bh-2"]
+
+    def test_deleting_text_queries_source(
+        self, service: LookupSourceService, source: FakeLookupSource
+    ) -> None:
+        """A shorter text may match more options than the previous result."""
+        completer = service.create_completer()
+
+        completer.update("lab c")
+        page = completer.update("lab").value
+
+        assert len(page.options) == 2
+        assert len(source.search_calls) == 2
+
+    def test_next_page(self, service: LookupSourceService) -> None:
+        """next_page walks the pages of the current text."""
+        completer = service.create_completer(LookupMatchMode.PREFIX)
+        completer.update("bh")
+
+        second = completer.next_page().value
+        third = completer.next_page().value
+
+        assert second.page_index == 1
+        assert third.has_more is False
+        assert completer.next_page().value is None
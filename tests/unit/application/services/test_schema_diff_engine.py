@@ -0,0 +1,216 @@
+"""Unit tests for the indexed schema diff engine (Phase 3)."""
+
+import time
+
+import pytest
+
+from doc_helper.application.services.schema_comparison_service import (
+    SchemaComparisonService,
+)
+from doc_helper.application.services.schema_diff_engine import (
+    DiffStatus,
+    SchemaConflict,
+    SchemaIndex,
+)
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_change import ChangeType
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.validation.constraints import (
+    MaxLengthConstraint,
+    MinLengthConstraint,
+    RequiredConstraint,
+)
+
+
+def _field(field_id: str, required: bool = False, constraints: tuple = (), **kwargs) -> FieldDefinition:
+    return FieldDefinition(
+        id=FieldDefinitionId(field_id),
+        field_type=kwargs.pop("field_type", FieldType.TEXT),
+        label_key=TranslationKey(f"field.{field_id}"),
+        required=required,
+        constraints=constraints,
+        **kwargs,
+    )
+
+
+def _entity(entity_id: str, *fields: FieldDefinition) -> EntityDefinition:
+    return EntityDefinition(
+        id=EntityDefinitionId(entity_id),
+        name_key=TranslationKey(f"entity.{entity_id}"),
+        fields={f.id: f for f in fields},
+    )
+
+
+def _schema(entity_count: int, field_count: int, required: tuple = ()) -> tuple:
+    """Build a schema; (entity_index, field_index) pairs in required are required."""
+    return tuple(
+        _entity(
+            f"entity_{e}",
+            *(
+                _field(
+                    f"field_{f}",
+                    required=(e, f) in required,
+                    constraints=(MaxLengthConstraint(max_length=50),),
+                )
+                for f in range(field_count)
+            ),
+        )
+        for e in range(entity_count)
+    )
+
+
+class TestSchemaDiff:
+    """Tests for the lazily expanded change tree."""
+
+    @pytest.fixture
+    def service(self) -> SchemaComparisonService:
+        return SchemaComparisonService()
+
+    def test_identical_schemas_have_no_nodes(self, service: SchemaComparisonService) -> None:
+        """Separately built but equal schemas produce an empty tree."""
+        diff = service.diff(_schema(3, 5), _schema(3, 5))
+
+        assert diff.entities == ()
+        assert diff.has_changes is False
+
+    def test_only_changed_entities_are_nodes(self, service: SchemaComparisonService) -> None:
+        """Entities with equal fields are skipped; fields expand on access."""
+        diff = service.diff(_schema(3, 5), _schema(3, 5, required=((1, 2),)))
+
+        assert [(n.entity_id, n.status) for n in diff.entities] == [
+            ("entity_1", DiffStatus.MODIFIED)
+        ]
+        node = diff.entity("entity_1")
+        assert [f.field_id for f in node.fields] == ["field_2"]
+        assert [c.change_type for c in node.changes] == [ChangeType.FIELD_REQUIRED_CHANGED]
+        assert diff.entity("entity_0") is None
+
+    def test_added_and_removed_entities(self, service: SchemaComparisonService) -> None:
+        """Entity-level changes come first and have no field nodes."""
+        diff = service.diff(
+            (_entity("project", _field("name")), _entity("old")),
+            (_entity("project", _field("name"), _field("code")), _entity("new")),
+        )
+
+        statuses = {n.entity_id: n.status for n in diff.entities}
+        assert statuses == {
+            "new": DiffStatus.ADDED,
+            "old": DiffStatus.REMOVED,
+            "project": DiffStatus.MODIFIED,
+        }
+        assert diff.entity("new").fields == ()
+        assert [c.change_type for c in diff.changes] == [
+            ChangeType.ENTITY_ADDED,
+            ChangeType.ENTITY_REMOVED,
+            ChangeType.FIELD_ADDED,
+        ]
+
+    def test_reordered_constraints_are_not_a_change(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Forms differ on constraint order but no change is reported."""
+        constraints = (RequiredConstraint(), MinLengthConstraint(min_length=2))
+        diff = service.diff(
+            (_entity("project", _field("name", constraints=constraints)),),
+            (_entity("project", _field("name", constraints=constraints[::-1])),),
+        )
+
+        assert diff.entity("project").fields == ()
+        assert diff.has_changes is False
+
+    def test_fingerprints_are_stable_and_ignore_labels(self) -> None:
+        """Equal structure gives equal fingerprints regardless of label keys."""
+        source = SchemaIndex((_entity("project", _field("name", help_text_key=TranslationKey("a"))),))
+        target = SchemaIndex((_entity("project", _field("name", help_text_key=TranslationKey("b"))),))
+        changed = SchemaIndex((_entity("project", _field("name", required=True)),))
+
+        assert source.entity_fingerprint("project") == target.entity_fingerprint("project")
+        assert source.field_fingerprint("project", "name") != changed.field_fingerprint(
+            "project", "name"
+        )
+        assert len(source.entity_fingerprint("project")) == 64
+
+    def test_compare_matches_diff_changes(self, service: SchemaComparisonService) -> None:
+        """compare() reports exactly the flattened change tree."""
+        source = _schema(2, 3)
+        target = _schema(2, 3, required=((0, 1),))
+
+        assert service.compare(source, target).changes == service.diff(source, target).changes
+
+    @pytest.mark.slow
+    def test_benchmark_near_identical_5000_fields(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Microbenchmark: two 50 x 100 field schemas differing in one field."""
+        source = _schema(50, 100)
+        target = _schema(50, 100, required=((25, 50),))
+
+        start = time.perf_counter()
+        result = service.compare(source, target)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n5,000-field near-identical compare: {elapsed * 1000:.1f} ms")
+        assert [c.location for c in result.changes] == ["entity_25.field_50"]
+        assert elapsed < 1.0
+
+
+class TestThreeWaySchemaDiff:
+    """Tests for three-way diffs against a common base."""
+
+    @pytest.fixture
+    def service(self) -> SchemaComparisonService:
+        return SchemaComparisonService()
+
+    def test_changes_on_different_fields_do_not_conflict(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Each side changing its own field is a clean merge."""
+        result = service.compare_three_way(
+            _schema(2, 3),
+            _schema(2, 3, required=((0, 0),)),
+            _schema(2, 3, required=((0, 1),)),
+        )
+
+        assert result.has_conflicts is False
+        assert [c.location for c in result.ours.changes] == ["entity_0.field_0"]
+        assert [c.location for c in result.theirs.changes] == ["entity_0.field_1"]
+
+    def test_identical_change_on_both_sides_does_not_conflict(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Both sides making the same change agree."""
+        changed = _schema(2, 3, required=((1, 2),))
+        result = service.compare_three_way(_schema(2, 3), changed, _schema(2, 3, required=((1, 2),)))
+
+        assert result.conflicts == ()
+
+    def test_different_changes_to_same_field_conflict(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Diverging edits of one field are reported at field level."""
+        base = (_entity("project", _field("name"), _field("code")),)
+        ours = (_entity("project", _field("name", required=True), _field("code")),)
+        theirs = (_entity("project", _field("name", field_type=FieldType.TEXTAREA), _field("code")),)
+
+        result = service.compare_three_way(base, ours, theirs)
+
+        assert result.conflicts == (
+            SchemaConflict("project", "name", DiffStatus.MODIFIED, DiffStatus.MODIFIED),
+        )
+
+    def test_removed_versus_modified_entity_conflicts(
+        self, service: SchemaComparisonService
+    ) -> None:
+        """Removing an entity the other side modified is an entity-level conflict."""
+        base = (_entity("project", _field("name")),)
+        ours = ()
+        theirs = (_entity("project", _field("name"), _field("code")),)
+
+        result = service.compare_three_way(base, ours, theirs)
+
+        assert result.conflicts == (
+            SchemaConflict("project", None, DiffStatus.REMOVED, DiffStatus.MODIFIED),
+        )
@@ -1,5 +1,7 @@
 """Unit tests for SchemaImportValidationService (Phase 4)."""
 
+import time
+
 import pytest
 
 from doc_helper.application.services.schema_import_validation_service import (
@@ -886,3 +888,99 @@ class TestSchemaImportValidationService:
             "MaxFileSizeConstraint",
         }
         assert KNOWN_CONSTRAINT_TYPES == expected
+
+
+def _package(entity_count: int, field_count: int = 5, broken: tuple = ()) -> dict:
+    """Build an import package; entity indexes in broken get an invalid field type."""
+    return {
+        "schema_id": "vendor_package",
+        "entities": [
+            {
+                "id": f"entity_{e}",
+                "name_key": f"entity.{e}",
+                "is_root_entity": e == 0,
+                "fields": [
+                    {
+                        "id": f"field_{f}",
+                        "field_type": "BOGUS" if e in broken and f == 0 else "NUMBER",
+                        "label_key": f"field.{f}",
+                        "required": False,
+                        "control_rules": [
+                            {
+                                "rule_type": "VISIBILITY",
+                                "target_field_id": f"field_{f}",
+                                "formula_text": "field_0 > 0",
+                            }
+                        ] if f > 0 else [],
+                    }
+                    for f in range(field_count)
+                ],
+            }
+            for e in range(entity_count)
+        ],
+    }
+
+
+class TestStreamingImportValidation:
+    """Tests for per-entity, fail-fast validation."""
+
+    def test_errors_are_reported_in_entity_order(self) -> None:
+        """Errors of every entity are collected, in file order."""
+        data = _package(20, broken=(3, 11))
+
+        result = SchemaImportValidationService().validate_json_data(data)
+
+        assert result.is_failure()
+        assert [e.location for e in result.error] == [
+            "entities[3].fields[0].field_type",
+            "entities[11].fields[0].field_type",
+        ]
+
+    def test_success_keeps_entity_order(self) -> None:
+        """Converted entities come back in file order."""
+        result = SchemaImportValidationService().validate_json_data(_package(20))
+
+        assert result.is_success()
+        assert [e.id.value for e in result.value["entities"]] == [
+            f"entity_{e}" for e in range(20)
+        ]
+
+    def test_fail_fast_stops_at_error_limit(self) -> None:
+        """Only the first max_errors errors are reported."""
+        data = _package(30, broken=(2, 5, 9, 20))
+
+        result = SchemaImportValidationService(max_errors=2).validate_json_data(data)
+
+        assert [e.location for e in result.error] == [
+            "entities[2].fields[0].field_type",
+            "entities[5].fields[0].field_type",
+        ]
+
+    def test_control_rules_share_one_parse_cache(self) -> None:
+        """A formula repeated across the package is parsed once."""
+        service = SchemaImportValidationService()
+
+        result = service.validate_json_data(_package(4))
+
+        assert result.is_success()
+        assert service._parse_cache.misses == 1
+        assert service._parse_cache.hits > 0
+
+    def test_max_errors_must_be_positive(self) -> None:
+        """A zero error limit is rejected."""
+        with pytest.raises(ValueError):
+            SchemaImportValidationService(max_errors=0)
+
+    @pytest.mark.slow
+    def test_benchmark_fail_fast_on_large_package(self) -> None:
+        """Microbenchmark: first errors of a 2,000-entity package."""
+        data = _package(2000, field_count=10, broken=(1, 3))
+        service = SchemaImportValidationService(max_errors=2)
+
+        start = time.perf_counter()
+        result = service.validate_json_data(data)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nfail-fast on 2,000 entities x 10 fields: {elapsed * 1000:.1f} ms")
+        assert len(result.error) == 2
+        assert elapsed < 1.0
@@ -176,3 +176,25 @@ class TestValidationService:
 
         assert result.is_invalid()
         assert result.error_count == 2
+
+    def test_plan_is_reused_until_constraints_change(
+        self, service: ValidationService, entity_definition: EntityDefinition
+    ) -> None:
+        """get_plan should reuse the compiled plan for an unchanged schema."""
+        plan = service.get_plan(entity_definition)
+        assert service.get_plan(entity_definition) is plan
+
+        changed = EntityDefinition(
+            id=entity_definition.id,
+            name_key=entity_definition.name_key,
+            fields={
+                FieldDefinitionId("field1"): FieldDefinition(
+                    id=FieldDefinitionId("field1"),
+                    label_key=TranslationKey("fields.field1"),
+                    field_type=FieldType.TEXT,
+                    constraints=(),
+                ),
+            },
+        )
+        assert service.get_plan(changed) is not plan
+        assert service.validate_fields({FieldDefinitionId("field1"): None}, changed).is_valid()
@@ -22,6 +22,11 @@ class MockSchemaUseCases:
     def __init__(self, entities=None):
         """Initialize with optional entity definitions."""
         self._entities = entities or []
+        self.schema_revision = 0
+
+    def get_rule_dependencies(self, entity_id: str):
+        """Dependency sets are not mocked (results are not memoized)."""
+        return None
 
     def get_all_entities(self):
         """Return all entities."""
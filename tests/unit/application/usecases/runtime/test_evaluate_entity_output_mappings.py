@@ -636,3 +636,124 @@ def test_multiple_output_mappings_per_field():
         "NUMBER": 5.0,  # First successful mapping is used
     }
     assert result.result.error is None
+
+
+# ============================================================================
+# Compiled Program Tests
+# ============================================================================
+
+
+class CountingSchemaRepository(MockSchemaRepository):
+    """Mock schema repository that counts calls."""
+
+    def __init__(self, entities: dict[EntityDefinitionId, EntityDefinition] | None = None):
+        super().__init__(entities)
+        self.calls = 0
+
+    def exists(self, entity_id: EntityDefinitionId) -> bool:
+        self.calls += 1
+        return super().exists(entity_id)
+
+    def get_by_id(self, entity_id: EntityDefinitionId):
+        self.calls += 1
+        return super().get_by_id(entity_id)
+
+
+class CountingSchemaUseCases(MockSchemaUseCases):
+    """Mock SchemaUseCases that counts per-field mapping lookups."""
+
+    def __init__(self, schema_repository: MockSchemaRepository):
+        super().__init__(schema_repository)
+        self.calls = 0
+
+    def list_output_mappings_for_field(self, entity_id: str, field_id: str):
+        self.calls += 1
+        return super().list_output_mappings_for_field(entity_id, field_id)
+
+
+def _entity_with_fields(field_count: int, formula_suffix: str = "") -> EntityDefinition:
+    """Create entity with field_count NUMBER fields, each with a TEXT mapping."""
+    fields = {
+        FieldDefinitionId(f"f{i}"): FieldDefinition(
+            id=FieldDefinitionId(f"f{i}"),
+            field_type=FieldType.NUMBER,
+            label_key=TranslationKey(f"field.f{i}"),
+            output_mappings=(
+                OutputMappingExportDTO(target="TEXT", formula_text=f"f{i}{formula_suffix}"),
+            ),
+        )
+        for i in range(field_count)
+    }
+    return EntityDefinition(
+        id=EntityDefinitionId("project"),
+        name_key=TranslationKey("entity.project"),
+        fields=fields,
+    )
+
+
+def _schema_calls_for(field_count: int) -> int:
+    """Count schema calls for one evaluation of an entity with field_count fields."""
+    repo = CountingSchemaRepository(
+        entities={EntityDefinitionId("project"): _entity_with_fields(field_count)}
+    )
+    schema = CountingSchemaUseCases(schema_repository=repo)
+    use_case = EvaluateEntityOutputMappingsUseCase(
+        schema_usecases=schema,
+        formula_usecases=FormulaUseCases(),
+    )
+
+    result = use_case.execute(
+        entity_id="project",
+        field_values={f"f{i}": i for i in range(field_count)},
+    )
+
+    assert result.result.success is True
+    assert len(result.result.values) == 1  # All mappings share the TEXT target
+    return repo.calls + schema.calls
+
+
+def test_schema_calls_do_not_depend_on_field_count():
+    """Test: Schema repository calls are constant in the number of fields."""
+    assert _schema_calls_for(1) == _schema_calls_for(20)
+
+
+def test_program_is_recompiled_when_mappings_change():
+    """Test: Changed output mapping formula → new program, new result."""
+    repo = MockSchemaRepository(entities={EntityDefinitionId("project"): _entity_with_fields(2)})
+    use_case = EvaluateEntityOutputMappingsUseCase(
+        schema_usecases=MockSchemaUseCases(schema_repository=repo),
+        formula_usecases=FormulaUseCases(),
+    )
+
+    first = use_case.execute(entity_id="project", field_values={"f0": 1, "f1": 2})
+    program = use_case._programs["project"]
+    again = use_case.execute(entity_id="project", field_values={"f0": 1, "f1": 2})
+    assert use_case._programs["project"] is program  # Reused while unchanged
+
+    repo.entities[EntityDefinitionId("project")] = _entity_with_fields(2, " * 10")
+    changed = use_case.execute(entity_id="project", field_values={"f0": 1, "f1": 2})
+
+    assert first.result.values == again.result.values == {"TEXT": "2"}
+    assert use_case._programs["project"] is not program
+    assert changed.result.values == {"TEXT": "20"}
+
+
+def test_program_cache_is_bounded():
+    """Test: Only the most recently used max_programs entities keep a program."""
+    entities = {}
+    for name in ("alpha", "beta", "gamma"):
+        entity = _entity_with_fields(1)
+        entities[EntityDefinitionId(name)] = EntityDefinition(
+            id=EntityDefinitionId(name), name_key=entity.name_key, fields=entity.fields
+        )
+    repo = MockSchemaRepository(entities=entities)
+    use_case = EvaluateEntityOutputMappingsUseCase(
+        schema_usecases=MockSchemaUseCases(schema_repository=repo),
+        formula_usecases=FormulaUseCases(),
+        max_programs=2,
+    )
+
+    for name in ("alpha", "beta", "alpha", "gamma"):
+        assert use_case.execute(entity_id=name, field_values={"f0": 1}).result.success
+
+    assert list(use_case._programs) == ["alpha", "gamma"]
@@ -0,0 +1,208 @@
+"""Unit tests for EvaluateProjectRuntimeUseCase (Phase R-7).
+
+Tests project-level runtime evaluation:
+- Every entity of the snapshot evaluated, results in snapshot order
+- Output mappings skipped for entities whose validation blocks
+- Blocking aggregated over entities
+- Same results with and without an executor
+- Aggregated result consumable by the checklist (ValidationErrorDTO)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from doc_helper.application.dto.runtime_dto import (
+    EntityControlRulesEvaluationResultDTO,
+    EntityOutputMappingsEvaluationDTO,
+    ProjectRuntimeEvaluationRequestDTO,
+    RuntimeEvaluationResultDTO,
+    ValidationEvaluationResultDTO,
+    ValidationIssueDTO,
+)
+from doc_helper.application.dto.validation_dto import ValidationErrorDTO
+from doc_helper.application.usecases.runtime.evaluate_project_runtime import (
+    EvaluateProjectRuntimeUseCase,
+)
+from doc_helper.domain.project.field_value import FieldValue
+from doc_helper.domain.project.project import Project
+from doc_helper.domain.project.project_ids import ProjectId
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+
+
+def _issue(field_id: str, severity: str = "ERROR") -> ValidationIssueDTO:
+    return ValidationIssueDTO(
+        field_id=field_id,
+        field_label=field_id.title(),
+        constraint_type="RequiredConstraint",
+        severity=severity,
+        message=f"{field_id} is required",
+        code="REQUIRED_FIELD_EMPTY",
+    )
+
+
+class StubRuntimeRulesUseCase:
+    """R-3 stub: an empty 'name' is a blocking error, an empty 'notes' a warning."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def execute(self, request):
+        self.calls.append(request.entity_id)
+        values = request.field_values
+        errors = (_issue("name"),) if values.get("name") == "" else ()
+        warnings = (_issue("notes", "WARNING"),) if values.get("notes") == "" else ()
+        validation = ValidationEvaluationResultDTO.success_result(
+            errors=errors,
+            warnings=warnings,
+            info=(),
+            evaluated_fields=tuple(values),
+            failed_fields=tuple(issue.field_id for issue in errors),
+        )
+        return RuntimeEvaluationResultDTO.success(
+            control_rules_result=EntityControlRulesEvaluationResultDTO.default(
+                request.entity_id
+            ),
+            validation_result=validation,
+            output_mappings_result=None,
+            is_blocked=validation.blocking,
+            blocking_reason="Validation failed" if validation.blocking else None,
+        )
+
+
+class StubOutputMappingsUseCase:
+    """R-5 stub: outputs the upper-cased name; fails if 'fail' is set."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def execute(self, entity_id, field_values):
+        self.calls.append(entity_id)
+        if field_values.get("fail"):
+            return EntityOutputMappingsEvaluationDTO.failure(entity_id, "bad formula")
+        return EntityOutputMappingsEvaluationDTO.success_result(
+            entity_id, {"TEXT": str(field_values.get("name", "")).upper()}
+        )
+
+
+def _use_case(executor=None):
+    runtime = StubRuntimeRulesUseCase()
+    outputs = StubOutputMappingsUseCase()
+    use_case = EvaluateProjectRuntimeUseCase(
+        schema_usecases=None,
+        runtime_rules_use_case=runtime,
+        output_mappings_use_case=outputs,
+        executor=executor,
+    )
+    return use_case, runtime, outputs
+
+
+class TestEvaluateProjectRuntimeUseCase:
+    """Tests for project-level runtime evaluation."""
+
+    def test_all_entities_evaluated_in_snapshot_order(self):
+        """Every entity gets R-3 and R-5 results, in snapshot order."""
+        use_case, runtime, outputs = _use_case()
+        result = use_case.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={"project": {"name": "a"}, "borehole": {"name": "b"}}
+            )
+        )
+
+        assert [r.entity_id for r in result.entity_results] == ["project", "borehole"]
+        assert runtime.calls == ["project", "borehole"]
+        assert outputs.calls == ["project", "borehole"]
+        assert result.is_blocked is False
+        assert result.output_values("project") == {"TEXT": "A"}
+        assert result.output_values("borehole") == {"TEXT": "B"}
+
+    def test_blocked_entity_skips_output_mappings(self):
+        """Output mappings are not evaluated for an entity whose validation blocks."""
+        use_case, _, outputs = _use_case()
+        result = use_case.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={"project": {"name": ""}, "borehole": {"name": "b"}}
+            )
+        )
+
+        assert outputs.calls == ["borehole"]
+        assert result.is_blocked is True
+        assert result.blocked_entity_ids == ("project",)
+        project = result.get_entity_result("project")
+        assert project.output_mappings is None
+        assert project.blocking_reason == "Validation failed"
+        assert result.output_values("project") == {}
+
+    def test_output_mapping_failure_blocks_project(self):
+        """A failed output mapping blocks its entity and the project."""
+        use_case, _, _ = _use_case()
+        result = use_case.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={"project": {"name": "a", "fail": True}}
+            )
+        )
+
+        assert result.is_blocked is True
+        assert result.blocked_entity_ids == ("project",)
+        assert "bad formula" in result.entity_results[0].blocking_reason
+
+    def test_validation_error_dtos_for_checklist(self):
+        """Issues of all entities convert to ValidationErrorDTOs, errors first."""
+        use_case, _, _ = _use_case()
+        result = use_case.execute(
+            ProjectRuntimeEvaluationRequestDTO(
+                entity_values={
+                    "project": {"name": "", "notes": ""},
+                    "borehole": {"name": ""},
+                }
+            )
+        )
+
+        errors = result.to_validation_error_dtos()
+
+        assert errors == (
+            ValidationErrorDTO("name", "name is required", "RequiredConstraint", "ERROR"),
+            ValidationErrorDTO("notes", "notes is required", "RequiredConstraint", "WARNING"),
+            ValidationErrorDTO("name", "name is required", "RequiredConstraint", "ERROR"),
+        )
+
+    def test_executor_gives_same_result(self):
+        """Evaluating on a thread pool gives the same result, in snapshot order."""
+        snapshot = ProjectRuntimeEvaluationRequestDTO(
+            entity_values={f"entity_{i}": {"name": "" if i % 3 else "x"} for i in range(20)}
+        )
+        sequential, _, _ = _use_case()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pooled, _, _ = _use_case(executor)
+            pooled_result = pooled.execute(snapshot)
+
+        assert pooled_result == sequential.execute(snapshot)
+
+    def test_empty_snapshot(self):
+        """An empty snapshot evaluates to an empty, unblocked result."""
+        use_case, _, _ = _use_case()
+        result = use_case.execute(ProjectRuntimeEvaluationRequestDTO(entity_values={}))
+
+        assert result.entity_results == ()
+        assert result.is_blocked is False
+        assert result.to_validation_error_dtos() == ()
+        assert result.get_entity_result("project") is None
+
+    def test_execute_for_project_uses_project_field_values(self):
+        """A project is evaluated as a snapshot of its entity's field values."""
+        use_case, runtime, _ = _use_case()
+        project = Project(
+            id=ProjectId(uuid4()),
+            name="Site",
+            app_type_id="soil_investigation",
+            entity_definition_id=EntityDefinitionId("project"),
+            field_values={
+                FieldDefinitionId("name"): FieldValue(
+                    field_id=FieldDefinitionId("name"), value="site a"
+                )
+            },
+        )
+
+        result = use_case.execute_for_project(project)
+
+        assert runtime.calls == ["project"]
+        assert result.output_values("project") == {"TEXT": "SITE A"}
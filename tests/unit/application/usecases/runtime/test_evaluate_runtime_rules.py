@@ -38,6 +38,12 @@ class MockSchemaUseCases:
         self.entities = entities
         self.constraints_map = constraints_map or {}
         self.should_fail = False
+        self.schema_revision = 0
+        self.label_language = "en"
+
+    def get_rule_dependencies(self, entity_id: str):
+        """Dependency sets are not mocked (results are not memoized)."""
+        return None
 
     def get_all_entities(self):
         """Return entities tuple directly. Raises exception on failure."""
@@ -728,3 +734,200 @@ def test_blocking_reason_includes_error_count():
     # Assert
     assert result.is_blocked is True
     assert "2 ERROR severity" in result.blocking_reason or "2" in result.blocking_reason
+
+
+# ============================================================================
+# Test Memoization
+# ============================================================================
+
+
+class _SchemaRepository:
+    """Minimal schema repository serving one domain entity."""
+
+    def __init__(self, entity):
+        self.entity = entity
+
+
+class MemoSchemaUseCases(MockSchemaUseCases):
+    """Mock SchemaUseCases backed by a domain entity, counting evaluations."""
+
+    def __init__(self, entity, entity_dto, constraints_map):
+        super().__init__(entities=(entity_dto,), constraints_map=constraints_map)
+        self._schema_repository = _SchemaRepository(entity)
+        self.constraint_lookups = 0
+        self.dependency_lookups = 0
+
+    def get_rule_dependencies(self, entity_id: str):
+        """Fields with constraints plus 'kind', read by the 'code' rule."""
+        self.dependency_lookups += 1
+        entity = self._schema_repository.entity
+        return frozenset(
+            {"kind"} | {f.id.value for f in entity.fields.values() if f.constraints}
+        )
+
+    def list_constraints_for_field(self, entity_id: str, field_id: str):
+        self.constraint_lookups += 1
+        return super().list_constraints_for_field(entity_id, field_id)
+
+    def list_control_rules_for_field(self, entity_id: str, field_id: str):
+        from doc_helper.domain.schema.schema_ids import FieldDefinitionId
+
+        field = self._schema_repository.entity.fields.get(FieldDefinitionId(field_id))
+        return field.control_rules if field else ()
+
+
+def _memo_fixture(min_length: int = 3):
+    """Entity with a constrained 'name', a 'notes' field, and 'code'
+    visible only when 'kind' is 'x'."""
+    from doc_helper.application.dto.export_dto import ControlRuleExportDTO
+    from doc_helper.domain.common.i18n import TranslationKey
+    from doc_helper.domain.schema.entity_definition import EntityDefinition
+    from doc_helper.domain.schema.field_definition import FieldDefinition
+    from doc_helper.domain.schema.field_type import FieldType
+    from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+    from doc_helper.domain.validation.constraints import MinLengthConstraint
+
+    def field(name, constraints=(), control_rules=()):
+        return FieldDefinition(
+            id=FieldDefinitionId(name),
+            field_type=FieldType.TEXT,
+            label_key=TranslationKey(f"field.{name}"),
+            constraints=constraints,
+            control_rules=control_rules,
+        )
+
+    fields = (
+        field("name", constraints=(MinLengthConstraint(min_length=min_length),)),
+        field("notes"),
+        field("kind"),
+        field(
+            "code",
+            control_rules=(
+                ControlRuleExportDTO(
+                    rule_type="VISIBILITY",
+                    target_field_id="code",
+                    formula_text='kind == "x"',
+                ),
+            ),
+        ),
+    )
+    entity = EntityDefinition(
+        id=EntityDefinitionId("project"),
+        name_key=TranslationKey("entity.project"),
+        fields={f.id: f for f in fields},
+    )
+    entity_dto = EntityDefinitionDTO(
+        id="project",
+        name="Project",
+        description=None,
+        name_key="entity.project",
+        description_key=None,
+        field_count=len(fields),
+        is_root_entity=True,
+        parent_entity_id=None,
+        fields=tuple(
+            FieldDefinitionDTO(
+                id=f.id.value,
+                field_type="TEXT",
+                label=f.id.value.title(),
+                help_text=None,
+                required=False,
+                is_required=False,
+                default_value=None,
+                options=(),
+                formula=None,
+                is_calculated=False,
+                is_choice_field=False,
+                is_collection_field=False,
+                lookup_entity_id=None,
+                lookup_display_field=None,
+                child_entity_id=None,
+            )
+            for f in fields
+        ),
+    )
+    constraints_map = {
+        "name": (
+            ConstraintExportDTO(
+                constraint_type="MinLengthConstraint",
+                parameters={"min_length": min_length, "severity": "ERROR"},
+            ),
+        ),
+    }
+    return MemoSchemaUseCases(entity, entity_dto, constraints_map)
+
+
+def test_revisiting_a_state_is_a_memo_hit():
+    """Undo/redo back to an evaluated state should not re-evaluate."""
+    schema = _memo_fixture()
+    use_case = EvaluateRuntimeRulesUseCase(schema_usecases=schema)
+    state_a = {"name": "ab", "notes": "", "kind": "x", "code": ""}
+    state_b = {**state_a, "name": "abcd"}
+
+    first = use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state_a))
+    use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state_b))
+    lookups = schema.constraint_lookups
+    undone = use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state_a))
+
+    assert undone is first
+    assert first.is_blocked is True
+    assert schema.constraint_lookups == lookups
+    assert use_case.memo.hits == 1
+    assert use_case.memo.hit_rate == pytest.approx(1 / 3)
+    # The dependency set is read once per schema revision
+    assert schema.dependency_lookups == 1
+
+
+def test_values_outside_dependency_set_share_a_result():
+    """Editing a field no rule reads should hit the memo."""
+    schema = _memo_fixture()
+    use_case = EvaluateRuntimeRulesUseCase(schema_usecases=schema)
+    state = {"name": "abcd", "notes": "first", "kind": "y", "code": ""}
+
+    first = use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state))
+    edited = use_case.execute(
+        RuntimeEvaluationRequestDTO(entity_id="project", field_values={**state, "notes": "second"})
+    )
+    toggled = use_case.execute(
+        RuntimeEvaluationRequestDTO(entity_id="project", field_values={**state, "kind": "x"})
+    )
+
+    assert edited is first
+    assert toggled is not first
+    code_state = {r.field_id: r for r in toggled.control_rules_result.field_results}["code"]
+    assert code_state.visibility is True
+
+
+def test_language_switch_misses_memo():
+    """Results are cached per label language, so a switch re-evaluates."""
+    schema = _memo_fixture()
+    use_case = EvaluateRuntimeRulesUseCase(schema_usecases=schema)
+    request = RuntimeEvaluationRequestDTO(
+        entity_id="project", field_values={"name": "ab", "notes": "", "kind": "y", "code": ""}
+    )
+
+    english = use_case.execute(request)
+    schema.label_language = "ar"
+    arabic = use_case.execute(request)
+    schema.label_language = "en"
+
+    assert arabic is not english
+    assert use_case.execute(request) is english
+
+
+def test_schema_change_invalidates_memo():
+    """A changed constraint should produce a new schema version."""
+    schema = _memo_fixture(min_length=3)
+    use_case = EvaluateRuntimeRulesUseCase(schema_usecases=schema)
+    state = {"name": "ab", "notes": "", "kind": "y", "code": ""}
+
+    before = use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state))
+    changed = _memo_fixture(min_length=1)
+    schema._schema_repository.entity = changed._schema_repository.entity
+    schema.constraints_map = changed.constraints_map
+    schema.schema_revision += 1
+    after = use_case.execute(RuntimeEvaluationRequestDTO(entity_id="project", field_values=state))
+
+    assert before.is_blocked is True
+    assert after.is_blocked is False
+    assert use_case.memo.hits == 0
@@ -1559,3 +1559,66 @@ def test_deterministic_evaluation():
     assert len(result1.errors) == len(result2.errors)
     assert result1.errors[0].field_id == result2.errors[0].field_id
     assert result1.errors[0].code == result2.errors[0].code
+
+
+# ============================================================================
+# Test Compiled Constraints
+# ============================================================================
+
+
+def test_constraints_recompiled_when_changed():
+    """Changed constraint parameters should take effect on the next execution."""
+    field = FieldDefinitionDTO(
+        id="code",
+        field_type="TEXT",
+        label="Code",
+        help_text=None,
+        required=False,
+        is_required=False,
+        default_value=None,
+        options=(),
+        formula=None,
+        is_calculated=False,
+        is_choice_field=False,
+        is_collection_field=False,
+        lookup_entity_id=None,
+        lookup_display_field=None,
+        child_entity_id=None,
+    )
+    entity = EntityDefinitionDTO(
+        id="project",
+        name="Project",
+        description=None,
+        name_key="entity.test",
+        description_key=None,
+        field_count=1,
+        is_root_entity=True,
+        parent_entity_id=None,
+        fields=(field,),
+    )
+    constraints_map = {
+        "code": (
+            ConstraintExportDTO(
+                constraint_type="PatternConstraint",
+                parameters={"pattern": r"^[A-Z]+$", "severity": "ERROR"},
+            ),
+        )
+    }
+    mock_schema = MockSchemaUseCases(entities=(entity,), constraints_map=constraints_map)
+    use_case = EvaluateValidationRulesUseCase(schema_usecases=mock_schema)
+    request = ValidationEvaluationRequestDTO(entity_id="project", field_values={"code": "abc"})
+
+    first = use_case.execute(request)
+    second = use_case.execute(request)
+
+    mock_schema.constraints_map["code"] = (
+        ConstraintExportDTO(
+            constraint_type="PatternConstraint",
+            parameters={"pattern": r"^[a-z]+$", "severity": "ERROR"},
+        ),
+    )
+    changed = use_case.execute(request)
+
+    assert first.blocking is True
+    assert second.errors == first.errors
+    assert changed.blocking is False
@@ -0,0 +1,74 @@
+"""Unit tests for RuntimeEvaluationMemo and value fingerprints (Phase R-3)."""
+
+import pytest
+
+from doc_helper.application.usecases.runtime.runtime_memo import (
+    RuntimeEvaluationMemo,
+    value_fingerprint,
+)
+
+
+def test_fingerprint_ignores_fields_outside_read_set():
+    """Only read fields (and the supplied field IDs) affect the fingerprint."""
+    a = value_fingerprint({"depth": 5, "notes": "x"}, ("depth",))
+    b = value_fingerprint({"depth": 5, "notes": "y"}, ("depth",))
+    c = value_fingerprint({"depth": 6, "notes": "x"}, ("depth",))
+
+    assert a == b
+    assert a != c
+
+
+def test_fingerprint_distinguishes_missing_none_and_types():
+    """Missing vs None, and 1 vs 1.0 vs True, are different fingerprints."""
+    fingerprints = {
+        value_fingerprint({"other": 0}, ("flag",))[1],
+        value_fingerprint({"flag": None}, ("flag",))[1],
+        value_fingerprint({"flag": 1}, ("flag",))[1],
+        value_fingerprint({"flag": 1.0}, ("flag",))[1],
+        value_fingerprint({"flag": True}, ("flag",))[1],
+    }
+    assert len(fingerprints) == 5
+
+
+def test_fingerprint_freezes_table_and_file_values():
+    """Lists of dicts (TABLE) and dicts (FILE) are fingerprinted by content."""
+    rows = [{"depth": 1.0}, {"depth": 2.0}]
+    a = value_fingerprint({"layers": rows}, ("layers",))
+    b = value_fingerprint({"layers": [dict(r) for r in rows]}, ("layers",))
+
+    assert a == b
+    assert hash(a) == hash(b)
+
+
+def test_fingerprint_unhashable_value_returns_none():
+    """Values that cannot be frozen disable memoization for the request."""
+    assert value_fingerprint({"blob": {1, 2}}, ("blob",)) is None
+
+
+def test_memo_counts_hits_and_misses():
+    memo = RuntimeEvaluationMemo()
+    result = object()
+
+    assert memo.get("k") is None
+    memo.put("k", result)
+    assert memo.get("k") is result
+
+    assert (memo.hits, memo.misses) == (1, 1)
+    assert memo.hit_rate == 0.5
+
+
+def test_memo_evicts_least_recently_used():
+    memo = RuntimeEvaluationMemo(max_entries=2)
+    memo.put("a", 1)
+    memo.put("b", 2)
+    memo.get("a")  # "b" is now least recently used
+    memo.put("c", 3)
+
+    assert len(memo) == 2
+    assert memo.get("b") is None
+    assert memo.get("a") == 1
+
+
+def test_memo_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        RuntimeEvaluationMemo(max_entries=0)
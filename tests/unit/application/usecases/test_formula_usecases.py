@@ -89,6 +89,7 @@ from doc_helper.application.dto.formula_dto import (
     FormulaBindingTarget,
 )
 from doc_helper.application.usecases.formula_usecases import FormulaUseCases
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
 
 
 class TestFormulaUseCases:
@@ -3279,3 +3280,236 @@ class TestFormulaBinding:
         assert bind_result.is_allowed is False
         assert bind_result.binding is None
         assert bind_result.block_reason is not None
+
+
+class TestFormulaDiagnosticsSession:
+    """Tests for FormulaUseCases.create_diagnostics_session()."""
+
+    @pytest.fixture
+    def usecases(self) -> FormulaUseCases:
+        """Create FormulaUseCases instance."""
+        return FormulaUseCases()
+
+    @pytest.fixture
+    def schema_fields(self) -> tuple[SchemaFieldInfoDTO, ...]:
+        """Create sample schema fields."""
+        return (
+            SchemaFieldInfoDTO(
+                field_id="subtotal",
+                field_type="NUMBER",
+                entity_id="invoice",
+                label="Subtotal",
+            ),
+            SchemaFieldInfoDTO(
+                field_id="tax",
+                field_type="NUMBER",
+                entity_id="invoice",
+                label="Tax",
+            ),
+            SchemaFieldInfoDTO(
+                field_id="total",
+                field_type="CALCULATED",
+                entity_id="invoice",
+                label="Total",
+            ),
+        )
+
+    @pytest.mark.parametrize(
+        "formula_text",
+        ["subtotal + tax", "subtotal +", "", "unknown * 2", "upper(tax)", "subtotal $"],
+    )
+    def test_matches_stateless_use_cases(
+        self,
+        usecases: FormulaUseCases,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+        formula_text: str,
+    ) -> None:
+        """Session results equal the individual use-case results."""
+        session = usecases.create_diagnostics_session()
+        session.diagnose("subtotal", schema_fields)  # warm the token cache
+
+        diagnostics = session.diagnose(formula_text, schema_fields)
+
+        validation = usecases.validate_formula(formula_text, schema_fields)
+        assert diagnostics.validation_result == validation
+        assert diagnostics.dependency_analysis_result == usecases.analyze_dependencies(
+            formula_text, schema_fields
+        )
+        assert diagnostics.cycle_analysis_result is None
+        assert diagnostics.governance_result == usecases.evaluate_governance(
+            formula_text, validation, None
+        )
+
+    def test_edit_updates_loaded_dependency_graph(
+        self,
+        usecases: FormulaUseCases,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Editing a field's formula re-checks cycles through that field."""
+        session = usecases.create_diagnostics_session()
+        graph = {"total": ("subtotal", "tax"), "tax": ("subtotal",)}
+        assert session.load_entity_dependencies(graph) == usecases.detect_cycles(graph)
+
+        diagnostics = session.diagnose("total * 0.2", schema_fields, field_id="tax")
+
+        expected = usecases.detect_cycles({"total": ("subtotal", "tax"), "tax": ("total",)})
+        assert diagnostics.cycle_analysis_result == expected
+        assert diagnostics.governance_result.is_blocked is True
+
+    def test_unparseable_edit_keeps_previous_graph_entry(
+        self,
+        usecases: FormulaUseCases,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Syntax errors mid-edit do not change the cycle result."""
+        session = usecases.create_diagnostics_session()
+        session.load_entity_dependencies({"total": ("tax",), "tax": ("total",)})
+
+        diagnostics = session.diagnose("subtotal *", schema_fields, field_id="tax")
+
+        assert diagnostics.cycle_analysis_result.has_cycles is True
+
+    def test_deeply_nested_formula_is_a_parse_error(
+        self,
+        usecases: FormulaUseCases,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Nesting beyond the recursion limit is reported, not raised."""
+        session = usecases.create_diagnostics_session()
+
+        diagnostics = session.diagnose("(" * 5000 + "tax" + ")" * 5000, schema_fields)
+
+        assert diagnostics.validation_result.is_valid is False
+        assert diagnostics.dependency_analysis_result.has_parse_error is True
+
+    def test_internal_errors_are_not_hidden(
+        self,
+        usecases: FormulaUseCases,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Bugs in the parser surface instead of becoming empty diagnostics."""
+        from doc_helper.domain.formula.parser import FormulaParser
+
+        def broken_parse(self):
+            raise AttributeError("parser bug")
+
+        monkeypatch.setattr(FormulaParser, "parse", broken_parse)
+        session = usecases.create_diagnostics_session()
+
+        with pytest.raises(AttributeError, match="parser bug"):
+            session.diagnose("subtotal + tax", schema_fields)
+
+
+class TestSharedParseCache:
+    """Tests for FormulaUseCases with a shared FormulaParseCache."""
+
+    @pytest.fixture
+    def schema_fields(self) -> tuple[SchemaFieldInfoDTO, ...]:
+        """Create sample schema fields."""
+        return (
+            SchemaFieldInfoDTO(field_id="price", field_type="NUMBER", entity_id="order", label="Price"),
+            SchemaFieldInfoDTO(
+                field_id="quantity", field_type="NUMBER", entity_id="order", label="Quantity"
+            ),
+        )
+
+    @pytest.mark.parametrize("formula_text", ["price * quantity", "price *", "unknown + 1"])
+    def test_results_match_uncached(
+        self,
+        formula_text: str,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """A cache changes nothing about the results."""
+        cached = FormulaUseCases(parse_cache=FormulaParseCache())
+        uncached = FormulaUseCases()
+
+        assert cached.validate_formula(formula_text, schema_fields) == uncached.validate_formula(
+            formula_text, schema_fields
+        )
+        assert cached.analyze_dependencies(
+            formula_text, schema_fields
+        ) == uncached.analyze_dependencies(formula_text, schema_fields)
+
+    def test_cache_is_shared_between_instances(
+        self,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Validation and dependency analysis reuse one parse across instances."""
+        cache = FormulaParseCache()
+
+        FormulaUseCases(parse_cache=cache).validate_formula("price * quantity", schema_fields)
+        FormulaUseCases(parse_cache=cache).analyze_dependencies("price * quantity", schema_fields)
+
+        assert (cache.misses, cache.hits) == (1, 1)
+
+
+class TestTableAggregates:
+    """Tests for TABLE aggregate functions over table.column references."""
+
+    LAYERS = [
+        {"thickness": 1.5, "spt_n": 12, "soil": "clay"},
+        {"thickness": 2.0, "spt_n": 55, "soil": "sand"},
+        {"thickness": 0.5, "spt_n": None, "soil": "clay"},
+        {"spt_n": 60, "soil": "rock"},
+    ]
+
+    @pytest.fixture
+    def usecases(self) -> FormulaUseCases:
+        """Create FormulaUseCases instance."""
+        return FormulaUseCases()
+
+    @pytest.mark.parametrize(
+        ("formula_text", "expected"),
+        [
+            ("sum_of(layers.thickness)", 4.0),
+            ("avg_of(layers.spt_n)", 127 / 3),
+            ("min_of(layers.thickness)", 0.5),
+            ("max_of(layers.spt_n)", 60),
+            ("count_where(layers.spt_n > 50)", 2),
+            ('count_where(layers.soil == "clay")', 2),
+            ("count_where(layers.spt_n > 10 and layers.thickness > 1)", 2),
+            ("sum_of(layers.thickness * layers.spt_n) / 2", (18 + 110) / 2),
+        ],
+    )
+    def test_aggregates(
+        self, usecases: FormulaUseCases, formula_text: str, expected: object
+    ) -> None:
+        """Aggregates evaluate over every row and skip null cells."""
+        result = usecases.execute_formula(formula_text, {"layers": self.LAYERS})
+
+        assert result.success is True, result.error
+        assert result.value == pytest.approx(expected)
+
+    def test_aggregates_of_empty_table(self, usecases: FormulaUseCases) -> None:
+        """An empty (or null) table sums to 0 and averages to null."""
+        assert usecases.execute_formula("sum_of(layers.thickness)", {"layers": []}).value == 0
+        assert usecases.execute_formula("avg_of(layers.thickness)", {"layers": None}).value is None
+
+    def test_aggregate_requires_column(self, usecases: FormulaUseCases) -> None:
+        """Aggregates reject scalar arguments."""
+        result = usecases.execute_formula("sum_of(depth)", {"depth": 3})
+
+        assert result.success is False
+        assert "expects a table column" in result.error
+
+    def test_validation_accepts_aggregates(self, usecases: FormulaUseCases) -> None:
+        """table.column on a TABLE field validates and references the table."""
+        schema_fields = (
+            SchemaFieldInfoDTO(field_id="layers", field_type="TABLE", entity_id="e", label="Layers"),
+        )
+        result = usecases.validate_formula("sum_of(layers.thickness)", schema_fields)
+
+        assert result.is_valid is True
+        assert result.field_references == ("layers",)
+        assert result.inferred_type == FormulaResultType.NUMBER.value
+
+    def test_validation_rejects_column_of_non_table(self, usecases: FormulaUseCases) -> None:
+        """table.column on a non-TABLE field is an error."""
+        schema_fields = (
+            SchemaFieldInfoDTO(field_id="depth", field_type="NUMBER", entity_id="e", label="Depth"),
+        )
+        result = usecases.validate_formula("sum_of(depth.value)", schema_fields)
+
+        assert result.is_valid is False
+        assert "Field 'depth' is not a TABLE field" in result.errors
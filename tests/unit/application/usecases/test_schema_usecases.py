@@ -13,6 +13,7 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 from doc_helper.application.dto.operation_result import OperationResult
+from doc_helper.application.dto.schema_dto import EntityChangeResult
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 from doc_helper.domain.common.result import Success, Failure
 from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
@@ -377,6 +378,29 @@ class TestSchemaUseCasesFieldOperations:
         assert result.success is True
         assert result.value == "test_field"
 
+    def test_update_field_returns_changed_entity(
+        self,
+        usecases: SchemaUseCases,
+        mock_schema_repository: Mock,
+        mock_entity_with_field: Mock,
+    ) -> None:
+        """Should return the changed entity DTO without listing all entities."""
+        mock_schema_repository.get_by_id.return_value = Success(mock_entity_with_field)
+        mock_schema_repository.exists.return_value = True
+        mock_schema_repository.save.return_value = Success(None)
+
+        result = usecases.update_field(
+            entity_id="test_entity",
+            field_id="test_field",
+            label_key="field.test.updated",
+        )
+
+        assert isinstance(result, EntityChangeResult)
+        assert result.entity is not None
+        assert result.entity.id == "test_entity"
+        assert [f.id for f in result.entity.fields] == ["test_field"]
+        mock_schema_repository.get_all.assert_not_called()
+
     def test_update_field_failure_field_not_found(
         self,
         usecases: SchemaUseCases,
@@ -2906,3 +2930,113 @@ class TestSchemaUseCasesRelationshipUpdateDeleteOperations:
 
         # Schema repository should not have any modification calls
         mock_schema_repository.save.assert_not_called()
+
+
+class TestSchemaUseCasesRuleDependencies:
+    """Tests for get_rule_dependencies, schema_revision and label_language."""
+
+    @pytest.fixture
+    def mock_schema_repository(self) -> Mock:
+        """Create schema repository serving one entity with rules."""
+        from doc_helper.application.dto.export_dto import ControlRuleExportDTO
+        from doc_helper.domain.common.i18n import TranslationKey
+        from doc_helper.domain.schema.entity_definition import EntityDefinition
+        from doc_helper.domain.schema.field_definition import FieldDefinition
+        from doc_helper.domain.schema.field_type import FieldType
+        from doc_helper.domain.validation.constraints import RequiredConstraint
+
+        def field(name, constraints=(), control_rules=()):
+            return FieldDefinition(
+                id=FieldDefinitionId(name),
+                field_type=FieldType.TEXT,
+                label_key=TranslationKey(f"field.{name}"),
+                constraints=constraints,
+                control_rules=control_rules,
+            )
+
+        fields = (
+            field("name", constraints=(RequiredConstraint(),)),
+            field("notes"),
+            field(
+                "code",
+                control_rules=(
+                    ControlRuleExportDTO(
+                        rule_type="VISIBILITY",
+                        target_field_id="code",
+                        formula_text='kind == "x" and depth > 1',
+                    ),
+                ),
+            ),
+        )
+        repository = Mock()
+        repository.get_by_id.return_value = Success(
+            EntityDefinition(
+                id=EntityDefinitionId("project"),
+                name_key=TranslationKey("entity.project"),
+                fields={f.id: f for f in fields},
+            )
+        )
+        return repository
+
+    @pytest.fixture
+    def usecases(self, mock_schema_repository: Mock) -> SchemaUseCases:
+        """Create SchemaUseCases with mock dependencies."""
+        return SchemaUseCases(
+            schema_repository=mock_schema_repository,
+            relationship_repository=Mock(),
+            translation_service=Mock(),
+        )
+
+    def test_constrained_and_rule_fields_are_dependencies(
+        self, usecases: SchemaUseCases
+    ) -> None:
+        """Constrained fields and control rule references are read."""
+        assert usecases.get_rule_dependencies("project") == {"name", "kind", "depth"}
+
+    def test_unknown_entity_has_no_dependencies(
+        self, usecases: SchemaUseCases, mock_schema_repository: Mock
+    ) -> None:
+        """Missing or invalid entities give None."""
+        mock_schema_repository.get_by_id.return_value = Failure("not found")
+
+        assert usecases.get_rule_dependencies("missing") is None
+        assert usecases.get_rule_dependencies("Not Valid") is None
+
+    def test_repository_errors_are_not_hidden(
+        self, usecases: SchemaUseCases, mock_schema_repository: Mock
+    ) -> None:
+        """Unexpected repository exceptions propagate."""
+        mock_schema_repository.get_by_id.side_effect = RuntimeError("disk error")
+
+        with pytest.raises(RuntimeError, match="disk error"):
+            usecases.get_rule_dependencies("project")
+
+    def test_successful_mutation_bumps_revision(
+        self, usecases: SchemaUseCases, mock_schema_repository: Mock
+    ) -> None:
+        """Only successful mutations change the schema revision."""
+        mock_schema_repository.exists.return_value = False
+        before = usecases.schema_revision
+
+        usecases.delete_entity(entity_id="project")
+        assert usecases.schema_revision == before
+
+        mock_schema_repository.exists.return_value = True
+        mock_schema_repository.get_entity_dependencies.return_value = Success({
+            "referenced_by_table_fields": [],
+            "referenced_by_lookup_fields": [],
+            "child_entities": [],
+        })
+        mock_schema_repository.delete.return_value = Success(None)
+        usecases.delete_entity(entity_id="project")
+        assert usecases.schema_revision == before + 1
+
+    def test_label_language_follows_translation_service(self, usecases: SchemaUseCases) -> None:
+        """label_language reports the translation service's current language."""
+        from doc_helper.domain.common.i18n import Language
+
+        usecases._translation_service.get_current_language.return_value = Language.ARABIC
+        assert usecases.label_language == "ar"
+
+        usecases._translation_service.get_current_language.return_value = Language.ENGLISH
+        assert usecases.label_language == "en"
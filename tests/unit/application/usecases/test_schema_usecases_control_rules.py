@@ -47,6 +47,7 @@ class TestSchemaUseCasesAddControlRule:
         entity = Mock()
         entity.fields = {FieldDefinitionId("test_field"): mock_field_definition}
         entity.update_field = Mock()
+        entity.get_all_fields = Mock(side_effect=lambda: list(entity.fields.values()))
         entity.id = EntityDefinitionId("test_entity")
         return entity
 
@@ -303,6 +304,7 @@ class TestSchemaUseCasesUpdateControlRule:
         entity = Mock()
         entity.fields = {FieldDefinitionId("test_field"): mock_field_definition}
         entity.update_field = Mock()
+        entity.get_all_fields = Mock(side_effect=lambda: list(entity.fields.values()))
         entity.id = EntityDefinitionId("test_entity")
         return entity
 
@@ -433,6 +435,7 @@ class TestSchemaUseCasesDeleteControlRule:
         entity = Mock()
         entity.fields = {FieldDefinitionId("test_field"): mock_field_definition}
         entity.update_field = Mock()
+        entity.get_all_fields = Mock(side_effect=lambda: list(entity.fields.values()))
         entity.id = EntityDefinitionId("test_entity")
         return entity
 
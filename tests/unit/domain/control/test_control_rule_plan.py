@@ -0,0 +1,88 @@
+"""Tests for ControlRulePlan."""
+
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.control.control_effect import ControlEffect, ControlType
+from doc_helper.domain.control.control_rule import ControlRule, ControlRuleId
+from doc_helper.domain.control.control_rule_plan import ControlRulePlan
+from doc_helper.domain.schema.schema_ids import FieldDefinitionId
+
+
+def _rule(
+    rule_id: str,
+    condition: str,
+    target: str,
+    control_type: ControlType = ControlType.VALUE_SET,
+    priority: int = 0,
+    enabled: bool = True,
+) -> ControlRule:
+    return ControlRule(
+        id=ControlRuleId(rule_id),
+        name_key=TranslationKey(f"rule.{rule_id}"),
+        condition=condition,
+        effect=ControlEffect(
+            control_type=control_type,
+            target_field_id=FieldDefinitionId(target),
+            value=True,
+        ),
+        priority=priority,
+        enabled=enabled,
+    )
+
+
+class TestControlRulePlan:
+    """Tests for ControlRulePlan."""
+
+    def test_enabled_rules_sorted_by_priority(self) -> None:
+        """Disabled rules are left out; equal priorities keep input order."""
+        rules = [
+            _rule("r1", "true", "a", priority=1),
+            _rule("r2", "true", "a", priority=5),
+            _rule("r3", "true", "a", priority=1),
+            _rule("r4", "true", "a", priority=9, enabled=False),
+        ]
+
+        plan = ControlRulePlan(rules)
+
+        assert [rule.id.value for rule in plan.rules] == ["r2", "r1", "r3"]
+
+    def test_rules_indexed_by_fields_read(self) -> None:
+        plan = ControlRulePlan(
+            [
+                _rule("r1", "a > 1 and b == 2", "c"),
+                _rule("r2", "min(a, 3) > 1", "d", ControlType.VISIBILITY, priority=1),
+                _rule("r3", "items.qty > 0", "e"),
+            ]
+        )
+
+        assert plan.readers_of("a") == (0, 1)
+        assert plan.readers_of("b") == (1,)
+        assert plan.readers_of("items") == (2,)
+        assert plan.readers_of("c") == ()
+
+    def test_value_set_rules_indexed_by_target(self) -> None:
+        plan = ControlRulePlan(
+            [
+                _rule("r1", "true", "a"),
+                _rule("r2", "true", "a", ControlType.ENABLE),
+                _rule("r3", "true", "a", priority=2),
+            ]
+        )
+
+        assert plan.setters_of("a") == (0, 1)
+        assert plan.target_of_setter(0) == "a"
+        assert plan.target_of_setter(2) is None
+
+    def test_parse_error_kept(self) -> None:
+        """A condition that fails to parse is stored as its error."""
+        plan = ControlRulePlan([_rule("r1", "a >", "b")])
+
+        assert isinstance(plan.condition(0), Exception)
+        assert plan.readers_of("a") == ()
+
+    def test_signature_changes_with_rules(self) -> None:
+        rule = _rule("r1", "a > 1", "b")
+        plan = ControlRulePlan([rule])
+
+        assert plan.signature == ControlRulePlan.signature_of([rule])
+        rule.priority = 3
+        assert plan.signature != ControlRulePlan.signature_of([rule])
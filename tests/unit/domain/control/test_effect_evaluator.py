@@ -481,3 +481,206 @@ class TestControlEffectEvaluator:
         evaluator = ControlEffectEvaluator()
         with pytest.raises(TypeError, match="effects must contain only ControlEffect"):
             evaluator.resolve_conflicts(["invalid"])  # type: ignore
+
+
+def _value_set_rule(
+    rule_id: str, condition: str, target: str, value, priority: int = 0
+) -> ControlRule:
+    return ControlRule(
+        id=ControlRuleId(rule_id),
+        name_key=TranslationKey(f"rule.{rule_id}"),
+        condition=condition,
+        effect=ControlEffect(
+            control_type=ControlType.VALUE_SET,
+            target_field_id=FieldDefinitionId(target),
+            value=value,
+        ),
+        priority=priority,
+    )
+
+
+class TestFixedPointEvaluation:
+    """Tests for chained VALUE_SET effects."""
+
+    def test_chained_value_sets_settle(self) -> None:
+        """A VALUE_SET read by another rule's condition is applied first."""
+        # Listed with the dependent rule first: a single pass would miss it
+        rule_b = _value_set_rule("set_b", "a == 2", "b", 3)
+        rule_a = _value_set_rule("set_a", "x > 10", "a", 2)
+        visible = ControlRule(
+            id=ControlRuleId("show_c"),
+            name_key=TranslationKey("rule.show_c"),
+            condition="b == 3",
+            effect=ControlEffect(
+                control_type=ControlType.VISIBILITY,
+                target_field_id=FieldDefinitionId("c"),
+                value=True,
+            ),
+        )
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(
+            rules=[visible, rule_b, rule_a], field_values={"x": 20, "a": 0, "b": 0}
+        )
+
+        assert result.errors == ()
+        assert result.effects == (visible.effect, rule_b.effect, rule_a.effect)
+
+    def test_field_set_by_rule_need_not_be_an_input(self) -> None:
+        """A condition reading a field only a rule sets succeeds once it is set."""
+        rule_flag = _value_set_rule("set_flag", "true", "flag", True)
+        rule_total = _value_set_rule("set_total", "flag == true", "total", 1)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[rule_total, rule_flag], field_values={})
+
+        assert result.errors == ()
+        assert set(result.effects) == {rule_flag.effect, rule_total.effect}
+
+    def test_value_reverts_when_setter_turns_false(self) -> None:
+        """A field keeps its input value when no VALUE_SET rule for it holds."""
+        set_x = _value_set_rule("set_x", "true", "x", 2)
+        set_a = _value_set_rule("set_a", "x == 1", "a", 5)  # true only before x is set
+        read_a = _value_set_rule("read_a", "a == 0", "c", 1)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(
+            rules=[set_x, set_a, read_a], field_values={"x": 1, "a": 0}
+        )
+
+        assert result.errors == ()
+        assert result.effects == (set_x.effect, read_a.effect)
+
+    def test_mutually_dependent_rules_oscillate(self) -> None:
+        """Rules that keep switching each other on and off are reported."""
+        rule_a = _value_set_rule("set_a", "x == 1", "a", 5)
+        rule_b = _value_set_rule("set_b", "a == 5", "x", 2)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[rule_a, rule_b], field_values={"x": 1, "a": 0})
+
+        # set_a -> a=5 -> set_b -> x=2 -> set_a off -> a=0 -> set_b off -> x=1 ...
+        assert result.has_errors
+        assert "oscillating" in result.errors[-1]
+
+    def test_highest_priority_value_set_wins(self) -> None:
+        """Conditions see the value of the highest priority true VALUE_SET rule."""
+        low = _value_set_rule("set_low", "true", "a", 1, priority=1)
+        high = _value_set_rule("set_high", "true", "a", 2, priority=5)
+        reader = _value_set_rule("read_a", "a == 2", "b", 1)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[low, reader, high], field_values={"a": 0})
+
+        assert result.effects == (high.effect, low.effect, reader.effect)
+
+    def test_only_readers_of_changed_fields_are_reevaluated(self) -> None:
+        """Rules that do not read a changed field are evaluated once."""
+        calls = []
+
+        def track(name):
+            calls.append(name)
+            return True
+
+        rule_a = _value_set_rule("set_a", "track(1)", "a", 1)
+        rule_b = _value_set_rule("read_a", "a == 1", "b", 2)
+        rule_c = _value_set_rule("unrelated", "track(2)", "c", 3)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(
+            rules=[rule_b, rule_a, rule_c], field_values={"a": 0}, functions={"track": track}
+        )
+
+        assert result.errors == ()
+        assert len(result.effects) == 3
+        assert sorted(calls) == [1, 2]
+
+    def test_rule_reading_its_own_target_sees_input_value(self) -> None:
+        """A VALUE_SET rule is not switched off by the value it sets."""
+        rule = _value_set_rule("toggle", "a == 0", "a", 1)
+        reader = _value_set_rule("read_a", "a == 1", "b", 2)
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[rule, reader], field_values={"a": 0})
+
+        assert result.errors == ()
+        assert result.effects == (rule.effect, reader.effect)
+
+    def test_iteration_bound(self) -> None:
+        """Evaluation gives up after max_iterations rounds."""
+        rules = [_value_set_rule(f"step_{i}", f"f{i} == 1", f"f{i + 1}", 1) for i in range(5)]
+        evaluator = ControlEffectEvaluator(max_iterations=3)
+
+        result = evaluator.evaluate_rules(
+            rules=rules, field_values={f"f{i}": 1 if i == 0 else 0 for i in range(6)}
+        )
+
+        assert result.errors == ("Control rules did not settle within 3 iterations",)
+        assert len(result.effects) == 3
+
+    def test_plan_reused_until_rules_change(self) -> None:
+        """Rules are compiled once per schema version."""
+        rule = _value_set_rule("set_a", "x > 1", "a", 1)
+        evaluator = ControlEffectEvaluator()
+
+        plan = evaluator.get_plan([rule])
+        assert evaluator.get_plan([rule]) is plan
+
+        rule.disable()
+        assert evaluator.get_plan([rule]) is not plan
+        assert evaluator.evaluate_rules(rules=[rule], field_values={"x": 5}).effects == ()
+
+    def test_plans_keyed_by_signature(self) -> None:
+        """Rule sets with the same IDs but other rules get their own plans."""
+        evaluator = ControlEffectEvaluator()
+
+        plan = evaluator.get_plan([_value_set_rule("set_a", "x > 1", "a", 1)])
+        other = evaluator.get_plan([_value_set_rule("set_a", "x > 2", "a", 1)])
+
+        assert other is not plan
+        assert evaluator.get_plan([_value_set_rule("set_a", "x > 1", "a", 1)]) is plan
+
+    def test_least_recently_used_plan_evicted(self) -> None:
+        """At most max_plans plans are kept."""
+        rules_1 = [_value_set_rule("set_a", "x > 1", "a", 1)]
+        rules_2 = [_value_set_rule("set_a", "x > 2", "a", 1)]
+        rules_3 = [_value_set_rule("set_a", "x > 3", "a", 1)]
+        evaluator = ControlEffectEvaluator(max_plans=2)
+
+        plan_1 = evaluator.get_plan(rules_1)
+        plan_2 = evaluator.get_plan(rules_2)
+        evaluator.get_plan(rules_1)
+        evaluator.get_plan(rules_3)
+
+        assert evaluator.get_plan(rules_1) is plan_1
+        assert evaluator.get_plan(rules_2) is not plan_2
+
+    def test_max_iterations_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="max_iterations must be positive"):
+            ControlEffectEvaluator(max_iterations=0)
+
+    def test_max_plans_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="max_plans must be positive"):
+            ControlEffectEvaluator(max_plans=0)
+
+    def test_list_valued_value_set_rule(self) -> None:
+        """VALUE_SET rules with list or dict values are evaluated and cached."""
+        rule = _value_set_rule("set_tags", "x > 1", "tags", ["a", "b"])
+        reader = _value_set_rule("set_meta", "x > 1", "meta", {"k": [1, 2]})
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[rule, reader], field_values={"x": 5})
+
+        assert result.errors == ()
+        assert result.effects == (rule.effect, reader.effect)
+        assert evaluator.get_plan([rule, reader]) is evaluator.get_plan([rule, reader])
+
+    def test_unhashable_value_set_rule_is_not_cached(self) -> None:
+        """Rules whose values cannot be hashed are compiled per evaluation."""
+        rule = _value_set_rule("set_tags", "x > 1", "tags", {"a", "b"})
+        evaluator = ControlEffectEvaluator()
+
+        result = evaluator.evaluate_rules(rules=[rule], field_values={"x": 5})
+
+        assert result.effects == (rule.effect,)
+        assert evaluator.get_plan([rule]).signature is None
@@ -0,0 +1,84 @@
+"""Unit tests for ContentHash and AttachmentStorageReport value objects."""
+
+from uuid import uuid4
+
+import pytest
+
+from doc_helper.domain.file.value_objects.content_hash import ContentHash
+from doc_helper.domain.file.value_objects.storage_report import AttachmentStorageReport
+from doc_helper.domain.project.project_ids import ProjectId
+
+
+DIGEST = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+
+
+class TestContentHash:
+    """Test ContentHash validation and sharding."""
+
+    def test_create_valid_hash(self):
+        """Test creating a hash from a SHA-256 hex digest."""
+        content_hash = ContentHash(DIGEST)
+
+        assert content_hash.value == DIGEST
+        assert str(content_hash) == DIGEST
+
+    def test_shard_uses_first_two_bytes(self):
+        """Test shard directories come from the digest prefix."""
+        assert ContentHash(DIGEST).shard == ("9f", "86")
+
+    def test_equal_digests_are_equal(self):
+        """Test value equality."""
+        assert ContentHash(DIGEST) == ContentHash(DIGEST)
+        assert hash(ContentHash(DIGEST)) == hash(ContentHash(DIGEST))
+
+    @pytest.mark.parametrize("value", ["", "abc", DIGEST.upper(), DIGEST[:-1] + "g"])
+    def test_invalid_digest_raises(self, value):
+        """Test non-digest strings are rejected."""
+        with pytest.raises(ValueError):
+            ContentHash(value)
+
+    def test_non_string_raises(self):
+        """Test non-string value is rejected."""
+        with pytest.raises(TypeError):
+            ContentHash(123)
+
+
+class TestAttachmentStorageReport:
+    """Test AttachmentStorageReport."""
+
+    def test_saved_bytes(self):
+        """Test saved bytes and ratio."""
+        report = AttachmentStorageReport(
+            project_id=ProjectId(uuid4()),
+            attachment_count=4,
+            unique_blob_count=1,
+            logical_bytes=4000,
+            stored_bytes=1000,
+        )
+
+        assert report.saved_bytes == 3000
+        assert report.saved_ratio == 0.75
+
+    def test_empty_report(self):
+        """Test empty project reports no savings."""
+        report = AttachmentStorageReport(
+            project_id=ProjectId(uuid4()),
+            attachment_count=0,
+            unique_blob_count=0,
+            logical_bytes=0,
+            stored_bytes=0,
+        )
+
+        assert report.saved_bytes == 0
+        assert report.saved_ratio == 0.0
+
+    def test_stored_cannot_exceed_logical(self):
+        """Test inconsistent sizes are rejected."""
+        with pytest.raises(ValueError):
+            AttachmentStorageReport(
+                project_id=ProjectId(uuid4()),
+                attachment_count=1,
+                unique_blob_count=1,
+                logical_bytes=10,
+                stored_bytes=20,
+            )
@@ -235,3 +235,40 @@ class TestFieldValue:
         assert fv1 == fv2
         assert fv1 != fv3
         assert fv1 != fv4
+
+    def test_field_value_is_slotted(self) -> None:
+        """FieldValue should carry no per-instance __dict__."""
+        fv = FieldValue(field_id=FieldDefinitionId("field1"), value=42)
+        assert not hasattr(fv, "__dict__")
+
+    def test_restore_equals_constructed_value(self) -> None:
+        """restore should build the same value as the constructor."""
+        restored = FieldValue.restore(
+            field_id=FieldDefinitionId("total"),
+            value=120,
+            is_override=True,
+            original_computed_value=100,
+        )
+        constructed = FieldValue(
+            field_id=FieldDefinitionId("total"),
+            value=120,
+            is_override=True,
+            original_computed_value=100,
+        )
+
+        assert restored == constructed
+        assert restored.has_override
+        assert restored.with_value(130).value == 130
+
+    def test_restore_skips_validation(self) -> None:
+        """restore is the trusted path and does not re-validate."""
+        restored = FieldValue.restore(
+            field_id=FieldDefinitionId("total"), value=1, is_override=True
+        )
+        assert restored.original_computed_value is None
+
+    def test_restored_value_is_immutable(self) -> None:
+        """Restored FieldValue should be immutable."""
+        restored = FieldValue.restore(field_id=FieldDefinitionId("field1"), value=1)
+        with pytest.raises(AttributeError):
+            restored.value = 2  # type: ignore
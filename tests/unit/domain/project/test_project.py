@@ -1,6 +1,7 @@
 """Tests for project aggregate."""
 
 import pytest
+from datetime import datetime
 from uuid import uuid4
 
 from doc_helper.domain.project.field_value import FieldValue
@@ -550,3 +551,38 @@ class TestProject:
             file_path="/path/to/project.dhproj",
         )
         assert project2.is_saved is True
+
+    def test_restore_takes_field_values_as_is(self) -> None:
+        """restore should keep field values, metadata and timestamps."""
+        created = datetime(2024, 1, 15, 10, 30)
+        modified = datetime(2024, 2, 1, 9, 0)
+        field_id = FieldDefinitionId("field1")
+        field_values = {field_id: FieldValue(field_id=field_id, value="value1")}
+
+        project = Project.restore(
+            id=ProjectId(uuid4()),
+            name="Test",
+            app_type_id="soil_investigation",
+            entity_definition_id=EntityDefinitionId("project"),
+            field_values=field_values,
+            file_path="/path/to/project.dhproj",
+            created_at=created,
+            modified_at=modified,
+        )
+
+        assert project.field_values is field_values
+        assert project.get_field_value(field_id).value == "value1"
+        assert project.is_saved is True
+        assert project.created_at == created
+        assert project.modified_at == modified
+
+    def test_restore_still_validates_metadata(self) -> None:
+        """restore should still reject invalid project metadata."""
+        with pytest.raises(ValueError, match="name cannot be empty"):
+            Project.restore(
+                id=ProjectId(uuid4()),
+                name="  ",
+                app_type_id="soil_investigation",
+                entity_definition_id=EntityDefinitionId("project"),
+                field_values={},
+            )
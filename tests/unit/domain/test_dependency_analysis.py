@@ -0,0 +1,209 @@
+"""Tests for iterative SCC dependency analysis."""
+
+import random
+import sys
+import time
+
+import pytest
+
+from doc_helper.domain.formula.dependency_analysis import (
+    DependencyAnalyzer,
+    IncrementalCycleDetector,
+)
+from doc_helper.domain.formula.dependency_tracker import DependencyGraph, DependencyTracker
+
+
+class TestDependencyAnalyzer:
+    """Tests for DependencyAnalyzer."""
+
+    def test_acyclic_graph_orders_dependencies_first(self) -> None:
+        """Evaluation order puts every dependency before its dependents."""
+        graph = {
+            "total": {"subtotal", "tax"},
+            "tax": {"subtotal"},
+            "subtotal": {"price"},
+            "price": set(),
+        }
+        analysis = DependencyAnalyzer().analyze(graph)
+
+        assert analysis.has_cycles is False
+        assert analysis.evaluation_order == ("price", "subtotal", "tax", "total")
+
+    def test_external_dependencies_are_ignored(self) -> None:
+        """Dependencies that are not nodes are treated as inputs."""
+        analysis = DependencyAnalyzer().analyze({"total": {"raw_price", "raw_qty"}})
+
+        assert analysis.has_cycles is False
+        assert analysis.evaluation_order == ("total",)
+
+    def test_self_reference_is_a_cluster(self) -> None:
+        """A node depending on itself forms a one-node cycle."""
+        analysis = DependencyAnalyzer().analyze({"a": {"a"}, "b": {"a"}})
+
+        assert analysis.cycle_clusters == (("a",),)
+        assert analysis.cycles == (("a",),)
+        assert analysis.evaluation_order == ("b",)
+
+    def test_cycle_cluster_reported_once(self) -> None:
+        """All members of a strongly connected component form one cluster."""
+        graph = {
+            "a": {"b", "c"},
+            "b": {"a"},
+            "c": {"a"},
+            "d": {"a"},  # depends on the cycle but is not part of it
+        }
+        analysis = DependencyAnalyzer().analyze(graph)
+
+        assert analysis.cycle_clusters == (("a", "b", "c"),)
+        assert analysis.cyclic_nodes == frozenset({"a", "b", "c"})
+        assert analysis.evaluation_order == ("d",)
+
+    def test_cycles_cover_every_cluster_member(self) -> None:
+        """Reported cycles are real paths and include every cyclic node."""
+        graph = {"a": {"b", "c"}, "b": {"a"}, "c": {"a"}}
+        analysis = DependencyAnalyzer().analyze(graph)
+
+        assert analysis.cycles == (("a", "b"), ("a", "c"))
+        for cycle in analysis.cycles:
+            for i, node in enumerate(cycle):
+                assert cycle[(i + 1) % len(cycle)] in graph[node]
+
+    def test_independent_clusters(self) -> None:
+        """Separate cycles produce separate sorted clusters."""
+        graph = {"q": {"p"}, "p": {"q"}, "y": {"x"}, "x": {"y"}}
+        analysis = DependencyAnalyzer().analyze(graph)
+
+        assert analysis.cycle_clusters == (("p", "q"), ("x", "y"))
+
+    def test_deterministic_for_any_input_order(self) -> None:
+        """Same graph in different insertion order gives the same result."""
+        first = DependencyAnalyzer().analyze({"a": ["b"], "b": ["c"], "c": ["a"], "d": []})
+        second = DependencyAnalyzer().analyze({"d": [], "c": ["a"], "b": ["c"], "a": ["b"]})
+
+        assert first == second
+        assert first.cycles == (("a", "b", "c"),)
+
+    def test_long_chain_does_not_recurse(self) -> None:
+        """Chains longer than the recursion limit are handled."""
+        length = sys.getrecursionlimit() * 3
+        graph = {f"f{i:06d}": {f"f{i + 1:06d}"} for i in range(length)}
+        graph[f"f{length:06d}"] = {"f000000"}  # close one huge cycle
+
+        analysis = DependencyAnalyzer().analyze(graph)
+
+        assert len(analysis.cycle_clusters) == 1
+        assert len(analysis.cycles[0]) == length + 1
+
+
+class TestIncrementalCycleDetector:
+    """Tests for IncrementalCycleDetector."""
+
+    def test_edit_creates_and_breaks_cycle(self) -> None:
+        """Cycles appear and disappear with single-node edits."""
+        detector = IncrementalCycleDetector({"a": {"b"}, "b": {"c"}, "c": set()})
+        assert detector.cycles == ()
+
+        detector.set_dependencies("c", {"a"})
+        assert detector.cycle_clusters == (("a", "b", "c"),)
+        assert detector.cycles == (("a", "b", "c"),)
+
+        detector.set_dependencies("b", set())
+        assert detector.cycles == ()
+
+    def test_unrelated_clusters_are_kept(self) -> None:
+        """Editing one cluster leaves other clusters untouched."""
+        detector = IncrementalCycleDetector({
+            "a": {"b"}, "b": {"a"},
+            "x": {"y"}, "y": {"x"},
+        })
+        detector.set_dependencies("a", set())
+
+        assert detector.cycle_clusters == (("x", "y"),)
+
+    def test_edit_merges_clusters(self) -> None:
+        """A new edge can join two clusters into one."""
+        detector = IncrementalCycleDetector({
+            "a": {"b"}, "b": {"a"},
+            "x": {"y"}, "y": {"x", "b"},
+        })
+        detector.set_dependencies("a", {"b", "x"})
+
+        assert detector.cycle_clusters == (("a", "b", "x", "y"),)
+
+    def test_new_node_is_added(self) -> None:
+        """Setting dependencies of an unknown node adds it."""
+        detector = IncrementalCycleDetector({"a": {"new"}})
+        detector.set_dependencies("new", {"a"})
+
+        assert detector.node_count == 2
+        assert detector.cycles == (("a", "new"),)
+
+    def test_matches_full_analysis_after_random_edits(self) -> None:
+        """Incremental result equals re-analyzing the whole graph."""
+        rng = random.Random(7)
+        nodes = [f"n{i:02d}" for i in range(40)]
+        graph = {node: set(rng.sample(nodes, 2)) for node in nodes}
+        detector = IncrementalCycleDetector(graph)
+
+        for _ in range(200):
+            node = rng.choice(nodes)
+            graph[node] = set(rng.sample(nodes, rng.randint(0, 2)))
+            detector.set_dependencies(node, graph[node])
+
+            expected = DependencyAnalyzer().analyze(graph)
+            assert detector.cycle_clusters == expected.cycle_clusters
+            covered = {member for cycle in detector.cycles for member in cycle}
+            assert covered == set(expected.cyclic_nodes)
+
+
+@pytest.mark.slow
+class TestDependencyAnalysisBenchmark:
+    """Stress benchmark for schemas with 10k+ calculated fields."""
+
+    def test_large_random_graph(self) -> None:
+        """20k nodes / ~60k edges with planted cycles analyze quickly."""
+        rng = random.Random(42)
+        node_count = 20_000
+        names = [f"calc_{i:05d}" for i in range(node_count)]
+        # Acyclic: each node depends on up to 3 earlier nodes
+        graph = {
+            name: {names[rng.randrange(i)] for _ in range(3)} if i else set()
+            for i, name in enumerate(names)
+        }
+        # Plant 100 back edges, each closing a cycle
+        for _ in range(100):
+            low = rng.randrange(node_count // 2)
+            graph[names[low]].add(names[low + rng.randrange(1, node_count // 2)])
+
+        start = time.perf_counter()
+        analysis = DependencyAnalyzer().analyze(graph)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"\nSCC analysis: {node_count} nodes, "
+            f"{sum(len(d) for d in graph.values())} edges, "
+            f"{len(analysis.cycle_clusters)} clusters in {elapsed * 1000:.1f}ms"
+        )
+        assert analysis.has_cycles
+        assert len(analysis.evaluation_order) + len(analysis.cyclic_nodes) == node_count
+        assert elapsed < 5.0
+
+    def test_long_acyclic_chain(self) -> None:
+        """Topological sort of a 10k-field chain is linear."""
+        tracker = DependencyTracker()
+        node_count = 10_000
+        graph = DependencyGraph(
+            dependencies={
+                f"f{i:05d}": ({f"f{i - 1:05d}"} if i else set()) for i in range(node_count)
+            }
+        )
+
+        start = time.perf_counter()
+        result = tracker.topological_sort(graph)
+        elapsed = time.perf_counter() - start
+
+        print(f"\ntopological_sort: {node_count}-field chain in {elapsed * 1000:.1f}ms")
+        assert result.is_success()
+        assert result.value[0] == "f00000"
+        assert result.value[-1] == f"f{node_count - 1:05d}"
+        assert elapsed < 2.0
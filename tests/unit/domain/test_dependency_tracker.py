@@ -201,3 +201,9 @@ class TestDependencyTracker:
         tracker = DependencyTracker()
         with pytest.raises(TypeError, match="must be string or ASTNode"):
             tracker.build_graph({"field1": 123})  # type: ignore
+
+    def test_extract_dependencies_includes_table_of_column(self) -> None:
+        """A table.column reference depends on the TABLE field."""
+        tracker = DependencyTracker()
+        ast = FormulaParser("sum_of(layers.thickness) + depth").parse()
+        assert tracker.extract_dependencies(ast) == {"layers", "depth"}
@@ -309,6 +309,58 @@ class TestFormulaEvaluator:
         assert isinstance(result, Failure)
         assert "Function 'unknown' not found" in result.error
 
+    def test_evaluate_column_aggregate(self) -> None:
+        """Column references evaluate to ColumnVectors for aggregates."""
+        ast = FormulaParser("total(layers.thickness * 2)").parse()
+        context = EvaluationContext(
+            field_values={"layers": [{"thickness": 1.5}, {"thickness": 2.0}]},
+            functions={"total": lambda column: column.sum()},
+        )
+        result = FormulaEvaluator(context).evaluate(ast)
+        assert isinstance(result, Success)
+        assert result.value == 7.0
+
+    def test_evaluate_column_condition(self) -> None:
+        """Comparisons and logical operators apply row by row."""
+        ast = FormulaParser("hits(layers.n > 10 and not layers.weathered)").parse()
+        context = EvaluationContext(
+            field_values={
+                "layers": [
+                    {"n": 5, "weathered": False},
+                    {"n": 20, "weathered": False},
+                    {"n": 30, "weathered": True},
+                ]
+            },
+            functions={"hits": lambda column: column.count_true()},
+        )
+        result = FormulaEvaluator(context).evaluate(ast)
+        assert isinstance(result, Success)
+        assert result.value == 1
+
+    def test_evaluate_bare_column_returns_failure(self) -> None:
+        """A column that is not aggregated is not a formula value."""
+        ast = FormulaParser("layers.thickness").parse()
+        context = EvaluationContext(field_values={"layers": []}, functions={})
+        result = FormulaEvaluator(context).evaluate(ast)
+        assert isinstance(result, Failure)
+        assert "aggregate" in result.error
+
+    def test_evaluate_column_of_non_table_returns_failure(self) -> None:
+        """Only TABLE field values have columns."""
+        ast = FormulaParser("f(depth.value)").parse()
+        context = EvaluationContext(field_values={"depth": 3}, functions={"f": len})
+        result = FormulaEvaluator(context).evaluate(ast)
+        assert isinstance(result, Failure)
+        assert "not a TABLE field" in result.error
+
+    def test_table_columns_shared_between_contexts(self) -> None:
+        """A shared table_columns cache reuses column views."""
+        records = [{"thickness": 1.5}]
+        shared: dict = {}
+        first = EvaluationContext(field_values={"layers": records}, functions={}, table_columns=shared)
+        second = EvaluationContext(field_values={"layers": records}, functions={}, table_columns=shared)
+        assert first.get_column("layers", "thickness") is second.get_column("layers", "thickness")
+
     def test_evaluator_requires_context(self) -> None:
         """FormulaEvaluator should require EvaluationContext."""
         with pytest.raises(TypeError, match="context must be an EvaluationContext"):
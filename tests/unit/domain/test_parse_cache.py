@@ -0,0 +1,93 @@
+"""Tests for the shared formula parse cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from doc_helper.domain.formula.ast_nodes import BinaryOp
+from doc_helper.domain.formula.parse_cache import FormulaParseCache
+from doc_helper.domain.formula.parser import FormulaParser
+
+
+class TestFormulaParseCache:
+    """Tests for FormulaParseCache."""
+
+    def test_same_text_returns_same_ast(self) -> None:
+        """A repeated formula is parsed once and the AST shared."""
+        cache = FormulaParseCache()
+
+        first = cache.parse("price * quantity")
+        second = cache.parse("price * quantity")
+
+        assert isinstance(first, BinaryOp)
+        assert second is first
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_syntax_error_is_cached(self) -> None:
+        """A syntax error is raised again without re-parsing."""
+        cache = FormulaParseCache()
+
+        with pytest.raises(ValueError) as first:
+            cache.parse("price *")
+        with pytest.raises(ValueError) as second:
+            cache.parse("price *")
+
+        assert str(second.value) == str(first.value)
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_cached_error_keeps_its_type(self, monkeypatch) -> None:
+        """A cached ValueError subclass is re-raised as that subclass."""
+
+        class FormulaSyntaxError(ValueError):
+            pass
+
+        def fail(self):
+            raise FormulaSyntaxError("Unexpected end of formula")
+
+        monkeypatch.setattr(FormulaParser, "parse", fail)
+        cache = FormulaParseCache()
+
+        with pytest.raises(FormulaSyntaxError):
+            cache.parse("price *")
+        with pytest.raises(FormulaSyntaxError, match="Unexpected end"):
+            cache.parse("price *")
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """The cache keeps at most max_size formulas."""
+        cache = FormulaParseCache(max_size=2)
+        cache.parse("a + 1")
+        cache.parse("b + 1")
+        cache.parse("a + 1")  # a is now most recently used
+        cache.parse("c + 1")  # evicts b
+
+        cache.parse("a + 1")
+        cache.parse("b + 1")
+
+        assert len(cache) == 2
+        assert cache.misses == 4
+
+    def test_concurrent_parses_are_consistent(self) -> None:
+        """Threads looking up the same formulas get equal ASTs."""
+        cache = FormulaParseCache()
+        formulas = [f"field_{i % 10} + {i % 10}" for i in range(500)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(cache.parse, formulas))
+
+        assert results == [cache.parse(f) for f in formulas]
+        assert len(cache) == 10
+
+    def test_clear_resets_statistics(self) -> None:
+        """clear() empties the cache."""
+        cache = FormulaParseCache()
+        cache.parse("1 + 1")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert (cache.misses, cache.hits) == (0, 0)
+
+    def test_max_size_must_be_positive(self) -> None:
+        """A zero-sized cache is rejected."""
+        with pytest.raises(ValueError):
+            FormulaParseCache(max_size=0)
@@ -4,6 +4,7 @@ import pytest
 
 from doc_helper.domain.formula.ast_nodes import (
     Literal,
+    ColumnReference,
     FieldReference,
     BinaryOp,
     UnaryOp,
@@ -273,3 +274,15 @@ class TestFormulaParser:
         assert ast.operator == "**"
         assert isinstance(ast.right, BinaryOp)
         assert ast.right.operator == "**"
+
+    def test_parse_column_reference(self) -> None:
+        """Parser should parse table.column references."""
+        ast = FormulaParser("sum_of(layers.thickness) * 2").parse()
+        assert isinstance(ast, BinaryOp)
+        assert isinstance(ast.left, FunctionCall)
+        assert ast.left.arguments == (ColumnReference("layers", "thickness"),)
+
+    def test_parse_column_reference_missing_column_raises(self) -> None:
+        """Parser should reject a dot without a column name."""
+        with pytest.raises(ValueError, match="Expected IDENTIFIER"):
+            FormulaParser("layers.").parse()
@@ -1,8 +1,17 @@
 """Tests for schema strongly-typed IDs."""
 
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
 
-from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.schema.schema_ids import (
+    EntityDefinitionId,
+    FieldDefinitionId,
+    RelationshipDefinitionId,
+)
 
 
 class TestFieldDefinitionId:
@@ -78,6 +87,55 @@ class TestFieldDefinitionId:
         assert FieldDefinitionId("site_location") in field_set
 
 
+    def test_field_id_is_slotted(self) -> None:
+        """FieldDefinitionId should carry no per-instance __dict__."""
+        assert not hasattr(FieldDefinitionId("site_location"), "__dict__")
+
+    def test_field_id_not_equal_to_entity_id(self) -> None:
+        """IDs of different kinds should not compare equal."""
+        assert FieldDefinitionId("project") != EntityDefinitionId("project")
+
+    def test_interned_returns_shared_instance(self) -> None:
+        """interned should return one instance per ID value."""
+        field_id = FieldDefinitionId.interned("site_location")
+
+        assert FieldDefinitionId.interned("site_location") is field_id
+        assert field_id == FieldDefinitionId("site_location")
+        assert hash(field_id) == hash(FieldDefinitionId("site_location"))
+
+    def test_interned_validates(self) -> None:
+        """interned should reject invalid IDs."""
+        with pytest.raises(ValueError, match="must be lowercase"):
+            FieldDefinitionId.interned("Site_Location")
+
+    def test_interned_table_is_bounded(self, monkeypatch) -> None:
+        """The interning table starts over instead of growing without limit."""
+        monkeypatch.setattr(FieldDefinitionId, "_interned", {})
+        monkeypatch.setattr(FieldDefinitionId, "_MAX_INTERNED", 3)
+
+        for i in range(10):
+            FieldDefinitionId.interned(f"field_{i}")
+
+        assert len(FieldDefinitionId._interned) <= 3
+        assert FieldDefinitionId.interned("field_9") is FieldDefinitionId.interned("field_9")
+
+    def test_unpickled_id_hashes_under_another_hash_seed(self) -> None:
+        """A pickled ID is found in sets built by a process with another seed."""
+        payload = pickle.dumps({FieldDefinitionId("soil_type")})
+        code = (
+            "import pickle, sys\n"
+            "from doc_helper.domain.schema.schema_ids import FieldDefinitionId\n"
+            "ids = pickle.loads(sys.stdin.buffer.read())\n"
+            "assert FieldDefinitionId('soil_type') in ids\n"
+        )
+        env = {**os.environ, "PYTHONHASHSEED": "12345", "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        completed = subprocess.run(
+            [sys.executable, "-c", code], input=payload, env=env, capture_output=True
+        )
+
+        assert completed.returncode == 0, completed.stderr.decode()
+
 class TestEntityDefinitionId:
     """Tests for EntityDefinitionId."""
 
@@ -141,3 +199,22 @@ class TestEntityDefinitionId:
         entity_set = {id1, id2}
         assert id1 in entity_set
         assert EntityDefinitionId("project") in entity_set
+
+
+class TestValueIdEquality:
+    """Equality and hashing shared by the schema IDs through ValueId."""
+
+    @pytest.mark.parametrize(
+        "id_type", [FieldDefinitionId, EntityDefinitionId, RelationshipDefinitionId]
+    )
+    def test_equal_by_value(self, id_type) -> None:
+        """IDs of one type with the same value are equal and hash like their value."""
+        assert id_type("soil_type") == id_type("soil_type")
+        assert id_type("soil_type") != id_type("depth")
+        assert hash(id_type("soil_type")) == hash("soil_type")
+        assert not hasattr(id_type("soil_type"), "__dict__")
+
+    def test_different_id_types_are_not_equal(self) -> None:
+        """A field ID never equals an entity ID with the same value."""
+        assert FieldDefinitionId("project") != EntityDefinitionId("project")
+        assert len({FieldDefinitionId("project"), EntityDefinitionId("project")}) == 2
@@ -0,0 +1,109 @@
+"""Tests for TABLE column views."""
+
+import pytest
+
+from doc_helper.domain.formula.table_columns import ColumnVector, TableColumns
+
+
+class TestColumnVector:
+    """Tests for ColumnVector."""
+
+    def test_numeric_column_is_packed(self) -> None:
+        """Numeric values are packed into an array."""
+        assert ColumnVector.from_values([1, 2, 3]).is_numeric
+        assert ColumnVector.from_values([1.5, None, 2]).is_numeric
+        assert not ColumnVector.from_values(["clay", "sand"]).is_numeric
+
+    def test_values_an_array_cannot_hold_exactly_stay_as_is(self) -> None:
+        """Booleans and ints wider than 64 bits are not converted."""
+        flags = ColumnVector.from_values([True, None, False])
+        wide = ColumnVector.from_values([2**64, 1])
+        mixed = ColumnVector.from_values([2**60, 0.5])
+
+        assert not flags.is_numeric and flags.to_list() == [True, None, False]
+        assert flags.max() is True
+        assert not wide.is_numeric and wide.sum() == 2**64 + 1
+        assert not mixed.is_numeric and mixed.max() == 2**60
+
+    def test_aggregates_skip_missing_cells(self) -> None:
+        """Missing cells do not count towards aggregates."""
+        column = ColumnVector.from_values([2, None, 4])
+        assert len(column) == 3
+        assert column.count() == 2
+        assert column.sum() == 6
+        assert column.mean() == 3
+        assert column.min() == 2
+        assert column.max() == 4
+
+    def test_aggregates_of_empty_column(self) -> None:
+        """Sum of nothing is 0; average, min and max are None."""
+        column = ColumnVector.from_values([None, None])
+        assert column.sum() == 0
+        assert column.mean() is None
+        assert column.min() is None
+        assert column.max() is None
+
+    def test_integer_sum_stays_integer(self) -> None:
+        """Integer columns sum to an int."""
+        total = ColumnVector.from_values([1, 2, 3]).sum()
+        assert total == 6
+        assert isinstance(total, int)
+
+    def test_combine_with_scalar_broadcasts(self) -> None:
+        """A scalar operand applies to every row."""
+        column = ColumnVector.from_values([1, 5, None, 10])
+        result = ColumnVector.combine(lambda a, b: a > b, column, 4)
+        assert result.to_list() == [0, 1, None, 1]
+        assert result.count_true() == 2
+
+    def test_combine_skips_missing_rows(self) -> None:
+        """Missing cells are not evaluated (no division by a placeholder)."""
+        left = ColumnVector.from_values([6, 8, 9])
+        right = ColumnVector.from_values([2, None, 3])
+        result = ColumnVector.combine(lambda a, b: a / b, left, right)
+        assert result.to_list() == [3.0, None, 3.0]
+
+    def test_combine_text_column_with_missing_cells(self) -> None:
+        """Comparisons work on text columns with gaps."""
+        column = ColumnVector.from_values(["clay", None, "sand"])
+        result = ColumnVector.combine(lambda a, b: a < b, column, "rock")
+        assert result.to_list() == [1, None, 0]
+
+    def test_combine_with_null_scalar_is_all_missing(self) -> None:
+        """Arithmetic with null yields null rows."""
+        result = ColumnVector.combine(lambda a, b: a + b, ColumnVector.from_values([1, 2]), None)
+        assert result.count() == 0
+
+    def test_combine_length_mismatch_raises(self) -> None:
+        """Columns of different tables cannot be combined."""
+        with pytest.raises(ValueError, match="different lengths"):
+            ColumnVector.combine(
+                lambda a, b: a + b,
+                ColumnVector.from_values([1, 2]),
+                ColumnVector.from_values([1]),
+            )
+
+    def test_apply_keeps_missing_rows(self) -> None:
+        """Unary operators keep the presence mask."""
+        result = ColumnVector.from_values([1, None, -3]).apply(abs)
+        assert result.to_list() == [1, None, 3]
+
+
+class TestTableColumns:
+    """Tests for TableColumns."""
+
+    def test_column_reads_records(self) -> None:
+        """Missing keys read as missing cells."""
+        table = TableColumns([{"depth": 1.0}, {"soil": "clay"}, {"depth": 3.0}])
+        assert table.row_count == 3
+        assert table.column("depth").to_list() == [1.0, None, 3.0]
+
+    def test_column_is_cached(self) -> None:
+        """Each column is extracted once."""
+        table = TableColumns([{"depth": 1.0}])
+        assert table.column("depth") is table.column("depth")
+
+    def test_records_must_be_a_sequence(self) -> None:
+        """A non-list value is not a TABLE value."""
+        with pytest.raises(TypeError, match="records must be a list"):
+            TableColumns("abc")  # type: ignore
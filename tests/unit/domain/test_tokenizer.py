@@ -2,7 +2,12 @@
 
 import pytest
 
-from doc_helper.domain.formula.tokenizer import FormulaTokenizer, Token, TokenType
+from doc_helper.domain.formula.tokenizer import (
+    FormulaTokenizer,
+    IncrementalFormulaTokenizer,
+    Token,
+    TokenType,
+)
 
 
 class TestFormulaTokenizer:
@@ -155,7 +160,75 @@ class TestFormulaTokenizer:
         assert tokens[1].position == 4  # + at position 4
         assert tokens[2].position == 6  # 123 at position 6
 
+    def test_tokenize_column_reference(self) -> None:
+        """Tokenizer should emit a DOT between table and column names."""
+        tokens = FormulaTokenizer("layers.thickness").tokenize()
+        assert [t.type for t in tokens] == [
+            TokenType.IDENTIFIER,
+            TokenType.DOT,
+            TokenType.IDENTIFIER,
+            TokenType.EOF,
+        ]
+
     def test_tokenizer_requires_string(self) -> None:
         """Tokenizer should require string formula."""
         with pytest.raises(TypeError, match="formula must be a string"):
             FormulaTokenizer(123)  # type: ignore
+
+
+class TestIncrementalFormulaTokenizer:
+    """Tests for IncrementalFormulaTokenizer."""
+
+    def test_appending_reuses_prefix_tokens(self) -> None:
+        """Typing at the end only re-lexes the tail."""
+        tokenizer = IncrementalFormulaTokenizer()
+        tokenizer.tokenize("price * quantity")
+        tokens = tokenizer.tokenize("price * quantity + tax")
+
+        assert tokens == FormulaTokenizer("price * quantity + tax").tokenize()
+        assert tokenizer.reused_count == 2  # "price", "*"
+
+    def test_extending_last_identifier_is_relexed(self) -> None:
+        """A token touching the edit is never reused."""
+        tokenizer = IncrementalFormulaTokenizer()
+        tokenizer.tokenize("a < b")
+        tokens = tokenizer.tokenize("a <= b")
+
+        assert tokens == FormulaTokenizer("a <= b").tokenize()
+        assert tokens[1].type == TokenType.LESS_EQUAL
+
+    def test_matches_full_tokenization_for_every_keystroke(self) -> None:
+        """Typing a formula character by character, then deleting it."""
+        formula = 'if_else(total >= 10.5, upper("a b"), field_2 ** 2) != null'
+        tokenizer = IncrementalFormulaTokenizer()
+        texts = [formula[:i] for i in range(1, len(formula) + 1)]
+        texts += list(reversed(texts))
+
+        for text in texts:
+            try:
+                expected = FormulaTokenizer(text).tokenize()
+            except ValueError:
+                with pytest.raises(ValueError):
+                    tokenizer.tokenize(text)
+                continue
+            assert tokenizer.tokenize(text) == expected
+
+    def test_number_before_dot_is_relexed(self) -> None:
+        """"1." followed by a digit becomes a float, not int + DOT."""
+        tokenizer = IncrementalFormulaTokenizer()
+        tokenizer.tokenize("x * 1.")
+        tokens = tokenizer.tokenize("x * 1.5")
+
+        assert tokens == FormulaTokenizer("x * 1.5").tokenize()
+        assert tokens[2].value == 1.5
+
+    def test_error_clears_cache(self) -> None:
+        """After a tokenize error nothing is reused."""
+        tokenizer = IncrementalFormulaTokenizer()
+        tokenizer.tokenize("a + b")
+        with pytest.raises(ValueError):
+            tokenizer.tokenize("a + b $")
+
+        tokenizer.tokenize("a + b + c")
+        assert tokenizer.reused_count == 0
+
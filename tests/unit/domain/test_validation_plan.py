@@ -0,0 +1,151 @@
+"""Tests for ValidationPlan."""
+
+import time
+
+import pytest
+
+from doc_helper.domain.common.i18n import TranslationKey
+from doc_helper.domain.schema.entity_definition import EntityDefinition
+from doc_helper.domain.schema.field_definition import FieldDefinition
+from doc_helper.domain.schema.field_type import FieldType
+from doc_helper.domain.schema.schema_ids import EntityDefinitionId, FieldDefinitionId
+from doc_helper.domain.validation.constraints import (
+    AllowedValuesConstraint,
+    MaxValueConstraint,
+    MinLengthConstraint,
+    MinValueConstraint,
+    PatternConstraint,
+    RequiredConstraint,
+)
+from doc_helper.domain.validation.validation_plan import ValidationPlan
+from doc_helper.domain.validation.validators import get_validator_for_field_type
+
+
+def _field(name: str, field_type: FieldType, constraints: tuple = ()) -> FieldDefinition:
+    return FieldDefinition(
+        id=FieldDefinitionId(name),
+        label_key=TranslationKey(f"fields.{name}"),
+        field_type=field_type,
+        constraints=constraints,
+    )
+
+
+def _entity(*fields: FieldDefinition) -> EntityDefinition:
+    return EntityDefinition(
+        id=EntityDefinitionId("test_entity"),
+        name_key=TranslationKey("entities.test"),
+        fields={f.id: f for f in fields},
+    )
+
+
+def _wide_entity(field_count: int) -> EntityDefinition:
+    """Entity cycling TEXT (pattern), NUMBER (range) and DROPDOWN fields."""
+    fields = []
+    for i in range(field_count):
+        kind = i % 3
+        if kind == 0:
+            fields.append(_field(f"f{i}", FieldType.TEXT, (
+                RequiredConstraint(),
+                MinLengthConstraint(min_length=2),
+                PatternConstraint(pattern=r"^[A-Z]{2}-\d+$"),
+            )))
+        elif kind == 1:
+            fields.append(_field(f"f{i}", FieldType.NUMBER, (
+                MinValueConstraint(min_value=0),
+                MaxValueConstraint(max_value=100),
+            )))
+        else:
+            fields.append(_field(f"f{i}", FieldType.DROPDOWN, (
+                AllowedValuesConstraint(allowed_values=tuple(f"opt{n}" for n in range(50))),
+            )))
+    return _entity(*fields)
+
+
+def _wide_values(field_count: int) -> dict:
+    values = {}
+    for i in range(field_count):
+        kind = i % 3
+        values[FieldDefinitionId(f"f{i}")] = (
+            f"AB-{i}" if kind == 0 else (i % 150 if kind == 1 else f"opt{i % 60}")
+        )
+    return values
+
+
+class TestValidationPlan:
+    """Tests for ValidationPlan."""
+
+    @pytest.fixture
+    def entity(self) -> EntityDefinition:
+        return _entity(
+            _field("name", FieldType.TEXT, (RequiredConstraint(),)),
+            _field("depth", FieldType.NUMBER, (MinValueConstraint(min_value=0),)),
+        )
+
+    def test_validate_collects_errors_of_all_fields(self, entity: EntityDefinition) -> None:
+        """validate() should report the errors of every invalid field."""
+        plan = ValidationPlan(entity)
+
+        result = plan.validate({
+            FieldDefinitionId("name"): "",
+            FieldDefinitionId("depth"): -1,
+        })
+
+        assert [e.constraint_type for e in result.errors] == [
+            "RequiredConstraint",
+            "MinValueConstraint",
+        ]
+
+    def test_validate_skips_orphaned_fields(self, entity: EntityDefinition) -> None:
+        """validate() should skip values of fields not in the definition."""
+        plan = ValidationPlan(entity)
+
+        result = plan.validate({FieldDefinitionId("orphan"): None})
+
+        assert result.is_valid()
+
+    def test_validator_is_built_once_per_field(self, entity: EntityDefinition) -> None:
+        """validator_for() should return the same prebuilt validator."""
+        plan = ValidationPlan(entity)
+
+        validator = plan.validator_for(FieldDefinitionId("name"))
+
+        assert validator is plan.validator_for(FieldDefinitionId("name"))
+        assert plan.validator_for(FieldDefinitionId("orphan")) is None
+
+    def test_signature_changes_with_constraints(self, entity: EntityDefinition) -> None:
+        """signature_of() should differ once a field's constraints change."""
+        changed = _entity(
+            _field("name", FieldType.TEXT, (RequiredConstraint(),)),
+            _field("depth", FieldType.NUMBER, (MinValueConstraint(min_value=1),)),
+        )
+
+        assert ValidationPlan(entity).signature == ValidationPlan.signature_of(entity)
+        assert ValidationPlan.signature_of(changed) != ValidationPlan.signature_of(entity)
+
+    def test_matches_per_field_validators(self) -> None:
+        """validate() should report the same errors as ad-hoc validators."""
+        entity = _wide_entity(300)
+        values = _wide_values(300)
+
+        expected = []
+        for field_id, value in values.items():
+            field_def = entity.fields[field_id]
+            validator = get_validator_for_field_type(field_def.field_type, field_def.constraints)
+            expected.extend(validator.validate(field_id.value, value).errors)
+
+        assert ValidationPlan(entity).validate(values).errors == tuple(expected)
+
+    @pytest.mark.slow
+    def test_benchmark_10000_fields(self) -> None:
+        """Microbenchmark: validate 10,000 fields with a compiled plan."""
+        entity = _wide_entity(10_000)
+        values = _wide_values(10_000)
+        plan = ValidationPlan(entity)
+
+        start = time.perf_counter()
+        result = plan.validate(values)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n10,000-field plan validation: {elapsed * 1000:.1f} ms")
+        assert result.is_invalid()
+        assert elapsed < 1.0
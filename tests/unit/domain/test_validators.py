@@ -273,6 +273,15 @@ class TestDropdownValidator:
         result = validator.validate("size", None)
         assert result.is_valid()
 
+    def test_unhashable_value_is_rejected(self) -> None:
+        """DropdownValidator should reject unhashable values without raising."""
+        validator = DropdownValidator(constraints=(
+            AllowedValuesConstraint(allowed_values=("small", "medium")),
+        ))
+        result = validator.validate("size", ["small"])
+        assert result.is_invalid()
+        assert result.errors[0].constraint_type == "AllowedValuesConstraint"
+
 
 class TestCheckboxValidator:
     """Tests for CheckboxValidator."""
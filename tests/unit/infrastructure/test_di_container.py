@@ -273,3 +273,79 @@ class TestContainer:
         assert service1.value == "call_1"
         assert service2.value == "call_2"
         assert service3.value == "call_3"
+
+
+DUMMY_SERVICE_PATH = f"{__name__}.IDummyService"
+
+
+class TestContainerLazyRegistration:
+    """Tests for lazy registration by dotted import path."""
+
+    def test_lazy_factory_not_called_until_resolve(self):
+        """Test lazy service is constructed only on first resolve."""
+        container = Container()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return DummyService("lazy")
+
+        container.register_lazy(DUMMY_SERVICE_PATH, factory)
+        assert calls == []
+
+        service = container.resolve(IDummyService)
+
+        assert service.value == "lazy"
+        assert calls == [1]
+
+    def test_lazy_singleton_reused(self):
+        """Test lazy singleton is cached after promotion."""
+        container = Container()
+        container.register_lazy(DUMMY_SERVICE_PATH, lambda: DummyService())
+
+        assert container.resolve(IDummyService) is container.resolve(IDummyService)
+
+    def test_lazy_transient_lifetime(self):
+        """Test lazy registration honours the requested lifetime."""
+        container = Container()
+        container.register_lazy(
+            DUMMY_SERVICE_PATH, lambda: DummyService(), lifetime="transient"
+        )
+
+        assert container.resolve(IDummyService) is not container.resolve(IDummyService)
+
+    def test_lazy_is_registered(self):
+        """Test is_registered sees lazy registrations before promotion."""
+        container = Container()
+        container.register_lazy(DUMMY_SERVICE_PATH, lambda: DummyService())
+
+        assert container.is_registered(IDummyService)
+
+    def test_lazy_unknown_lifetime_raises_error(self):
+        """Test unknown lifetime is rejected at registration."""
+        container = Container()
+        with pytest.raises(ValueError, match="Unknown lifetime"):
+            container.register_lazy(DUMMY_SERVICE_PATH, DummyService, lifetime="pooled")
+
+    def test_warm_up_constructs_lazy_singletons(self):
+        """Test warm_up builds lazy singletons eagerly."""
+        container = Container()
+        calls = []
+        container.register_lazy(
+            DUMMY_SERVICE_PATH, lambda: calls.append(1) or DummyService()
+        )
+
+        container.warm_up()
+
+        assert calls == [1]
+        assert container.resolve(IDummyService) is not None
+        assert calls == [1]
+
+    def test_clear_removes_lazy_registrations(self):
+        """Test clear also drops lazy registrations."""
+        container = Container()
+        container.register_lazy(DUMMY_SERVICE_PATH, lambda: DummyService())
+
+        container.clear()
+
+        assert not container.is_registered(IDummyService)
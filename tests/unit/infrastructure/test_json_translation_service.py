@@ -256,3 +256,73 @@ class TestJsonTranslationService:
         key = TranslationKey("menu.file.open")
         result = service.get(key, Language.ENGLISH)
         assert result == "Open File"
+
+
+class TestFlattenedTranslationTables:
+    """Tests for load-time flattening and pre-parsed templates."""
+
+    def test_shallow_key_wins_over_deeper_path(self, tmp_path):
+        """Test a direct dotted key takes precedence over a nested path."""
+        translations_dir = tmp_path / "translations"
+        translations_dir.mkdir()
+        data = {
+            "a.b": "direct",
+            "a": {"b": "nested", "c": {"d": "deep"}, "c.d": "partial"},
+        }
+        for code in ("en", "ar"):
+            with open(translations_dir / f"{code}.json", "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+        service = JsonTranslationService(translations_dir=translations_dir)
+
+        assert service.get(TranslationKey("a.b"), Language.ENGLISH) == "direct"
+        assert service.get(TranslationKey("a.c.d"), Language.ENGLISH) == "partial"
+
+    def test_non_string_values_are_stringified(self, tmp_path):
+        """Test numeric leaves are returned as strings."""
+        translations_dir = tmp_path / "translations"
+        translations_dir.mkdir()
+        for code in ("en", "ar"):
+            with open(translations_dir / f"{code}.json", "w", encoding="utf-8") as f:
+                json.dump({"limits": {"max": 10}}, f)
+
+        service = JsonTranslationService(translations_dir=translations_dir)
+
+        assert service.get(TranslationKey("limits.max"), Language.ENGLISH) == "10"
+
+    def test_static_text_ignores_params(self, temp_translations_dir):
+        """Test params passed to a placeholder-free string are ignored."""
+        service = JsonTranslationService(translations_dir=temp_translations_dir)
+        key = TranslationKey("validation.required")
+        result = service.get(key, Language.ENGLISH, {"unused": 1})
+        assert result == "This field is required"
+
+    def test_partial_params_keep_placeholders(self, temp_translations_dir):
+        """Test missing params return the raw template."""
+        service = JsonTranslationService(translations_dir=temp_translations_dir)
+        key = TranslationKey("welcome.greeting")
+        result = service.get(key, Language.ENGLISH, {"other": "x"})
+        assert result == "Hello {name}!"
+
+    def test_nested_value_lookup_does_not_flatten(self, temp_translations_dir, monkeypatch):
+        """Test _get_nested_value walks the key instead of flattening per call."""
+        service = JsonTranslationService(translations_dir=temp_translations_dir)
+
+        def fail(_data):
+            raise AssertionError("flattened on lookup")
+
+        monkeypatch.setattr(service, "_flatten", fail)
+        data = {"a.b": "direct", "a": {"b": "nested", "c": {"d": "deep"}}}
+
+        assert service._get_nested_value(data, "a.b") == "direct"
+        assert service._get_nested_value(data, "a.c.d") == "deep"
+        assert service._get_nested_value(data, "a.x") is None
+
+    def test_interpolation_reuses_parsed_templates(self, temp_translations_dir):
+        """Test _interpolate_params parses each text once."""
+        service = JsonTranslationService(translations_dir=temp_translations_dir)
+
+        assert service._interpolate_params("Hi {who}", {"who": "A"}) == "Hi A"
+        template = service._adhoc_templates["Hi {who}"]
+        assert service._interpolate_params("Hi {who}", {"who": "B"}) == "Hi B"
+        assert service._adhoc_templates["Hi {who}"] is template
@@ -0,0 +1,145 @@
+"""Tests for ManifestIndex and indexed AppType discovery."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from doc_helper.platform.discovery.app_type_discovery_service import (
+    AppTypeDiscoveryService,
+)
+from doc_helper.platform.discovery.manifest_index import ManifestIndex
+from doc_helper.platform.discovery.manifest_parser import ManifestParser
+
+
+def write_app_type(root: Path, app_type_id: str, name: str = "App") -> Path:
+    """Create an AppType directory with a valid manifest."""
+    app_dir = root / app_type_id
+    app_dir.mkdir(exist_ok=True)
+    manifest = {
+        "id": app_type_id,
+        "name": name,
+        "version": "1.0.0",
+        "kind": "tool",
+        "description": "desc",
+        "schema": {"source": "config.db", "type": "sqlite"},
+        "templates": {"word": ["a.docx"], "default": "a.docx"},
+        "capabilities": {"supports_pdf_export": False},
+    }
+    (app_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return app_dir
+
+
+class TestIndexedDiscovery:
+    """Tests for AppTypeDiscoveryService backed by a ManifestIndex."""
+
+    @pytest.fixture
+    def app_types_dir(self, tmp_path: Path) -> Path:
+        """Create app_types directory with two AppTypes."""
+        root = tmp_path / "app_types"
+        root.mkdir()
+        write_app_type(root, "alpha", "Alpha")
+        write_app_type(root, "beta", "Beta")
+        return root
+
+    @pytest.fixture
+    def index_path(self, tmp_path: Path) -> Path:
+        """Index file location."""
+        return tmp_path / "data" / "index.json"
+
+    def test_first_discovery_writes_index(self, app_types_dir: Path, index_path: Path) -> None:
+        """First run parses all manifests and persists the index."""
+        service = AppTypeDiscoveryService(index=ManifestIndex(index_path))
+
+        result = service.discover(app_types_dir)
+
+        assert result.manifest_count == 2
+        assert index_path.exists()
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        assert set(data["entries"]) == {"alpha", "beta"}
+
+    def test_unchanged_app_types_skip_parsing(
+        self, app_types_dir: Path, index_path: Path
+    ) -> None:
+        """Second run returns equal manifests without calling the parser."""
+        first = AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(
+            app_types_dir
+        )
+
+        service = AppTypeDiscoveryService(index=ManifestIndex(index_path))
+        with patch.object(ManifestParser, "parse") as parse:
+            second = service.discover(app_types_dir)
+
+        parse.assert_not_called()
+        assert second.manifests == first.manifests
+
+    def test_changed_manifest_is_reparsed(self, app_types_dir: Path, index_path: Path) -> None:
+        """Only the changed manifest is parsed again."""
+        AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(app_types_dir)
+        write_app_type(app_types_dir, "beta", "Beta Renamed")
+
+        parser = ManifestParser()
+        service = AppTypeDiscoveryService(parser=parser, index=ManifestIndex(index_path))
+        with patch.object(parser, "parse", wraps=parser.parse) as parse:
+            result = service.discover(app_types_dir)
+
+        assert parse.call_count == 1
+        names = {m.metadata.app_type_id: m.metadata.name for m in result.manifests}
+        assert names == {"alpha": "Alpha", "beta": "Beta Renamed"}
+
+    def test_touched_manifest_with_same_content_is_not_reparsed(
+        self, app_types_dir: Path, index_path: Path
+    ) -> None:
+        """A new mtime with identical content is resolved by hash."""
+        AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(app_types_dir)
+        manifest_path = app_types_dir / "alpha" / "manifest.json"
+        stat = manifest_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+        service = AppTypeDiscoveryService(index=ManifestIndex(index_path))
+        with patch.object(ManifestParser, "parse") as parse:
+            result = service.discover(app_types_dir)
+
+        parse.assert_not_called()
+        assert result.manifest_count == 2
+
+    def test_removed_app_type_is_dropped_from_index(
+        self, app_types_dir: Path, index_path: Path
+    ) -> None:
+        """Entries for deleted AppTypes are pruned."""
+        AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(app_types_dir)
+        (app_types_dir / "beta" / "manifest.json").unlink()
+
+        result = AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(
+            app_types_dir
+        )
+
+        assert result.manifest_count == 1
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        assert set(data["entries"]) == {"alpha"}
+
+    def test_invalid_manifest_not_indexed(self, app_types_dir: Path, index_path: Path) -> None:
+        """Failed manifests keep reporting errors on every run."""
+        (app_types_dir / "beta" / "manifest.json").write_text("{bad", encoding="utf-8")
+
+        AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(app_types_dir)
+        result = AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(
+            app_types_dir
+        )
+
+        assert result.manifest_count == 1
+        assert result.has_errors
+
+    def test_corrupt_index_is_rebuilt(self, app_types_dir: Path, index_path: Path) -> None:
+        """An unreadable index is ignored and rewritten."""
+        index_path.parent.mkdir(parents=True)
+        index_path.write_text("not json", encoding="utf-8")
+
+        result = AppTypeDiscoveryService(index=ManifestIndex(index_path)).discover(
+            app_types_dir
+        )
+
+        assert result.manifest_count == 2
+        assert json.loads(index_path.read_text(encoding="utf-8"))["version"] == 1
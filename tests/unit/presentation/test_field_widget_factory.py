@@ -3,9 +3,13 @@
 Tests the registry-based factory pattern for creating field widgets.
 """
 
+from unittest.mock import create_autospec
+
 import pytest
 
 from doc_helper.application.dto import FieldDefinitionDTO, FieldOptionDTO
+from doc_helper.application.lookup import ILookupSource, ILookupSourceFactory
+from doc_helper.domain.common.result import Success
 from doc_helper.presentation.factories import FieldWidgetFactory
 from doc_helper.presentation.widgets.calculated_widget import CalculatedFieldWidget
 from doc_helper.presentation.widgets.checkbox_widget import CheckboxFieldWidget
@@ -280,6 +284,70 @@ class TestFieldWidgetFactory:
         assert widget is not None
         assert isinstance(widget, LookupFieldWidget)
 
+    def test_create_lookup_widget_with_lookup_source(self):
+        """Test LOOKUP widgets of a project page options from the injected source."""
+        source = create_autospec(ILookupSource, instance=True)
+        source.search.return_value = Success([("bh-01", "North Pit")])
+        lookup_source_factory = create_autospec(ILookupSourceFactory, instance=True)
+        lookup_source_factory.create_source.return_value = source
+        factory = FieldWidgetFactory(lookup_source_factory=lookup_source_factory)
+        field_def = FieldDefinitionDTO(
+            id="field_9",
+            field_type="lookup",
+            label="Borehole",
+            help_text=None,
+            required=False,
+            is_required=False,
+            default_value=None,
+            options=(),
+            formula=None,
+            is_calculated=False,
+            is_choice_field=False,
+            is_collection_field=False,
+            lookup_entity_id="borehole",
+            lookup_display_field="name",
+            child_entity_id=None,
+        )
+
+        widget = factory.create_widget(field_def, project_id="proj-1")
+
+        assert isinstance(widget, LookupFieldWidget)
+        assert widget.field_definition == field_def
+        lookup_source_factory.create_source.assert_called_once_with(
+            "proj-1", "borehole", "name"
+        )
+        page = widget.complete("pit").value
+        assert [(option.value, option.display_text) for option in page.options] == [
+            ("bh-01", "North Pit")
+        ]
+
+    def test_create_lookup_widget_without_project(self):
+        """Test LOOKUP widgets created outside a project get no source."""
+        lookup_source_factory = create_autospec(ILookupSourceFactory, instance=True)
+        factory = FieldWidgetFactory(lookup_source_factory=lookup_source_factory)
+        field_def = FieldDefinitionDTO(
+            id="field_9",
+            field_type="lookup",
+            label="Borehole",
+            help_text=None,
+            required=False,
+            is_required=False,
+            default_value=None,
+            options=(),
+            formula=None,
+            is_calculated=False,
+            is_choice_field=False,
+            is_collection_field=False,
+            lookup_entity_id="borehole",
+            lookup_display_field="name",
+            child_entity_id=None,
+        )
+
+        widget = factory.create_widget(field_def)
+
+        lookup_source_factory.create_source.assert_not_called()
+        assert widget.complete("pit").is_failure()
+
     def test_create_file_widget(self):
         """Test creating FILE widget."""
         factory = FieldWidgetFactory()
@@ -144,3 +144,114 @@ class TestBaseViewModel:
 
         # Act & Assert - should not raise exception
         viewmodel.notify_change("nonexistent_property")
+
+
+class TestBatchedNotifications:
+    """Tests for batch_updates, deferred dispatch and notification stats."""
+
+    def test_batch_dedupes_and_dispatches_at_end(self) -> None:
+        """Changes inside a batch are dispatched once, after the block."""
+        viewmodel = SampleViewModel()
+        received: list[int] = []
+        viewmodel.subscribe("test_value", lambda: received.append(viewmodel.test_value))
+
+        with viewmodel.batch_updates():
+            viewmodel.set_test_value(1)
+            viewmodel.set_test_value(2)
+            viewmodel.set_test_value(3)
+            assert received == []
+
+        assert received == [3]
+
+    def test_nested_batches_dispatch_once(self) -> None:
+        """Only the outermost batch dispatches."""
+        viewmodel = SampleViewModel()
+        received: list[int] = []
+        viewmodel.subscribe("test_value", lambda: received.append(viewmodel.test_value))
+
+        with viewmodel.batch_updates():
+            with viewmodel.batch_updates():
+                viewmodel.set_test_value(1)
+            assert received == []
+            viewmodel.set_test_value(2)
+
+        assert received == [2]
+
+    def test_shared_handler_called_once_per_batch(self) -> None:
+        """A handler subscribed to several changed properties runs once."""
+        viewmodel = SampleViewModel()
+        calls: list[str] = []
+
+        def refresh() -> None:
+            calls.append("refresh")
+
+        viewmodel.subscribe("a", refresh)
+        viewmodel.subscribe("b", refresh)
+
+        with viewmodel.batch_updates():
+            viewmodel.notify_change("a")
+            viewmodel.notify_change("b")
+
+        assert calls == ["refresh"]
+
+    def test_batch_dispatches_when_block_raises(self) -> None:
+        """Already-made changes are still published on error."""
+        viewmodel = SampleViewModel()
+        received: list[int] = []
+        viewmodel.subscribe("test_value", lambda: received.append(viewmodel.test_value))
+
+        with pytest.raises(RuntimeError):
+            with viewmodel.batch_updates():
+                viewmodel.set_test_value(5)
+                raise RuntimeError("boom")
+
+        assert received == [5]
+
+    def test_deferred_dispatch_waits_for_scheduler(self) -> None:
+        """Deferred mode queues changes until the scheduled flush runs."""
+        viewmodel = SampleViewModel()
+        scheduled: list = []
+        received: list[int] = []
+        viewmodel.subscribe("test_value", lambda: received.append(viewmodel.test_value))
+        viewmodel.set_deferred_dispatch(scheduled.append)
+
+        viewmodel.set_test_value(1)
+        viewmodel.set_test_value(2)
+
+        assert received == []
+        assert len(scheduled) == 1  # one flush for the whole burst
+        scheduled.pop()()
+        assert received == [2]
+
+    def test_disabling_deferred_dispatch_flushes_pending(self) -> None:
+        """Switching back to synchronous mode publishes queued changes."""
+        viewmodel = SampleViewModel()
+        received: list[int] = []
+        viewmodel.subscribe("test_value", lambda: received.append(viewmodel.test_value))
+        viewmodel.set_deferred_dispatch(lambda flush: None)
+
+        viewmodel.set_test_value(7)
+        viewmodel.set_deferred_dispatch(None)
+
+        assert received == [7]
+
+    def test_track_notifications_counts_handler_calls(self) -> None:
+        """Stats report handler invocations for one action."""
+        viewmodel = SampleViewModel()
+        viewmodel.subscribe("test_value", lambda: None)
+        viewmodel.subscribe("test_value", lambda: None)
+        viewmodel.set_test_value(1)
+
+        with viewmodel.track_notifications() as stats:
+            viewmodel.set_test_value(2)
+            viewmodel.notify_change("unobserved")
+
+        assert stats.notifications == 2
+        assert stats.dispatches == 2
+        assert stats.handler_calls == 2
+        assert stats.handler_calls_by_property == {"test_value": 2}
+        assert viewmodel.notification_stats.handler_calls == 4
+
+        previous = viewmodel.reset_notification_stats()
+        assert previous.handler_calls == 4
+        assert viewmodel.notification_stats.handler_calls == 0
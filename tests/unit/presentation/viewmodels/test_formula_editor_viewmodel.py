@@ -2176,3 +2176,106 @@ class TestFormulaEditorViewModel:
 
         assert result.binding is not None
         assert result.binding.governance_status == FormulaGovernanceStatus.VALID
+
+    # -------------------------------------------------------------------------
+    # Test: Debounced, incremental diagnostics pipeline
+    # -------------------------------------------------------------------------
+
+    def test_scheduled_edits_are_coalesced_until_flush(
+        self,
+        viewmodel: FormulaEditorViewModel,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """schedule_formula only records text; flush diagnoses the latest."""
+        viewmodel.set_schema_context(schema_fields)
+        passes: list[str] = []
+        viewmodel.subscribe("diagnostics", lambda: passes.append(viewmodel.formula_text))
+
+        for text in ("v", "value1", "value1 +", "value1 + value2"):
+            viewmodel.schedule_formula(text)
+
+        assert passes == []
+        assert viewmodel.has_pending_diagnostics is True
+        assert viewmodel.validation_result is None
+
+        assert viewmodel.flush_diagnostics() is True
+        assert passes == ["value1 + value2"]
+        assert viewmodel.is_valid is True
+        assert viewmodel.has_pending_diagnostics is False
+        assert viewmodel.flush_diagnostics() is False
+
+    def test_diagnostics_published_once_per_pass(
+        self,
+        viewmodel: FormulaEditorViewModel,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Each pass publishes one consolidated diagnostics update."""
+        viewmodel.set_schema_context(schema_fields)
+        passes: list[int] = []
+        viewmodel.subscribe("diagnostics", lambda: passes.append(1))
+
+        viewmodel.set_formula("value1 + value2")
+
+        assert len(passes) == 1
+        diagnostics = viewmodel.diagnostics
+        assert diagnostics is not None
+        assert diagnostics.formula_text == "value1 + value2"
+        assert diagnostics.validation_result == viewmodel.validation_result
+        assert diagnostics.governance_result == viewmodel.governance_result
+
+    def test_unchanged_results_do_not_renotify_properties(
+        self,
+        viewmodel: FormulaEditorViewModel,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Property groups whose DTO did not change are not re-notified."""
+        viewmodel.set_schema_context(schema_fields)
+        viewmodel.set_formula("value1 + value2")
+        notifications: list[str] = []
+        viewmodel.subscribe("dependencies", lambda: notifications.append("deps"))
+
+        # Whitespace edit: same references, same dependency result
+        viewmodel.set_formula("value1 + value2 ")
+
+        assert notifications == []
+
+    def test_edit_rechecks_cycles_of_bound_field(
+        self,
+        viewmodel: FormulaEditorViewModel,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """Editing the bound field's formula updates the cached entity graph."""
+        viewmodel.set_schema_context(schema_fields)
+        viewmodel.set_binding_target(FormulaBindingTarget.CALCULATED_FIELD, "value1")
+        viewmodel.analyze_entity_cycles({"value1": (), "value2": ("value1",)})
+        assert viewmodel.has_cycles is False
+
+        viewmodel.set_formula("value2 * 2")
+        assert viewmodel.has_cycles is True
+        assert viewmodel.all_cycle_field_ids == ("value1", "value2")
+        assert viewmodel.is_formula_blocked is True
+
+        viewmodel.set_formula("10")
+        assert viewmodel.has_cycles is False
+
+    def test_clear_formula_runs_shared_handler_once(
+        self,
+        viewmodel: FormulaEditorViewModel,
+        schema_fields: tuple[SchemaFieldInfoDTO, ...],
+    ) -> None:
+        """clear_formula notifications are batched into one dispatch pass."""
+        viewmodel.set_schema_context(schema_fields)
+        viewmodel.set_formula("value1 + value2")
+        refreshes: list[int] = []
+
+        def refresh() -> None:
+            refreshes.append(1)
+
+        for name in ("errors", "warnings", "all_diagnostic_errors", "diagnostics"):
+            viewmodel.subscribe(name, refresh)
+
+        with viewmodel.track_notifications() as stats:
+            viewmodel.clear_formula()
+
+        assert refreshes == [1]
+        assert stats.handler_calls == 1
@@ -236,6 +236,61 @@ def test_update_field_uses_field_undo_service(
     assert result is True
 
 
+def test_update_table_row_writes_row_without_undo(
+    viewmodel, mock_field_undo_service, mock_project_usecases
+):
+    """Test: update_table_row() writes one record through ProjectUseCases."""
+    project_dto = ProjectDTO(
+        id=str(TEST_PROJECT_UUID),
+        name="Test Project",
+        description=None,
+        file_path=None,
+        entity_definition_id="entity-1",
+        app_type_id="soil_investigation",
+        field_count=0,
+        is_saved=True,
+    )
+    mock_project_usecases.get_project.return_value = Success(project_dto)
+    mock_project_usecases.update_table_row.return_value = Success(None)
+    entity_def = EntityDefinitionDTO(
+        id="entity-1",
+        name="Test Entity",
+        description=None,
+        name_key="entity.test",
+        description_key=None,
+        field_count=0,
+        is_root_entity=True,
+        parent_entity_id=None,
+        fields=(),
+    )
+    viewmodel.load_project(str(TEST_PROJECT_UUID), entity_def)
+
+    result = viewmodel.update_table_row("samples", "update", 2, record={"depth": 4.5})
+
+    mock_project_usecases.update_table_row.assert_called_once_with(
+        project_id=str(TEST_PROJECT_UUID),
+        field_id="samples",
+        kind="update",
+        index=2,
+        record={"depth": 4.5},
+        to_index=None,
+    )
+    mock_field_undo_service.set_field_value.assert_not_called()
+    assert result is True
+    assert viewmodel.has_unsaved_changes is True
+
+
+def test_update_table_row_reports_failure(viewmodel, mock_project_usecases):
+    """Test: update_table_row() surfaces a failed write as error_message."""
+    viewmodel._project_id = str(TEST_PROJECT_UUID)
+    mock_project_usecases.update_table_row.return_value = Failure("Row position 9 out of range")
+
+    result = viewmodel.update_table_row("samples", "delete", 9)
+
+    assert result is False
+    assert "Row position 9 out of range" in viewmodel.error_message
+
+
 def test_load_project_clears_undo_stack(
     viewmodel, mock_history_adapter, mock_project_usecases
 ):
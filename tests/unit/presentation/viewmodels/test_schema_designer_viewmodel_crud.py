@@ -12,7 +12,11 @@ import pytest
 from unittest.mock import MagicMock
 
 from doc_helper.application.dto.operation_result import OperationResult
-from doc_helper.application.dto.schema_dto import EntityDefinitionDTO, FieldDefinitionDTO
+from doc_helper.application.dto.schema_dto import (
+    EntityChangeResult,
+    EntityDefinitionDTO,
+    FieldDefinitionDTO,
+)
 from doc_helper.application.dto.export_dto import ConstraintExportDTO
 from doc_helper.application.usecases.schema_usecases import SchemaUseCases
 from doc_helper.presentation.viewmodels.schema_designer_viewmodel import (
@@ -1068,3 +1072,144 @@ class TestSchemaDesignerViewModelUIStateSync:
 
         # CRITICAL ASSERTION: Entity selection preserved
         assert viewmodel.selected_entity_id == "test_entity"
+
+
+class TestSchemaDesignerViewModelEntityChangePatching:
+    """Mutations patch the changed entity instead of re-reading the schema."""
+
+    @staticmethod
+    def _field(field_id: str, label: str) -> FieldDefinitionDTO:
+        return FieldDefinitionDTO(
+            id=field_id,
+            field_type="TEXT",
+            label=label,
+            help_text=None,
+            required=False,
+            is_required=False,
+            default_value=None,
+            options=(),
+            formula=None,
+            is_calculated=False,
+            is_choice_field=False,
+            is_collection_field=False,
+            lookup_entity_id=None,
+            lookup_display_field=None,
+            child_entity_id=None,
+        )
+
+    @staticmethod
+    def _entity(entity_id: str, *fields: FieldDefinitionDTO) -> EntityDefinitionDTO:
+        return EntityDefinitionDTO(
+            id=entity_id,
+            name=entity_id,
+            description=None,
+            name_key=f"entity.{entity_id}",
+            description_key=None,
+            field_count=len(fields),
+            is_root_entity=False,
+            parent_entity_id=None,
+            fields=fields,
+        )
+
+    @pytest.fixture
+    def mock_schema_usecases(self) -> MagicMock:
+        """Create mock SchemaUseCases with two loaded entities."""
+        usecases = MagicMock(spec=SchemaUseCases)
+        usecases.get_all_entities.return_value = (
+            self._entity("project", self._field("name", "Name"), self._field("code", "Code")),
+            self._entity("borehole", self._field("depth", "Depth")),
+        )
+        usecases.get_all_relationships.return_value = ()
+        usecases.get_field_validation_rules.return_value = ()
+        usecases.list_control_rules_for_field.return_value = ()
+        usecases.list_output_mappings_for_field.return_value = ()
+        usecases.list_field_options.return_value = ()
+        return usecases
+
+    @pytest.fixture
+    def viewmodel(self, mock_schema_usecases: MagicMock) -> SchemaDesignerViewModel:
+        """Create viewmodel with entities loaded and the query calls reset."""
+        vm = SchemaDesignerViewModel(schema_usecases=mock_schema_usecases)
+        vm.load_entities()
+        mock_schema_usecases.get_all_entities.reset_mock()
+        return vm
+
+    def test_update_field_patches_entity_without_reload(
+        self,
+        viewmodel: SchemaDesignerViewModel,
+        mock_schema_usecases: MagicMock,
+    ) -> None:
+        """Only the changed entity is replaced; the schema is not re-read."""
+        viewmodel.select_entity("project")
+        viewmodel.select_field("name")
+        mock_schema_usecases.update_field.return_value = EntityChangeResult(
+            success=True,
+            value="name",
+            entity=self._entity(
+                "project", self._field("name", "Full Name"), self._field("code", "Code")
+            ),
+        )
+        notified = []
+        viewmodel.subscribe("fields", lambda: notified.append("fields"))
+        viewmodel.subscribe("entities", lambda: notified.append("entities"))
+
+        result = viewmodel.update_field(entity_id="project", field_id="name", label_key="Full Name")
+
+        assert result.success is True
+        mock_schema_usecases.get_all_entities.assert_not_called()
+        assert viewmodel.fields[0].label == "Full Name"
+        assert [e.id for e in viewmodel.entities] == ["project", "borehole"]
+        assert viewmodel.selected_field_id == "name"
+        assert notified.count("fields") == 1
+        assert notified.count("entities") == 1
+
+    def test_delete_field_deselects_removed_field(
+        self,
+        viewmodel: SchemaDesignerViewModel,
+        mock_schema_usecases: MagicMock,
+    ) -> None:
+        """A deleted selected field is deselected from the patched entity."""
+        viewmodel.select_entity("project")
+        viewmodel.select_field("code")
+        mock_schema_usecases.delete_field.return_value = EntityChangeResult(
+            success=True,
+            entity=self._entity("project", self._field("name", "Name")),
+        )
+
+        viewmodel.delete_field(entity_id="project", field_id="code")
+
+        mock_schema_usecases.get_all_entities.assert_not_called()
+        assert viewmodel.selected_field_id is None
+        assert [f.id for f in viewmodel.fields] == ["name"]
+
+    def test_create_entity_appends_entity(
+        self,
+        viewmodel: SchemaDesignerViewModel,
+        mock_schema_usecases: MagicMock,
+    ) -> None:
+        """A created entity is appended to the loaded entities."""
+        mock_schema_usecases.create_entity.return_value = EntityChangeResult(
+            success=True, value="sample", entity=self._entity("sample")
+        )
+
+        viewmodel.create_entity(entity_id="sample", name_key="Sample")
+
+        mock_schema_usecases.get_all_entities.assert_not_called()
+        assert [e.id for e in viewmodel.entities] == ["project", "borehole", "sample"]
+
+    def test_delete_entity_removes_entity_and_selection(
+        self,
+        viewmodel: SchemaDesignerViewModel,
+        mock_schema_usecases: MagicMock,
+    ) -> None:
+        """A deleted entity is dropped and its selection cleared."""
+        viewmodel.select_entity("borehole")
+        mock_schema_usecases.delete_entity.return_value = EntityChangeResult(
+            success=True, removed_entity_id="borehole"
+        )
+
+        viewmodel.delete_entity("borehole")
+
+        mock_schema_usecases.get_all_entities.assert_not_called()
+        assert [e.id for e in viewmodel.entities] == ["project"]
+        assert viewmodel.selected_entity_id is None
@@ -0,0 +1,85 @@
+"""Tests for the lazily fetched TABLE row model."""
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from doc_helper.presentation.widgets.table_rows_model import TableRowsModel
+from doc_helper.presentation.widgets.table_widget import TableFieldWidget
+
+
+class TestTableRowsModel:
+    """Tests for TableRowsModel."""
+
+    @pytest.fixture
+    def widget(self) -> TableFieldWidget:
+        """Create TableFieldWidget with 25 rows."""
+        widget = TableFieldWidget("layer")
+        widget.set_value([{"depth": float(i), "soil": "clay"} for i in range(25)])
+        return widget
+
+    @pytest.fixture
+    def model(self, widget: TableFieldWidget) -> TableRowsModel:
+        """Create model fetching 10 rows per batch."""
+        return TableRowsModel(widget, batch_size=10)
+
+    def test_rows_are_fetched_in_batches(self, model: TableRowsModel) -> None:
+        """Test no rows are exposed until fetched, then one batch at a time."""
+        assert model.rowCount() == 0
+        assert model.canFetchMore()
+
+        model.fetchMore()
+        model.fetchMore()
+        model.fetchMore()
+
+        assert model.rowCount() == 25
+        assert not model.canFetchMore()
+
+    def test_columns_are_discovered_from_fetched_rows(self, model: TableRowsModel) -> None:
+        """Test column keys come from the records."""
+        model.fetchMore()
+
+        assert model.columns == ("depth", "soil")
+        assert model.headerData(1, Qt.Orientation.Horizontal) == "soil"
+
+    def test_data_and_set_data(self, widget: TableFieldWidget, model: TableRowsModel) -> None:
+        """Test cells read from and write back to the widget as row updates."""
+        model.fetchMore()
+        changes: list = []
+        widget.on_row_changed(changes.append)
+
+        index = model.index(2, 0)
+        assert model.data(index) == "2.0"
+        assert model.setData(index, 7.5)
+
+        assert widget.get_row(2) == {"depth": 7.5, "soil": "clay"}
+        assert [change.kind for change in changes] == ["update"]
+
+    def test_follows_widget_edits(self, widget: TableFieldWidget, model: TableRowsModel) -> None:
+        """Test edits inside the fetched range change the row count."""
+        model.fetchMore()
+
+        widget.insert_row(0, {"depth": -1.0})
+        widget.delete_row(5)
+        widget.add_row({"depth": 99.0})  # past the fetched range
+
+        assert model.rowCount() == 10
+        assert model.data(model.index(0, 0)) == "-1.0"
+
+    def test_reset_on_set_value(self, widget: TableFieldWidget, model: TableRowsModel) -> None:
+        """Test replacing the value drops fetched rows."""
+        model.fetchMore()
+
+        widget.set_value([{"thickness": 1.0}])
+
+        assert model.rowCount() == 0
+        model.fetchMore()
+        assert model.columns == ("thickness",)
+
+    def test_dispose_stops_following(self, widget: TableFieldWidget, model: TableRowsModel) -> None:
+        """Test a disposed model ignores widget edits."""
+        model.fetchMore()
+        model.dispose()
+
+        widget.insert_row(0, {"depth": -1.0})
+
+        assert model.rowCount() == 10
@@ -0,0 +1,125 @@
+"""Tests for table field widget."""
+
+import pytest
+
+from doc_helper.presentation.widgets.table_widget import TableFieldWidget, TableRowChange
+
+
+class TestTableFieldWidget:
+    """Tests for TableFieldWidget."""
+
+    @pytest.fixture
+    def widget(self) -> TableFieldWidget:
+        """Create TableFieldWidget with two rows."""
+        widget = TableFieldWidget("sample")
+        widget.set_value([{"depth": 1.5}, {"depth": 3.0}])
+        return widget
+
+    def test_set_value_keeps_only_records(self) -> None:
+        """Test set_value drops entries that are not dicts."""
+        # Arrange
+        widget = TableFieldWidget()
+
+        # Act
+        widget.set_value([{"depth": 1.5}, "bad", 3])
+
+        # Assert
+        assert widget.get_value() == [{"depth": 1.5}]
+
+    def test_empty_value_is_none(self) -> None:
+        """Test empty table returns None."""
+        assert TableFieldWidget().get_value() is None
+
+    def test_row_access(self, widget: TableFieldWidget) -> None:
+        """Test row_count and get_row."""
+        assert widget.row_count == 2
+        assert widget.get_row(1) == {"depth": 3.0}
+        assert widget.get_row(2) is None
+
+    def test_insert_row(self, widget: TableFieldWidget) -> None:
+        """Test insert_row places the row before index."""
+        # Act
+        widget.insert_row(1, {"depth": 2.0})
+
+        # Assert
+        assert widget.get_value() == [{"depth": 1.5}, {"depth": 2.0}, {"depth": 3.0}]
+
+    def test_move_row(self, widget: TableFieldWidget) -> None:
+        """Test move_row reorders rows."""
+        # Act
+        widget.move_row(0, 1)
+
+        # Assert
+        assert widget.get_value() == [{"depth": 3.0}, {"depth": 1.5}]
+
+    def test_row_edits_report_row_changes(self, widget: TableFieldWidget) -> None:
+        """Test each edit reports only the affected row."""
+        # Arrange
+        changes: list[TableRowChange] = []
+        values: list = []
+        widget.on_row_changed(changes.append)
+        widget.on_value_changed(values.append)
+
+        # Act
+        widget.add_row({"depth": 4.5})
+        widget.update_row(0, {"depth": 1.0})
+        widget.move_row(2, 0)
+        widget.delete_row(1)
+
+        # Assert
+        assert changes == [
+            TableRowChange("insert", 2, record={"depth": 4.5}),
+            TableRowChange("update", 0, record={"depth": 1.0}),
+            TableRowChange("move", 2, to_index=0),
+            TableRowChange("delete", 1),
+        ]
+        assert values == []
+
+    def test_row_edits_fall_back_to_value_changed(self, widget: TableFieldWidget) -> None:
+        """Test edits report the whole table without a row callback."""
+        # Arrange
+        values: list = []
+        widget.on_value_changed(values.append)
+
+        # Act
+        widget.add_row({"depth": 4.5})
+
+        # Assert
+        assert values == [[{"depth": 1.5}, {"depth": 3.0}, {"depth": 4.5}]]
+
+    def test_out_of_range_edits_are_ignored(self, widget: TableFieldWidget) -> None:
+        """Test out-of-range edits change nothing and report nothing."""
+        # Arrange
+        changes: list[TableRowChange] = []
+        widget.on_row_changed(changes.append)
+
+        # Act
+        widget.insert_row(5, {"depth": 9.0})
+        widget.update_row(5, {"depth": 9.0})
+        widget.delete_row(-1)
+        widget.move_row(0, 5)
+
+        # Assert
+        assert widget.row_count == 2
+        assert changes == []
+
+    def test_row_observers_see_edits_and_resets(self, widget: TableFieldWidget) -> None:
+        """Test row observers receive every edit alongside the callbacks."""
+        # Arrange
+        observed: list[TableRowChange] = []
+        reported: list[TableRowChange] = []
+        widget.add_row_observer(observed.append)
+        widget.on_row_changed(reported.append)
+
+        # Act
+        widget.update_row(0, {"depth": 2.0})
+        widget.set_value([])
+        widget.remove_row_observer(observed.append)
+        widget.add_row({"depth": 1.0})
+
+        # Assert
+        assert observed == [
+            TableRowChange("update", 0, record={"depth": 2.0}),
+            TableRowChange("reset", 0),
+        ]
+        assert [change.kind for change in reported] == ["update", "insert"]